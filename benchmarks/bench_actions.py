@@ -0,0 +1,71 @@
+"""
+Benchmark: reading a hero's combat actions once per turn.
+
+Compares building the action menu from scratch on every read (what
+`get_actions` did before the registry, simulated with a fresh
+`ActionView`) against the cached view of `Hero.get_actions`.
+
+Usage:
+    uv run python benchmarks/bench_actions.py [reads]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.actions import ActionView  # noqa: E402
+from domain.archer import Archer  # noqa: E402
+from domain.mage import Mage  # noqa: E402
+from domain.warrior import Warrior  # noqa: E402
+
+
+def _heroes():
+    return [
+        Warrior(name="Knight", max_life=100, current_life=100, attack=10, speed=5),
+        Archer(name="Legolas", max_life=100, current_life=100, attack=10, speed=5),
+        Mage(
+            name="Gandalf",
+            max_life=100,
+            current_life=100,
+            max_mana=100,
+            current_mana=100,
+            attack=10,
+            speed=5,
+        ),
+    ]
+
+
+def _rebuilt(hero) -> dict:
+    return ActionView(hero).menu
+
+
+def _cached(hero) -> dict:
+    return hero.get_actions()
+
+
+def run(read, hero, reads: int) -> float:
+    start = time.perf_counter()
+    for _ in range(reads):
+        read(hero)
+    elapsed = time.perf_counter() - start
+
+    return reads / elapsed
+
+
+def main() -> None:
+    reads = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    print(f"{reads} menu reads per hero")
+    for hero in _heroes():
+        slow = run(_rebuilt, hero, reads)
+        fast = run(_cached, hero, reads)
+        print(
+            f"{type(hero).__name__:>8}: rebuilt {slow:>12,.0f} reads/s | "
+            f"cached {fast:>12,.0f} reads/s | {fast / slow:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: area-of-effect damage over a horde.
+
+Compares hitting every monster through `Entity.damage_received` (one
+multiplier lookup per target) against the batched pass of
+`domain.area_damage.apply_area_damage`, which also reports the life each
+target lost.
+
+Usage:
+    uv run python benchmarks/bench_area_damage.py [repeats]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.area_damage import apply_area_damage  # noqa: E402
+from domain.element import Element  # noqa: E402
+from domain.monster import Monster  # noqa: E402
+
+ENDLESS_LIFE = 10**9
+SIZES = (10, 100, 1000)
+ELEMENTS = list(Element)
+
+
+def _make_horde(size: int) -> list[Monster]:
+    return [
+        Monster(
+            name="Goblin",
+            max_life=ENDLESS_LIFE,
+            attack=10,
+            speed=5,
+            element=ELEMENTS[i % len(ELEMENTS)],
+        )
+        for i in range(size)
+    ]
+
+
+def _one_by_one(horde: list[Monster]) -> None:
+    for monster in horde:
+        monster.damage_received(25, Element.FIRE)
+
+
+def _batched(horde: list[Monster]) -> None:
+    apply_area_damage(horde, 25, Element.FIRE)
+
+
+def run(hit, size: int, repeats: int) -> float:
+    horde = _make_horde(size)
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        hit(horde)
+    elapsed = time.perf_counter() - start
+
+    return repeats * size / elapsed
+
+
+def main() -> None:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print(f"{repeats} area hits per horde")
+    for size in SIZES:
+        slow = run(_one_by_one, size, repeats)
+        fast = run(_batched, size, repeats)
+        print(
+            f"{size:>5} monsters: damage_received {slow:>12,.0f} hits/s | "
+            f"batched {fast:>12,.0f} hits/s | {fast / slow:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: object-model battles vs the NumPy BatchBattle engine (fights/second).
+
+Both sides fight the same hero/monster matchup with the basic policy.
+
+Usage:
+    uv run python benchmarks/bench_batch_battle.py [fights]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.element import Element  # noqa: E402
+from services.batch_battle import BatchBattle  # noqa: E402
+from services.simulation import (  # noqa: E402
+    MonsterSpec,
+    create_simulation_hero,
+    run_trial,
+)
+
+SPEC = MonsterSpec(level=3, element=Element.FIRE)
+OBJECT_FIGHTS = 2_000
+
+
+def run_object(archetype: str, fights: int) -> float:
+    random.seed(42)
+    start = time.perf_counter()
+    for _ in range(fights):
+        run_trial(create_simulation_hero(archetype), SPEC.create())
+    return fights / (time.perf_counter() - start)
+
+
+def run_batch(archetype: str, fights: int) -> float:
+    start = time.perf_counter()
+    batch = BatchBattle.repeat(
+        create_simulation_hero(archetype), SPEC.create(), fights, seed=42
+    )
+    batch.run()
+    return fights / (time.perf_counter() - start)
+
+
+def main() -> None:
+    fights = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    print(f"{'archetype':<10} {'object':>14} {'batch':>14} {'speedup':>8}")
+    for archetype in ("warrior", "mage", "archer"):
+        obj = run_object(archetype, OBJECT_FIGHTS)
+        batch = run_batch(archetype, fights)
+        print(
+            f"{archetype:<10} {obj:>10,.0f} f/s {batch:>10,.0f} f/s "
+            f"{batch / obj:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
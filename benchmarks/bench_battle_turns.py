@@ -0,0 +1,81 @@
+"""
+Benchmark: Battle.execute_turn throughput (turns/second).
+
+Compares the default mode, which renders the Portuguese turn log on every
+turn, against headless mode, which only records the typed events (its
+`turn_log["actions"]` is rendered when read, and the benchmark never reads it).
+
+Usage:
+    uv run python benchmarks/bench_battle_turns.py [turns]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.element import Element  # noqa: E402
+from domain.monster import Monster  # noqa: E402
+from domain.weapon import Weapon  # noqa: E402
+from services.battle import Battle  # noqa: E402
+from services.hero_factory import HeroFactory  # noqa: E402
+
+ENDLESS_LIFE = 10**9
+
+
+def _make_battle(archetype: str, headless: bool) -> Battle:
+    hero = HeroFactory.create_hero(archetype, "Bench")
+    weapon = next(i for i in hero.inventory.items if isinstance(i, Weapon))
+    hero.equip_weapon(weapon)
+    hero.max_life = ENDLESS_LIFE
+    hero.current_life = ENDLESS_LIFE
+
+    monster = Monster(
+        name="Saco de Pancadas",
+        max_life=ENDLESS_LIFE,
+        attack=20,
+        speed=12,
+        element=Element.ICE,
+    )
+    return Battle(hero, monster, headless=headless)
+
+
+def _choice(hero) -> str:
+    if hasattr(hero, "current_ammo") and hero.current_ammo == 0:
+        return "3"
+    if hasattr(hero, "current_mana") and hero.current_mana < 10:
+        hero.current_mana = hero.max_mana
+    return "1"
+
+
+def run(archetype: str, headless: bool, turns: int) -> float:
+    random.seed(42)
+    battle = _make_battle(archetype, headless)
+    hero = battle.hero
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        battle.execute_turn(_choice(hero))
+        hero.end_of_turn_routine()
+    elapsed = time.perf_counter() - start
+
+    return turns / elapsed
+
+
+def main() -> None:
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+
+    print(f"{'archetype':<10} {'rendered':>14} {'headless':>14} {'speedup':>8}")
+    for archetype in ("warrior", "mage", "archer"):
+        rendered = run(archetype, headless=False, turns=turns)
+        headless = run(archetype, headless=True, turns=turns)
+        print(
+            f"{archetype:<10} {rendered:>10,.0f} t/s {headless:>10,.0f} t/s "
+            f"{headless / rendered:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
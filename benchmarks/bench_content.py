@@ -0,0 +1,46 @@
+"""
+Benchmark: loading the content packs, compiled vs. from the startup cache.
+
+Times `load_content` parsing, checking and compiling the built-in packs
+(no cache) against loading their compiled pickle from a warm cache, as
+every startup after the first one does.
+
+Usage:
+    uv run python benchmarks/bench_content.py [loads]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from services.content import content_packs, load_content  # noqa: E402
+
+
+def per_load(cache_dir, loads: int) -> float:
+    packs = content_packs()
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(loads):
+            load_content(packs, cache_dir)
+        best = min(best, time.perf_counter() - start)
+    return best / loads
+
+
+def main() -> None:
+    loads = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        load_content(content_packs(), Path(cache_dir))
+        print(f"{loads} loads of the built-in packs, best of 5 (ms per load)")
+        print(f"  parse + check + compile: {per_load(None, loads) * 1000:>8.3f}")
+        print(
+            f"  from the cache:          {per_load(Path(cache_dir), loads) * 1000:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: elemental multiplier lookups.
+
+Compares the rules as `Element.multiplier` used to apply them (the
+advantage dict rebuilt on every call) with the precomputed `ElementMatrix`,
+both as a plain method call and as a tuple lookup, and times a full
+`Monster.damage_received` in a neutral and in an elemental room.
+
+Usage:
+    uv run python benchmarks/bench_elements.py [lookups]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.element import ELEMENT_MATRIX, Element  # noqa: E402
+from domain.monster import Monster  # noqa: E402
+
+
+def _rebuilt_multiplier(strike: Element, target: Element) -> float:
+    """`Element.multiplier` before the matrix."""
+    advantages = {
+        Element.POISON: Element.LIGHTNING,
+        Element.LIGHTNING: Element.ICE,
+        Element.ICE: Element.FIRE,
+        Element.FIRE: Element.POISON,
+    }
+    if strike == Element.NEUTRAL or target == Element.NEUTRAL:
+        return 1.0
+    if advantages.get(strike) == target:
+        return 2.0
+    if advantages.get(target) == strike:
+        return 0.5
+    return 1.0
+
+
+def _pairs(lookups: int) -> list:
+    elements = list(Element)
+    return [
+        (elements[i % len(elements)], elements[(i // 3) % len(elements)])
+        for i in range(lookups)
+    ]
+
+
+def per_lookup(lookup, pairs) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for strike, target in pairs:
+            lookup(strike, target)
+        best = min(best, time.perf_counter() - start)
+    return best / len(pairs) * 1e9
+
+
+def per_hit(environment: Element, hits: int) -> float:
+    monster = Monster(
+        name="Ogre", max_life=10**9, attack=10, speed=5, element=Element.POISON
+    )
+    monster.element_matrix = ELEMENT_MATRIX.for_environment(environment)
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(hits):
+            monster.damage_received(3, Element.FIRE)
+        best = min(best, time.perf_counter() - start)
+    return best / hits * 1e9
+
+
+def main() -> None:
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    pairs = _pairs(lookups)
+    rows = ELEMENT_MATRIX.rows
+
+    print(f"{lookups} lookups, best of 5 (ns per lookup)")
+    print(f"  rebuilt rules: {per_lookup(_rebuilt_multiplier, pairs):>7.0f}")
+    print(f"  matrix method: {per_lookup(ELEMENT_MATRIX.multiplier, pairs):>7.0f}")
+    print(
+        f"  tuple lookup:  "
+        f"{per_lookup(lambda s, t: rows[s.index][t.index], pairs):>7.0f}"
+    )
+    print("damage_received (ns per hit)")
+    print(f"  neutral room:  {per_hit(Element.NEUTRAL, lookups):>7.0f}")
+    print(f"  fire room:     {per_hit(Element.FIRE, lookups):>7.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Soak benchmark: an endless run of many floors through a `FloorWindow`.
+
+Every floor is generated, its monsters defeated and recycled into a
+`MonsterPool` as the GameManager does, then left behind. The memory traced
+(tracemalloc) is reported at regular checkpoints: it must level off after
+the first floors instead of growing with the depth. The rooms kept by an
+eager list of the same floors are reported for comparison on a short run.
+
+Usage:
+    uv run python benchmarks/bench_endless.py [floors] [capacity]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from services.level_factory import FloorWindow, LevelFactory  # noqa: E402
+from services.monster_factory import MonsterFactory, MonsterPool  # noqa: E402
+
+SEED = 2024
+
+
+def clear(room) -> None:
+    for monster in room.monsters:
+        monster.current_life = 0
+        room.remove_defeated_monster()
+        MonsterFactory.recycle(monster)
+
+
+def soak(floors: int, capacity: int) -> None:
+    window = FloorWindow(SEED, capacity=capacity)
+    checkpoint = max(floors // 10, 1)
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    print(f"{floors} floors, window of {capacity}")
+    for level in range(1, floors + 1):
+        clear(window.room(level))
+        if level % checkpoint == 0:
+            current, peak = tracemalloc.get_traced_memory()
+            print(
+                f"  floor {level:>6}: {current / 1024:>8.1f} KiB traced"
+                f"  (peak {peak / 1024:>8.1f} KiB)"
+                f"  {level / (time.perf_counter() - start):>8,.0f} floors/s"
+            )
+    tracemalloc.stop()
+
+
+def eager(floors: int) -> float:
+    """KiB held by a list of `floors` rooms, as the five-floor game did."""
+    gc.collect()
+    tracemalloc.start()
+    rooms = [LevelFactory.room_at(SEED, level) for level in range(1, floors + 1)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rooms
+    return current / 1024
+
+
+def main() -> None:
+    floors = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    capacity = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    MonsterFactory.pool = MonsterPool()
+
+    soak(floors, capacity)
+    short = min(floors, 1_000)
+    print(f"eager list of {short} floors: {eager(short):>8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Benchmark: cost of the validated attributes of `domain.fields`.
+
+Per attribute: one set of `current_life` in validated and trusted mode,
+next to a hand-written validating property (the pattern fields replaced)
+and a raw write to the storage attribute, plus the cost of a read.
+Construction: objects built per second in each mode. Every figure is the
+best of 5 rounds.
+
+Usage:
+    uv run python benchmarks/bench_fields.py [repeats]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.archer import Archer  # noqa: E402
+from domain.element import Element  # noqa: E402
+from domain.fields import trusted  # noqa: E402
+from domain.grimoire import Grimoire  # noqa: E402
+from domain.mage import Mage  # noqa: E402
+from domain.monster import Monster  # noqa: E402
+from domain.ranged_weapon import RangedWeapon  # noqa: E402
+from domain.weapon import Weapon  # noqa: E402
+
+
+class _PropertyLife:
+    """`current_life` as a hand-written validating property."""
+
+    def __init__(self):
+        self.max_life = 100
+        self._life = 100
+
+    @property
+    def current_life(self):
+        return self._life
+
+    @current_life.setter
+    def current_life(self, value):
+        if not isinstance(value, int):
+            raise TypeError("Current life needs to be a whole number")
+        if value < 0:
+            self._life = 0
+        elif value > self.max_life:
+            self._life = self.max_life
+        else:
+            self._life = value
+
+
+def _monster() -> Monster:
+    return Monster(
+        name="Goblin", max_life=100, attack=10, speed=5, element=Element.NEUTRAL
+    )
+
+
+BUILDERS = {
+    "Monster": _monster,
+    "Weapon": lambda: Weapon(name="Espada", base_damage=10),
+    "RangedWeapon": lambda: RangedWeapon(name="Arco", base_damage=8, ammo_required=1),
+    "Grimoire": lambda: Grimoire(
+        name="Grimório", element=Element.FIRE, magic_power=12, mana_cost=5
+    ),
+    "Archer": lambda: Archer(
+        name="Legolas", max_life=100, current_life=100, attack=10, speed=5
+    ),
+    "Mage": lambda: Mage(
+        name="Merlin",
+        max_life=100,
+        current_life=100,
+        max_mana=100,
+        current_mana=100,
+        attack=10,
+        speed=5,
+    ),
+}
+
+
+def _per_op(loop, repeats: int, rounds: int = 5) -> float:
+    """Nanoseconds per iteration of `loop(repeats)`, best of `rounds`."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        loop(repeats)
+        best = min(best, time.perf_counter() - start)
+    return best / repeats * 1e9
+
+
+def _set_loop(obj):
+    def loop(repeats):
+        for i in range(repeats):
+            obj.current_life = 50
+
+    return loop
+
+
+def _raw_loop(obj):
+    def loop(repeats):
+        for i in range(repeats):
+            obj._Entity__current_life = 50
+
+    return loop
+
+
+def _get_loop(obj):
+    def loop(repeats):
+        for i in range(repeats):
+            obj.current_life
+
+    return loop
+
+
+def _trusted(loop):
+    def run(repeats):
+        with trusted():
+            loop(repeats)
+
+    return run
+
+
+def main() -> None:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    monster, legacy = _monster(), _PropertyLife()
+
+    print(f"current_life, {repeats} operations (ns/op)")
+    rows = [
+        ("set: hand-written property", _set_loop(legacy)),
+        ("set: field, validated", _set_loop(monster)),
+        ("set: field, trusted", _trusted(_set_loop(monster))),
+        ("set: raw storage write", _raw_loop(monster)),
+        ("get: hand-written property", _get_loop(legacy)),
+        ("get: field", _get_loop(monster)),
+    ]
+    for label, loop in rows:
+        print(f"  {label:<28} {_per_op(loop, repeats):>7.1f}")
+
+    builds = max(repeats // 20, 1)
+    print(f"\nconstruction, {builds} objects (objects/s)")
+    for name, build in BUILDERS.items():
+
+        def loop(repeats, build=build):
+            for _ in range(repeats):
+                build()
+
+        validated = 1e9 / _per_op(loop, builds)
+        fast = 1e9 / _per_op(_trusted(loop), builds)
+        print(
+            f"  {name:<12} validated {validated:>10,.0f} | "
+            f"trusted {fast:>10,.0f} | {fast / validated:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
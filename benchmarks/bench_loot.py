@@ -0,0 +1,106 @@
+"""
+Benchmark: loot generation and saved inventories, configs vs. catalog.
+
+Times a monster's loot built as `ItemsFactory` used to (the fixed drops
+coded inline and the equipment built from its config, in trusted mode)
+against the loot tables, which create each drop from an immutable catalog
+definition. Reports the memory held by many such loot lists, and the JSON
+size of a full inventory saved item by item vs. by catalog id.
+
+Usage:
+    uv run python benchmarks/bench_loot.py [drops]
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.consumable_item import ConsumableItem  # noqa: E402
+from domain.fields import trusted  # noqa: E402
+from domain.rng import RandomStream  # noqa: E402
+from infra.hero_repository import HeroRepository  # noqa: E402
+from services.items_factory import ItemsFactory  # noqa: E402
+
+MONSTER = "Raijin"
+
+
+def _copied_loot(rng) -> list:
+    """`get_loot_for_monster` before the catalog."""
+    drops = []
+    with trusted():
+        if rng.random() <= 0.70:
+            drops.append(
+                ConsumableItem("Poção de Cura", "Recupera 40 de Vida.", 0.5, 40)
+            )
+        if rng.random() <= 0.50:
+            drops.append(
+                ConsumableItem("Poção de Mana", "Recupera 30 de Mana.", 0.5, 30, "mana")
+            )
+        drops += ItemsFactory.create_items_from_config(
+            ItemsFactory.DROP_TABLES[MONSTER]
+        )
+    return drops
+
+
+def _catalog_loot(rng) -> list:
+    return ItemsFactory.get_loot_for_monster(MONSTER, rng)
+
+
+def per_second(loot, drops: int) -> float:
+    rng = RandomStream(1)
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(drops):
+            loot(rng)
+        best = min(best, time.perf_counter() - start)
+    return drops / best
+
+
+def bytes_per_loot(loot, drops: int) -> float:
+    rng = RandomStream(1)
+    kept = [None] * drops
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for index in range(drops):
+        kept[index] = loot(rng)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / drops
+
+
+def save_size(items: list) -> int:
+    inventory = {"items": [HeroRepository._serialize_item(item) for item in items]}
+    return len(json.dumps(inventory, ensure_ascii=False).encode())
+
+
+def main() -> None:
+    drops = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    ItemsFactory.catalog()
+
+    print(f"{drops} drops of {MONSTER}")
+    for label, loot in (("configs", _copied_loot), ("catalog", _catalog_loot)):
+        print(
+            f"  {label:>8}: {per_second(loot, drops):>10,.0f} loot/s"
+            f"  {bytes_per_loot(loot, drops):>6.0f} bytes per loot"
+        )
+
+    catalog = ItemsFactory.catalog()
+    created = [catalog.create(catalog_id) for catalog_id in catalog]
+    with trusted():
+        copies = []
+        for config in [ItemsFactory.BASE_ITEMS, *ItemsFactory.DROP_TABLES.values()]:
+            copies += ItemsFactory.create_items_from_config(config)
+    print(f"saved inventory of {len(created)} items (JSON bytes)")
+    print(f"  full items: {save_size(copies):>6}")
+    print(f"  by id:      {save_size(created):>6}")
+
+
+if __name__ == "__main__":
+    main()
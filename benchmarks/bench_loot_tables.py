@@ -0,0 +1,92 @@
+"""
+Benchmark: weighted drops, linear cumulative-weight scan vs. alias table.
+
+Draws from tables of growing size with the scan a hand-written drop table
+would do (walk the entries until the running weight passes the roll) and
+with `AliasTable.sample`, and times a horde's loot rolled monster by
+monster against `ItemsFactory.get_loot_for_monsters`.
+
+Usage:
+    uv run python benchmarks/bench_loot_tables.py [draws]
+"""
+
+import sys
+import time
+from itertools import accumulate
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.rng import RandomStream  # noqa: E402
+from services.items_factory import ItemsFactory  # noqa: E402
+from services.loot_table import AliasTable  # noqa: E402
+
+
+def _scan(weights):
+    cumulative = list(accumulate(weights))
+    total = cumulative[-1]
+
+    def sample(uniform: float) -> int:
+        roll = uniform * total
+        for index, limit in enumerate(cumulative):
+            if roll < limit:
+                return index
+        return len(cumulative) - 1
+
+    return sample
+
+
+def per_second(draw, count: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        rng = RandomStream(1)
+        start = time.perf_counter()
+        draw(rng, count)
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def main() -> None:
+    draws = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    print(f"{draws} draws, best of 5 (draws per second)")
+    for size in (4, 32, 256):
+        # Decreasing weights: the likely entries are the first ones scanned.
+        weights = [size - index for index in range(size)]
+        scan = _scan(weights)
+        alias = AliasTable(weights).sample
+
+        def scanned(rng, count, scan=scan):
+            uniform = rng.random
+            for _ in range(count):
+                scan(uniform())
+
+        def aliased(rng, count, alias=alias):
+            uniform = rng.random
+            for _ in range(count):
+                alias(uniform())
+
+        print(
+            f"  {size:>3} entries: scan {per_second(scanned, draws):>12,.0f}"
+            f"  alias {per_second(aliased, draws):>12,.0f}"
+        )
+
+    names = ["Yeti", "Golem de Gelo", "Espectro Congelado"] * 4
+    hordes = draws // len(names)
+
+    def one_by_one(rng, count):
+        for _ in range(count // len(names)):
+            [ItemsFactory.get_loot_for_monster(name, rng) for name in names]
+
+    def bulk(rng, count):
+        for _ in range(count // len(names)):
+            ItemsFactory.get_loot_for_monsters(names, rng)
+
+    ItemsFactory.loot_tables()
+    print(f"{hordes} hordes of {len(names)} (monster loots per second)")
+    print(f"  one by one: {per_second(one_by_one, draws):>12,.0f}")
+    print(f"  bulk:       {per_second(bulk, draws):>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: memory held per domain object.
+
+Builds `count` objects of each kind, keeps them alive and reports the
+bytes tracemalloc attributes to them (the list holding them excluded):
+a Monster as built by the factories, a Weapon and a potion, and a Room
+with its (empty) monster and item lists.
+
+Usage:
+    uv run python benchmarks/bench_memory.py [count]
+"""
+
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.consumable_item import ConsumableItem  # noqa: E402
+from domain.element import Element  # noqa: E402
+from domain.monster import Monster  # noqa: E402
+from domain.room import Room  # noqa: E402
+from domain.weapon import Weapon  # noqa: E402
+
+
+def _monster():
+    return Monster(
+        name="goblin", max_life=100, attack=10, speed=5, element=Element.FIRE
+    )
+
+
+def _weapon():
+    return Weapon(name="espada", base_damage=15, element=Element.ICE)
+
+
+def _potion():
+    return ConsumableItem("poção", "Cura", 1, 20)
+
+
+def _room():
+    return Room("Uma sala úmida.", Element.NEUTRAL)
+
+
+def bytes_per_object(build, count: int) -> float:
+    objects = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for index in range(count):
+        objects[index] = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (after - before) / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    print(f"{count} objects of each kind")
+    for label, build in (
+        ("Monster", _monster),
+        ("Weapon", _weapon),
+        ("Potion", _potion),
+        ("Room", _room),
+    ):
+        print(f"{label:>8}: {bytes_per_object(build, count):>7.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark: reading stats through the modifier stack.
+
+Times `warrior.attack` without modifiers, enraged and burned (the cached
+effective value), and a full rage cycle (`to_rage` + `reset_rage`), which
+pushes and pops three modifiers.
+
+Usage:
+    uv run python benchmarks/bench_modifiers.py [reads]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.state import BurnState  # noqa: E402
+from domain.warrior import Warrior  # noqa: E402
+
+
+def _warrior() -> Warrior:
+    return Warrior(
+        name="Knight", max_life=100, current_life=100, attack=10, speed=5, shield=20
+    )
+
+
+def per_read(warrior: Warrior, reads: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(reads):
+            warrior.attack
+        best = min(best, time.perf_counter() - start)
+    return best / reads * 1e9
+
+
+def per_cycle(warrior: Warrior, cycles: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(cycles):
+            warrior.to_rage()
+            warrior.reset_rage()
+        best = min(best, time.perf_counter() - start)
+    return best / cycles * 1e9
+
+
+def main() -> None:
+    reads = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+
+    plain = _warrior()
+    enraged = _warrior()
+    enraged.add_status(BurnState(duration_turns=5, attack_decrease=3))
+    enraged.tick_statuses()
+    enraged.to_rage()
+
+    print(f"{reads} reads, best of 5 (ns per read)")
+    print(f"  no modifiers:    {per_read(plain, reads):>7.0f}")
+    print(f"  burned, enraged: {per_read(enraged, reads):>7.0f}")
+    print(f"rage on/off (ns per cycle): {per_cycle(_warrior(), reads // 10):>7.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: monster spawns per second.
+
+Compares building a monster as `MonsterFactory` used to (scaling formulas,
+art lookup, description and the constructor, in trusted mode) with copying
+its cached prototype, with and without a `MonsterPool`, and times the full
+`create_monster` (loot rolls included) and `LevelFactory.create_room`.
+
+Usage:
+    uv run python benchmarks/bench_monster_spawns.py [spawns]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.element import Element  # noqa: E402
+from domain.fields import trusted  # noqa: E402
+from domain.monster import Monster  # noqa: E402
+from domain.rng import RandomStream  # noqa: E402
+from services.arts import MONSTER_ARTS  # noqa: E402
+from services.level_factory import LevelFactory  # noqa: E402
+from services.monster_factory import MonsterFactory, MonsterPool  # noqa: E402
+
+
+def _built(name="Yeti", level=7, element=Element.ICE) -> Monster:
+    """The monster part of `create_monster` before the prototypes."""
+    max_life = 55 + (level * 10)
+    attack = 8 + (level * 5)
+    speed = 5 + level
+    art = MONSTER_ARTS.get(name, MONSTER_ARTS["DEFAULT"])
+    description = (
+        f"{name} de nível {level}. "
+        f"Uma criatura imbuída com o poder de {element.name.lower()}."
+    )
+    with trusted():
+        return Monster(
+            name=name,
+            max_life=max_life,
+            attack=attack,
+            speed=speed,
+            element=element,
+            loot=[],
+            description=description,
+            art=art,
+        )
+
+
+def per_second(spawn, count: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(count):
+            spawn()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    prototype = MonsterFactory.prototype("Yeti", 7, Element.ICE)
+    pool = MonsterPool()
+
+    def pooled():
+        monster = pool.acquire(prototype, [])
+        monster.current_life = 0
+        pool.release(monster)
+
+    rng = RandomStream(42)
+
+    print(f"{count} spawns, best of 5 (spawns per second)")
+    print(f"  constructor:     {per_second(_built, count):>12,.0f}")
+    print(f"  prototype copy:  {per_second(prototype.spawn, count):>12,.0f}")
+    print(f"  pooled respawn:  {per_second(pooled, count):>12,.0f}")
+    print(
+        f"  create_monster:  "
+        f"{per_second(lambda: MonsterFactory.create_monster(7, rng=rng), count):>12,.0f}"
+    )
+    rooms = count // 10
+    print(
+        f"  create_room:     "
+        f"{per_second(lambda: LevelFactory.create_room(7, rng=rng), rooms):>12,.0f}"
+        " rooms"
+    )
+
+
+if __name__ == "__main__":
+    main()
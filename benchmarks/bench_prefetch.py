@@ -0,0 +1,64 @@
+"""
+Benchmark: time to move forward to the next room, with and without prefetch.
+
+Walks a run floor by floor as `GameManager.run_exploration_loop` does,
+with a short pause per floor standing for the player picking actions in
+combat. Without a prefetcher the next room is generated when the hero
+moves forward; with a `RoomPrefetcher` it was generated on a worker during
+the pause and only handed over. Reports the median and worst latency of
+moving forward.
+
+Usage:
+    uv run python benchmarks/bench_prefetch.py [floors] [pause_ms]
+"""
+
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from services.items_factory import ItemsFactory  # noqa: E402
+from services.level_factory import FloorWindow, RoomPrefetcher  # noqa: E402
+
+SEED = 2024
+
+
+def walk(floors: int, pause: float, prefetch: bool) -> list[float]:
+    window = FloorWindow(SEED)
+    prefetcher = RoomPrefetcher(window) if prefetch else None
+    latencies = []
+
+    for level in range(1, floors + 1):
+        start = time.perf_counter()
+        room = prefetcher.room(level) if prefetcher else window.room(level)
+        latencies.append(time.perf_counter() - start)
+        if prefetcher:
+            prefetcher.prefetch(level + 1)
+
+        time.sleep(pause)  # the player, in combat
+        for _ in room.monsters:
+            room.remove_defeated_monster()
+
+    if prefetcher:
+        prefetcher.close()
+    return latencies
+
+
+def main() -> None:
+    floors = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    pause = (float(sys.argv[2]) if len(sys.argv) > 2 else 2.0) / 1000
+    ItemsFactory.loot_tables()
+
+    print(f"{floors} floors, {pause * 1000:.1f} ms in each (microseconds to enter)")
+    for label, prefetch in (("on the spot", False), ("prefetched", True)):
+        latencies = [seconds * 1e6 for seconds in walk(floors, pause, prefetch)]
+        print(
+            f"  {label:>11}: median {statistics.median(latencies):>8.1f}"
+            f"  worst {max(latencies):>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark: d100 combat rolls, one call at a time vs. pre-drawn blocks.
+
+Times `randint(1, 100)` on a `RandomStream` against its buffered `d100`
+(with `random()` for reference), and an Archer dodge check
+(`attempted_dodge`) with and without a stream assigned.
+
+Usage:
+    uv run python benchmarks/bench_rng.py [rolls]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.archer import Archer  # noqa: E402
+from domain.rng import RandomStream  # noqa: E402
+
+
+def per_call(call, rolls: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(rolls):
+            call()
+        best = min(best, time.perf_counter() - start)
+    return best / rolls * 1e9
+
+
+def main() -> None:
+    rolls = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    stream = RandomStream(42)
+
+    print(f"{rolls} rolls, best of 5 (ns per roll)")
+    print(f"  randint(1, 100): {per_call(lambda: stream.randint(1, 100), rolls):>6.0f}")
+    print(f"  d100():          {per_call(stream.d100, rolls):>6.0f}")
+    print(f"  random():        {per_call(stream.random, rolls):>6.0f}")
+
+    archer = Archer(name="Legolas", max_life=100, current_life=100, attack=10, speed=30)
+    print("Archer.attempted_dodge (ns per check)")
+    archer.rng = random
+    print(f"  random module:   {per_call(archer.attempted_dodge, rolls):>6.0f}")
+    archer.rng = stream
+    print(f"  stream:          {per_call(archer.attempted_dodge, rolls):>6.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: RoomBattle slot throughput as the room grows.
+
+One hero against N monsters that cannot die; every round each monster
+strikes once, so the cost per slot shows how the initiative queue scales
+(a re-sort per round would grow with N log N per round instead).
+
+Usage:
+    uv run python benchmarks/bench_room_battle.py [rounds]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.element import Element  # noqa: E402
+from domain.monster import Monster  # noqa: E402
+from domain.rng import RandomStream  # noqa: E402
+from domain.weapon import Weapon  # noqa: E402
+from services.hero_factory import HeroFactory  # noqa: E402
+from services.room_battle import RoomBattle  # noqa: E402
+
+ENDLESS_LIFE = 10**9
+SIZES = (10, 100, 1000)
+
+
+def _make_battle(size: int) -> RoomBattle:
+    hero = HeroFactory.create_hero("warrior", "Bench")
+    weapon = next(i for i in hero.inventory.items if isinstance(i, Weapon))
+    hero.equip_weapon(weapon)
+    hero.max_life = ENDLESS_LIFE
+    hero.current_life = ENDLESS_LIFE
+
+    monsters = [
+        Monster(
+            name=f"Saco {i}",
+            max_life=ENDLESS_LIFE,
+            attack=1,
+            speed=i % 50,
+            element=Element.NEUTRAL,
+        )
+        for i in range(size)
+    ]
+    return RoomBattle(hero, monsters, headless=True, rng=RandomStream(42))
+
+
+def run(size: int, rounds: int) -> float:
+    battle = _make_battle(size)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        battle.execute_turn("1")
+    elapsed = time.perf_counter() - start
+
+    return rounds * (size + 1) / elapsed
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print(f"{rounds} rounds per room")
+    for size in SIZES:
+        slots = run(size, rounds)
+        print(f"{size:>5} monsters: {slots:>10,.0f} slots/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: saved run size and load time against the depth of the run.
+
+A run is saved as its seed plus the `Room.delta` of its recent floors, so
+neither the JSON of the game state nor the time to rebuild the current
+room from it (parse, `FloorWindow.restore`, generate the room) should
+depend on how deep the hero is.
+
+Usage:
+    uv run python benchmarks/bench_save_run.py [loads]
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from services.game_state import GameState  # noqa: E402
+from services.hero_factory import HeroFactory  # noqa: E402
+from services.level_factory import FloorWindow  # noqa: E402
+
+SEED = 2024
+
+
+def saved_run(hero, depth: int) -> str:
+    """The game state JSON of a run saved at `depth`, recent floors cleared."""
+    window = FloorWindow(SEED)
+    for level in range(max(depth - window.capacity + 1, 1), depth + 1):
+        room = window.room(level)
+        while room.monsters:
+            room.remove_defeated_monster()
+
+    state = GameState.create_new_game(hero, endless=True)
+    state.current_level = depth
+    state.seed = SEED
+    state.battles_fought = 2 * depth
+    state.room_deltas = window.deltas()
+    return json.dumps(state.to_dict())
+
+
+def load(hero, saved: str):
+    state = GameState.from_dict(json.loads(saved), hero)
+    window = FloorWindow(state.seed)
+    window.restore(state.room_deltas)
+    return window.room(state.current_level)
+
+
+def loads_per_second(hero, saved: str, loads: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(loads):
+            load(hero, saved)
+        best = min(best, time.perf_counter() - start)
+    return loads / best
+
+
+def main() -> None:
+    loads = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    hero = HeroFactory.create_hero("warrior", "Conan")
+
+    print(f"{loads} loads, best of 5")
+    for depth in (5, 100, 10_000, 1_000_000):
+        saved = saved_run(hero, depth)
+        print(
+            f"  floor {depth:>9}: {len(saved):>4} bytes"
+            f"  {loads_per_second(hero, saved, loads):>8,.0f} loads/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: branching a Battle with snapshot/restore vs copy.deepcopy.
+
+Each branch saves the fight, plays one turn and goes back, which is what a
+search over the hero's actions does at every node.
+
+Usage:
+    uv run python benchmarks/bench_snapshot.py [branches]
+"""
+
+import copy
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.element import Element  # noqa: E402
+from domain.monster import Monster  # noqa: E402
+from domain.rng import RandomStream  # noqa: E402
+from services.battle import Battle  # noqa: E402
+from services.simulation import create_simulation_hero  # noqa: E402
+
+
+def _make_battle(archetype: str) -> Battle:
+    hero = create_simulation_hero(archetype)
+    monster = Monster("Saco de Pancadas", 10**6, 20, 12, Element.ICE)
+    return Battle(hero, monster, headless=True, rng=RandomStream(42))
+
+
+def run_deepcopy(archetype: str, branches: int) -> float:
+    battle = _make_battle(archetype)
+    start = time.perf_counter()
+    for _ in range(branches):
+        branch = copy.deepcopy(battle)
+        branch.execute_turn("1")
+    return branches / (time.perf_counter() - start)
+
+
+def run_snapshot(archetype: str, branches: int) -> float:
+    battle = _make_battle(archetype)
+    start = time.perf_counter()
+    for _ in range(branches):
+        saved = battle.snapshot()
+        battle.execute_turn("1")
+        battle.restore(saved)
+    return branches / (time.perf_counter() - start)
+
+
+def main() -> None:
+    branches = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    print(f"{'archetype':<10} {'deepcopy':>14} {'snapshot':>14} {'speedup':>8}")
+    for archetype in ("warrior", "mage", "archer"):
+        deep = run_deepcopy(archetype, branches // 10)
+        snap = run_snapshot(archetype, branches)
+        print(
+            f"{archetype:<10} {deep:>10,.0f} b/s {snap:>10,.0f} b/s "
+            f"{snap / deep:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
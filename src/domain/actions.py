@@ -0,0 +1,137 @@
+"""
+Combat action registry.
+
+Each archetype declares its actions once, as `ActionSpec`s in its `ACTIONS`
+class attribute; the consumables of the inventory become specs too. A hero's
+`action_view()` binds them to the hero and keeps the result until the
+equipped weapon or the inventory changes, so the menu and the battle look
+actions up by key instead of rebuilding a dict of bound methods every turn.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+from domain.consumable_item import ConsumableItem
+
+if TYPE_CHECKING:
+    from domain.hero import Hero
+
+# Targeting
+ENEMY = "enemy"
+ALL_ENEMIES = "all_enemies"
+SELF = "self"
+
+CONSUMABLE_PREFIX = "p"
+
+
+@dataclass(frozen=True, slots=True)
+class ActionSpec:
+    """
+    Declaration of one combat action.
+
+    Attributes:
+        key (str): Menu key (e.g. "1").
+        method (str): Name of the hero method that performs it.
+        description (str | Callable): Menu label, or a function of the hero
+            for labels that show its stats (weapon name, mana...).
+        targeting (str): ENEMY, ALL_ENEMIES or SELF.
+        resource (str | None): "ammo" or "mana" if the action spends it.
+        cost (int): Fixed cost in `resource`; 0 when the weapon defines it.
+        consumes_turn (bool): Whether using it ends the hero's turn.
+        requires_weapon (bool): Only offered with a weapon equipped.
+        live (bool): The label shows values that change between turns
+            (e.g. current mana), so it is refreshed on every read.
+    """
+
+    key: str
+    method: str
+    description: str | Callable[["Hero"], str]
+    targeting: str = ENEMY
+    resource: str | None = None
+    cost: int = 0
+    consumes_turn: bool = True
+    requires_weapon: bool = False
+    live: bool = False
+
+    def describe(self, hero: "Hero") -> str:
+        if callable(self.description):
+            return self.description(hero)
+        return self.description
+
+
+@dataclass(frozen=True, slots=True)
+class BoundAction:
+    """An `ActionSpec` bound to a hero (and to the item, for consumables)."""
+
+    spec: ActionSpec
+    method: Callable
+    description: str
+    item: ConsumableItem | None = None
+
+
+def consumable_spec(index: int, item: ConsumableItem) -> ActionSpec:
+    """Spec of the `index`-th consumable of the inventory (keys p1, p2...)."""
+    return ActionSpec(
+        key=f"{CONSUMABLE_PREFIX}{index}",
+        method="use",
+        description=item.name,
+        targeting=SELF,
+        resource=item.recovery_type,
+    )
+
+
+class ActionView:
+    """
+    The actions of one hero, bound and laid out for the menus.
+
+    `menu`, `area_menu` and `consumable_menu` keep the
+    `{key: {"description", "method"}}` format of `Hero.get_actions`; they
+    are shared with every caller and must not be modified.
+    """
+
+    def __init__(self, hero: "Hero"):
+        self.weapon = hero.equipped_weapon
+        self.inventory = hero.inventory
+        self.version = self.inventory.version
+
+        self.actions: dict[str, BoundAction] = {}
+        self.menu: dict[str, dict] = {}
+        self.area_menu: dict[str, dict] = {}
+        self.consumable_menu: dict[str, dict] = {}
+        self._live: list[tuple[dict, ActionSpec]] = []
+
+        for spec in type(hero).ACTIONS:
+            if spec.requires_weapon and self.weapon is None:
+                continue
+            menu = self.area_menu if spec.targeting == ALL_ENEMIES else self.menu
+            self._bind(hero, spec, getattr(hero, spec.method), menu)
+
+        consumables = [
+            item for item in self.inventory.items if isinstance(item, ConsumableItem)
+        ]
+        for index, item in enumerate(consumables, 1):
+            self._bind(
+                hero, consumable_spec(index, item), item.use, self.consumable_menu, item
+            )
+
+    def _bind(self, hero, spec, method, menu, item=None) -> None:
+        description = spec.describe(hero)
+        self.actions[spec.key] = BoundAction(spec, method, description, item)
+        entry = {"description": description, "method": method}
+        menu[spec.key] = entry
+        if spec.live:
+            self._live.append((entry, spec))
+
+    def is_current(self, hero: "Hero") -> bool:
+        """False once the weapon or the inventory changed since the build."""
+        inventory = hero.inventory
+        return (
+            hero.equipped_weapon is self.weapon
+            and inventory is self.inventory
+            and inventory.version == self.version
+        )
+
+    def refresh(self, hero: "Hero") -> None:
+        """Re-renders the labels that show live values."""
+        for entry, spec in self._live:
+            entry["description"] = spec.describe(hero)
@@ -4,7 +4,29 @@ from domain.entity import Entity
 from domain import state
 from domain.ranged_weapon import RangedWeapon
 from domain.inventory import Inventory
-import random
+from domain.area_damage import apply_area_damage
+from domain.actions import ALL_ENEMIES, SELF, ActionSpec
+from domain.events import AmmoChanged, Dodged, StanceEntered
+from domain.fields import field, greater_than
+from domain.modifiers import Modifier
+from domain.rng import roll_d100
+
+# An aimed shot hits 40% harder.
+AIM_MODIFIER = Modifier("attack", "aim", ratio=0.4)
+
+
+def _check_ammo(archer: "Archer", value: int) -> None:
+    if value < 0:
+        raise ValueError("Current ammo cannot be a negative number")
+    if value > archer.max_ammo:
+        raise ValueError("Current ammo must not be greater than max_ammo")
+
+
+def _publish_ammo(archer: "Archer", value: int) -> int:
+    bus = archer.event_bus
+    if bus is not None and value != archer._current_ammo:
+        bus.emit(AmmoChanged, archer, archer._current_ammo, value)
+    return value
 
 
 class Archer(Hero):
@@ -24,6 +46,42 @@ class Archer(Hero):
         is_aiming (bool): State indicating if the Archer is focused (cant dodge, buffs damage).
     """
 
+    ULTIMATE_AMMO_COST = 3
+    ARROW_RAIN_AMMO_COST = 3
+
+    __slots__ = ("_max_ammo", "_current_ammo", "_dodge", "_is_aiming")
+
+    ACTIONS = (
+        ActionSpec(
+            "1",
+            "strike",
+            "Atirar (Ataque básico com arma, gasta 1 flecha)",
+            resource="ammo",
+        ),
+        ActionSpec(
+            "2",
+            "aim",
+            "Mirar (acerto garantido, sacrifica esquiva, aumenta de leve o dano)",
+            targeting=SELF,
+        ),
+        ActionSpec("3", "reload", "Recarregar (recarrega a munição)", targeting=SELF),
+        ActionSpec(
+            "4",
+            "ultimate",
+            "Tiro Triplo (Gasta 3 flechas, se dá 10 de dano, mas inflige muito dano)",
+            resource="ammo",
+            cost=ULTIMATE_AMMO_COST,
+        ),
+        ActionSpec(
+            "5",
+            "arrow_rain",
+            "Chuva de Flechas (Gasta 3 flechas, atinge todos os inimigos)",
+            targeting=ALL_ENEMIES,
+            resource="ammo",
+            cost=ARROW_RAIN_AMMO_COST,
+        ),
+    )
+
     def __init__(
         self,
         name: str,
@@ -58,58 +116,23 @@ class Archer(Hero):
             self.equip_weapon(equipped_weapon)
         self.is_aiming = is_aiming
 
-    @property
-    def max_ammo(self):
-        return self._max_ammo
-
-    @max_ammo.setter
-    def max_ammo(self, value):
-        if not isinstance(value, int):
-            raise TypeError("Max ammo must be a int")
-
-        if value <= 0:
-            raise ValueError("Max ammo cannot be negative or 0")
-
-        self._max_ammo = value
-
-    @property
-    def current_ammo(self):
-        return self._current_ammo
-
-    @current_ammo.setter
-    def current_ammo(self, value):
-        if not isinstance(value, int):
-            raise TypeError("Current ammo must be a int")
-
-        if value < 0:
-            raise ValueError("Current ammo cannot be a negative number")
-
-        if value > self.max_ammo:
-            raise ValueError("Current ammo must not be greater than max_ammo")
-
-        self._current_ammo = value
-
-    @property
-    def dodge(self):
-        return self._dodge
-
-    @dodge.setter
-    def dodge(self, value):
-        if not isinstance(value, bool):
-            raise TypeError("Deviation probability needs to be true or false")
-
-        self._dodge = value
-
-    @property
-    def is_aiming(self):
-        return self._is_aiming
-
-    @is_aiming.setter
-    def is_aiming(self, value):
-        if not isinstance(value, bool):
-            raise TypeError("Is aiming needs to be True or False")
-
-        self._is_aiming = value
+    # FIELDS (see `domain.fields`):
+
+    max_ammo = field(
+        "_max_ammo",
+        int,
+        "Max ammo must be a int",
+        check=greater_than(0, "Max ammo cannot be negative or 0"),
+    )
+    current_ammo = field(
+        "_current_ammo",
+        int,
+        "Current ammo must be a int",
+        check=_check_ammo,
+        normalize=_publish_ammo,
+    )
+    dodge = field("_dodge", bool, "Deviation probability needs to be true or false")
+    is_aiming = field("_is_aiming", bool, "Is aiming needs to be True or False")
 
     def equip_weapon(self, weapon: RangedWeapon):
         if not isinstance(weapon, RangedWeapon):
@@ -122,33 +145,34 @@ class Archer(Hero):
         Attack enemies - lembrar de modificar esse método em guerreiro
         """
 
-        normal_attack = self.attack
         if self.equipped_weapon is None:
             raise ValueError("No weapon equiped")
 
         if self.is_aiming:
-            self.attack = int(self.attack + (self.attack / 2.5))
+            self.add_modifier(AIM_MODIFIER)
         try:
             self.equipped_weapon.attack(self, target)
         finally:
             # Still happens yet the weapon method fail
-            self.is_aiming = False
-            self.attack = normal_attack
+            if self.is_aiming:
+                self.is_aiming = False
+                self.remove_modifiers("aim")
 
     def damage_received(self, value: int, strike_element: Element) -> None:
         """Calculates dodge chance first, then applies damage if not dodged."""
-        # Roll dodge BEFORE taking damage so battle.py can compare life before/after
         self.attempted_dodge()
 
         if self.dodge:
             # Dodge successful: reset flag and skip damage entirely
-            self.last_dodged = True
             self.reset_dodge()
+            bus = self.event_bus
+            if bus is not None:
+                bus.emit(Dodged, self)
             return
 
-        multiplier = strike_element.multiplier(self.element)
+        multiplier = self.element_matrix.multiplier(strike_element, self.element)
         final_damage = multiplier * value
-        self.current_life -= int(final_damage)
+        self._take_damage(int(final_damage), strike_element)
 
     def attempted_dodge(self) -> None:
         """Calculate dodge based on speed and randomness"""
@@ -157,13 +181,13 @@ class Archer(Hero):
             self.reset_dodge()
             return
 
-        chance = random.randint(1, 100)
+        chance = roll_d100(self.rng)
         self.dodge = chance <= self.speed
 
     def ultimate(self, target: Entity):
         """Archer's special attack. Costs lots of arrows and a bit of life, deals lots of damage."""
 
-        ammo_cost = 3
+        ammo_cost = self.ULTIMATE_AMMO_COST
 
         if self.current_ammo < ammo_cost:
             return f"{self.name} não tem munição suficiente para isso."
@@ -180,6 +204,27 @@ class Archer(Hero):
 
         return f"{self.name} sacrifica sua própria vitalidade para disparar um TIRO TRIPLO letal em {target.name}! Causou {damage} de dano."
 
+    def arrow_rain(self, targets: list[Entity]) -> str:
+        """Fires a volley into the air. Costs 3 arrows and hits every target."""
+
+        ammo_cost = self.ARROW_RAIN_AMMO_COST
+
+        if self.equipped_weapon is None:
+            raise ValueError("No weapon equiped")
+
+        if self.current_ammo < ammo_cost:
+            raise ValueError(
+                f"{self.name} não tem flechas suficientes para a Chuva de Flechas."
+            )
+
+        self.current_ammo -= ammo_cost
+        weapon = self.equipped_weapon
+        damages = apply_area_damage(
+            targets, weapon.base_damage + self.attack, weapon.element
+        )
+
+        return f"{self.name} dispara uma CHUVA DE FLECHAS sobre {len(damages)} inimigo(s)! {sum(damages)} de dano no total."
+
     def reset_dodge(self) -> None:
         """Reset dodge after deviating"""
         self.dodge = False
@@ -193,6 +238,30 @@ class Archer(Hero):
         self.is_aiming = True
         self.dodge = False
 
+        bus = self.event_bus
+        if bus is not None:
+            bus.emit(StanceEntered, self, "aiming")
+
+    def snapshot(self) -> tuple:
+        """Entity snapshot plus ammo, dodge and aim (see `Entity.snapshot`)."""
+        return (
+            super().snapshot(),
+            self._max_ammo,
+            self._current_ammo,
+            self._dodge,
+            self._is_aiming,
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        (
+            base,
+            self._max_ammo,
+            self._current_ammo,
+            self._dodge,
+            self._is_aiming,
+        ) = snapshot
+        super().restore(base)
+
     def end_of_turn_routine(self):
         """Resets aiming for GameManager using."""
         pass
@@ -206,33 +275,9 @@ class Archer(Hero):
         ammo_increase = points - speed_increase
         attack_increase = ammo_increase
 
-        self.speed += speed_increase
+        self.speed = self.base_stat("speed") + speed_increase
         self.max_ammo += ammo_increase
-        self.attack += attack_increase
+        self.attack = self.base_stat("attack") + attack_increase
 
         self.max_life += 10
         self.current_life += 10
-
-    def get_actions(self) -> dict:
-        """
-        Returns available combat actions for this archetype.
-        """
-
-        return {
-            "1": {
-                "description": "Atirar (Ataque básico com arma, gasta 1 flecha)",
-                "method": self.strike,
-            },
-            "2": {
-                "description": "Mirar (acerto garantido, sacrifica esquiva, aumenta de leve o dano)",
-                "method": self.aim,
-            },
-            "3": {
-                "description": "Recarregar (recarrega a munição)",
-                "method": self.reload,
-            },
-            "4": {
-                "description": "Tiro Triplo (Gasta 3 flechas, se dá 10 de dano, mas inflige muito dano)",
-                "method": self.ultimate,
-            },
-        }
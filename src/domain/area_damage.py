@@ -0,0 +1,61 @@
+"""
+Area-of-effect damage: one hit applied to many entities in a single pass.
+
+`Entity.damage_received` looks the elemental multiplier up in the target's
+`ElementMatrix` for every strike. Over a horde of hundreds of monsters the
+strike's row is fetched once per matrix instead (a room shares one), and
+each target only indexes it with its element before `Entity._take_damage`.
+
+Entities with their own defense (Warrior block, Archer dodge, ...) override
+`damage_received`; those still go through it, so their rolls happen as in
+a normal strike.
+"""
+
+from typing import Iterable
+
+from domain.element import Element
+from domain.entity import Entity
+
+_base_damage_received = Entity.damage_received
+# type -> True if it keeps the Entity rule (no defense of its own)
+_plain_types: dict[type, bool] = {}
+
+
+def _is_plain(cls: type) -> bool:
+    plain = _plain_types[cls] = cls.damage_received is _base_damage_received
+    return plain
+
+
+def apply_area_damage(
+    targets: Iterable[Entity], value: int, strike_element: Element
+) -> list[int]:
+    """
+    Deals `value` damage of `strike_element` to every target.
+
+    Returns:
+        list[int]: Life actually lost by each target, in order.
+    """
+    strike = strike_element.index
+    last = row = None
+    damages = []
+
+    for target in targets:
+        # The cache is read inline: a call per target costs as much as the hit.
+        plain = _plain_types.get(type(target))
+        if plain is None:
+            plain = _is_plain(type(target))
+        if not plain:
+            before = target.current_life
+            target.damage_received(value, strike_element)
+            damages.append(before - target.current_life)
+            continue
+
+        matrix = target.element_matrix
+        if matrix is not last:
+            last = matrix
+            row = matrix.rows[strike]
+
+        multiplier = row[target.element.index]
+        damages.append(target._take_damage(int(value * multiplier), strike_element))
+
+    return damages
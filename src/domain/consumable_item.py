@@ -1,5 +1,13 @@
 from domain.item import Item
 from domain.entity import Entity
+from domain.fields import field, greater_than
+
+
+def _check_recovery_type(item: "ConsumableItem", value) -> None:
+    if value not in item.VALID_RECOVERY_TYPES:
+        raise ValueError(
+            f"recovery_type must be one of {item.VALID_RECOVERY_TYPES}, got '{value}'."
+        )
 
 
 class ConsumableItem(Item):
@@ -11,6 +19,8 @@ class ConsumableItem(Item):
         recovery_type (str): What is restored — "life" (default) or "mana".
     """
 
+    __slots__ = ("_recovered_value", "_recovery_type")
+
     VALID_RECOVERY_TYPES = ("life", "mana")
 
     def __init__(
@@ -25,31 +35,20 @@ class ConsumableItem(Item):
         self.recovered_value = recovered_value
         self.recovery_type = recovery_type
 
-    @property
-    def recovered_value(self):
-        return self._recovered_value
-
-    @recovered_value.setter
-    def recovered_value(self, value):
-        if not isinstance(value, int):
-            raise TypeError("Recovered Value needs to be a whole number.")
-
-        if value <= 0:
-            raise ValueError("Recovered Value Must be greater than 0")
-
-        self._recovered_value = value
+    # FIELDS (see `domain.fields`):
 
-    @property
-    def recovery_type(self):
-        return self._recovery_type
+    recovered_value = field(
+        "_recovered_value",
+        int,
+        "Recovered Value needs to be a whole number.",
+        check=greater_than(0, "Recovered Value Must be greater than 0"),
+    )
+    recovery_type = field("_recovery_type", object, "", check=_check_recovery_type)
 
-    @recovery_type.setter
-    def recovery_type(self, value):
-        if value not in self.VALID_RECOVERY_TYPES:
-            raise ValueError(
-                f"recovery_type must be one of {self.VALID_RECOVERY_TYPES}, got '{value}'."
-            )
-        self._recovery_type = value
+    def _copy_into(self, clone: "ConsumableItem") -> None:
+        super()._copy_into(clone)
+        clone._recovered_value = self._recovered_value
+        clone._recovery_type = self._recovery_type
 
     def use(self, target: Entity) -> None:
         if self.recovery_type == "mana":
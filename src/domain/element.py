@@ -1,4 +1,20 @@
+"""
+Game elements and the matrix of their damage multipliers.
+
+The element rules are content: the chart of `ELEMENTS_PACK` says who deals
+more damage to whom and how the element of a room strengthens or weakens
+strikes (see `ElementMatrix.from_config`). `ElementMatrix` turns it into a
+table of every (strike, target) multiplier once, so a hit costs two tuple
+lookups instead of rebuilding the rules. Adding an element means adding its
+`Element` member, with the next index, and its entries in the chart.
+"""
+
+import json
 from enum import Enum
+from pathlib import Path
+from typing import Iterable, Mapping
+
+ELEMENTS_PACK = Path(__file__).resolve().parent.parent / "content" / "elements.json"
 
 
 class Element(Enum):
@@ -17,35 +33,158 @@ class Element(Enum):
         NEUTRAL: Neutral element.
     """
 
-    FIRE = "fire"
-    ICE = "ice"
-    LIGHTNING = "lightning"
-    POISON = "poison"
-    NEUTRAL = "neutral"
-
-    @property
-    def _advantages(self) -> dict["Element", "Element"]:
-        return {
-            Element.POISON: Element.LIGHTNING,
-            Element.LIGHTNING: Element.ICE,
-            Element.ICE: Element.FIRE,
-            Element.FIRE: Element.POISON,
-        }
+    # (value, row/column of the element in every `ElementMatrix`)
+    FIRE = "fire", 0
+    ICE = "ice", 1
+    LIGHTNING = "lightning", 2
+    POISON = "poison", 3
+    NEUTRAL = "neutral", 4
 
-    def has_advantage_over(self, other: "Element") -> bool:
-        if self == Element.NEUTRAL or other == Element.NEUTRAL:
-            return False
+    def __new__(cls, value: str, index: int) -> "Element":
+        element = object.__new__(cls)
+        element._value_ = value
+        element.index = index
+        return element
 
-        return self._advantages.get(self) == other
+    def has_advantage_over(self, other: "Element") -> bool:
+        return ELEMENT_MATRIX.rows[self.index][other.index] > 1.0
 
     def multiplier(self, other: "Element") -> float:
-        if self == Element.NEUTRAL or other == Element.NEUTRAL:
-            return 1.0
+        return ELEMENT_MATRIX.rows[self.index][other.index]
+
+
+# Multipliers of `from_chart` when the chart does not give its own.
+ADVANTAGE_MULTIPLIER = 2.0
+DISADVANTAGE_MULTIPLIER = 0.5
+
+
+class ElementMatrix:
+    """
+    Precomputed damage multipliers: `rows[strike.index][target.index]`.
+
+    Built from the element tables (`from_chart`) or from content data
+    (`from_config`). `for_environment` returns the variant of a room, built
+    once per environment; `as_array` exposes the same table to NumPy.
+    """
+
+    __slots__ = ("rows", "_modifiers", "_environments", "_array")
+
+    def __init__(
+        self,
+        rows: Iterable[Iterable[float]],
+        modifiers: Mapping[Element, Mapping[Element, float]] | None = None,
+    ):
+        self.rows: tuple[tuple[float, ...], ...] = tuple(tuple(row) for row in rows)
+        size = len(Element)
+        if len(self.rows) != size or any(len(row) != size for row in self.rows):
+            raise ValueError(f"The element matrix must be {size}x{size}")
+
+        self._modifiers = modifiers or {}
+        self._environments: dict[Element, ElementMatrix] = {}
+        self._array = None
+
+    @classmethod
+    def from_chart(
+        cls,
+        advantages: Mapping[Element, Element],
+        modifiers: Mapping[Element, Mapping[Element, float]] | None = None,
+        strong: float = ADVANTAGE_MULTIPLIER,
+        weak: float = DISADVANTAGE_MULTIPLIER,
+    ) -> "ElementMatrix":
+        """Builds the matrix of an advantage chart: {strike: target it beats}."""
+        rows = []
+        for strike in Element:
+            row = []
+            for target in Element:
+                if advantages.get(strike) == target:
+                    row.append(strong)
+                elif advantages.get(target) == strike:
+                    row.append(weak)
+                else:
+                    row.append(1.0)
+            rows.append(row)
+        return cls(rows, modifiers)
+
+    @classmethod
+    def from_config(cls, config: dict) -> "ElementMatrix":
+        """
+        Builds a matrix from content data, with elements named by value:
+
+            {"advantages": {"fire": "poison", ...},
+             "environments": {"fire": {"fire": 1.25, "ice": 0.75}, ...},
+             "strong": 2.0, "weak": 0.5}
+
+        Every key is optional; missing tables are empty.
+        """
+        try:
+            advantages = {
+                Element(strike): Element(target)
+                for strike, target in config.get("advantages", {}).items()
+            }
+            modifiers = {
+                Element(environment): {
+                    Element(strike): float(factor) for strike, factor in factors.items()
+                }
+                for environment, factors in config.get("environments", {}).items()
+            }
+        except (AttributeError, TypeError, ValueError) as error:
+            raise ValueError(f"Invalid element table: {error}") from error
+
+        return cls.from_chart(
+            advantages,
+            modifiers,
+            config.get("strong", ADVANTAGE_MULTIPLIER),
+            config.get("weak", DISADVANTAGE_MULTIPLIER),
+        )
+
+    def multiplier(self, strike: Element, target: Element) -> float:
+        return self.rows[strike.index][target.index]
+
+    def for_environment(self, environment: Element | None) -> "ElementMatrix":
+        """This matrix with the modifiers of a room of `environment` applied."""
+        factors = self._modifiers.get(environment)
+        if not factors:
+            return self
+
+        matrix = self._environments.get(environment)
+        if matrix is None:
+            scale = [factors.get(strike, 1.0) for strike in Element]
+            matrix = ElementMatrix(
+                [
+                    [value * scale[strike] for value in row]
+                    for strike, row in enumerate(self.rows)
+                ]
+            )
+            self._environments[environment] = matrix
+        return matrix
+
+    def as_array(self):
+        """The table as a read-only `numpy` array, `[strike, target]`."""
+        if self._array is None:
+            import numpy as np
+
+            array = np.array(self.rows, dtype=np.float64)
+            array.flags.writeable = False
+            self._array = array
+        return self._array
+
+    def environment_array(self):
+        """Every room variant stacked: `[environment, strike, target]`."""
+        import numpy as np
+
+        return np.stack(
+            [self.for_environment(environment).as_array() for environment in Element]
+        )
+
 
-        if self._advantages.get(self) == other:
-            return 2.0
+def element_chart(path: Path = ELEMENTS_PACK) -> dict:
+    """The element chart of the pack `path`, as `ElementMatrix.from_config` reads it."""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except ValueError as error:
+        raise ValueError(
+            f"Invalid element table '{Path(path).name}': {error}"
+        ) from None
 
-        if self._advantages.get(other) == self:
-            return 0.5
 
-        return 1.0
+ELEMENT_MATRIX = ElementMatrix.from_config(element_chart())
@@ -1,10 +1,11 @@
+import random
 from abc import ABC, abstractmethod
-from domain.element import Element
-from typing import TYPE_CHECKING
-from domain.state import State, NeutralState
-
-if TYPE_CHECKING:
-    from domain.state import State
+from domain.element import ELEMENT_MATRIX, Element, ElementMatrix
+from domain.events import DamageApplied, EventBus, Healed, StatusApplied
+from domain.fields import field, greater_than, not_blank, title_case
+from domain.modifiers import Modifier, ModifierStack
+from domain.state import NEUTRAL, State
+from domain.status_effects import StatusEffects
 
 
 class Entity(ABC):
@@ -18,12 +19,41 @@ class Entity(ABC):
     name (str): The entity's name.
     max_life (int): The maximum amount of life points.
     current_life (int): The current life. Never exceeds `max_life` and does not fall below 0.
-    attack (int): The entity's base attack power.
+    attack (int): The entity's attack power. Like every stat, reading it applies the
+        active modifiers (rage, burn...); setting it changes the base value.
     speed (int): The speed, usually used to calculate turn order or dodge.
     element (Element): The entity's elemental affinity (e.g., Fire, Ice, Neutral).
     current_status (State): The current condition state. (e.g., BurnState, PoisonedState, NeutralState).
+        With several effects active it is the most recent one; see `statuses`.
+    modifiers (tuple[Modifier, ...]): Active buffs and debuffs of the stats, in the
+        order they apply (see `domain.modifiers`).
+    rng: Source of the entity's dice rolls (dodge, block, weapon procs). Defaults to
+        the global `random` module; a Battle may assign its own `RandomStream`.
+    element_matrix (ElementMatrix): Multipliers of the strikes the entity takes.
+        Defaults to `ELEMENT_MATRIX`; a battle in an elemental room assigns that
+        room's variant (see `ElementMatrix.for_environment`).
+    event_bus (EventBus | None): Where the entity publishes what happens to it
+        (see `domain.events`). None outside a battle, which assigns its own.
+    is_active (bool): Whether the entity is still in the fight; a battle sets it
+        to False once the entity is defeated.
     """
 
+    # No per-instance __dict__: large simulated populations are kept in memory.
+    __slots__ = (
+        "_Entity__name",
+        "_Entity__max_life",
+        "_Entity__current_life",
+        "_Entity__attack",
+        "_Entity__speed",
+        "_Entity__element",
+        "_Entity__statuses",
+        "_modifiers",
+        "_Entity__rng",
+        "_Entity__element_matrix",
+        "event_bus",
+        "is_active",
+    )
+
     def __init__(
         self,
         name: str,
@@ -34,128 +64,145 @@ class Entity(ABC):
         current_status: State = None,
         element: Element = Element.NEUTRAL,
     ):
+        self.__rng = None
+        self.__element_matrix = None
+        self.event_bus: EventBus | None = None
+        self.is_active = True
+        self._modifiers: ModifierStack | None = None
         self.name = name
         self.max_life = max_life
         self.current_life = current_life
         self.attack = attack
         self.speed = speed
-        self.current_status = current_status
+        self.__statuses = None
+        if current_status is not None:
+            self.current_status = current_status
         self.element = element
 
-    @property
-    def name(self):
-        return self.__name
-
-    @name.setter
-    def name(self, valor):
-        if not isinstance(valor, str):
-            raise TypeError("the attribute Name must be a string")
-
-        if len((valor.strip())) == 0:
-            raise ValueError("Name cannot be empty")
-
-        self.__name = valor.strip().title()
+    # FIELDS (see `domain.fields`):
+
+    name = field(
+        "_Entity__name",
+        str,
+        "the attribute Name must be a string",
+        check=not_blank("Name cannot be empty"),
+        normalize=title_case,
+    )
+    max_life = field(
+        "_Entity__max_life",
+        int,
+        "Max life must be a whole number",
+        check=greater_than(0, "Max life must be greater than 0"),
+    )
+    current_life = field(
+        "_Entity__current_life",
+        int,
+        "Current life needs to be a whole number",
+        minimum=0,
+        maximum_of="_Entity__max_life",
+    )
+    attack = field(
+        "_Entity__attack",
+        int,
+        "The attack value needs to be a whole number",
+        minimum=0,
+        stat="attack",
+    )
+    speed = field(
+        "_Entity__speed",
+        int,
+        "The speed value needs to be a whole number",
+        minimum=0,
+        stat="speed",
+    )
+    element = field(
+        "_Entity__element",
+        Element,
+        "element must be a Element attribute. Example: 'Element.ICE'",
+    )
+
+    # Stat -> attribute holding its base value, for `base_stat`.
+    BASE_STATS = {"attack": "_Entity__attack", "speed": "_Entity__speed"}
 
     @property
-    def max_life(self):
-        return self.__max_life
-
-    @max_life.setter
-    def max_life(self, valor):
-        if not isinstance(valor, int):
-            raise TypeError("Max life must be a whole number")
+    def rng(self):
+        # The `random` module is the default, but is not kept per entity:
+        # modules can't be pickled or deep-copied.
+        rng = self.__rng
+        return random if rng is None else rng
 
-        if valor <= 0:
-            raise ValueError("Max life must be greater than 0")
-
-        self.__max_life = valor
+    @rng.setter
+    def rng(self, value):
+        self.__rng = None if value is random else value
 
     @property
-    def current_life(self):
-        return self.__current_life
-
-    @current_life.setter
-    def current_life(self, valor):
-        if not isinstance(valor, int):
-            raise TypeError("Current life needs to be a whole number")
+    def element_matrix(self) -> ElementMatrix:
+        matrix = self.__element_matrix
+        return ELEMENT_MATRIX if matrix is None else matrix
 
-        if valor < 0:
-            self.__current_life = 0
-
-        elif valor > self.max_life:
-            self.__current_life = self.max_life
-
-        else:
-            self.__current_life = valor
-
-    @property
-    def attack(self):
-        return self.__attack
-
-    @attack.setter
-    def attack(self, valor):
-        if not isinstance(valor, int):
-            raise TypeError("The attack value needs to be a whole number")
-
-        if valor < 0:
-            self.__attack = 0
-
-        else:
-            self.__attack = valor
-
-    @property
-    def speed(self):
-        return self.__speed
-
-    @speed.setter
-    def speed(self, valor):
-        if not isinstance(valor, int):
-            raise TypeError("The speed value needs to be a whole number")
-
-        if valor < 0:
-            self.__speed = 0
-
-        else:
-            self.__speed = valor
+    @element_matrix.setter
+    def element_matrix(self, value: ElementMatrix) -> None:
+        self.__element_matrix = None if value is ELEMENT_MATRIX else value
 
     @property
     def current_status(self):
-        return self.__current_status
+        statuses = self.__statuses
+        return NEUTRAL if statuses is None else statuses.current()
 
     @current_status.setter
     def current_status(self, valor):
+        """Replaces every active effect by `valor` (None or Neutral clears them)."""
         if valor is None:
-            self.__current_status = NeutralState()
-            return
+            valor = NEUTRAL
 
         if not isinstance(valor, State):
             raise TypeError("'new_status' must be a object from state")
 
-        self.__current_status = valor
+        statuses = self.__statuses
+        if statuses is not None:
+            for effect in statuses.active:
+                self.remove_modifiers(effect)
+        self.__statuses = None
+        if valor is not NEUTRAL:
+            self.add_status(valor)
 
     @property
-    def element(self):
-        return self.__element
-
-    @element.setter
-    def element(self, value):
-        if not isinstance(value, Element):
-            raise TypeError(
-                "element must be a Element attribute. Example: 'Element.ICE'"
-            )
-
-        self.__element = value
+    def statuses(self) -> tuple:
+        """Every active effect, oldest first."""
+        statuses = self.__statuses
+        return () if statuses is None else tuple(statuses.active)
 
     def damage_received(self, value: int, strike_element: Element) -> None:
         """
         Applies damage to the entity's current life, calculating the multiplier
         based on elemental weaknesses and strengths.
         """
-        multiplier = strike_element.multiplier(self.element)
+        multiplier = self.element_matrix.multiplier(strike_element, self.element)
 
         final_damage = int(value * multiplier)
 
-        self.current_life -= final_damage
+        self._take_damage(final_damage, strike_element)
+
+    def _take_damage(self, amount: int, strike_element: Element) -> int:
+        """
+        Removes `amount` life (never below 0), publishes `DamageApplied` and
+        returns the life actually lost.
+        """
+        # `amount` is an int computed by the damage rules: the field's checks
+        # would only repeat what is known, so the storage is written directly.
+        life = self.__current_life
+        new_life = life - amount
+        if new_life < 0:
+            new_life = 0
+        elif new_life > self.__max_life:
+            new_life = self.__max_life
+        self.__current_life = new_life
+
+        lost = life - new_life
+        bus = self.event_bus
+        if bus is not None:
+            bus.emit(DamageApplied, self, lost, strike_element)
+        return lost
 
     @abstractmethod
     def strike(self, target) -> None:
@@ -165,6 +212,72 @@ class Entity(ABC):
         """Change the entity`s current_status"""
         self.current_status = new_status
 
+    def add_status(self, new_status: State) -> None:
+        """
+        Stacks an effect over the active ones (Burned and Poisoned at once).
+        An active effect with the same name is replaced.
+        """
+        if not isinstance(new_status, State):
+            raise TypeError("'new_status' must be a object from state")
+        if new_status is NEUTRAL:
+            return
+
+        if self.__statuses is None:
+            self.__statuses = StatusEffects()
+        replaced = self.__statuses.add(new_status)
+        if replaced is not None:
+            self.remove_modifiers(replaced)
+
+        bus = self.event_bus
+        if bus is not None:
+            bus.emit(StatusApplied, self, new_status)
+
+    def has_status(self, name: str) -> bool:
+        statuses = self.__statuses
+        return statuses is not None and any(e.name == name for e in statuses.active)
+
+    def tick_statuses(self) -> None:
+        """
+        The start of the entity's turn: expired effects are dropped and the
+        others apply. Costs nothing for an entity without effects.
+        """
+        statuses = self.__statuses
+        if statuses is not None:
+            statuses.tick(self)
+
+    def preventing_status(self) -> State | None:
+        """The active effect that stops the entity from acting, if any."""
+        statuses = self.__statuses
+        return None if statuses is None else statuses.preventing()
+
+    # MODIFIERS:
+
+    @property
+    def modifiers(self) -> tuple[Modifier, ...]:
+        stack = self._modifiers
+        return () if stack is None else stack.snapshot()
+
+    def add_modifier(self, modifier: Modifier) -> None:
+        """Applies `modifier` on top of the active ones until it is removed."""
+        if modifier.stat not in self.BASE_STATS:
+            raise ValueError(f"{type(self).__name__} has no stat '{modifier.stat}'")
+
+        if self._modifiers is None:
+            self._modifiers = ModifierStack()
+        self._modifiers.push(modifier)
+
+    def remove_modifiers(self, source) -> None:
+        """Removes the modifiers added by `source`; the base stats are untouched."""
+        stack = self._modifiers
+        if stack is not None:
+            stack.remove(source)
+            if not stack:
+                self._modifiers = None
+
+    def base_stat(self, stat: str) -> int:
+        """The value of `stat` without modifiers (what setting the stat changes)."""
+        return getattr(self, self.BASE_STATS[stat])
+
     def is_it_alive(self) -> bool:
         return self.current_life > 0
 
@@ -180,7 +293,77 @@ class Entity(ABC):
         if value < 0:
             raise ValueError("Value to heal life must be greater than 0")
 
+        life = self.current_life
         self.current_life += value
 
         if self.current_life > self.max_life:
             self.current_life = self.max_life
+
+        bus = self.event_bus
+        if bus is not None:
+            bus.emit(Healed, self, self.current_life - life)
+
+    # RESPAWNING:
+
+    def _respawn(self, clone: "Entity | None" = None) -> "Entity":
+        """
+        `clone` (a new entity of the same type when None) with this entity's
+        name, stats and element, at full life and without combat state: no
+        statuses, modifiers, rng, event bus or element matrix of its own.
+        The values were valid, so no setters run; subclasses copy their slots.
+        """
+        if clone is None:
+            clone = object.__new__(type(self))
+        clone.__name = self.__name
+        clone.__max_life = self.__max_life
+        clone.__current_life = self.__max_life
+        clone.__attack = self.__attack
+        clone.__speed = self.__speed
+        clone.__element = self.__element
+        clone.__statuses = None
+        clone._modifiers = None
+        clone.__rng = None
+        clone.__element_matrix = None
+        clone.event_bus = None
+        clone.is_active = True
+        return clone
+
+    # SNAPSHOTS:
+
+    def snapshot(self) -> tuple:
+        """
+        Captures the values that change during combat as a flat tuple.
+
+        Used with `restore` to branch or undo a fight without `copy.deepcopy`:
+        nothing is copied, the status objects are kept with their own snapshots
+        and the (immutable) modifiers in a tuple.
+        Subclasses nest this tuple as the first item of theirs.
+        """
+        statuses = self.__statuses
+        modifiers = self._modifiers
+        return (
+            self.__current_life,
+            self.__max_life,
+            self.__attack,
+            self.__speed,
+            None if statuses is None else statuses.snapshot(),
+            None if modifiers is None else modifiers.snapshot(),
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        """Puts back the values of `snapshot`. They were valid, so no setters run."""
+        (
+            self.__current_life,
+            self.__max_life,
+            self.__attack,
+            self.__speed,
+            statuses,
+            modifiers,
+        ) = snapshot
+        self._modifiers = None if modifiers is None else ModifierStack(modifiers)
+        if statuses is None:
+            self.__statuses = None
+        else:
+            if self.__statuses is None:
+                self.__statuses = StatusEffects()
+            self.__statuses.restore(statuses)
@@ -0,0 +1,133 @@
+"""
+Typed domain events and the synchronous bus they are published on.
+
+Entities publish what happens to them (damage taken, a dodge, a block, a new
+status, ammo spent...) instead of leaving flags behind for the battle to
+inspect. Subscribers (the battle log, telemetry, achievements...) register
+only for the event types they need.
+
+Publishing costs one dict lookup when nobody subscribed to that type: the
+event object is only built if there is a handler (see `EventBus.emit`). An
+entity outside a battle has no bus at all (its `event_bus` is None).
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from domain.element import Element
+    from domain.entity import Entity
+    from domain.state import State
+
+
+@dataclass(frozen=True, slots=True)
+class DamageApplied:
+    """`target` lost `amount` life (0 if its armor absorbed the whole hit)."""
+
+    target: "Entity"
+    amount: int
+    element: "Element"
+
+
+@dataclass(frozen=True, slots=True)
+class Healed:
+    """`target` recovered `amount` life."""
+
+    target: "Entity"
+    amount: int
+
+
+@dataclass(frozen=True, slots=True)
+class Dodged:
+    """`defender` dodged a strike (Archer)."""
+
+    defender: "Entity"
+
+
+@dataclass(frozen=True, slots=True)
+class Blocked:
+    """`defender` blocked a strike with the shield (Warrior)."""
+
+    defender: "Entity"
+
+
+@dataclass(frozen=True, slots=True)
+class StatusApplied:
+    """`status` was added to the effects of `target`."""
+
+    target: "Entity"
+    status: "State"
+
+
+@dataclass(frozen=True, slots=True)
+class AmmoChanged:
+    """The ammo of `actor` went from `before` to `after`."""
+
+    actor: "Entity"
+    before: int
+    after: int
+
+
+@dataclass(frozen=True, slots=True)
+class ManaChanged:
+    """The mana of `actor` went from `before` to `after`."""
+
+    actor: "Entity"
+    before: int
+    after: int
+
+
+@dataclass(frozen=True, slots=True)
+class StanceEntered:
+    """`actor` entered a special stance ("aiming" or "enraged")."""
+
+    actor: "Entity"
+    stance: str
+
+
+class EventBus:
+    """
+    Synchronous publish/subscribe keyed by the exact event type.
+
+    Handlers run in subscription order, inside the call that publishes.
+    Handler lists are replaced, never mutated, so a handler may subscribe or
+    unsubscribe while an event is being dispatched.
+    """
+
+    __slots__ = ("_handlers",)
+
+    def __init__(self):
+        self._handlers: dict[type, list[Callable]] = {}
+
+    def subscribe(self, event_type: type, handler: Callable) -> None:
+        self._handlers[event_type] = [*self._handlers.get(event_type, ()), handler]
+
+    def unsubscribe(self, event_type: type, handler: Callable) -> None:
+        handlers = self._handlers.get(event_type)
+        if handlers is None or handler not in handlers:
+            raise ValueError(f"Handler not subscribed to {event_type.__name__}")
+
+        remaining = handlers[:]
+        remaining.remove(handler)
+        if remaining:
+            self._handlers[event_type] = remaining
+        else:
+            del self._handlers[event_type]
+
+    def has_subscribers(self, event_type: type) -> bool:
+        return event_type in self._handlers
+
+    def publish(self, event) -> None:
+        """Delivers an already built event."""
+        handlers = self._handlers.get(type(event))
+        if handlers is not None:
+            for handler in handlers:
+                handler(event)
+
+    def emit(self, event_type: type, *args) -> None:
+        """Builds `event_type(*args)` and delivers it, only if someone listens."""
+        handlers = self._handlers.get(event_type)
+        if handlers is not None:
+            event = event_type(*args)
+            for handler in handlers:
+                handler(event)
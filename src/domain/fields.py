@@ -0,0 +1,177 @@
+"""
+Typed attribute descriptors with a validated and a trusted mode.
+
+`field(...)` declares an attribute: its type, the checks a value of that
+type must pass and how it is normalized (clamped, stripped...) before it
+is stored. It returns a plain `property` whose getter and setter are
+specialised for that attribute: ordinary closures of this module, with the
+storage attribute read and written by name as in a hand-written property
+(see `_specialise`), so CPython specializes both like it does those.
+
+Validated mode is the default, so API boundaries, the CLI and save loading
+keep every check. Code that only handles values known to be valid (the
+factories, the simulator) runs inside `with trusted():`, where the range
+checks are skipped and only the normalization runs. The mode is per thread
+(and per asyncio task), and a setter only reads it when that saves work:
+before a `check`, or when a value of the wrong type is let through.
+
+A field declared with `stat=` is a stat buffs and debuffs apply to: setting
+it writes the base value, reading it returns the base with the modifiers of
+the object applied (see `domain.modifiers`).
+"""
+
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import FunctionType
+from typing import Any, Callable, Iterator
+
+# A context variable rather than a global: other threads (and their
+# contexts) keep validating while one of them runs trusted code.
+_trusted: ContextVar[bool] = ContextVar("trusted_fields", default=False)
+
+
+@contextmanager
+def trusted() -> Iterator[None]:
+    """Skips the checks of every field set in this context until the block ends."""
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+def is_trusted() -> bool:
+    return _trusted.get()
+
+
+def field(
+    storage: str,
+    kind: type | tuple[type, ...],
+    type_error: str,
+    *,
+    check: Callable[[Any, Any], None] | None = None,
+    minimum: int | None = None,
+    maximum_of: str | None = None,
+    normalize: Callable[[Any, Any], Any] | None = None,
+    stat: str | None = None,
+    doc: str | None = None,
+) -> property:
+    """
+    Builds the property of a validated attribute stored in `storage`.
+
+    Args:
+        storage (str): Attribute holding the value (e.g. "_Entity__attack").
+        kind (type | tuple): Accepted type(s); anything else raises TypeError.
+        type_error (str): Message of that TypeError.
+        check (Callable | None): `check(obj, value)` raises ValueError for a
+            value of the right type that is still invalid.
+        minimum (int | None): Lower values are stored as `minimum`.
+        maximum_of (str | None): Attribute of the same object capping the
+            value (e.g. "max_life"); higher values are stored as it.
+        normalize (Callable | None): `normalize(obj, value)` returns the value
+            to store, after the clamping. Runs in both modes.
+        stat (str | None): Name of the stat in `Modifier.stat`. Reads apply
+            the `ModifierStack` kept in `obj._modifiers` (None: no modifiers).
+
+    Only `check` and the type check are skipped in trusted mode.
+    """
+    for name in (storage, maximum_of, stat):
+        if name is not None and not name.isidentifier():
+            raise ValueError(f"Invalid attribute name: {name!r}")
+
+    if stat is None:
+
+        def fget(obj):
+            return obj._storage
+
+    else:
+
+        def fget(obj):
+            stack = obj._modifiers
+            if stack is None:
+                return obj._storage
+            return stack.effective(stat, obj._storage)
+
+    trusted_mode = _trusted.get
+
+    def fset(obj, value):
+        # The type check costs no more than reading the mode, so the mode is
+        # only read when it saves work: before `check`, or to let a value of
+        # the wrong type through in trusted mode.
+        if not isinstance(value, kind) and not trusted_mode():
+            raise TypeError(type_error)
+        if check is not None and not trusted_mode():
+            check(obj, value)
+
+        if minimum is not None and value < minimum:
+            value = minimum
+        elif maximum_of is not None and value > obj._maximum:
+            value = obj._maximum
+
+        if normalize is not None:
+            value = normalize(obj, value)
+        obj._storage = value
+
+    names = {"_storage": storage, "_maximum": maximum_of or "_maximum"}
+    return property(_specialise(fget, names), _specialise(fset, names), None, doc)
+
+
+def _specialise(function: Callable, names: dict[str, str]) -> Callable:
+    """
+    A copy of `function` with the placeholder attribute names of `names`
+    replaced (`obj._storage` becomes e.g. `obj._Entity__attack`). The copy
+    keeps its source lines and closure, and its attribute accesses are the
+    plain ones CPython specializes, as in a hand-written property.
+    """
+    code = function.__code__
+    code = code.replace(co_names=tuple(names.get(name, name) for name in code.co_names))
+    copy = FunctionType(
+        code, function.__globals__, function.__name__, None, function.__closure__
+    )
+    copy.__qualname__ = function.__qualname__
+    return copy
+
+
+# Common checks and normalizers.
+
+
+def greater_than(limit: int, message: str) -> Callable[[Any, Any], None]:
+    def check(obj, value):
+        if value <= limit:
+            raise ValueError(message)
+
+    return check
+
+
+def at_least(limit: int, message: str) -> Callable[[Any, Any], None]:
+    def check(obj, value):
+        if value < limit:
+            raise ValueError(message)
+
+    return check
+
+
+def between(low: int, high: int, message: str) -> Callable[[Any, Any], None]:
+    def check(obj, value):
+        if value < low or value > high:
+            raise ValueError(message)
+
+    return check
+
+
+def not_blank(message: str) -> Callable[[Any, Any], None]:
+    def check(obj, value):
+        if len(value.strip()) == 0:
+            raise ValueError(message)
+
+    return check
+
+
+def as_float(obj, value) -> float:
+    return float(value)
+
+
+def title_case(obj, value: str) -> str:
+    # Interned: a population of "Goblin"s shares one name string.
+    return sys.intern(value.strip().title())
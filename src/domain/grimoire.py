@@ -1,7 +1,8 @@
 from __future__ import annotations
 from domain.weapon import Weapon
 from domain.element import Element
-from typing import TYPE_CHECKING, Dict, Any
+from domain.fields import field, at_least, is_trusted
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from domain.entity import Entity
@@ -15,6 +16,10 @@ class Grimoire(Weapon):
     Can only be used by Mages.
     """
 
+    __slots__ = ("_mana_cost",)
+
+    allowed_class = ["Mage"]
+
     def __init__(
         self,
         name: str,
@@ -24,13 +29,16 @@ class Grimoire(Weapon):
         description: str = "",
         weight: float = 2.0,
     ):
-        if not isinstance(element, Element):
+        if not is_trusted() and not isinstance(element, Element):
             raise TypeError(
                 "The element must belong to the Element type. EX: Element.FIRE"
             )
 
         desc = f"Um grimório antigo, cujas runas emanam {element.name}."
 
+        # Set first: the attack menu built by `Weapon.__init__` shows the cost.
+        self.mana_cost = mana_cost
+
         super().__init__(
             name=name,
             description=desc,
@@ -39,20 +47,6 @@ class Grimoire(Weapon):
             element=element,
         )
 
-        self.mana_cost = mana_cost
-        self.allowed_class = ["Mage"]
-
-        self._attacks = {
-            "1": {
-                "description": f"Conjurar {element.name} (MP: {self.mana_cost})",
-                "method": self.attack,
-            },
-            "2": {
-                "description": f"Conjurar {element.name} Aprimorado (MP: {self.mana_cost * 2})",
-                "method": self.heavy_attack,
-            },
-        }
-
     # GETTERS & SETTERS:
 
     @property
@@ -63,20 +57,32 @@ class Grimoire(Weapon):
     def magic_power(self, value: int) -> None:
         self.base_damage = value
 
-    @property
-    def mana_cost(self) -> int:
-        return self._mana_cost
-
-    @mana_cost.setter
-    def mana_cost(self, value: int) -> None:
-        if not isinstance(value, int):
-            raise TypeError("Mana Cost must have a 'int' value.")
-        if value < 0:
-            raise ValueError("Mana Cost can't go below 0.")
-        self._mana_cost = value
+    mana_cost = field(
+        "_mana_cost",
+        int,
+        "Mana Cost must have a 'int' value.",
+        check=at_least(0, "Mana Cost can't go below 0."),
+    )
 
     # METHODS:
 
+    def _menu(self) -> dict:
+        element = self.element.name
+        return {
+            "1": {
+                "description": f"Conjurar {element} (MP: {self.mana_cost})",
+                "method": self.attack,
+            },
+            "2": {
+                "description": f"Conjurar {element} Aprimorado (MP: {self.mana_cost * 2})",
+                "method": self.heavy_attack,
+            },
+        }
+
+    def _copy_into(self, clone: "Grimoire") -> None:
+        super()._copy_into(clone)
+        clone._mana_cost = self._mana_cost
+
     def use(self, target: Entity) -> str:
         """
         Tries to equip the grimoire to the target.
@@ -89,9 +95,6 @@ class Grimoire(Weapon):
 
         return f"{target.name} tentou ler o grimório e não entendeu nada. Apenas Magos podem usar isso."
 
-    def get_attacks(self) -> Dict[str, Any]:
-        return self._attacks
-
     def attack(self, user: Hero, target: Entity) -> None:
         """
         Attacks. Just like that.
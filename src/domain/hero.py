@@ -1,6 +1,7 @@
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 
+from domain.actions import ActionSpec, ActionView
 from domain.element import Element
 from domain.entity import Entity
 from domain.inventory import Inventory
@@ -14,9 +15,14 @@ class Hero(Entity):
     Abstract base class for game heroes.
 
     Subclasses must implement 'strike' and 'upgrade' mechanics specific to their archetype
-    (Warrior, Archer and Wizard).
+    (Warrior, Archer and Wizard), and declare their combat actions in `ACTIONS`
+    (see `domain.actions`).
     """
 
+    __slots__ = ("inventory", "_equipped_weapon", "_action_view")
+
+    ACTIONS: tuple[ActionSpec, ...] = ()
+
     def __init__(
         self,
         name: str,
@@ -28,11 +34,18 @@ class Hero(Entity):
         element: Element = Element.NEUTRAL,
         inventory: Inventory = None,
     ):
+        cls = type(self)
+        if not cls.ACTIONS and cls.get_actions is Hero.get_actions:
+            raise TypeError(
+                f"Can't instantiate {cls.__name__} without combat actions (ACTIONS)"
+            )
+
         super().__init__(
             name, max_life, current_life, attack, speed, current_status, element
         )
         self.inventory = inventory if inventory is not None else Inventory()
         self._equipped_weapon = None
+        self._action_view = None
 
     @property
     def equipped_weapon(self):
@@ -91,12 +104,40 @@ class Hero(Entity):
         """
         pass
 
-    @abstractmethod
+    def action_view(self) -> ActionView:
+        """
+        The hero's `ACTIONS` and consumables, bound to the hero. Cached until
+        the equipped weapon or the inventory changes.
+        """
+        view = self._action_view
+        if view is None or not view.is_current(self):
+            view = ActionView(self)
+            self._action_view = view
+        return view
+
     def get_actions(self) -> dict:
         """
-        Mapping of action keys to action details.
+        Mapping of action keys to action details ("description", "method").
+        The dict is cached: read it, do not modify it.
         """
-        pass
+        view = self.action_view()
+        view.refresh(self)
+        return view.menu
+
+    def get_area_actions(self) -> dict:
+        """
+        Actions that hit every enemy at once, in the `get_actions` format.
+
+        Their methods take the list of targets, so they are only offered by
+        battles with several monsters (see `services.room_battle`).
+        """
+        view = self.action_view()
+        view.refresh(self)
+        return view.area_menu
+
+    def get_consumable_actions(self) -> dict:
+        """Consumables of the inventory (keys p1, p2...), in the `get_actions` format."""
+        return self.action_view().consumable_menu
 
     def get_hero_status(self) -> dict:
         """
@@ -12,11 +12,16 @@ class Inventory:
     Attributes:
         items (List[Item]): List of items currently in the inventory.
         capacity (float): Maximum weight capacity of the inventory.
+        version (int): Bumped on every change of the items, so caches built
+            from them (e.g. `Hero.action_view`) know when to rebuild.
     """
 
+    __slots__ = ("_capacity", "_items", "version")
+
     def __init__(self, capacity: float = 100.0):
         self.capacity = capacity
         self._items: List[Item] = []
+        self.version = 0
 
     @property
     def items(self) -> List[Item]:
@@ -53,11 +58,13 @@ class Inventory:
             return False
 
         self._items.append(item)
+        self.version += 1
         return True
 
     def remove_item_from_inventory(self, item: Item) -> bool:
         if item in self._items:
             self._items.remove(item)
+            self.version += 1
             return True
         return False
 
@@ -109,6 +116,7 @@ class Inventory:
 
     def clear_all_items_from_inventory(self) -> None:
         self._items.clear()
+        self.version += 1
 
     def has_item(self, item_name: str) -> bool:
         return self.find_item_by_name(item_name) is not None
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from domain.fields import field, as_float, greater_than, not_blank, title_case
 from domain.mixins import DescriptionMixin
 
 
@@ -17,40 +18,51 @@ class Item(ABC, DescriptionMixin):
         name (str): The item's name.
         description (str): A textual description of the item.
         weight (float): The item's weight, affecting inventory capacity.
+        catalog_id (str | None): Id of the catalog definition the item was
+            created from (see `services.item_catalog.ItemCatalog`); None for
+            an item built on its own.
     """
 
+    __slots__ = ("_name", "_weight", "_description", "catalog_id")
+
     def __init__(self, name: str, description: str = "", weight: float = 1.0):
         self.name = name
         self.weight = weight
         self._description: str = description
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @name.setter
-    def name(self, value: str) -> None:
-        if not isinstance(value, str):
-            raise TypeError("Item name must be a string")
-
-        if len(value.strip()) == 0:
-            raise ValueError("Item name cannot be empty")
-
-        self._name = value.strip().title()
-
-    @property
-    def weight(self) -> float:
-        return self._weight
-
-    @weight.setter
-    def weight(self, value: float) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("Item weight must be a number")
-
-        if value <= 0:
-            raise ValueError("Item weight must be positive")
-
-        self._weight = float(value)
+        self.catalog_id: str | None = None
+
+    # FIELDS (see `domain.fields`):
+
+    name = field(
+        "_name",
+        str,
+        "Item name must be a string",
+        check=not_blank("Item name cannot be empty"),
+        normalize=title_case,
+    )
+    weight = field(
+        "_weight",
+        (int, float),
+        "Item weight must be a number",
+        check=greater_than(0, "Item weight must be positive"),
+        normalize=as_float,
+    )
+
+    def spawn(self) -> "Item":
+        """
+        A new item like this one. Nothing is validated or recomputed, so it
+        is much cheaper than the constructor; subclasses copy their slots in
+        `_copy_into`.
+        """
+        clone = object.__new__(type(self))
+        self._copy_into(clone)
+        return clone
+
+    def _copy_into(self, clone: "Item") -> None:
+        clone._name = self._name
+        clone._weight = self._weight
+        clone._description = self._description
+        clone.catalog_id = self.catalog_id
 
     def get_description(self) -> str:
         """Return the item's description or a default one."""
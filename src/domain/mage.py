@@ -3,7 +3,24 @@ from domain.element import Element
 from domain.inventory import Inventory
 from domain.grimoire import Grimoire
 from domain.entity import Entity
-from typing import Dict, Any
+from domain.area_damage import apply_area_damage
+from domain.actions import ALL_ENEMIES, SELF, ActionSpec
+from domain.events import ManaChanged
+from domain.fields import field, at_least
+
+
+def _shrink_mana(mage: "Mage", value: int) -> int:
+    """A lower `max_mana` also lowers the current mana above it."""
+    if hasattr(mage, "_current_mana") and mage._current_mana > value:
+        mage._current_mana = value
+    return value
+
+
+def _publish_mana(mage: "Mage", value: int) -> int:
+    bus = mage.event_bus
+    if bus is not None and value != mage._current_mana:
+        bus.emit(ManaChanged, mage, mage._current_mana, value)
+    return value
 
 
 class Mage(Hero):
@@ -13,6 +30,59 @@ class Mage(Hero):
     Able to use grimoires.
     """
 
+    ANCIENT_MAGIC_MANA_COST = 50
+    ARCANE_STORM_MANA_COST = 40
+
+    __slots__ = ("_max_mana", "_current_mana", "meditate_cooldown")
+
+    ACTIONS = (
+        ActionSpec(
+            "1",
+            "strike",
+            lambda mage: (
+                f"Magia Básica ({mage.equipped_weapon.name})"
+                if mage.equipped_weapon
+                else "Soco Fraco (MP: 0)"
+            ),
+        ),
+        ActionSpec(
+            "2",
+            "heavy_strike",
+            lambda mage: f"Magia Aprimorada ({mage.equipped_weapon.name})",
+            requires_weapon=True,
+        ),
+        ActionSpec(
+            "3",
+            "ancient_magic",
+            lambda mage: (
+                f"Magia Ancestral (MP: {Mage.ANCIENT_MAGIC_MANA_COST})"
+                f"[Mana Atual: {mage.current_mana}/{mage.max_mana}]"
+            ),
+            resource="mana",
+            cost=ANCIENT_MAGIC_MANA_COST,
+            live=True,
+        ),
+        ActionSpec(
+            "4",
+            "meditate",
+            lambda mage: f"Meditar (+{mage.max_mana / 2} MP)",
+            targeting=SELF,
+            live=True,
+        ),
+        ActionSpec(
+            "5",
+            "arcane_storm",
+            lambda mage: (
+                f"Tempestade Arcana (MP: {Mage.ARCANE_STORM_MANA_COST}, atinge todos os inimigos)"
+                f"[Mana Atual: {mage.current_mana}/{mage.max_mana}]"
+            ),
+            targeting=ALL_ENEMIES,
+            resource="mana",
+            cost=ARCANE_STORM_MANA_COST,
+            live=True,
+        ),
+    )
+
     def __init__(
         self,
         name: str,
@@ -43,37 +113,21 @@ class Mage(Hero):
 
     # PROPERTIES:
 
-    @property
-    def max_mana(self) -> int:
-        return self._max_mana
-
-    @max_mana.setter
-    def max_mana(self, value: int) -> None:
-        if not isinstance(value, int):
-            raise TypeError("max_mana must have a 'int' value!")
-        if value < 0:
-            raise ValueError("max_mana value can't be lower than 0.")
-
-        self._max_mana = value
-
-        if hasattr(self, "_current_mana") and self._current_mana > value:
-            self._current_mana = value
-
-    @property
-    def current_mana(self) -> int:
-        return self._current_mana
-
-    @current_mana.setter
-    def current_mana(self, value: int) -> None:
-        if not isinstance(value, int):
-            raise TypeError("current_mana must have a 'int' value!")
-
-        if value < 0:
-            self._current_mana = 0
-        elif value > self._max_mana:
-            self._current_mana = self._max_mana
-        else:
-            self._current_mana = value
+    max_mana = field(
+        "_max_mana",
+        int,
+        "max_mana must have a 'int' value!",
+        check=at_least(0, "max_mana value can't be lower than 0."),
+        normalize=_shrink_mana,
+    )
+    current_mana = field(
+        "_current_mana",
+        int,
+        "current_mana must have a 'int' value!",
+        minimum=0,
+        maximum_of="_max_mana",
+        normalize=_publish_mana,
+    )
 
     # COMBAT METHODS:
 
@@ -101,10 +155,10 @@ class Mage(Hero):
 
     def damage_received(self, value: int, strike_element: Element) -> None:
         """O Mago não possui defesa física. Recebe o dano elemental direto."""
-        multiplier = strike_element.multiplier(self.element)
+        multiplier = self.element_matrix.multiplier(strike_element, self.element)
         final_damage = int(value * multiplier)
 
-        self.current_life -= final_damage
+        self._take_damage(final_damage, strike_element)
 
     def meditate(self, target: Entity = None) -> str:
         """
@@ -122,6 +176,19 @@ class Mage(Hero):
 
         return f"{self.name} se concentra e medita. Recupera {mana_recovery} de MP!"
 
+    def snapshot(self) -> tuple:
+        """Entity snapshot plus mana and cooldown (see `Entity.snapshot`)."""
+        return (
+            super().snapshot(),
+            self._max_mana,
+            self._current_mana,
+            self.meditate_cooldown,
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        base, self._max_mana, self._current_mana, self.meditate_cooldown = snapshot
+        super().restore(base)
+
     def end_of_turn_routine(self) -> None:
         """
         Called by the game manager at the end of every turn.
@@ -133,7 +200,7 @@ class Mage(Hero):
     def ancient_magic(self, target: Entity) -> str:
         """Mage's special attack. Costs lots of mana, deals lots of damage."""
 
-        mana_cost = 50
+        mana_cost = self.ANCIENT_MAGIC_MANA_COST
 
         if self.current_mana < mana_cost:
             raise ValueError(
@@ -146,43 +213,32 @@ class Mage(Hero):
 
         return f"{self.name} canaliza energia pura e lança MAGIA ANCESTRAL em {target.name}! {damage} de dano!"
 
+    def arcane_storm(self, targets: list[Entity]) -> str:
+        """Mage's area spell. Costs mana and hits every target with the grimoire's element."""
+
+        mana_cost = self.ARCANE_STORM_MANA_COST
+
+        if self.current_mana < mana_cost:
+            raise ValueError(
+                f"{self.name} tentou conjurar Tempestade Arcana, mas não tem mana o suficiente para isso."
+            )
+
+        self.current_mana -= mana_cost
+        weapon = self.equipped_weapon
+        element = weapon.element if weapon else Element.NEUTRAL
+        damages = apply_area_damage(targets, self.attack * 2, element)
+
+        return f"{self.name} invoca uma TEMPESTADE ARCANA sobre {len(damages)} inimigo(s)! {sum(damages)} de dano no total."
+
     def upgrade(self, points: int) -> None:
         """Allows to allocate stat points to upgrade the hero."""
 
         attack_increase = points // 2
         mana_increase = points - attack_increase
 
-        self.attack += attack_increase
+        self.attack = self.base_stat("attack") + attack_increase
         self.max_mana += mana_increase
         self.current_mana += mana_increase
 
         self.max_life += 15
         self.current_life += 15
-
-    def get_actions(self) -> Dict[str, Any]:
-        actions = {}
-
-        if self.equipped_weapon:
-            actions["1"] = {
-                "description": f"Magia Básica ({self.equipped_weapon.name})",
-                "method": self.strike,
-            }
-            actions["2"] = {
-                "description": f"Magia Aprimorada ({self.equipped_weapon.name})",
-                "method": self.heavy_strike,
-            }
-        else:
-            actions["1"] = {
-                "description": "Soco Fraco (MP: 0)",
-                "method": self.strike,
-            }
-        actions["3"] = {
-            "description": f"Magia Ancestral (MP: 50)[Mana Atual: {self.current_mana}/{self.max_mana}]",
-            "method": self.ancient_magic,
-        }
-        actions["4"] = {
-            "description": f"Meditar (+{self.max_mana / 2} MP)",
-            "method": self.meditate,
-        }
-
-        return actions
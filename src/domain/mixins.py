@@ -7,5 +7,7 @@ class DescriptionMixin:
     the `get_description` method.
     """
 
+    __slots__ = ()
+
     def get_description(self) -> str:
         raise NotImplementedError("Class must implement get_description()")
@@ -0,0 +1,90 @@
+"""
+Temporary buffs and debuffs of an entity's stats.
+
+Rage, aiming, Burn and Frozen used to change a stat in place and undo the
+change later, which corrupted the base value whenever the undo did not
+mirror the change exactly (a clamp at 0, an effect removed early, two
+effects overlapping). Now they push a `Modifier` on the entity's
+`ModifierStack` and pop it when they end; the base value is never touched.
+
+Reading a stat with modifiers costs one dict lookup: the effective value
+is cached per stat together with the base it was computed from, and the
+cache entry is dropped (marked dirty) whenever a modifier of that stat is
+pushed or popped. An entity without modifiers has no stack at all.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable
+
+
+@dataclass(frozen=True, slots=True)
+class Modifier:
+    """
+    Changes `stat` to `value + value * ratio + add` while it is on a stack.
+
+    Attributes:
+        stat (str): Name of the stat (e.g. "attack", "speed", "shield").
+        source: What added it (e.g. "rage", a BurnState); modifiers are
+            removed by source.
+        add (int): Flat amount added (negative for a debuff).
+        ratio (float): Fraction of the current value added (1.0 doubles it,
+            -1.0 zeroes it).
+    """
+
+    stat: str
+    source: object
+    add: int = 0
+    ratio: float = 0.0
+
+
+class ModifierStack:
+    """
+    Ordered modifiers of one entity, applied first to last over the base.
+
+    Effective values are truncated to int and never go below 0.
+    """
+
+    __slots__ = ("_modifiers", "_cache")
+
+    def __init__(self, modifiers: Iterable[Modifier] = ()):
+        self._modifiers: list[Modifier] = list(modifiers)
+        # stat -> (base, effective value); a missing entry is dirty.
+        self._cache: dict[str, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._modifiers)
+
+    def __iter__(self):
+        return iter(self._modifiers)
+
+    def push(self, modifier: Modifier) -> None:
+        self._modifiers.append(modifier)
+        self._cache.pop(modifier.stat, None)
+
+    def remove(self, source) -> None:
+        """Removes every modifier added by `source`."""
+        kept = []
+        for modifier in self._modifiers:
+            if modifier.source == source:
+                self._cache.pop(modifier.stat, None)
+            else:
+                kept.append(modifier)
+        self._modifiers = kept
+
+    def effective(self, stat: str, base: int) -> int:
+        cached = self._cache.get(stat)
+        if cached is not None and cached[0] == base:
+            return cached[1]
+
+        value = base
+        for modifier in self._modifiers:
+            if modifier.stat == stat:
+                value = value + value * modifier.ratio + modifier.add
+        value = max(0, int(value))
+
+        self._cache[stat] = (base, value)
+        return value
+
+    def snapshot(self) -> tuple:
+        """The modifiers are immutable, so copying the list is enough."""
+        return tuple(self._modifiers)
@@ -1,5 +1,6 @@
 from domain.element import Element
 from domain.entity import Entity
+from domain.fields import field
 from domain.mixins import DescriptionMixin
 
 
@@ -19,8 +20,12 @@ class Monster(Entity, DescriptionMixin):
         current_status (State | None): The current status effect applied to the monster.
         element (Element): The elemental affinity of the monster.
         dropped_items (List[Item]): Items that can be dropped when defeated.
+        prototype (Monster | None): The monster this one was spawned from
+            (see `spawn`); None for a monster built by the constructor.
     """
 
+    __slots__ = ("_loot", "_description", "art", "prototype")
+
     def __init__(
         self,
         name: str,
@@ -45,16 +50,25 @@ class Monster(Entity, DescriptionMixin):
         self.loot = loot or []
         self._description = description
         self.art = art
+        self.prototype: Monster | None = None
 
-    @property
-    def loot(self) -> list:
-        return self._loot
+    loot = field("_loot", list, "Loot must be a list")
 
-    @loot.setter
-    def loot(self, value: list):
-        if not isinstance(value, list):
-            raise TypeError("Loot must be a list")
-        self._loot = value
+    def spawn(
+        self, loot: list | None = None, recycled: "Monster | None" = None
+    ) -> "Monster":
+        """
+        A monster like this one at full life, carrying `loot`, without any of
+        this one's combat state. Nothing is validated or recomputed, so it is
+        much cheaper than the constructor. `recycled`, a defeated monster
+        spawned from this one before, is reused instead of a new object.
+        """
+        clone = self._respawn(recycled)
+        clone._loot = [] if loot is None else loot
+        clone._description = self._description
+        clone.art = self.art
+        clone.prototype = self
+        return clone
 
     def strike(self, target: Entity) -> None:
         target.damage_received(self.attack, self.element)
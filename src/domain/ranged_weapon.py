@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import random
 from typing import TYPE_CHECKING, cast
 
 from domain.element import Element
+from domain.fields import field, between, greater_than
+from domain.rng import roll_d100
 from domain.weapon import Weapon
 
 if TYPE_CHECKING:
@@ -24,6 +25,10 @@ class RangedWeapon(Weapon):
         hit_probability (int): Base chance to hit when not aiming (0 to 100).
     """
 
+    __slots__ = ("_ammo_required", "_hit_probability")
+
+    allowed_class = ["Archer"]
+
     def __init__(
         self,
         name: str,
@@ -37,31 +42,26 @@ class RangedWeapon(Weapon):
         super().__init__(name, base_damage, description, weight, element)
         self.ammo_required = ammo_required
         self.hit_probability = hit_probability
-        self.allowed_class = ["Archer"]
-
-    @property
-    def ammo_required(self) -> int:
-        return self._ammo_required
-
-    @ammo_required.setter
-    def ammo_required(self, value: int) -> None:
-        if not isinstance(value, int):
-            raise TypeError("ammo_required must be an integer.")
-        if value <= 0:
-            raise ValueError("ammo_required must be greater than 0.")
-        self._ammo_required = value
-
-    @property
-    def hit_probability(self) -> int:
-        return self._hit_probability
-
-    @hit_probability.setter
-    def hit_probability(self, value: int) -> None:
-        if not isinstance(value, int):
-            raise TypeError("hit_probability must be an integer.")
-        if value < 0 or value > 100:
-            raise ValueError("hit_probability must be between 0 and 100.")
-        self._hit_probability = value
+
+    # FIELDS (see `domain.fields`):
+
+    ammo_required = field(
+        "_ammo_required",
+        int,
+        "ammo_required must be an integer.",
+        check=greater_than(0, "ammo_required must be greater than 0."),
+    )
+    hit_probability = field(
+        "_hit_probability",
+        int,
+        "hit_probability must be an integer.",
+        check=between(0, 100, "hit_probability must be between 0 and 100."),
+    )
+
+    def _copy_into(self, clone: "RangedWeapon") -> None:
+        super()._copy_into(clone)
+        clone._ammo_required = self._ammo_required
+        clone._hit_probability = self._hit_probability
 
     def attack(self, user: Hero, target: Entity) -> None:
         archer_user = cast("Archer", user)
@@ -75,7 +75,7 @@ class RangedWeapon(Weapon):
             super().attack(archer_user, target)
             return
 
-        if random.randint(1, 100) <= self._hit_probability:
+        if roll_d100(self._rng_of(archer_user)) <= self._hit_probability:
             super().attack(archer_user, target)
 
     def heavy_attack(self, user, target):
@@ -90,5 +90,5 @@ class RangedWeapon(Weapon):
             super().heavy_attack(archer_user, target)
             return
 
-        if random.randint(1, 100) <= self._hit_probability:
+        if roll_d100(self._rng_of(archer_user)) <= self._hit_probability:
             super().heavy_attack(archer_user, target)
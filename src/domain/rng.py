@@ -0,0 +1,103 @@
+"""
+Seeded random streams and the combat dice drawn from them.
+
+The d100 rolls of combat (dodge, block, hit) are drawn in blocks:
+`RandomStream.d100` hands out bytes from a buffer filled by one
+`getrandbits` call and one `bytes.translate` per block, instead of running
+`randint(1, 100)` (a Python-level `randrange`) for every roll. A block is
+drawn from the stream itself, at the moment the previous one runs out, so a
+seed still replays the same fight (the block size is part of the sequence).
+`random()` is a single C call already and is not buffered.
+`roll_d100` takes any source: without a stream (the global `random`
+module) it falls back to `randint(1, 100)`.
+"""
+
+import hashlib
+import random
+
+# Random bytes drawn per block; about 78% of them become d100 rolls.
+BLOCK_SIZE = 256
+
+# A d100 is one random byte: bytes 0-199 are faces 1-100 (two bytes each)
+# and 200-255 are dropped, so every face is equally likely.
+_D100_FACES = bytes(byte % 100 + 1 if byte < 200 else 0 for byte in range(256))
+_D100_REJECTED = bytes(range(200, 256))
+
+
+class RandomStream(random.Random):
+    """
+    An independent, reproducible source of randomness.
+
+    Every Battle (or simulation trial) gets its own stream instead of sharing
+    the global `random` module, so results do not depend on which process or
+    thread ran first. Child streams are derived from the root seed and a key,
+    never from the parent's current state: `root.spawn(7)` is always the same
+    stream, no matter how many numbers the root has already produced.
+
+    Attributes:
+        root_seed (int): Seed the stream was created with.
+        block_size (int): Random bytes drawn at a time by `d100`.
+    """
+
+    def __init__(self, seed: int | None = None, block_size: int = BLOCK_SIZE):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        if not isinstance(seed, int):
+            raise TypeError("seed must be an integer")
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        self.root_seed = seed
+        self.block_size = block_size
+        super().__init__(seed)
+
+    def seed(self, *args, **kwargs) -> None:
+        super().seed(*args, **kwargs)
+        # Rolls pre-drawn from the old state would not follow the new one.
+        self._d100s = bytearray()
+
+    def setstate(self, state) -> None:
+        super().setstate(state)
+        self._d100s = bytearray()
+
+    def d100(self) -> int:
+        """A roll like `randint(1, 100)`, taken from the pre-drawn block."""
+        rolls = self._d100s
+        while not rolls:  # a block may have had every byte dropped
+            rolls = self._d100s = self._draw_d100s()
+        return rolls.pop()
+
+    def _draw_d100s(self) -> bytearray:
+        size = self.block_size
+        data = self.getrandbits(8 * size).to_bytes(size, "little")
+        rolls = bytearray(data.translate(_D100_FACES, _D100_REJECTED))
+        # Reversed, so `pop()` hands them out in the order they were drawn.
+        rolls.reverse()
+        return rolls
+
+    def spawn(self, key) -> "RandomStream":
+        """Returns the child stream identified by `key` (e.g. a trial index)."""
+        digest = hashlib.blake2b(
+            f"{self.root_seed}/{key}".encode(), digest_size=8
+        ).digest()
+        return RandomStream(int.from_bytes(digest, "big"), self.block_size)
+
+    def __reduce__(self):
+        # Keeps `root_seed` and the d100s not handed out yet when the stream
+        # is sent to a worker process.
+        return (
+            self.__class__,
+            (self.root_seed, self.block_size),
+            (self.getstate(), bytes(self._d100s)),
+        )
+
+    def __setstate__(self, state) -> None:
+        generator, d100s = state
+        self.setstate(generator)
+        self._d100s = bytearray(d100s)
+
+
+def roll_d100(rng) -> int:
+    """`rng.randint(1, 100)`, from the pre-drawn block when `rng` is a stream."""
+    if isinstance(rng, RandomStream):
+        return rng.d100()
+    return rng.randint(1, 100)
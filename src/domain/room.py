@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Sequence, TYPE_CHECKING
 
 from .mixins import DescriptionMixin
 from .element import Element
@@ -9,6 +9,9 @@ if TYPE_CHECKING:
     from .entity import Entity
     from .item import Item
 
+# Indices of the initial monsters defeated and initial items taken (`Room.delta`).
+RoomDelta = tuple[tuple[int, ...], tuple[int, ...]]
+
 
 class Room(DescriptionMixin):
     """
@@ -21,6 +24,16 @@ class Room(DescriptionMixin):
         items (List[Item]): List of loot available in the room.
     """
 
+    __slots__ = (
+        "_description",
+        "_environment",
+        "_monsters",
+        "_items",
+        "_monster_origins",
+        "_item_origins",
+        "_spawned",
+    )
+
     def __init__(
         self,
         description: str,
@@ -32,6 +45,11 @@ class Room(DescriptionMixin):
         self.environment = environment
         self._monsters: List[Monster] = []
         self._items: List[Item] = []
+        # Index of each monster and item among those the room was created
+        # with (None: added later). By position, not identity: a room may
+        # hold the same item object twice.
+        self._monster_origins: List[Optional[int]] = []
+        self._item_origins: List[Optional[int]] = []
 
         if monsters:
             for m in monsters:
@@ -41,6 +59,11 @@ class Room(DescriptionMixin):
             for i in items:
                 self.add_item(i)
 
+        # What the room was created with, to tell what happened since (`delta`).
+        self._spawned = (len(self._monsters), len(self._items))
+        self._monster_origins = list(range(len(self._monsters)))
+        self._item_origins = list(range(len(self._items)))
+
     # PROPERTIES:
 
     @property
@@ -70,17 +93,27 @@ class Room(DescriptionMixin):
     def add_monster(self, monster: Monster) -> None:
         """Adds a monster to the room."""
         self._monsters.append(monster)
+        self._monster_origins.append(None)
 
     def remove_monster(self, monster: Monster) -> None:
         if monster in self._monsters:
-            self._monsters.remove(monster)
+            self._pop_monster(self._monsters.index(monster))
 
     def add_item(self, item: Item) -> None:
         self._items.append(item)
+        self._item_origins.append(None)
 
     def remove_item(self, item: Item) -> None:
         if item in self._items:
-            self._items.remove(item)
+            self._pop_item(self._items.index(item))
+
+    def _pop_monster(self, index: int) -> Monster:
+        del self._monster_origins[index]
+        return self._monsters.pop(index)
+
+    def _pop_item(self, index: int) -> Item:
+        del self._item_origins[index]
+        return self._items.pop(index)
 
     def take_item(self, item_name: str) -> Optional[Item]:
         """
@@ -90,7 +123,7 @@ class Room(DescriptionMixin):
 
         for index, item in enumerate(self._items):
             if item.name.lower() == item_name.lower():
-                return self._items.pop(index)
+                return self._pop_item(index)
         return None
 
     @property
@@ -126,6 +159,37 @@ class Room(DescriptionMixin):
 
         return text
 
+    def delta(self) -> RoomDelta:
+        """
+        What changed since the room was created: the indices of its initial
+        monsters that are gone (defeated) and of its initial items that were
+        taken. A room rebuilt from the same seed plus `apply_delta` is the
+        room as it is now.
+        """
+        monsters, items = self._spawned
+        present = set(self._monster_origins)
+        defeated = tuple(index for index in range(monsters) if index not in present)
+        present = set(self._item_origins)
+        taken = tuple(index for index in range(items) if index not in present)
+        return defeated, taken
+
+    def apply_delta(self, defeated: Sequence[int], taken: Sequence[int]) -> None:
+        """Removes the initial monsters and items of the indices given."""
+        monsters, items = self._spawned
+        if any(not 0 <= index < monsters for index in defeated) or any(
+            not 0 <= index < items for index in taken
+        ):
+            raise ValueError("Room delta does not match the room!")
+
+        gone = set(defeated)
+        for index in reversed(range(len(self._monsters))):
+            if self._monster_origins[index] in gone:
+                self._pop_monster(index)
+        gone = set(taken)
+        for index in reversed(range(len(self._items))):
+            if self._item_origins[index] in gone:
+                self._pop_item(index)
+
     def enter(self, hero: Entity) -> str:
         """
         Logic for when an entity (usually, the Hero) enters the room.
@@ -145,6 +209,6 @@ class Room(DescriptionMixin):
     def remove_defeated_monster(self) -> None:
         """Removes a monster when it gets defeated by the hero."""
         if self._monsters:
-            self._monsters.pop(
+            self._pop_monster(
                 0
             )  # GAME MANAGER CANNOT ACCESS A PROTECTED ATTRIBUTE FROM OUTSIDE.
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from domain.element import Element
+from domain.modifiers import Modifier
 
 
 class State(ABC):
@@ -10,6 +11,8 @@ class State(ABC):
 
     """
 
+    __slots__ = ("name", "duration_turns")
+
     def __init__(self, name: str, duration_turns: int):
         self.name = name
         self.duration_turns = duration_turns
@@ -22,16 +25,36 @@ class State(ABC):
     def prevents_action(self) -> bool:
         pass
 
+    def snapshot(self) -> tuple:
+        """The mutable part of the state (see `Entity.snapshot`)."""
+        return (self.duration_turns,)
+
+    def restore(self, snapshot: tuple) -> None:
+        (self.duration_turns,) = snapshot
+
 
 class NeutralState(State):
     """
     Expected effect of Neutral:
     - Applies no effects.
     - Does not prevent action.
+
+    It holds no state, so there is a single shared instance: `NeutralState()`
+    always returns `NEUTRAL`.
     """
 
+    __slots__ = ()
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            super().__init__(cls._instance, "Neutral", 0)
+        return cls._instance
+
     def __init__(self):
-        super().__init__("Neutral", 0)
+        pass
 
     def apply_effect(self, entity):
         pass
@@ -39,6 +62,12 @@ class NeutralState(State):
     def prevents_action(self):
         return False
 
+    def restore(self, snapshot: tuple) -> None:
+        pass
+
+
+NEUTRAL = NeutralState()
+
 
 class PoisonedState(State):
     """
@@ -47,6 +76,8 @@ class PoisonedState(State):
     - Does not prevent action.
     """
 
+    __slots__ = ("damage_per_turns",)
+
     def __init__(self, duration_turns, damage_per_turns: int):
         super().__init__("Poison", duration_turns)
         self.damage_per_turns = damage_per_turns
@@ -65,10 +96,12 @@ class PoisonedState(State):
 class BurnState(State):
     """
     Expected effect of Burn:
-    - Temporarily reduces attack.
+    - Temporarily reduces attack (a modifier, removed when the effect ends).
     - Does not prevent action.
     """
 
+    __slots__ = ("attack_decrease", "_applied")
+
     def __init__(self, duration_turns: int, attack_decrease: int):
         super().__init__("Burned", duration_turns)
         self.attack_decrease = attack_decrease
@@ -76,17 +109,23 @@ class BurnState(State):
 
     def apply_effect(self, entity):
         if not self._applied:
-            entity.attack -= self.attack_decrease
+            entity.add_modifier(Modifier("attack", self, add=-self.attack_decrease))
             self._applied = True
 
         self.duration_turns -= 1
 
         if self.duration_turns <= 0:
-            entity.attack += self.attack_decrease
+            entity.remove_modifiers(self)
 
     def prevents_action(self) -> bool:
         return False
 
+    def snapshot(self) -> tuple:
+        return (self.duration_turns, self._applied)
+
+    def restore(self, snapshot: tuple) -> None:
+        self.duration_turns, self._applied = snapshot
+
 
 class StunnedState(State):
     """
@@ -95,6 +134,8 @@ class StunnedState(State):
     - Applies no damage.
     """
 
+    __slots__ = ()
+
     def __init__(self, duration_turns: int = 1):
         super().__init__("Stunned", duration_turns)
 
@@ -108,10 +149,12 @@ class StunnedState(State):
 class FrozenState(State):
     """
     Expected effect of Frozen:
-    - Temporarily reduces speed.
+    - Temporarily reduces speed (a modifier, removed when the effect ends).
     - Does not prevent action.
     """
 
+    __slots__ = ("speed_decrease", "_applied")
+
     def __init__(self, duration_turns: int, speed_decrease: int):
         super().__init__("Frozen", duration_turns)
         self.speed_decrease = speed_decrease
@@ -119,13 +162,19 @@ class FrozenState(State):
 
     def apply_effect(self, entity):
         if not self._applied:
-            entity.speed -= self.speed_decrease
+            entity.add_modifier(Modifier("speed", self, add=-self.speed_decrease))
             self._applied = True
 
         self.duration_turns -= 1
 
         if self.duration_turns <= 0:
-            entity.speed += self.speed_decrease
+            entity.remove_modifiers(self)
 
     def prevents_action(self) -> bool:
         return False
+
+    def snapshot(self) -> tuple:
+        return (self.duration_turns, self._applied)
+
+    def restore(self, snapshot: tuple) -> None:
+        self.duration_turns, self._applied = snapshot
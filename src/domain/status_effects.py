@@ -0,0 +1,134 @@
+"""
+Concurrent status effects per entity (e.g. Burned and Poisoned at once).
+
+Every effect is scheduled to expire on a `TimerWheel` keyed by the turn
+number of its entity, so a turn only touches the effects that fire and the
+ones expiring on it. An entity without effects keeps no `StatusEffects` at
+all (see `Entity.add_status`), and `NEUTRAL` stands for "no effect".
+"""
+
+from domain.state import NEUTRAL, State
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel: items due on turn `t` are kept in bucket
+    `t % slots`. A bucket may also hold items due one or more revolutions
+    later; they stay there until their own turn comes around.
+    """
+
+    __slots__ = ("_buckets",)
+
+    def __init__(self, slots: int = 8):
+        if slots <= 0:
+            raise ValueError("slots must be greater than 0")
+        self._buckets: list[list | None] = [None] * slots
+
+    def schedule(self, turn: int, item) -> None:
+        index = turn % len(self._buckets)
+        bucket = self._buckets[index]
+        if bucket is None:
+            self._buckets[index] = [(turn, item)]
+        else:
+            bucket.append((turn, item))
+
+    def pop_due(self, turn: int) -> list:
+        """Removes and returns the items due exactly on `turn`."""
+        index = turn % len(self._buckets)
+        bucket = self._buckets[index]
+        if bucket is None:
+            return []
+
+        due = [item for when, item in bucket if when == turn]
+        if len(due) == len(bucket):
+            self._buckets[index] = None
+        elif due:
+            self._buckets[index] = [entry for entry in bucket if entry[0] != turn]
+        return due
+
+
+class StatusEffects:
+    """
+    Active effects of one entity and the wheel that expires them.
+
+    An effect added with `duration_turns = d` is applied on the next `d`
+    ticks of its entity and removed at the start of the tick after that,
+    the same lifetime a single `current_status` always had.
+    """
+
+    __slots__ = ("turn", "active", "_wheel", "_due")
+
+    def __init__(self):
+        self.turn = 0
+        self.active: list[State] = []
+        self._wheel = TimerWheel()
+        # id(effect) -> turn it expires on
+        self._due: dict[int, int] = {}
+
+    def add(self, effect: State) -> State | None:
+        """Adds the effect; one with the same name is replaced and returned."""
+        replaced = None
+        for index, current in enumerate(self.active):
+            if current.name == effect.name:
+                del self.active[index]
+                del self._due[id(current)]
+                replaced = current
+                break
+
+        self.active.append(effect)
+        self._schedule(effect, self.turn + effect.duration_turns + 1)
+        return replaced
+
+    def _schedule(self, effect: State, turn: int) -> None:
+        self._due[id(effect)] = turn
+        self._wheel.schedule(turn, effect)
+
+    def tick(self, entity) -> None:
+        """One turn of the entity: expires due effects and applies the rest."""
+        self.turn += 1
+
+        for effect in self._wheel.pop_due(self.turn):
+            if self._due.get(id(effect)) != self.turn:
+                continue  # replaced, or rescheduled meanwhile
+            if effect.duration_turns > 0:
+                # Its duration was extended after it was scheduled.
+                self._schedule(effect, self.turn + effect.duration_turns)
+                continue
+            del self._due[id(effect)]
+            self.active.remove(effect)
+            # Whatever the effect still applies to the stats ends with it.
+            entity.remove_modifiers(effect)
+
+        for effect in self.active:
+            if effect.duration_turns > 0:
+                effect.apply_effect(entity)
+
+    def current(self) -> State:
+        return self.active[-1] if self.active else NEUTRAL
+
+    def preventing(self) -> State | None:
+        """The first effect that stops the entity from acting, if any."""
+        for effect in self.active:
+            if effect.prevents_action():
+                return effect
+        return None
+
+    def snapshot(self) -> tuple:
+        """Effects with their own snapshots and expiry turns."""
+        return (
+            self.turn,
+            tuple(
+                (effect, effect.snapshot(), self._due[id(effect)])
+                for effect in self.active
+            ),
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        self.turn, effects = snapshot
+        self.active = []
+        self._wheel = TimerWheel()
+        self._due = {}
+        for effect, effect_snapshot, due in effects:
+            effect.restore(effect_snapshot)
+            self.active.append(effect)
+            self._schedule(effect, due)
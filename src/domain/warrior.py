@@ -2,7 +2,12 @@ from domain.hero import Hero
 from domain.element import Element
 from domain.inventory import Inventory
 from domain.entity import Entity
-import random
+from domain.area_damage import apply_area_damage
+from domain.actions import ALL_ENEMIES, SELF, ActionSpec
+from domain.events import Blocked, StanceEntered
+from domain.fields import field
+from domain.modifiers import Modifier
+from domain.rng import roll_d100
 
 
 class Warrior(Hero):
@@ -12,6 +17,32 @@ class Warrior(Hero):
         Hero (abstraticlass): define some responsabilities to Warrior class.
     """
 
+    __slots__ = ("_shield", "_armor", "defend", "in_rage", "rage_duration", "in_test")
+
+    BASE_STATS = {**Hero.BASE_STATS, "shield": "_shield", "armor": "_armor"}
+
+    # Rage doubles the attack and drops the guard until it ends.
+    RAGE_MODIFIERS = (
+        Modifier("attack", "rage", ratio=1.0),
+        Modifier("shield", "rage", ratio=-1.0),
+        Modifier("armor", "rage", ratio=-1.0),
+    )
+
+    attributes_to_upgrade = ["shield", "armor"]
+
+    ACTIONS = (
+        ActionSpec("1", "strike", "Atacar (ataque básico com arma)"),
+        ActionSpec(
+            "2", "to_rage", "Fúria (dobra ataque, sacrifica defesa)", targeting=SELF
+        ),
+        ActionSpec(
+            "3",
+            "whirlwind",
+            "Giro de Lâmina (atinge todos os inimigos)",
+            targeting=ALL_ENEMIES,
+        ),
+    )
+
     def __init__(
         self,
         name: str,
@@ -43,11 +74,15 @@ class Warrior(Hero):
         self.armor = armor
         self.defend = defend
         self.in_rage = in_rage
+        self.rage_duration = 0
         #
-        self.normal_state: dict = {}
-        self.attributes_to_upgrade = ["shield", "armor"]
         self.in_test = in_test
 
+    # FIELDS (see `domain.fields`):
+
+    shield = field("_shield", int, "Shield must be a whole number", stat="shield")
+    armor = field("_armor", int, "Armor must be a whole number", stat="armor")
+
     def strike(self, target: Entity) -> None:
         """
         Atack enemies with default choice.
@@ -68,27 +103,45 @@ class Warrior(Hero):
             )
         self.equipped_weapon.heavy_attack(self, target)
 
+    def whirlwind(self, targets: list[Entity]) -> str:
+        """
+        Spins the weapon around, hitting every target with a basic strike's
+        damage (no elemental status).
+        """
+        if self.equipped_weapon is None:
+            raise ValueError(
+                "Nenhuma arma equipada! Equipe uma arma no inventário antes de atacar."
+            )
+        weapon = self.equipped_weapon
+        damages = apply_area_damage(
+            targets, weapon.base_damage + self.attack, weapon.element
+        )
+
+        return f"{self.name} gira {weapon.name} e atinge {len(damages)} inimigo(s)! {sum(damages)} de dano no total."
+
     def damage_received(self, value: int, strike_element: Element) -> None:
         """Defends an strike or takes damage"""
-        multiplier = strike_element.multiplier(self.element)
+        multiplier = self.element_matrix.multiplier(strike_element, self.element)
         final_damage = multiplier * value
 
         self._attempt_defend()
 
         if self.defend:
-            self.last_blocked = True
             self._reset_defend()
+            bus = self.event_bus
+            if bus is not None:
+                bus.emit(Blocked, self)
             return
 
-        self.current_life -= max(0, int(final_damage - self.armor))
+        self._take_damage(max(0, int(final_damage - self.armor)), strike_element)
 
     def upgrade(self, points: int) -> None:
         """Upgrade specific attributes (shield, armor)."""
         shield_increase = points // 2
         armor_increase = points - shield_increase
-        self.shield += shield_increase
-        self.armor += armor_increase
-        self.attack += 2
+        self.shield = self.base_stat("shield") + shield_increase
+        self.armor = self.base_stat("armor") + armor_increase
+        self.attack = self.base_stat("attack") + 2
 
         self.max_life += 10
         self.current_life += 10
@@ -100,7 +153,7 @@ class Warrior(Hero):
         if self.in_test:
             return
 
-        chance = random.randint(1, 100)
+        chance = roll_d100(self.rng)
         self.defend = chance <= self.shield
 
     def _reset_defend(self):
@@ -114,29 +167,21 @@ class Warrior(Hero):
         if self.in_rage:
             raise ValueError(f"{self.name} já está em Fúria! ATAQUE!!")
 
-        self.normal_state = {
-            "in_rage": self.in_rage,
-            "attack": self.attack,
-            "shield": self.shield,
-            "armor": self.armor,
-        }
-
         self.in_rage = True
-        self.attack = self.attack * 2
-        self.shield = 0
-        self.armor = 0
+        for modifier in self.RAGE_MODIFIERS:
+            self.add_modifier(modifier)
 
         # Some kind of clock to end rage when needed
         self.rage_duration = 2
 
+        bus = self.event_bus
+        if bus is not None:
+            bus.emit(StanceEntered, self, "enraged")
+
     def reset_rage(self) -> None:
         """Return attributes to normal values after a rage"""
-        self.in_rage = self.normal_state["in_rage"]
-        self.attack = self.normal_state["attack"]
-        self.shield = self.normal_state["shield"]
-        self.armor = self.normal_state["armor"]
-
-        self.normal_state = {}
+        self.in_rage = False
+        self.remove_modifiers("rage")
 
     def end_of_turn_routine(self):
         """Calls reset_rage for GameManager using."""
@@ -146,18 +191,24 @@ class Warrior(Hero):
             if self.rage_duration <= 0:
                 self.reset_rage()
 
-    def get_actions(self) -> dict:
-        """
-        Returns available combat actions for this archetype.
-        """
+    def snapshot(self) -> tuple:
+        """Entity snapshot plus defense and rage (see `Entity.snapshot`)."""
+        return (
+            super().snapshot(),
+            self._shield,
+            self._armor,
+            self.defend,
+            self.in_rage,
+            self.rage_duration,
+        )
 
-        return {
-            "1": {
-                "description": "Atacar (ataque básico com arma)",
-                "method": self.strike,
-            },
-            "2": {
-                "description": "Fúria (dobra ataque, sacrifica defesa)",
-                "method": self.to_rage,
-            },
-        }
+    def restore(self, snapshot: tuple) -> None:
+        (
+            base,
+            self._shield,
+            self._armor,
+            self.defend,
+            self.in_rage,
+            self.rage_duration,
+        ) = snapshot
+        super().restore(base)
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 import random
 from domain.element import Element
 from domain.entity import Entity
+from domain.fields import field, greater_than
 from domain.item import Item
 from domain.state import PoisonedState, BurnState, FrozenState, StunnedState
 
@@ -22,6 +23,10 @@ class Weapon(Item):
         element (Element): Element applied on strike.
     """
 
+    __slots__ = ("_base_damage", "_element", "_attacks")
+
+    allowed_class = ["Warrior"]
+
     def __init__(
         self,
         name: str,
@@ -33,65 +38,73 @@ class Weapon(Item):
         super().__init__(name, description, weight)
         self.base_damage = base_damage
         self.element = element
-        self.allowed_class = ["Warrior"]
-        self._attacks = {
+        self._attacks = self._menu()
+
+    # FIELDS (see `domain.fields`):
+
+    base_damage = field(
+        "_base_damage",
+        int,
+        "base_damage must be an integer",
+        check=greater_than(0, "base_damage must be greater than 0"),
+    )
+    element = field(
+        "_element",
+        Element,
+        "element must be a Element member. Example: Element.FIRE",
+    )
+
+    def get_attacks(self):
+        return self._attacks
+
+    def _menu(self) -> dict:
+        """The attack menu of `get_attacks`, built once per weapon."""
+        return {
             "1": {"description": "Ataque Normal", "method": self.attack},
             "2": {"description": "Ataque Pesado", "method": self.heavy_attack},
         }
 
-    @property
-    def base_damage(self) -> int:
-        return self._base_damage
-
-    @base_damage.setter
-    def base_damage(self, value: int) -> None:
-        if not isinstance(value, int):
-            raise TypeError("base_damage must be an integer")
-        if value <= 0:
-            raise ValueError("base_damage must be greater than 0")
-        self._base_damage = value
-
-    @property
-    def element(self) -> Element:
-        return self._element
+    def spawn(self) -> "Weapon":
+        clone = super().spawn()
+        clone._attacks = clone._menu()
+        return clone
 
-    @element.setter
-    def element(self, value: Element) -> None:
-        if not isinstance(value, Element):
-            raise TypeError("element must be a Element member. Example: Element.FIRE")
-        self._element = value
+    def _copy_into(self, clone: "Weapon") -> None:
+        super()._copy_into(clone)
+        clone._base_damage = self._base_damage
+        clone._element = self._element
 
-    def get_attacks(self):
-        return self._attacks
+    @staticmethod
+    def _rng_of(user) -> object:
+        """The wielder's random stream; the global module for anything else."""
+        return user.rng if isinstance(user, Entity) else random
 
-    def _apply_elemental_status(self, target: Entity) -> None:
-        """50% de chance de aplicar o status do elemento da arma no alvo."""
-        if random.random() <= 0.50:  # Role os dados!
-            status_atual = (
-                target.current_status.name
-                if getattr(target, "current_status", None)
-                else "Neutral"
-            )
+    def _apply_elemental_status(self, target: Entity, rng=random) -> None:
+        """
+        50% de chance de aplicar o status do elemento da arma no alvo.
+        Stacks over other effects, but never over one of the same kind.
+        """
+        if rng.random() <= 0.50:  # Role os dados!
+            status = None
+            if self.element == Element.FIRE:
+                status = BurnState(duration_turns=2, attack_decrease=5)
 
-            if status_atual == "Neutral":
-                if self.element == Element.FIRE:
-                    target.set_status(BurnState(duration_turns=2, attack_decrease=5))
+            elif self.element == Element.ICE:
+                status = FrozenState(duration_turns=2, speed_decrease=5)
 
-                elif self.element == Element.ICE:
-                    target.set_status(FrozenState(duration_turns=2, speed_decrease=5))
+            elif self.element == Element.POISON:
+                status = PoisonedState(duration_turns=2, damage_per_turns=5)
 
-                elif self.element == Element.POISON:
-                    target.set_status(
-                        PoisonedState(duration_turns=2, damage_per_turns=5)
-                    )
+            elif self.element == Element.LIGHTNING:
+                status = StunnedState(duration_turns=1)
 
-                elif self.element == Element.LIGHTNING:
-                    target.set_status(StunnedState(duration_turns=1))
+            if status is not None and not target.has_status(status.name):
+                target.add_status(status)
 
     def attack(self, user: Hero, target: Entity) -> None:
         damage = self.base_damage + user.attack
         target.damage_received(damage, self.element)
-        self._apply_elemental_status(target)
+        self._apply_elemental_status(target, self._rng_of(user))
 
     def heavy_attack(self, user: Hero, target: Entity) -> None:
         damage = int((self.base_damage + user.attack) * 2.0)
@@ -99,4 +112,4 @@ class Weapon(Item):
 
     def use(self, target: Hero) -> None:
         target.equip_weapon(self)
-        self._apply_elemental_status(target)
+        self._apply_elemental_status(target, self._rng_of(target))
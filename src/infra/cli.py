@@ -2,6 +2,8 @@ import os
 import sys
 import time
 
+from services.battle_events import render_events
+
 
 class Color:
     """
@@ -724,8 +726,12 @@ class CLI:
         hp_max: int,
         arte_monstro: str,
         nome_monstro: str,
+        dica: str | None = None,
     ) -> str:
-        """Desenha a tela de batalha e pede a ação do jogador."""
+        """
+        Desenha a tela de batalha e pede a ação do jogador.
+        `dica` é a sugestão do conselheiro de combate, mostrada abaixo do HP.
+        """
 
         barra_hp = CLI._gerar_barra_progresso(hp_atual, hp_max)
 
@@ -740,6 +746,8 @@ class CLI:
  {Color.ORANGE}HP: {cor_hp}{barra_hp}{Color.RESET}
 {Color.WHITE}============================================================{Color.RESET}
 """
+        if dica:
+            cena_batalha += f" {Color.GRAY}💡 {dica}{Color.RESET}\n"
 
         opcoes_menu_principal = [
             f"{Color.RED}Atacar{Color.RESET}",
@@ -796,6 +804,27 @@ class CLI:
                 input()
                 continue
 
+    @staticmethod
+    def choose_combat_target(alvos: list[tuple[str, int, int]]) -> int | None:
+        """
+        Pergunta qual monstro de uma horda atacar.
+        `alvos` traz (nome, hp, hp máximo) de cada monstro vivo; devolve o
+        índice do escolhido, ou None para voltar ao menu de combate.
+        """
+        opcoes = [
+            f"{Color.RED}{nome}{Color.RESET} {Color.GRAY}({hp}/{hp_max} HP){Color.RESET}"
+            for nome, hp, hp_max in alvos
+        ]
+        opcoes.append(f"{Color.GRAY}Voltar{Color.RESET}")
+
+        escolha_idx = CLI._mostrar_menu_interativo(
+            f"{Color.RED}ESCOLHA O ALVO:{Color.RESET}", opcoes
+        )
+
+        if escolha_idx == len(alvos):
+            return None
+        return escolha_idx
+
     @staticmethod
     def show_inventory(inventory_summary: dict) -> tuple[str, str] | None:
         """Exibe o inventário de forma interativa."""
@@ -907,6 +936,7 @@ class CLI:
         actions: list[str],
         status: dict[str, str],
         extra_status: dict[str, str] = None,  # ← NOVO: ammo, mana, etc.
+        events: list = None,
     ) -> None:
         """
         Exibe o resumo visual de um turno de combate.
@@ -914,7 +944,11 @@ class CLI:
         extra_status: dicionário opcional com recursos especiais do herói.
                       Chaves reconhecidas: 'ammo' (Arqueiro), 'mana' (Mago).
                       Ex: {"ammo": "7/10"} ou {"mana": "30/100"}
+        events: eventos de uma Battle em modo headless. Só viram texto aqui,
+                quando `actions` não é informado.
         """
+        if actions is None and events is not None:
+            actions = render_events(events)
 
         print("\n" + f"{Color.YELLOW}" + "=" * 60)
         turn_text = f"TURNO {turn_number}"
@@ -1,14 +1,19 @@
-from typing import List, Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
+from domain.actions import ENEMY
 from domain.consumable_item import ConsumableItem
 from domain.hero import Hero
+from domain.rng import RandomStream
 from domain.room import Room
 from domain.weapon import Weapon
 from infra.hero_repository import HeroRepository
 from services.battle import Battle
+from services.combat_advisor import CombatAdvisor
 from services.game_state import GameState
 from services.hero_factory import HeroFactory
-from services.level_factory import LevelFactory
+from services.level_factory import FloorWindow, LevelFactory, RoomPrefetcher
+from services.monster_factory import MonsterFactory
+from services.room_battle import RoomBattle
 
 # import game_state
 if TYPE_CHECKING:
@@ -19,17 +24,36 @@ class GameManager:
     """
     The orchestrator of the DungeonPy game.
     Manages the game state, room progression and the main game loop.
+
+    With `endless`, a new game has no last floor: the rooms keep coming,
+    ever stronger, and only the few most recent ones are kept in memory.
     """
 
-    def __init__(self, cli_instance: "CLI"):
+    def __init__(
+        self, cli_instance: "CLI", seed: Optional[int] = None, endless: bool = False
+    ):
         self._cli = cli_instance
+        # Seed asked for on the command line: None gives every new run its own.
+        self._seed = seed
+        # Root of every random stream of the run (rooms, loot and battles).
+        self._rng = RandomStream(seed)
+        self._battles_fought = 0
         self._hero: Optional[Hero] = None
-        self._dungeon: List[Room] = []
+        self._endless = endless
+        # Rooms are generated from the run seed as the hero reaches them.
+        self._dungeon: Optional[FloorWindow] = None
+        # Generates the next room on a worker thread while the player fights.
+        self._prefetcher: Optional[RoomPrefetcher] = None
+        self._current_room: Optional[Room] = None
         self._current_room_index: int = 0
         self._is_running: bool = True
 
         self._repository = HeroRepository()
         self._game_state: Optional[GameState] = None
+        self._advisor = CombatAdvisor()
+        # Last combat hint and the (battle, turn) it was computed for.
+        self._hint_turn: Optional[tuple[Battle, int]] = None
+        self._hint: Optional[str] = None
 
     # STARTING THE GAME:
 
@@ -63,6 +87,9 @@ class GameManager:
                 self._cli.display_message("Saindo do jogo... Até a próxima!")
                 self._is_running = False
 
+        if self._prefetcher:
+            self._prefetcher.close()
+
     def setup_new_game(self) -> None:
         """Prepares the board for accessing and using the factories."""
         name, hero_class = self._cli.ask_hero_info()
@@ -81,14 +108,12 @@ class GameManager:
 
         self._hero = HeroFactory.create_hero(archetype, name)
 
-        floors = 5
-        self._dungeon = [
-            LevelFactory.create_room(level=i) for i in range(1, floors + 1)
-        ]
-
-        self._game_state = GameState.create_new_game(self._hero)
+        self._game_state = GameState.create_new_game(self._hero, self._endless)
 
-        self._current_room_index = 0
+        # A new run: a new dungeon, unless a seed was asked for.
+        self._rng = RandomStream(self._seed)
+        self._battles_fought = 0
+        self._enter_dungeon(0)
         self.run_exploration_loop()
 
     # SAVE & LOAD:
@@ -105,6 +130,10 @@ class GameManager:
 
         self._game_state.hero = self._hero
         self._game_state.current_level = self._current_room_index + 1
+        # A dungeon é salva como a semente da partida + o que mudou nas salas.
+        self._game_state.seed = self._rng.root_seed
+        self._game_state.battles_fought = self._battles_fought
+        self._game_state.room_deltas = self._dungeon.deltas() if self._dungeon else {}
         self._game_state.update_save_timestamp()
 
         try:
@@ -132,14 +161,14 @@ class GameManager:
 
             self._hero = self._game_state.hero
 
-            # Recria a masmorra fresca para os monstros não quebrarem
-            floors = 5
-            self._dungeon = [
-                LevelFactory.create_room(level=i) for i in range(1, floors + 1)
-            ]
-
-            # Pula as salas para colocar o herói no nível onde ele salvou
-            self._current_room_index = self._game_state.current_level - 1
+            # Recria a mesma masmorra (saves antigos, sem semente: uma nova)
+            # e repete nela o que o herói já tinha feito.
+            if self._game_state.seed is not None:
+                self._rng = RandomStream(self._game_state.seed)
+            self._battles_fought = self._game_state.battles_fought
+            self._enter_dungeon(
+                self._game_state.current_level - 1, self._game_state.room_deltas
+            )
 
             self._cli.display_message(
                 f"Jogo carregado! Bem-vindo de volta às trevas, {self._hero.name}."
@@ -152,6 +181,33 @@ class GameManager:
             )
             return False
 
+    def _enter_dungeon(
+        self, room_index: int, room_deltas: Optional[dict] = None
+    ) -> None:
+        """
+        Generates the floors of the run from `room_index` on, as reached,
+        replaying the saved `room_deltas` on them.
+        """
+        floors = None if self._game_state.endless else GameState.MAX_LEVELS
+        self._dungeon = FloorWindow(self._rng.root_seed, floors=floors)
+        if room_deltas:
+            self._dungeon.restore(room_deltas)
+        if self._prefetcher:
+            self._prefetcher.close()
+        self._prefetcher = RoomPrefetcher(self._dungeon)
+        self._current_room_index = room_index
+        self._current_room = self._room_at(room_index)
+
+    def _room_at(self, room_index: int) -> Optional[Room]:
+        """The room of `room_index`, or None past the last floor."""
+        level = room_index + 1
+        if not self._dungeon.has_floor(level):
+            return None
+        room = self._prefetcher.room(level)
+        # The next one is generated while the hero is busy in this one.
+        self._prefetcher.prefetch(level + 1)
+        return room
+
     # LOOPS:
 
     def run_exploration_loop(self):
@@ -160,8 +216,8 @@ class GameManager:
         # Notepad for remembering rooms.
         last_room_described = -1
 
-        while self._is_running and self._current_room_index < len(self._dungeon):
-            current_room = self._dungeon[self._current_room_index]
+        while self._is_running and self._current_room is not None:
+            current_room = self._current_room
 
             if self._current_room_index != last_room_described:
                 self._cli.print_room_description(current_room.get_description())
@@ -177,8 +233,9 @@ class GameManager:
 
                 if choice == "1":  # GO FOWARD
                     self._current_room_index += 1
+                    self._current_room = self._room_at(self._current_room_index)
 
-                    if self._current_room_index >= len(self._dungeon):
+                    if self._current_room is None:
                         self._cli.show_victory(self._hero.name)
                         self._is_running = False
 
@@ -192,12 +249,24 @@ class GameManager:
                     self._is_running = False
 
     def run_combat_loop(self, room: Room):
-        """Orchestrates the fight in the current room."""
+        """
+        Orchestrates the fight in the current room: one monster at a time,
+        or the whole horde at once on a horde floor.
+        """
         room_level = self._current_room_index + 1
+        if LevelFactory.is_horde_floor(room_level):
+            return self.run_horde_combat_loop(room)
 
         while room.monsters:
             current_monsters = room.monsters[0]
-            battle = Battle(self._hero, current_monsters)
+            self._battles_fought += 1
+            battle = Battle(
+                self._hero,
+                current_monsters,
+                headless=True,
+                rng=self._rng.spawn(("battle", self._battles_fought)),
+                environment=room.environment,
+            )
 
             turn_counter = 1
 
@@ -217,6 +286,7 @@ class GameManager:
                     hp_max=self._hero.max_life,
                     arte_monstro=getattr(current_monsters, "art", ""),
                     nome_monstro=current_monsters.name,
+                    dica=self._combat_hint(battle, actions),
                 )
 
                 if choice == "inventario":
@@ -225,27 +295,11 @@ class GameManager:
                 try:
                     turn_result = battle.execute_turn(choice)
                     log = turn_result.get("turn_log", {})
-                    actions_list = log.get("actions", [])
 
                 except Exception as e:
                     self._cli.display_message(str(e))
                     continue
 
-                # Build extra status info (ammo for Archer, mana for Mage, etc.)
-                extra_status = {}
-                if hasattr(self._hero, "current_ammo") and hasattr(
-                    self._hero, "max_ammo"
-                ):
-                    extra_status["ammo"] = (
-                        f"{self._hero.current_ammo}/{self._hero.max_ammo}"
-                    )
-                if hasattr(self._hero, "current_mana") and hasattr(
-                    self._hero, "max_mana"
-                ):
-                    extra_status["mana"] = (
-                        f"{self._hero.current_mana}/{self._hero.max_mana}"
-                    )
-
                 self._cli.display_turn_log(
                     turn_number=turn_counter,
                     hero_name=self._hero.name,
@@ -254,9 +308,10 @@ class GameManager:
                     monster_name=current_monsters.name,
                     monster_hp=current_monsters.current_life,
                     monster_max_hp=current_monsters.max_life,
-                    actions=actions_list,
+                    actions=None,
                     status={self._hero.name: hero_status},
-                    extra_status=extra_status,
+                    extra_status=self._extra_status(),
+                    events=log.get("events", []),
                 )
 
                 # Ação falhou (sem munição, sem mana, etc.): não avança o turno
@@ -267,46 +322,180 @@ class GameManager:
                 turn_counter += 1
 
                 if not self._hero.is_it_alive():
-                    game_over_choice = self._cli.show_game_over()
+                    return self._handle_defeat()
 
-                    if game_over_choice == "1":
-                        if self._repository.has_save():
-                            self.load_game()
+                if hasattr(self._hero, "end_of_turn_routine"):
+                    self._hero.end_of_turn_routine()
 
-                        else:
-                            self._cli.display_message(
-                                "Você não possui um jogo salvo! Vai ter que ir do começo..."
-                            )
-                            self.setup_new_game()
+            self._collect_loot(current_monsters.name, current_monsters.get_loot())
 
-                    return False
+            room.remove_defeated_monster()
+            if not current_monsters.is_it_alive():
+                MonsterFactory.recycle(current_monsters)
+            self.process_room_clear()
 
-                if hasattr(self._hero, "end_of_turn_routine"):
-                    self._hero.end_of_turn_routine()
+        return True
 
-            loot = current_monsters.get_loot()
-            dropped_names = []
-            missed_names = []
+    def run_horde_combat_loop(self, room: Room) -> bool:
+        """
+        Orchestrates the fight against every monster of a horde room at once
+        (see `RoomBattle`). Area actions hit the whole horde; the other
+        attacks ask which monster to hit.
+        """
+        room_level = self._current_room_index + 1
+        self._battles_fought += 1
+        battle = RoomBattle(
+            self._hero,
+            room,
+            headless=True,
+            rng=self._rng.spawn(("battle", self._battles_fought)),
+        )
+        horde_size = len(battle.monsters)
+        turn_counter = 1
+
+        while battle.is_combat_active:
+            living = battle.living_monsters
+            actions = battle.get_available_actions()
+            choice = self._cli.get_combat_choice(
+                acoes_do_heroi=actions,
+                nome_heroi=self._hero.name,
+                nivel_heroi=room_level,
+                hp_atual=self._hero.current_life,
+                hp_max=self._hero.max_life,
+                arte_monstro=getattr(living[0], "art", ""),
+                nome_monstro=f"HORDA: {len(living)} de {horde_size} inimigos",
+            )
 
-            for item in loot:
-                if self._hero.inventory.can_add_item(item):
-                    self._hero.inventory.add_item_to_inventory(item)
-                    dropped_names.append(item.name)
-                else:
-                    missed_names.append(item.name)
+            if choice == "inventario":
+                self.open_inventory_menu()
+                continue
 
-            self._cli.show_battle_reward(
-                monster_name=current_monsters.name,
-                dropped_items=dropped_names,
-                missed_items=missed_names,
-                leveled_up=True,
+            target = None
+            action = self._hero.action_view().actions.get(choice)
+            if (
+                action is not None
+                and action.spec.targeting == ENEMY
+                and len(living) > 1
+            ):
+                target = self._cli.choose_combat_target(
+                    [(m.name, m.current_life, m.max_life) for m in living]
+                )
+                if target is None:
+                    continue
+            try:
+                log = battle.execute_turn(choice, target)["turn_log"]
+
+            except Exception as e:
+                self._cli.display_message(str(e))
+                continue
+
+            hero_status = self._hero.current_status.name
+            self._cli.display_turn_log(
+                turn_number=turn_counter,
+                hero_name=self._hero.name,
+                hero_hp=self._hero.current_life,
+                hero_max_hp=self._hero.max_life,
+                monster_name="Horda",
+                monster_hp=sum(m.current_life for m in battle.living_monsters),
+                monster_max_hp=sum(m.max_life for m in battle.monsters),
+                actions=None,
+                status={self._hero.name: hero_status},
+                extra_status=self._extra_status(),
+                events=log["events"],
             )
 
-            room.remove_defeated_monster()
-            self.process_room_clear()
+            # Ação falhou: o herói escolhe de novo (o RoomBattle não gasta a vez).
+            if not log.get("action_failed"):
+                turn_counter += 1
+
+        # Monstros mais rápidos que o herói podem vencer antes da 1ª escolha.
+        if not self._hero.is_it_alive():
+            return self._handle_defeat()
+
+        self._collect_loot(
+            f"Horda de {horde_size} inimigos", battle.get_combat_result()["loot"]
+        )
+
+        for monster in battle.monsters:
+            room.remove_monster(monster)
+            MonsterFactory.recycle(monster)
+        self.process_room_clear()
 
         return True
 
+    def _extra_status(self) -> dict:
+        """Extra status info of the hero (ammo for Archer, mana for Mage, etc.)."""
+        extra_status = {}
+        if hasattr(self._hero, "current_ammo") and hasattr(self._hero, "max_ammo"):
+            extra_status["ammo"] = f"{self._hero.current_ammo}/{self._hero.max_ammo}"
+        if hasattr(self._hero, "current_mana") and hasattr(self._hero, "max_mana"):
+            extra_status["mana"] = f"{self._hero.current_mana}/{self._hero.max_mana}"
+        return extra_status
+
+    def _collect_loot(self, defeated_name: str, loot: list) -> None:
+        """Puts the `loot` in the hero's inventory and shows the reward screen."""
+        dropped_names = []
+        missed_names = []
+
+        for item in loot:
+            if self._hero.inventory.can_add_item(item):
+                self._hero.inventory.add_item_to_inventory(item)
+                dropped_names.append(item.name)
+            else:
+                missed_names.append(item.name)
+
+        self._cli.show_battle_reward(
+            monster_name=defeated_name,
+            dropped_items=dropped_names,
+            missed_items=missed_names,
+            leveled_up=True,
+        )
+
+    def _handle_defeat(self) -> bool:
+        """Game over screen: reloads the save or starts over. Returns False."""
+        game_over_choice = self._cli.show_game_over()
+
+        if game_over_choice == "1":
+            if self._repository.has_save():
+                self.load_game()
+
+            else:
+                self._cli.display_message(
+                    "Você não possui um jogo salvo! Vai ter que ir do começo..."
+                )
+                self.setup_new_game()
+
+        return False
+
+    def _combat_hint(self, battle: Battle, actions: dict) -> Optional[str]:
+        """
+        Advisor suggestion for the combat menu, in the player's language.
+        Computed once per turn: the menu is drawn again after the inventory
+        or a failed action, and each advice runs several timed searches.
+        """
+        turn = (battle, battle.turn_count)
+        if turn != self._hint_turn:
+            self._hint_turn = turn
+            self._hint = self._advise(battle, actions)
+        return self._hint
+
+    def _advise(self, battle: Battle, actions: dict) -> Optional[str]:
+        try:
+            advice = self._advisor.advise_battle(battle)
+        except (TypeError, ValueError):
+            # Situations the advisor does not model (e.g. hero with a status).
+            return None
+
+        action = actions.get(advice.action)
+        if action is None:
+            return None
+        hint = (
+            f"Sugestão: {action['description']} (chance de vitória ~{advice.value:.0%})"
+        )
+        if advice.consumable:
+            hint += f" — beba '{advice.consumable}' antes (Inventário)"
+        return hint
+
     def open_inventory_menu(self) -> None:
         """Manages the inventory display and interactions."""
 
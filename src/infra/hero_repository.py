@@ -14,6 +14,7 @@ from domain.ranged_weapon import RangedWeapon
 from domain.warrior import Warrior
 from domain.weapon import Weapon
 from services.game_state import GameState
+from services.items_factory import ItemsFactory
 
 if TYPE_CHECKING:
     from domain.weapon import Weapon
@@ -41,6 +42,21 @@ class HeroRepository:
 
     @staticmethod
     def _serialize_item(item: Item) -> Dict[str, Any]:
+        data = HeroRepository._serialize_item_data(item)
+
+        # A catalog item still as its definition builds it is saved as its id.
+        catalog_id = item.catalog_id
+        if catalog_id is not None:
+            catalog = ItemsFactory.catalog()
+            if catalog_id in catalog:
+                pristine = catalog.create(catalog_id)
+                if data == HeroRepository._serialize_item_data(pristine):
+                    return {"id": catalog_id}
+
+        return data
+
+    @staticmethod
+    def _serialize_item_data(item: Item) -> Dict[str, Any]:
         base_data = {
             "name": item.name,
             "description": item.get_description(),
@@ -97,8 +113,8 @@ class HeroRepository:
             "name": hero.name,
             "max_life": hero.max_life,
             "current_life": hero.current_life,
-            "attack": hero.attack,
-            "speed": hero.speed,
+            "attack": hero.base_stat("attack"),
+            "speed": hero.base_stat("speed"),
             "element": hero.element.value,
             "inventory": HeroRepository._serialize_inventory(hero.inventory),
             "equipped_weapon": (
@@ -112,8 +128,8 @@ class HeroRepository:
             return {
                 "type": "warrior",
                 **base_data,
-                "shield": hero.shield,
-                "armor": hero.armor,
+                "shield": hero.base_stat("shield"),
+                "armor": hero.base_stat("armor"),
             }
 
         elif isinstance(hero, Mage):
@@ -146,6 +162,9 @@ class HeroRepository:
 
     @staticmethod
     def _deserialize_item(data: Dict[str, Any]) -> Item:
+        if "id" in data:
+            return ItemsFactory.catalog().create(data["id"])
+
         item_type = data["type"]
 
         if item_type == "consumable":
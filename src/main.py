@@ -1,11 +1,44 @@
+import sys
+from typing import Optional, Sequence
+
 from infra.cli import CLI
 from infra.game_manager import GameManager
 
 
+def parse_seed(args: Sequence[str]) -> Optional[int]:
+    """
+    The seed of `--seed N` (or `--seed=N`) in `args`; None when absent.
+    Raises ValueError when the seed is missing or is not a whole number.
+    """
+    for position, arg in enumerate(args):
+        if arg == "--seed":
+            value = args[position + 1] if position + 1 < len(args) else ""
+        elif arg.startswith("--seed="):
+            value = arg.removeprefix("--seed=")
+        else:
+            continue
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError(
+                f"--seed precisa de um número inteiro, recebido: '{value}'"
+            ) from None
+    return None
+
+
 def main():
+    args = sys.argv[1:]
     interface = CLI()
 
-    jogo = GameManager(interface)
+    # `--seed N`: repete a mesma dungeon (salas, loot e batalhas).
+    try:
+        seed = parse_seed(args)
+    except ValueError as e:
+        print(f"\n[ERRO]: {e}")
+        return
+
+    # `--infinito`: modo infinito, sem último andar.
+    jogo = GameManager(interface, seed=seed, endless="--infinito" in args)
 
     try:
         jogo.start_game()
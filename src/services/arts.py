@@ -1,139 +1,9 @@
 """
 File to storage the monsters arts :)
+
+The arts live in the content packs (`content/arts.toml`), by monster name.
 """
 
-MONSTER_ARTS = {
-    "Salamandra": r"""
-      (  )   
-     (    )  
-    (______) 
-     \  /    
-     )  (    
-    """,
-    "Goblin": r"""
-      ,      ,
-     /(.-""-.)\
- |\  \/      \/  /|
- | \ / =.  .= \ / |
- \( \   o\/o   / )/
-  \_, '-/  \-' ,_/
-    /   \__/   \ 
-    """,
-    # É vital ter uma arte padrão para monstros que você
-    # ainda não teve tempo de desenhar/pegar da internet!
-    "DEFAULT": r"""
-       ??????
-      ?      ?
-     ?  O  O  ?
-      ?  __  ?
-       ??????
-    """,
-    "Lobo de Fogo": r"""
-                     .
-                   / V\
-                 / `  /
-                <<   |
-                /    |
-              /      |
-            /        |
-          /    \  \ /
-         (      ) | |
-  _______|   _/_  | |
-<_________\______)\__)
-""",
-    "Golem de Gelo": r"""
-       ._________.
-      /  _     _  \
-     |  [#]   [#]  |
-     |     ___     |
-    _|____[___]____|_
-   / / /|       |\ \ \
-  /_/_/ |_______| \_\_\
-        |   |   |
-        |___|___|
+from services.content import content
 
-""",
-    "Yeti": r"""
-       / \-----/ \
-      /           \
-     |   ><   ><   |
-     |             |
-      \     W     /
-      /___________\
-     / /|, , , ,| \ \
-    / / |_______|  \ \
-   <___|         |___>
-       |____|____|
-""",
-    "Espectro Congelado": r"""
-              .-.
-             (o o)
-            _ \=/ _
-           /\/   \/\
-          / /     \ \
-          \ \_____/ /
-           \/\/ \/\/
-            \/   \/
-             '   '
-""",
-    "Raijin": r"""
-           ()------()
-          /  ^    ^  \
-      ()--| \O/  \O/ |--()
-       |  |   _||_   |  |
-      ()  |  /(  )\  |  ()
-       |  \          /  |
-      ()---\        /---()
-            \______/
-""",
-    "Medusa Elétrica": r"""
-             .-------.
-           /   O   O   \
-          |    \___/    |
-           \___________/
-            / /  |  \ \
-           / /  / \  \ \
-          < <  <   >  > >
-           \ \  \ /  / /
-            \_\  V  /_/
-                 *
-""",
-    "Slime Corrosivo": r"""
-       \____/
-       (o  o)   
-      /  ()  \   
-     /________\  
-    """,
-    "Aranha Tóxica": r"""
-        /      \  
-    \  \  ,,  /  /
-     '-.`\()/`.-'
-    .--_'(  )'_--.
-   / /` /`""`\ `\ \
-    |  |  ><  |  | 
-    \  \      /  /
-        '.__.'  
-""",
-    "Sapo Venenoso": r"""
-              _
-  __   ___.--'_`.
- ( _`.'. -   'o` )
- _\.'_'      _.-' 
-( \`. )    //\`
- \_`-'`---'\\__,
-  \`        `-\
-   `
-""",
-    "Cavaleiro de Fogo": r"""
- /` /         \, \
-(`-(          )-')
- \-'\,-'"`- ./`-/
-  \-')      (`-/
-  /`'        `'\
- (  _       _   )
- | ( \     / )  |
- |  `.\   /,'   |
- |    `\ /'     |
- (              )
-""",
-}
+MONSTER_ARTS = content().monster_arts
@@ -0,0 +1,385 @@
+"""
+Structure-of-arrays combat engine for balancing.
+
+`BatchBattle` advances thousands of hero-vs-monster fights in lockstep. Every
+combat attribute (life, attack, element, status, duration, ammo, mana...) is a
+NumPy array with one slot per fight, and each turn applies the same rules as
+`Battle` + `simulation.basic_policy` as vectorized operations:
+
+    - Turn order by speed, fixed when the fight starts (hero wins ties).
+    - The room's element multipliers on every hit and on poison ticks, looked
+      up for all fights at once in `ElementMatrix.environment_array()`.
+    - Warrior shield block roll and armor reduction.
+    - Archer dodge roll, ammo consumption and `RangedWeapon.hit_probability`.
+    - Mage mana cost per cast and `meditate` cooldown.
+    - 50% elemental status proc on neutral targets (Burn, Frozen, Poison, Stun).
+
+Heroes are assumed to start in the Neutral state (monsters never apply status).
+Requires NumPy (dev dependency group).
+"""
+
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from domain.archer import Archer
+from domain.element import ELEMENT_MATRIX, Element
+from domain.hero import Hero
+from domain.mage import Mage
+from domain.monster import Monster
+from domain.warrior import Warrior
+from services.simulation import DEFAULT_MAX_TURNS, SimulationStats
+
+WARRIOR, MAGE, ARCHER = 0, 1, 2
+
+NEUTRAL_STATUS, BURNED, FROZEN, POISONED, STUNNED = 0, 1, 2, 3, 4
+
+ELEMENTS = list(Element)
+ELEMENT_INDEX = {element: element.index for element in ELEMENTS}
+
+# Status applied by Weapon._apply_elemental_status: (status, duration)
+ELEMENT_STATUS = {
+    Element.FIRE: (BURNED, 2),
+    Element.ICE: (FROZEN, 2),
+    Element.POISON: (POISONED, 2),
+    Element.LIGHTNING: (STUNNED, 1),
+}
+
+STATUS_ATTACK_DECREASE = 5
+STATUS_DAMAGE_PER_TURN = 5
+STATUS_PROC_CHANCE = 0.50
+MEDITATE_COOLDOWN = 3
+
+VICTORY, TIMEOUT, DEFEAT = 1, 0, -1
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("BatchBattle requires NumPy: uv sync --group dev")
+
+
+def _columns(hero: Hero, monster: Monster, environment: Element | None = None) -> dict:
+    """Flattens a hero/monster pair (and their room) into one batch row."""
+    weapon = hero.equipped_weapon
+
+    if isinstance(hero, Warrior):
+        kind = WARRIOR
+    elif isinstance(hero, Mage):
+        kind = MAGE
+    elif isinstance(hero, Archer):
+        kind = ARCHER
+    else:
+        raise TypeError(f"Unsupported hero archetype: {type(hero).__name__}")
+
+    return {
+        "hero_kind": kind,
+        "hero_first": hero.speed >= monster.speed,
+        "hero_life": hero.current_life,
+        "hero_attack": hero.attack,
+        "hero_element": ELEMENT_INDEX[hero.element],
+        "shield": hero.shield if kind == WARRIOR else 0,
+        "armor": hero.armor if kind == WARRIOR else 0,
+        "dodge_chance": hero.speed if kind == ARCHER else 0,
+        "ammo": hero.current_ammo if kind == ARCHER else 0,
+        "max_ammo": hero.max_ammo if kind == ARCHER else 0,
+        "mana": hero.current_mana if kind == MAGE else 0,
+        "max_mana": hero.max_mana if kind == MAGE else 0,
+        "cooldown": hero.meditate_cooldown if kind == MAGE else 0,
+        "has_weapon": weapon is not None,
+        "weapon_damage": weapon.base_damage if weapon else 0,
+        "weapon_element": ELEMENT_INDEX[weapon.element if weapon else Element.NEUTRAL],
+        "ammo_required": getattr(weapon, "ammo_required", 0),
+        "hit_probability": getattr(weapon, "hit_probability", 100),
+        "mana_cost": getattr(weapon, "mana_cost", 0),
+        "monster_life": monster.current_life,
+        "monster_attack": monster.attack,
+        "monster_element": ELEMENT_INDEX[monster.element],
+        "environment": ELEMENT_INDEX[environment or Element.NEUTRAL],
+    }
+
+
+@dataclass
+class BatchResult:
+    """
+    Per-fight outcome arrays.
+
+    Attributes:
+        outcome: VICTORY (1), DEFEAT (-1) or TIMEOUT (0) per fight.
+        turns: Turns played per fight (failed actions are not counted).
+        hero_life: Hero life left per fight.
+    """
+
+    outcome: "np.ndarray"
+    turns: "np.ndarray"
+    hero_life: "np.ndarray"
+
+    def to_stats(self) -> SimulationStats:
+        """Aggregates the arrays in the same format as the Monte Carlo simulator."""
+        won = self.outcome == VICTORY
+        turns, counts = np.unique(self.turns[won], return_counts=True)
+
+        stats = SimulationStats(
+            trials=int(self.outcome.size),
+            wins=int(won.sum()),
+            timeouts=int((self.outcome == TIMEOUT).sum()),
+            turns_to_kill_total=int(self.turns[won].sum()),
+            remaining_hp_total=int(self.hero_life[won].sum()),
+        )
+        stats.turns_histogram.update(dict(zip(turns.tolist(), counts.tolist())))
+        return stats
+
+
+class BatchBattle:
+    """
+    Runs many independent fights as one structure of arrays.
+
+    Build it with `repeat` (one matchup copied `size` times) or `from_pairs`
+    (one row per hero/monster pair), then call `run`. Each fight may happen
+    in a room of its own environment (`Battle(environment=...)`).
+    """
+
+    def __init__(self, columns: dict, seed=None, max_turns: int = DEFAULT_MAX_TURNS):
+        _require_numpy()
+
+        self.size = len(columns["hero_life"])
+        self.max_turns = max_turns
+        self.rng = np.random.default_rng(seed)
+        # multipliers[environment, strike element, target element]
+        self.multipliers = ELEMENT_MATRIX.environment_array()
+        self.environment = np.full(self.size, ELEMENT_INDEX[Element.NEUTRAL])
+
+        for name, values in columns.items():
+            dtype = bool if name in ("hero_first", "has_weapon") else np.int64
+            setattr(self, name, np.array(values, dtype=dtype))
+
+        self.status = np.zeros(self.size, dtype=np.int64)
+        self.duration = np.zeros(self.size, dtype=np.int64)
+        self.status_applied = np.zeros(self.size, dtype=bool)
+
+        self.active = np.ones(self.size, dtype=bool)
+        self.turns = np.zeros(self.size, dtype=np.int64)
+        self.battle_turns = np.zeros(self.size, dtype=np.int64)
+        self._failed = np.zeros(self.size, dtype=bool)
+
+    @classmethod
+    def repeat(
+        cls,
+        hero: Hero,
+        monster: Monster,
+        size: int,
+        environment: Element | None = None,
+        **kwargs,
+    ) -> "BatchBattle":
+        """Copies a single matchup `size` times."""
+        _require_numpy()
+        row = _columns(hero, monster, environment)
+        return cls(
+            {name: np.full(size, value) for name, value in row.items()}, **kwargs
+        )
+
+    @classmethod
+    def from_pairs(
+        cls, pairs: list, environments: list | None = None, **kwargs
+    ) -> "BatchBattle":
+        """
+        One fight per (hero, monster) pair, archetypes may be mixed.
+        `environments` gives the room of each pair (None: neutral rooms).
+        """
+        if environments is None:
+            environments = [None] * len(pairs)
+        elif len(environments) != len(pairs):
+            raise ValueError("One environment is needed per pair")
+
+        rows = [
+            _columns(hero, monster, environment)
+            for (hero, monster), environment in zip(pairs, environments)
+        ]
+        return cls({name: [row[name] for row in rows] for name in rows[0]}, **kwargs)
+
+    # TURN PHASES:
+
+    def _multiplier(self, idx, strike, target):
+        """Multipliers of the fights in `idx` for the given element indices."""
+        return self.multipliers[self.environment[idx], strike, target]
+
+    def _roll(self, count: int):
+        """Vectorized `random.randint(1, 100)`."""
+        return self.rng.integers(1, 101, size=count)
+
+    def _hero_phase(self, idx) -> None:
+        """Hero action chosen by `basic_policy` for the fights in `idx`."""
+        kind = self.hero_kind[idx]
+
+        reload = (kind == ARCHER) & (self.ammo[idx] < self.ammo_required[idx])
+        meditate = (
+            (kind == MAGE)
+            & self.has_weapon[idx]
+            & (self.mana[idx] < self.mana_cost[idx])
+            & (self.cooldown[idx] == 0)
+        )
+
+        reloading = idx[reload]
+        self.ammo[reloading] = self.max_ammo[reloading]
+
+        meditating = idx[meditate]
+        self.mana[meditating] = np.minimum(
+            self.mana[meditating] + self.max_mana[meditating] // 2,
+            self.max_mana[meditating],
+        )
+        self.cooldown[meditating] = MEDITATE_COOLDOWN
+
+        strikers = idx[~(reload | meditate)]
+        kind = self.hero_kind[strikers]
+        armed = self.has_weapon[strikers]
+
+        # Actions that raise ValueError cancel the whole turn.
+        failed = ~armed & (kind != MAGE)
+        failed |= (
+            (kind == MAGE) & armed & (self.mana[strikers] < self.mana_cost[strikers])
+        )
+        failed |= (kind == ARCHER) & (
+            self.ammo[strikers] < self.ammo_required[strikers]
+        )
+        self._failed[strikers[failed]] = True
+        strikers = strikers[~failed]
+        kind = self.hero_kind[strikers]
+        armed = self.has_weapon[strikers]
+
+        casting = strikers[(kind == MAGE) & armed]
+        self.mana[casting] -= self.mana_cost[casting]
+
+        # Mage without grimoire: 1 neutral damage, no status.
+        punching = strikers[~armed]
+        punch = self._multiplier(
+            punching, ELEMENT_INDEX[Element.NEUTRAL], self.monster_element[punching]
+        )
+        self.monster_life[punching] -= np.trunc(punch).astype(np.int64)
+
+        archers = kind == ARCHER
+        shooting = strikers[archers]
+        self.ammo[shooting] -= self.ammo_required[shooting]
+
+        hit = np.ones(strikers.size, dtype=bool)
+        hit[archers] = self._roll(shooting.size) <= self.hit_probability[shooting]
+        hitting = strikers[armed & hit]
+
+        damage = self.weapon_damage[hitting] + self.hero_attack[hitting]
+        multiplier = self._multiplier(
+            hitting, self.weapon_element[hitting], self.monster_element[hitting]
+        )
+        self.monster_life[hitting] -= np.trunc(damage * multiplier).astype(np.int64)
+        np.maximum(self.monster_life, 0, out=self.monster_life)
+
+        self._proc_status(hitting)
+
+    def _proc_status(self, idx) -> None:
+        """Weapon._apply_elemental_status for the fights in `idx`."""
+        proc = (self.rng.random(idx.size) <= STATUS_PROC_CHANCE) & (
+            self.status[idx] == NEUTRAL_STATUS
+        )
+        for element, (status, duration) in ELEMENT_STATUS.items():
+            applied = idx[proc & (self.weapon_element[idx] == ELEMENT_INDEX[element])]
+            self.status[applied] = status
+            self.duration[applied] = duration
+            self.status_applied[applied] = False
+
+    def _monster_status_phase(self, idx) -> None:
+        """Battle._apply_status_effects for the monsters in `idx`."""
+        status = self.status[idx]
+        ticking = (status != NEUTRAL_STATUS) & (self.duration[idx] > 0)
+
+        expired = idx[(status != NEUTRAL_STATUS) & ~ticking]
+        self.status[expired] = NEUTRAL_STATUS
+        self.status_applied[expired] = False
+
+        ticking = idx[ticking]
+        burned = ticking[self.status[ticking] == BURNED]
+        starting = burned[~self.status_applied[burned]]
+        self.monster_attack[starting] = np.maximum(
+            self.monster_attack[starting] - STATUS_ATTACK_DECREASE, 0
+        )
+
+        frozen = ticking[self.status[ticking] == FROZEN]
+        self.status_applied[starting] = True
+        self.status_applied[frozen] = True
+
+        poisoned = ticking[self.status[ticking] == POISONED]
+        poison = self._multiplier(
+            poisoned, ELEMENT_INDEX[Element.POISON], self.monster_element[poisoned]
+        )
+        self.monster_life[poisoned] -= np.trunc(STATUS_DAMAGE_PER_TURN * poison).astype(
+            np.int64
+        )
+        np.maximum(self.monster_life, 0, out=self.monster_life)
+
+        self.duration[ticking] -= 1
+        ending = burned[self.duration[burned] <= 0]
+        self.monster_attack[ending] += STATUS_ATTACK_DECREASE
+
+    def _monster_phase(self, idx) -> None:
+        """Status tick, then `Monster.strike` against each archetype's defense."""
+        self._monster_status_phase(idx)
+
+        idx = idx[(self.monster_life[idx] > 0) & (self.status[idx] != STUNNED)]
+        kind = self.hero_kind[idx]
+        multiplier = self._multiplier(
+            idx, self.monster_element[idx], self.hero_element[idx]
+        )
+        raw = multiplier * self.monster_attack[idx]
+
+        damage = np.trunc(raw)
+        roll = self._roll(idx.size)
+
+        warriors = kind == WARRIOR
+        blocked = warriors & (roll <= self.shield[idx])
+        damage[warriors] = np.maximum(
+            0, np.trunc(raw[warriors] - self.armor[idx[warriors]])
+        )
+
+        dodged = (kind == ARCHER) & (roll <= self.dodge_chance[idx])
+
+        damage[blocked | dodged] = 0
+        self.hero_life[idx] -= damage.astype(np.int64)
+        np.maximum(self.hero_life, 0, out=self.hero_life)
+
+    # LOOP:
+
+    def _alive(self):
+        return (self.hero_life > 0) & (self.monster_life > 0)
+
+    def step(self) -> None:
+        """Advances every active fight by one `Battle.execute_turn`."""
+        playing = self.active.copy()
+        self._failed[:] = False
+
+        first = np.flatnonzero(playing & self.hero_first)
+        second = np.flatnonzero(playing & ~self.hero_first)
+        self._hero_phase(first)
+        self._monster_phase(second)
+
+        still = playing & self._alive() & ~self._failed
+        self._hero_phase(np.flatnonzero(still & ~self.hero_first))
+        self._monster_phase(np.flatnonzero(still & self.hero_first))
+
+        self.battle_turns[playing] += 1
+
+        # GameManager only spends the turn (and ticks cooldowns) on success.
+        spent = playing & ~self._failed
+        self.turns[spent] += 1
+        cooling = spent & (self.cooldown > 0)
+        self.cooldown[cooling] -= 1
+
+        self.active = playing & self._alive() & (self.battle_turns < self.max_turns)
+
+    def run(self) -> BatchResult:
+        while self.active.any():
+            self.step()
+
+        outcome = np.full(self.size, TIMEOUT, dtype=np.int64)
+        outcome[(self.monster_life == 0) & (self.hero_life > 0)] = VICTORY
+        outcome[self.hero_life == 0] = DEFEAT
+
+        return BatchResult(outcome, self.turns.copy(), self.hero_life.copy())
@@ -1,9 +1,37 @@
-from typing import List
+import random
+from typing import Iterable, List
+from domain import events as domain_events
+from domain.element import ELEMENT_MATRIX, Element
 from domain.entity import Entity
 from domain.hero import Hero
 from domain.monster import Monster
-from domain.state import NeutralState
-from domain.consumable_item import ConsumableItem
+from domain.actions import ALL_ENEMIES, SELF
+from domain.rng import RandomStream
+from services.battle_events import (
+    AbilityUsed,
+    ActionFailed,
+    ActionPrevented,
+    Blocked,
+    ConsumableRejected,
+    ConsumableUsed,
+    DamageDealt,
+    Dodged,
+    Missed,
+    ResourceChanged,
+    SpecialStateEntered,
+    StatusApplied,
+    RenderedEvents,
+    render_events,
+)
+
+# Domain events the turn log is built from. Life, ammo and mana are not
+# among them: their changes are read from the fighters around each action.
+RECORDED_EVENTS = (
+    domain_events.Dodged,
+    domain_events.Blocked,
+    domain_events.StatusApplied,
+    domain_events.StanceEntered,
+)
 
 
 class Battle:
@@ -16,11 +44,45 @@ class Battle:
         - Check if a participant can act (e.g., Stunned prevents action).
         - Detect the end of combat (death of one side).
         - Collect loot in case of victory.
+
+    Every turn is recorded as typed events (see `services.battle_events`) in
+    `turn_log["events"]`. In headless mode the text lines of
+    `turn_log["actions"]` are only rendered if someone reads them (see
+    `RenderedEvents`).
+
+    When `rng` (a `RandomStream`) is given, both fighters roll their dice
+    from it, so the battle is reproducible and independent of any other
+    battle running at the same time.
+
+    `environment` is the element of the room the fight happens in: strikes
+    use that room's multipliers (see `ElementMatrix.for_environment`).
+
+    The fighters publish what happens to them on the battle's `event_bus`
+    (see `domain.events`); the log records the outcomes that leave no value
+    behind (dodges, blocks, new statuses, stances) while an action runs.
+    Life, ammo and mana are read before and after the action instead, so a
+    plain hit costs no event at all. Other subscribers (telemetry,
+    achievements...) may register on the same bus.
+
+    The rng, the room multipliers and the bus are lent to the fighters for
+    the fight only: `close` takes them back when it ends.
     """
 
-    def __init__(self, hero: Hero, monster: Monster):
+    def __init__(
+        self,
+        hero: Hero,
+        monster: Monster,
+        headless: bool = False,
+        rng: RandomStream | None = None,
+        environment: Element | None = None,
+    ):
         self.hero = hero
         self.monster = monster
+        self.headless = headless
+        self.rng = rng
+        self._enter_environment(environment)
+        self._open_event_bus()
+        self._join([hero, monster])
         self.turn_count = 0
         self.is_combat_active = True
         self.turn_order = self._determine_turn_order()
@@ -35,6 +97,11 @@ class Battle:
             raise TypeError("Entrada não é instância de 'Hero'")
         self._hero = input
 
+        # Archetype resources are looked up once instead of on every turn.
+        self._hero_uses_ammo = hasattr(input, "current_ammo")
+        self._hero_uses_mana = hasattr(input, "current_mana")
+        self._hero_uses_rage = hasattr(input, "in_rage")
+
     @property
     def monster(self):
         return self._monster
@@ -55,299 +122,308 @@ class Battle:
             return [self.hero, self.monster]
 
     def _apply_status_effects(self, entity: Entity) -> None:
-        current_effect = entity.current_status
-        if current_effect.duration_turns > 0:
-            current_effect.apply_effect(entity)
-        else:
-            entity.set_status(NeutralState())
+        entity.tick_statuses()
 
     def _can_act(self, entity: Entity) -> bool:
-        return True if not entity.current_status.prevents_action() else False
+        return entity.preventing_status() is None
 
     def _is_combat_over(self) -> bool:
-        self.hero.is_active = self.hero.is_it_alive()
-        self.monster.is_active = self.monster.is_it_alive()
-
-        return not self.hero.is_active or not self.monster.is_active
+        hero = self._hero
+        monster = self._monster
+        hero.is_active = hero_alive = hero.is_it_alive()
+        monster.is_active = monster_alive = monster.is_it_alive()
+
+        return not hero_alive or not monster_alive
+
+    def _enter_environment(self, environment: Element | None) -> None:
+        """Picks the multipliers of the room (plain ones outside)."""
+        self.environment = environment
+        self.element_matrix = ELEMENT_MATRIX.for_environment(environment)
+
+    def _open_event_bus(self) -> None:
+        """Opens the battle's bus and records what the fighters publish on it."""
+        self.event_bus = domain_events.EventBus()
+        # Domain events published while the current action runs.
+        self._published: list = []
+        for event_type in RECORDED_EVENTS:
+            self.event_bus.subscribe(event_type, self._published.append)
+
+    def _join(self, entities: Iterable[Entity]) -> None:
+        """Makes `entities` the fighters of the battle and attaches them."""
+        self._fighters = list(entities)
+        self._attach()
+
+    def _attach(self) -> None:
+        """Lends every fighter the battle's rng (if any), multipliers and bus."""
+        for entity in self._fighters:
+            if self.rng is not None:
+                entity.rng = self.rng
+            entity.element_matrix = self.element_matrix
+            entity.event_bus = self.event_bus
+        self._attached = True
+
+    def close(self) -> None:
+        """
+        Detaches the fighters from the battle: they stop publishing on its
+        bus and go back to the global dice and the plain multipliers.
+        `execute_turn` calls it when the fight ends; calling it again, or
+        on a fight that is abandoned, is harmless.
+        """
+        for entity in self._fighters:
+            if entity.event_bus is self.event_bus:
+                entity.event_bus = None
+            if self.rng is not None and entity.rng is self.rng:
+                entity.rng = random
+            if entity.element_matrix is self.element_matrix:
+                entity.element_matrix = ELEMENT_MATRIX
+        self._attached = False
+
+    def _ammo_event(self, before: int) -> ResourceChanged:
+        """The hero's ammo, `before` being its value when the action started."""
+        hero = self._hero
+        return ResourceChanged(
+            hero.name, "ammo", before, hero.current_ammo, hero.max_ammo
+        )
 
-    def _get_archer_ammo_info(self) -> str | None:
-        """Returns a formatted ammo string if hero is an Archer, else None."""
-        if hasattr(self.hero, "current_ammo") and hasattr(self.hero, "max_ammo"):
-            return f"[Flechas: {self.hero.current_ammo}/{self.hero.max_ammo}]"
-        return None
+    def _mana_event(self, before: int) -> ResourceChanged | None:
+        """The hero's mana change in the current action, if it changed."""
+        hero = self._hero
+        if before == hero.current_mana:
+            return None
+        return ResourceChanged(
+            hero.name, "mana", before, hero.current_mana, hero.max_mana
+        )
 
     def _execute_hero_action(self, choice: str, turn_log: dict) -> bool:
         """
-        Executes the hero's chosen action and enriches the turn_log.
+        Executes the hero's chosen action and records what happened as events.
 
         Returns:
             bool: True if the action consumed the hero's turn (attacks, skills,
-                  consumables), False if it was a non-turn action (reserved for
-                  future use). Currently all actions consume the turn.
+                  consumables), False if it failed and the turn must be cancelled.
         """
-        actions = self.get_available_actions()
+        events = turn_log["events"]
+        hero = self._hero
+        monster = self._monster
 
-        if choice not in actions:
-            raise ValueError(f"Ação {choice} é inválida.")
+        action = hero.action_view().actions.get(choice)
 
-        selected_action = actions[choice]
-        action_method = selected_action["method"]
-        action_description = selected_action["description"]
+        # Area actions need every enemy; they are dispatched by RoomBattle.
+        if action is None or action.spec.targeting == ALL_ENEMIES:
+            raise ValueError(f"Ação {choice} é inválida.")
 
-        # --- Detect consumable use BEFORE executing ---
-        consumable_item = getattr(action_method, "__self__", None)
-        is_consumable_action = isinstance(consumable_item, ConsumableItem)
+        spec = action.spec
+        action_description = spec.describe(hero) if spec.live else action.description
+        consumable_item = action.item
+        is_consumable_action = consumable_item is not None
 
         # Bloqueia poção de mana para classes sem mana (Guerreiro, Arqueiro).
         if (
             is_consumable_action
-            and getattr(consumable_item, "recovery_type", "life") == "mana"
+            and consumable_item.recovery_type == "mana"
+            and not self._hero_uses_mana
         ):
-            if not hasattr(self.hero, "current_mana"):
-                turn_log["actions"].append(
-                    f"⚠️  {self.hero.name} tentou usar '{action_description}', "
-                    f"mas não possui mana. Apenas Magos se beneficiam disso."
-                )
-                turn_log["action_failed"] = True
-                return False
-
-        # --- Detect special states BEFORE executing (aim / rage) ---
-        was_aiming_before = getattr(self.hero, "is_aiming", False)
-        was_enraged_before = getattr(self.hero, "in_rage", False)
-
-        # --- Snapshot life values to detect damage dealt / received ---
-        monster_life_before = self.monster.current_life
-        hero_life_before = self.hero.current_life
-        monster_status_before = (
-            self.monster.current_status.name
-            if self.monster.current_status
-            else "Neutral"
-        )
+            events.append(ConsumableRejected(hero.name, action_description))
+            turn_log["action_failed"] = True
+            return False
+
+        # The action consumes these stances; the damage event still shows them.
+        aimed = self._hero_uses_ammo and hero.is_aiming
+        enraged = self._hero_uses_rage and hero.in_rage
+
+        published = self._published
+        published.clear()
+        # Values before the action: the log reports how they changed.
+        hero_life = hero.current_life
+        monster_life = monster.current_life
+        ammo = hero.current_ammo if self._hero_uses_ammo else 0
+        mana = hero.current_mana if self._hero_uses_mana else 0
 
         try:
-            action_result = action_method(self.monster)
-        except TypeError:
-            action_result = action_method()
+            if is_consumable_action:
+                action_result = consumable_item.use(hero)
+            elif spec.targeting == SELF:
+                action_result = action.method()
+            else:
+                action_result = action.method(monster)
         except ValueError as e:
-            turn_log["actions"].append(f"⚠️  {self.hero.name}: {e}")
+            events.append(ActionFailed(hero.name, str(e)))
             turn_log["action_failed"] = True
             return False
 
         # 1. Consumable used: inform recovery and that the turn was spent
         if is_consumable_action:
-            recovery_type = getattr(consumable_item, "recovery_type", "life")
-            if recovery_type == "mana":
-                turn_log["actions"].append(
-                    f"🧪 {self.hero.name} usou '{action_description}' e recuperou "
-                    f"{consumable_item.recovered_value} de mana. "
-                    f"MP: {self.hero.current_mana}/{self.hero.max_mana}. (Turno consumido)"
+            hero.inventory.remove_item_from_inventory(consumable_item)
+            if consumable_item.recovery_type == "mana":
+                events.append(
+                    ConsumableUsed(
+                        hero.name,
+                        action_description,
+                        "mana",
+                        consumable_item.recovered_value,
+                        hero.current_mana,
+                        hero.max_mana,
+                    )
                 )
             else:
-                life_recovered = self.hero.current_life - hero_life_before
-                turn_log["actions"].append(
-                    f"🧪 {self.hero.name} usou '{action_description}' e recuperou "
-                    f"{life_recovered} de vida. (Turno consumido)"
+                events.append(
+                    ConsumableUsed(
+                        hero.name,
+                        action_description,
+                        "life",
+                        hero.current_life - hero_life,
+                        hero.current_life,
+                        hero.max_life,
+                    )
                 )
             turn_log["hero_used_consumable"] = True
             return True  # Turn is consumed
 
-        # 2. Aiming: Archer sacrificed the turn to focus
-        if not was_aiming_before and getattr(self.hero, "is_aiming", False):
-            turn_log["actions"].append(
-                f"🎯 {self.hero.name} está mirando! Próximo ataque terá acerto "
-                f"garantido e dano aumentado. (Turno consumido)"
-            )
-            turn_log["special_state"] = "aiming"
-            ammo_info = self._get_archer_ammo_info()
-            if ammo_info:
-                turn_log["actions"].append(f"   {ammo_info}")
+        # 2. Stance: Archer aimed or Warrior activated fury (turn consumed)
+        stance = next(
+            (
+                event.stance
+                for event in published
+                if type(event) is domain_events.StanceEntered
+            ),
+            None,
+        )
+        if stance is not None:
+            events.append(SpecialStateEntered(hero.name, stance))
+            if stance == "aiming":
+                events.append(self._ammo_event(ammo))
+            turn_log["special_state"] = stance
             return True
 
-        # 3. Rage: Warrior activated fury
-        if not was_enraged_before and getattr(self.hero, "in_rage", False):
-            turn_log["actions"].append(
-                f"💢 {self.hero.name} entra em FÚRIA! Defesa reduzida, mas próximo "
-                f"ataque causará dano dobrado. (Turno consumido)"
-            )
-            turn_log["special_state"] = "enraged"
-            return True
+        damage_dealt = monster_life - monster.current_life
 
-        # 4. Reload: Archer reloaded (no target, turn consumed)
-        ammo_after = getattr(self.hero, "current_ammo", None)
-        ammo_max = getattr(self.hero, "max_ammo", None)
-        if ammo_after is not None and ammo_max is not None:
-            ammo_info = f"[Flechas: {ammo_after}/{ammo_max}]"
-            ammo_before_action = getattr(self, "_ammo_snapshot", ammo_after)
-            if (
-                ammo_after > ammo_before_action
-                and monster_life_before == self.monster.current_life
-            ):
-                turn_log["actions"].append(
-                    f"🔄 {self.hero.name} recarregou a aljava! {ammo_info} (Turno consumido)"
-                )
+        # 3. Reload: Archer reloaded (no target, turn consumed)
+        if self._hero_uses_ammo and damage_dealt == 0:
+            ammo_event = self._ammo_event(ammo)
+            if ammo_event.after > ammo_event.before:
+                events.append(ammo_event)
                 return True
 
-        # 5. Attack: verifica se o ataque zerou (erro do Arqueiro ou dano muito baixo)
-        damage_dealt = monster_life_before - self.monster.current_life
-
+        # 4. Attack: abilities narrate themselves, the rest is built from damage
         if isinstance(action_result, str):
-            turn_log["actions"].append(f"✨ {action_result}")
+            events.append(AbilityUsed(hero.name, action_result, damage_dealt))
 
-            # (Opcional: Se quiser que o Tiro Triplo também mostre super efetivo,
-            # você pode colocar a lógica do multiplier aqui dentro também!)
+        elif damage_dealt <= 0 and self._hero_uses_ammo and not aimed:
+            events.append(Missed(hero.name, monster.name))
 
-        # SE NÃO TEM TEXTO PRÓPRIO, USA A NOSSA LÓGICA PADRÃO DE DANO:
-        elif damage_dealt <= 0:
-            if hasattr(self.hero, "current_ammo") and not was_aiming_before:
-                turn_log["actions"].append(
-                    f"💨 {self.hero.name} atirou, mas a flecha errou o alvo!"
-                )
-            else:
-                turn_log["actions"].append(
-                    f"🛡️ {self.hero.name} atacou, mas o golpe foi fraco demais para ferir {self.monster.name}!"
-                )
         else:
             # Descobre o elemento que o herói usou para atacar
-            if hasattr(self.hero, "equipped_weapon") and self.hero.equipped_weapon:
-                atk_element = self.hero.equipped_weapon.element
-            else:
-                atk_element = self.hero.element
-
-            # Calcula a matemática reversa para mostrar o dano base!
-            multiplier = atk_element.multiplier(self.monster.element)
-            base_damage_calc = (
-                int(damage_dealt / multiplier) if multiplier > 0 else damage_dealt
-            )
-            if was_enraged_before:
-                base_damage_calc = base_damage_calc // 2
-
-            # Monta a mensagem rica
-            attack_msg = f"⚔️  {self.hero.name} usou '{action_description}' com {base_damage_calc} de dano."
-
-            # Adiciona os modificadores de classe
-            if was_aiming_before:
-                attack_msg += " 🎯 (Mira: Acerto Crítico!)"
-            if was_enraged_before:
-                attack_msg += " 💢 (Fúria: Dano Base Dobrado!)"
-
-            # Adiciona a efetividade elemental no final
-            if multiplier > 1.0:
-                attack_msg += f" 🌟 Super Efetivo! Dano final aumentou para {damage_dealt} em {self.monster.name}."
-            elif multiplier < 1.0:
-                attack_msg += f" 🛡️ Resistido... Dano final caiu para {damage_dealt} em {self.monster.name}."
-            else:
-                attack_msg += (
-                    f" Causou {damage_dealt} de dano final em {self.monster.name}."
+            weapon = hero.equipped_weapon
+            atk_element = weapon.element if weapon else hero.element
+
+            events.append(
+                DamageDealt(
+                    hero.name,
+                    monster.name,
+                    damage_dealt,
+                    self.element_matrix.multiplier(atk_element, monster.element),
+                    action_description,
+                    aimed,
+                    enraged,
                 )
+            )
 
-            turn_log["actions"].append(attack_msg)
-
-        monster_status_after = (
-            self.monster.current_status.name
-            if self.monster.current_status
-            else "Neutral"
-        )
+        # Effects stack, so a new one on top of another is reported too.
+        for event in published:
+            if type(event) is domain_events.StatusApplied and event.target is monster:
+                events.append(StatusApplied(monster.name, event.status.name))
 
-        if monster_status_before == "Neutral" and monster_status_after != "Neutral":
-            status_pt = {
-                "Burned": "🔥 QUEIMADURA",
-                "Frozen": "❄️ CONGELAMENTO",
-                "Poison": "☠️ VENENO",
-                "Stunned": "⚡ ATORDOAMENTO",
-            }
-            nome_status = status_pt.get(monster_status_after, monster_status_after)
-            turn_log["actions"].append(
-                f"✨ O ataque do seu elemento aplicou {nome_status} em {self.monster.name}!"
-            )
+        if self._hero_uses_mana:
+            mana_event = self._mana_event(mana)
+            if mana_event is not None:
+                events.append(mana_event)
 
-        # Always append ammo info for Archer after any action
-        ammo_info = self._get_archer_ammo_info()
-        if ammo_info:
-            turn_log["actions"].append(f"   {ammo_info}")
+        # Always report ammo for Archer after any action
+        if self._hero_uses_ammo:
+            events.append(self._ammo_event(ammo))
 
         return True
 
     def _execute_monster_action(self, turn_log: dict) -> None:
         """
-        Executes the monster's attack against the hero and enriches the turn_log,
-        reporting dodge (Archer) and block (Warrior) outcomes.
+        Executes the monster's attack against the hero and records the outcome,
+        including dodge (Archer) and block (Warrior).
         """
-        hero_life_before = self.hero.current_life
-
-        self.monster.strike(self.hero)
-
-        hero_life_after = self.hero.current_life
-        damage_taken = hero_life_before - hero_life_after
-
-        # --- Dodge (Archer) ---
-        # After damage_received(), the Archer resets self.dodge to False if it dodged.
-        # We detect the dodge by checking: was dodge True before, and now life didn't drop.
-        dodged = getattr(self.hero, "last_dodged", False)
-        if dodged:
-            turn_log["actions"].append(
-                f"💨 {self.hero.name} esquivou do ataque de {self.monster.name}!"
-            )
-            # Reseta o aviso para não ficar esquivando para sempre
-            self.hero.last_dodged = False
-            return
-
-        # --- Block (Warrior) ---
-        # Warrior.damage_received sets self.last_blocked = True when a block occurs.
-        blocked = getattr(self.hero, "last_blocked", False)
-        if blocked:
-            turn_log["actions"].append(
-                f"🛡️  {self.hero.name} bloqueou o ataque de {self.monster.name}! "
-                f"Dano reduzido: -{damage_taken} HP."
-            )
-            # Reset the flag so it doesn't persist to next turn
-            self.hero.last_blocked = False
-            return
-
-        # --- Normal hit ---
-        if damage_taken > 0:
-            multiplier_monstro = self.monster.element.multiplier(self.hero.element)
-            base_damage_monstro = (
-                int(damage_taken / multiplier_monstro)
-                if multiplier_monstro > 0
-                else damage_taken
+        events = turn_log["events"]
+        hero = self._hero
+        monster = self._monster
+
+        published = self._published
+        published.clear()
+        hero_life = hero.current_life
+
+        monster.strike(hero)
+
+        damage_taken = hero_life - hero.current_life
+
+        for event in published:
+            kind = type(event)
+            # --- Dodge (Archer) ---
+            if kind is domain_events.Dodged and event.defender is hero:
+                events.append(Dodged(hero.name, monster.name))
+                return
+            # --- Block (Warrior) ---
+            if kind is domain_events.Blocked and event.defender is hero:
+                events.append(Blocked(hero.name, monster.name, damage_taken))
+                return
+
+        # --- Hit (a zero means the armor absorbed the whole strike) ---
+        events.append(
+            DamageDealt(
+                monster.name,
+                hero.name,
+                damage_taken,
+                self.element_matrix.multiplier(monster.element, hero.element),
             )
+        )
 
-            msg = f"🐉 {self.monster.name} atacou {self.hero.name} com {base_damage_monstro} de dano."
+    def snapshot(self) -> tuple:
+        """
+        Captures the whole fight (both entities included) as nested tuples.
 
-            if multiplier_monstro > 1.0:
-                msg += f" 🌟 Super Efetivo! Dano final aumentou para {damage_taken}."
-            elif multiplier_monstro < 1.0:
-                msg += f" 🛡️ Resistido... Dano final caiu para {damage_taken}."
-            else:
-                msg += f" Causou {damage_taken} de dano."
+        `restore` rewinds to it, so a search can try an action, look at the
+        result and go back, thousands of times per second.
+        """
+        return (
+            self.turn_count,
+            self.is_combat_active,
+            self.hero.snapshot(),
+            self.monster.snapshot(),
+        )
 
-            turn_log["actions"].append(msg)
-        else:
-            # Hit but dealt no damage (e.g. full armor absorption)
-            turn_log["actions"].append(
-                f"🐉 {self.monster.name} atacou {self.hero.name}, mas a armadura absorveu todo o impacto!"
-            )
+    def restore(self, snapshot: tuple) -> None:
+        self.turn_count, self.is_combat_active, hero, monster = snapshot
+        self.hero.restore(hero)
+        self.monster.restore(monster)
+        # Rewinding a finished fight lends the fighters back to it.
+        if not self._attached and self.is_combat_active:
+            self._attach()
 
     def get_available_actions(self) -> dict:
         return self.hero.get_actions()
 
     def execute_turn(self, player_choice: str) -> dict:
+        events = []
+        status = {}
         turn_log = {
             "turn": self.turn_count + 1,
-            "actions": [],
-            "status": {},
+            "events": events,
+            "status": status,
             "combat_over": False,
             "hero_used_consumable": False,
             "special_state": None,
         }
-
-        # Snapshot ammo at the start of turn for reload detection
-        self._ammo_snapshot = getattr(self.hero, "current_ammo", None)
+        hero = self._hero
 
         for entity in self.turn_order:
             # Apply status effects
             self._apply_status_effects(entity)
-            turn_log["status"][entity.name] = entity.current_status.name
+            status[entity.name] = entity.current_status.name
 
             # Check if died from status effect
             if self._is_combat_over():
@@ -357,13 +433,13 @@ class Battle:
 
             # Check if can act
             if not self._can_act(entity):
-                turn_log["actions"].append(
-                    f"😵 {entity.name} está impedido de agir ({entity.current_status.name})."
+                events.append(
+                    ActionPrevented(entity.name, entity.preventing_status().name)
                 )
                 continue
 
             # Execute action
-            if entity is self.hero:
+            if entity is hero:
                 action_succeeded = self._execute_hero_action(player_choice, turn_log)
 
                 # If the action fails (e.g., no ammunition/mana), the entire turn is canceled.
@@ -380,14 +456,24 @@ class Battle:
                 self.is_combat_active = False
                 break
 
-        combat_result = self.get_combat_result()
-        self.turn_count += 1
+        if self.headless:
+            turn_log["actions"] = RenderedEvents(events)
+        else:
+            turn_log["actions"] = render_events(events)
 
-        return {
-            "result": combat_result["result"],
-            "loot": combat_result["loot"],
-            "turn_log": turn_log,
-        }
+        self.turn_count += 1
+        # The loop above already checked whether the fight is over.
+        if self.is_combat_active:
+            return {"result": "ongoing", "loot": [], "turn_log": turn_log}
+
+        self.close()
+        if hero.is_active:
+            return {
+                "result": "victory",
+                "loot": self._monster.get_loot(),
+                "turn_log": turn_log,
+            }
+        return {"result": "defeat", "loot": [], "turn_log": turn_log}
 
     def get_combat_result(self) -> dict:
         if self._is_combat_over():
@@ -0,0 +1,310 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+# The records are built on every action, so they are plain slotted classes:
+# a frozen dataclass costs about three times as much to build. Nothing
+# changes them once they are in a turn log.
+
+
+@dataclass(slots=True)
+class ActionFailed:
+    """The hero's action raised an error; the whole turn is cancelled."""
+
+    actor: str
+    reason: str
+
+
+@dataclass(slots=True)
+class ConsumableRejected:
+    """A mana potion was picked by a hero that has no mana."""
+
+    actor: str
+    item: str
+
+
+@dataclass(slots=True)
+class ConsumableUsed:
+    """A consumable restored `amount` points of `resource` ("life" or "mana")."""
+
+    actor: str
+    item: str
+    resource: str
+    amount: int
+    current: int
+    maximum: int
+
+
+@dataclass(slots=True)
+class SpecialStateEntered:
+    """The hero spent the turn entering a special state ("aiming" or "enraged")."""
+
+    actor: str
+    state: str
+
+
+@dataclass(slots=True)
+class AbilityUsed:
+    """An ability that narrates itself (e.g. `Mage.ancient_magic`)."""
+
+    actor: str
+    text: str
+    damage: int
+
+
+@dataclass(slots=True)
+class DamageDealt:
+    """
+    Damage applied by `source` to `target`.
+
+    `action` is the description of the hero action used, or None for a
+    monster's basic strike.
+    """
+
+    source: str
+    target: str
+    damage: int
+    multiplier: float
+    action: str | None = None
+    aimed: bool = False
+    enraged: bool = False
+
+
+@dataclass(slots=True)
+class Missed:
+    """A ranged attack failed its hit roll."""
+
+    source: str
+    target: str
+
+
+@dataclass(slots=True)
+class Dodged:
+    """The defender (Archer) dodged the attacker's strike."""
+
+    defender: str
+    attacker: str
+
+
+@dataclass(slots=True)
+class Blocked:
+    """The defender (Warrior) blocked the attacker's strike with the shield."""
+
+    defender: str
+    attacker: str
+    damage: int
+
+
+@dataclass(slots=True)
+class StatusApplied:
+    """A status effect was applied on a previously neutral target."""
+
+    target: str
+    status: str
+
+
+@dataclass(slots=True)
+class ActionPrevented:
+    """The entity skipped its action because of its status (e.g. Stunned)."""
+
+    actor: str
+    status: str
+
+
+@dataclass(slots=True)
+class Defeated:
+    """The entity fell in a room battle (see `services.room_battle`)."""
+
+    actor: str
+
+
+@dataclass(slots=True)
+class ResourceChanged:
+    """Snapshot of a hero resource ("ammo" or "mana") after an action."""
+
+    actor: str
+    resource: str
+    before: int
+    after: int
+    maximum: int
+
+
+STATUS_NAMES_PT = {
+    "Burned": "🔥 QUEIMADURA",
+    "Frozen": "❄️ CONGELAMENTO",
+    "Poison": "☠️ VENENO",
+    "Stunned": "⚡ ATORDOAMENTO",
+}
+
+
+def _base_damage(damage: int, multiplier: float) -> int:
+    """Reverses the elemental multiplier to show the damage before it."""
+    return int(damage / multiplier) if multiplier > 0 else damage
+
+
+def _render_damage(event: DamageDealt) -> str:
+    if event.action is None:
+        if event.damage <= 0:
+            return (
+                f"🐉 {event.source} atacou {event.target}, mas a armadura "
+                f"absorveu todo o impacto!"
+            )
+
+        msg = (
+            f"🐉 {event.source} atacou {event.target} com "
+            f"{_base_damage(event.damage, event.multiplier)} de dano."
+        )
+        if event.multiplier > 1.0:
+            msg += f" 🌟 Super Efetivo! Dano final aumentou para {event.damage}."
+        elif event.multiplier < 1.0:
+            msg += f" 🛡️ Resistido... Dano final caiu para {event.damage}."
+        else:
+            msg += f" Causou {event.damage} de dano."
+        return msg
+
+    if event.damage <= 0:
+        return (
+            f"🛡️ {event.source} atacou, mas o golpe foi fraco demais para "
+            f"ferir {event.target}!"
+        )
+
+    base_damage = _base_damage(event.damage, event.multiplier)
+    if event.enraged:
+        base_damage = base_damage // 2
+
+    msg = f"⚔️  {event.source} usou '{event.action}' com {base_damage} de dano."
+
+    if event.aimed:
+        msg += " 🎯 (Mira: Acerto Crítico!)"
+    if event.enraged:
+        msg += " 💢 (Fúria: Dano Base Dobrado!)"
+
+    if event.multiplier > 1.0:
+        msg += f" 🌟 Super Efetivo! Dano final aumentou para {event.damage} em {event.target}."
+    elif event.multiplier < 1.0:
+        msg += f" 🛡️ Resistido... Dano final caiu para {event.damage} em {event.target}."
+    else:
+        msg += f" Causou {event.damage} de dano final em {event.target}."
+    return msg
+
+
+def render_event(event) -> str | None:
+    """
+    Turns a single event into the Portuguese line shown in the turn log.
+
+    Returns None for events that carry data only (e.g. mana snapshots).
+    """
+    if isinstance(event, DamageDealt):
+        return _render_damage(event)
+
+    if isinstance(event, ResourceChanged):
+        if event.resource != "ammo":
+            return None
+        ammo_info = f"[Flechas: {event.after}/{event.maximum}]"
+        if event.after > event.before:
+            return (
+                f"🔄 {event.actor} recarregou a aljava! {ammo_info} (Turno consumido)"
+            )
+        return f"   {ammo_info}"
+
+    if isinstance(event, StatusApplied):
+        status = STATUS_NAMES_PT.get(event.status, event.status)
+        return f"✨ O ataque do seu elemento aplicou {status} em {event.target}!"
+
+    if isinstance(event, Dodged):
+        return f"💨 {event.defender} esquivou do ataque de {event.attacker}!"
+
+    if isinstance(event, Blocked):
+        return (
+            f"🛡️  {event.defender} bloqueou o ataque de {event.attacker}! "
+            f"Dano reduzido: -{event.damage} HP."
+        )
+
+    if isinstance(event, Missed):
+        return f"💨 {event.source} atirou, mas a flecha errou o alvo!"
+
+    if isinstance(event, AbilityUsed):
+        return f"✨ {event.text}"
+
+    if isinstance(event, ActionPrevented):
+        return f"😵 {event.actor} está impedido de agir ({event.status})."
+
+    if isinstance(event, Defeated):
+        return f"💀 {event.actor} foi derrotado!"
+
+    if isinstance(event, SpecialStateEntered):
+        if event.state == "aiming":
+            return (
+                f"🎯 {event.actor} está mirando! Próximo ataque terá acerto "
+                f"garantido e dano aumentado. (Turno consumido)"
+            )
+        return (
+            f"💢 {event.actor} entra em FÚRIA! Defesa reduzida, mas próximo "
+            f"ataque causará dano dobrado. (Turno consumido)"
+        )
+
+    if isinstance(event, ConsumableUsed):
+        if event.resource == "mana":
+            return (
+                f"🧪 {event.actor} usou '{event.item}' e recuperou "
+                f"{event.amount} de mana. "
+                f"MP: {event.current}/{event.maximum}. (Turno consumido)"
+            )
+        return (
+            f"🧪 {event.actor} usou '{event.item}' e recuperou "
+            f"{event.amount} de vida. (Turno consumido)"
+        )
+
+    if isinstance(event, ConsumableRejected):
+        return (
+            f"⚠️  {event.actor} tentou usar '{event.item}', "
+            f"mas não possui mana. Apenas Magos se beneficiam disso."
+        )
+
+    if isinstance(event, ActionFailed):
+        return f"⚠️  {event.actor}: {event.reason}"
+
+    raise TypeError(f"Evento de batalha desconhecido: {type(event).__name__}")
+
+
+def render_events(events: list) -> list[str]:
+    """Renders a turn's events into the text lines shown by the CLI."""
+    lines = []
+    for event in events:
+        line = render_event(event)
+        if line is not None:
+            lines.append(line)
+    return lines
+
+
+class RenderedEvents(Sequence):
+    """
+    The text lines of a turn's `events`, rendered the first time they are
+    read. Headless battles put one in `turn_log["actions"]`: callers that
+    read the text still get it, the others never pay for it.
+    """
+
+    __slots__ = ("_events", "_lines")
+
+    def __init__(self, events: list):
+        self._events = events
+        self._lines: list[str] | None = None
+
+    @property
+    def lines(self) -> list[str]:
+        if self._lines is None:
+            self._lines = render_events(self._events)
+        return self._lines
+
+    def __getitem__(self, index):
+        return self.lines[index]
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RenderedEvents):
+            other = other.lines
+        return self.lines == other
+
+    def __repr__(self) -> str:
+        return f"RenderedEvents({self.lines!r})"
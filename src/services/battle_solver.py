@@ -0,0 +1,757 @@
+"""
+Exact battle outcomes through Markov-chain dynamic programming.
+
+A fight between one hero and one monster under a fixed policy is a small
+stochastic process: both lives, the monster's status (with its remaining
+duration and the attack lost to Burn), ammo and aim, mana and the meditate
+cooldown, and the Warrior's rage clock. `BattleModel` describes one
+`Battle.execute_turn` as a probability distribution over the next
+`CombatState`; `solve` enumerates every reachable state once and computes
+the exact win probability and expected turns, instead of sampling `Battle`.
+
+The rules mirror `Battle` + `GameManager`:
+    - Turn order by speed, fixed when the battle starts (hero wins ties).
+    - Status effects tick at the start of each entity's slot.
+    - A failed hero action (ValueError) ends the turn immediately; it is not
+      counted and `end_of_turn_routine` is not called.
+    - Consumables are used outside `execute_turn` and are not modelled.
+
+Heroes must start Neutral (monsters never apply status effects).
+
+Usage (from `src/`):
+    python -m services.battle_solver warrior --level 3 --element fire --boss
+"""
+
+import argparse
+from dataclasses import dataclass
+from typing import Callable, NamedTuple
+
+from domain.archer import Archer
+from domain.element import ELEMENT_MATRIX, Element, ElementMatrix
+from domain.hero import Hero
+from domain.mage import Mage
+from domain.monster import Monster
+from domain.warrior import Warrior
+from services.hero_factory import VALID_ARCHETYPES
+from services.simulation import MonsterSpec, create_simulation_hero
+
+NEUTRAL_STATUS, BURNED, FROZEN, POISONED, STUNNED = (
+    "Neutral",
+    "Burned",
+    "Frozen",
+    "Poison",
+    "Stunned",
+)
+
+# Status applied by Weapon._apply_elemental_status: (status, duration)
+ELEMENT_STATUS = {
+    Element.FIRE: (BURNED, 2),
+    Element.ICE: (FROZEN, 2),
+    Element.POISON: (POISONED, 2),
+    Element.LIGHTNING: (STUNNED, 1),
+}
+
+STATUS_PROC_CHANCE = 0.50
+BURN_ATTACK_DECREASE = 5
+POISON_DAMAGE = 5
+RAGE_DURATION = 2
+MEDITATE_COOLDOWN = 3
+ULTIMATE_AMMO_COST = 3
+ULTIMATE_LIFE_RECOIL = 15
+ANCIENT_MAGIC_COST = 50
+
+
+class CombatState(NamedTuple):
+    """
+    Everything that changes during a fight. Hashable, so it can key the memo.
+
+    Attributes:
+        hero_life (int): Hero current life.
+        monster_life (int): Monster current life.
+        monster_attack (int): Monster attack, lowered while Burned.
+        status (str): Monster status name (see the *_STATUS constants).
+        duration (int): Remaining `duration_turns` of the monster status.
+        status_applied (bool): Burn already lowered the monster attack.
+        ammo (int): Archer ammo (0 for other archetypes).
+        aiming (bool): Archer is aiming.
+        mana (int): Mage mana (0 for other archetypes).
+        cooldown (int): Mage meditate cooldown.
+        rage (int): Warrior rage turns left (0 when not enraged).
+    """
+
+    hero_life: int
+    monster_life: int
+    monster_attack: int
+    status: str = NEUTRAL_STATUS
+    duration: int = 0
+    status_applied: bool = False
+    ammo: int = 0
+    aiming: bool = False
+    mana: int = 0
+    cooldown: int = 0
+    rage: int = 0
+
+
+class Transition(NamedTuple):
+    """One possible result of a turn. `counted` is False for failed actions."""
+
+    probability: float
+    state: CombatState
+    counted: bool
+
+
+@dataclass(frozen=True)
+class Matchup:
+    """
+    The values of a hero/monster pair that never change during the fight.
+
+    `hero_matrix` and `monster_matrix` are the element multipliers of the
+    strikes each side takes: the room's, in an elemental room.
+    """
+
+    archetype: str
+    hero_first: bool
+    hero_attack: int
+    hero_element: Element
+    monster_element: Element
+    has_weapon: bool
+    weapon_damage: int = 0
+    weapon_element: Element = Element.NEUTRAL
+    shield: int = 0
+    armor: int = 0
+    dodge_chance: int = 0
+    max_ammo: int = 0
+    ammo_required: int = 0
+    hit_probability: int = 100
+    max_mana: int = 0
+    mana_cost: int = 0
+    hero_matrix: ElementMatrix = ELEMENT_MATRIX
+    monster_matrix: ElementMatrix = ELEMENT_MATRIX
+
+    @classmethod
+    def from_entities(
+        cls, hero: Hero, monster: Monster, environment: Element | None = None
+    ) -> "Matchup":
+        """
+        The matchup of `hero` and `monster`, fighting in a room of
+        `environment` (None: with the matrices the fighters already hold).
+        """
+        if hero.current_status.name != NEUTRAL_STATUS:
+            raise ValueError("The solver only models heroes that start Neutral")
+
+        if isinstance(hero, Warrior):
+            archetype = "warrior"
+        elif isinstance(hero, Mage):
+            archetype = "mage"
+        elif isinstance(hero, Archer):
+            archetype = "archer"
+        else:
+            raise TypeError(f"Unsupported hero archetype: {type(hero).__name__}")
+
+        weapon = hero.equipped_weapon
+        # Rage, aim and status debuffs are modifiers; the model wants the base.
+        base = hero.base_stat
+
+        if environment is None:
+            hero_matrix, monster_matrix = hero.element_matrix, monster.element_matrix
+        else:
+            hero_matrix = monster_matrix = ELEMENT_MATRIX.for_environment(environment)
+
+        return cls(
+            archetype=archetype,
+            hero_first=hero.speed >= monster.speed,
+            hero_attack=base("attack"),
+            hero_element=hero.element,
+            monster_element=monster.element,
+            has_weapon=weapon is not None,
+            weapon_damage=weapon.base_damage if weapon else 0,
+            weapon_element=weapon.element if weapon else Element.NEUTRAL,
+            shield=base("shield") if archetype == "warrior" else 0,
+            armor=base("armor") if archetype == "warrior" else 0,
+            dodge_chance=hero.speed if archetype == "archer" else 0,
+            max_ammo=getattr(hero, "max_ammo", 0),
+            ammo_required=getattr(weapon, "ammo_required", 0),
+            hit_probability=getattr(weapon, "hit_probability", 100),
+            max_mana=getattr(hero, "max_mana", 0),
+            mana_cost=getattr(weapon, "mana_cost", 0),
+            hero_matrix=hero_matrix,
+            monster_matrix=monster_matrix,
+        )
+
+    def monster_multiplier(self, strike: Element) -> float:
+        """Multiplier of a `strike` element hitting the monster."""
+        return self.monster_matrix.multiplier(strike, self.monster_element)
+
+    def hero_multiplier(self) -> float:
+        """Multiplier of the monster's strikes hitting the hero."""
+        return self.hero_matrix.multiplier(self.monster_element, self.hero_element)
+
+
+def _chance(percent: int) -> float:
+    """Probability of `random.randint(1, 100) <= percent`."""
+    return min(max(percent, 0), 100) / 100
+
+
+class BattleModel:
+    """
+    Transition model of `Battle.execute_turn` for one matchup.
+
+    `transitions(state, choice)` returns every possible next state with its
+    probability. Terminal states (one side at 0 life) are canonical: only
+    the lives are kept, so all ways of winning with the same HP merge.
+    """
+
+    def __init__(self, matchup: Matchup, initial_state: CombatState):
+        self.matchup = matchup
+        self.initial_state = initial_state
+
+    @classmethod
+    def from_entities(
+        cls, hero: Hero, monster: Monster, environment: Element | None = None
+    ) -> "BattleModel":
+        if len(monster.statuses) > 1:
+            raise ValueError("The solver models one monster status at a time")
+
+        state = CombatState(
+            hero_life=hero.current_life,
+            monster_life=monster.current_life,
+            monster_attack=monster.attack,
+            status=monster.current_status.name,
+            duration=monster.current_status.duration_turns,
+            status_applied=getattr(monster.current_status, "_applied", False),
+            ammo=getattr(hero, "current_ammo", 0),
+            aiming=getattr(hero, "is_aiming", False),
+            mana=getattr(hero, "current_mana", 0),
+            cooldown=getattr(hero, "meditate_cooldown", 0),
+            rage=getattr(hero, "rage_duration", 0)
+            if getattr(hero, "in_rage", False)
+            else 0,
+        )
+        return cls(Matchup.from_entities(hero, monster, environment), state)
+
+    @staticmethod
+    def is_over(state: CombatState) -> bool:
+        return state.hero_life == 0 or state.monster_life == 0
+
+    def actions(self, state: CombatState) -> list[str]:
+        """Action keys offered by the hero's `get_actions` in this state."""
+        archetype = self.matchup.archetype
+        if archetype == "warrior":
+            return ["1", "2"]
+        if archetype == "mage" and not self.matchup.has_weapon:
+            return ["1", "3", "4"]
+        return ["1", "2", "3", "4"]
+
+    # TURN:
+
+    def transitions(self, state: CombatState, choice: str) -> list[Transition]:
+        """Distribution of the state after `Battle.execute_turn(choice)`."""
+        if self.is_over(state):
+            raise ValueError("The battle is already over")
+        if choice not in self.actions(state):
+            raise ValueError(f"Ação {choice} é inválida.")
+
+        # (probability, state, failed)
+        outcomes = [(1.0, state, False)]
+        slots = (True, False) if self.matchup.hero_first else (False, True)
+
+        for hero_slot in slots:
+            next_outcomes = []
+            for probability, current, failed in outcomes:
+                if failed or self.is_over(current):
+                    next_outcomes.append((probability, current, failed))
+                    continue
+
+                if hero_slot:
+                    branches = self._hero_phase(current, choice)
+                else:
+                    branches = [
+                        (chance, after, False)
+                        for chance, after in self._monster_phase(current)
+                    ]
+
+                for chance, after, branch_failed in branches:
+                    next_outcomes.append((probability * chance, after, branch_failed))
+            outcomes = next_outcomes
+
+        merged: dict[tuple[CombatState, bool], float] = {}
+        for probability, after, failed in outcomes:
+            if probability == 0.0:
+                continue
+            if self.is_over(after):
+                after = CombatState(after.hero_life, after.monster_life, 0)
+            elif not failed:
+                after = self._end_of_turn(after)
+            key = (after, failed)
+            merged[key] = merged.get(key, 0.0) + probability
+
+        return [
+            Transition(probability, after, not failed)
+            for (after, failed), probability in merged.items()
+        ]
+
+    def _end_of_turn(self, state: CombatState) -> CombatState:
+        """`end_of_turn_routine`: rage clock (Warrior) and cooldown (Mage)."""
+        if state.cooldown > 0:
+            state = state._replace(cooldown=state.cooldown - 1)
+        if state.rage > 0:
+            state = state._replace(rage=state.rage - 1)
+        return state
+
+    # HERO:
+
+    def _hit_monster(
+        self, state: CombatState, damage: int, element: Element, proc: bool
+    ) -> list[tuple[float, CombatState]]:
+        """`Monster.damage_received`, then the weapon's status proc if `proc`."""
+        multiplier = self.matchup.monster_multiplier(element)
+        life = max(0, state.monster_life - int(damage * multiplier))
+        hit = state._replace(monster_life=life)
+
+        status = ELEMENT_STATUS.get(self.matchup.weapon_element)
+        if not proc or status is None or state.status != NEUTRAL_STATUS:
+            return [(1.0, hit)]
+
+        name, duration = status
+        applied = hit._replace(status=name, duration=duration, status_applied=False)
+        return [(STATUS_PROC_CHANCE, applied), (1 - STATUS_PROC_CHANCE, hit)]
+
+    def _weapon_attack(
+        self, state: CombatState, attack: int
+    ) -> list[tuple[float, CombatState]]:
+        """`Weapon.attack` with the given user attack."""
+        matchup = self.matchup
+        return self._hit_monster(
+            state, matchup.weapon_damage + attack, matchup.weapon_element, True
+        )
+
+    def _hero_phase(self, state: CombatState, choice: str) -> list:
+        archetype = self.matchup.archetype
+        if archetype == "warrior":
+            branches = self._warrior_action(state, choice)
+        elif archetype == "archer":
+            branches = self._archer_action(state, choice)
+        else:
+            branches = self._mage_action(state, choice)
+
+        if branches is None:
+            return [(1.0, state, True)]
+        if isinstance(branches, CombatState):
+            # Failed action that still changed the hero (Archer loses aim).
+            return [(1.0, branches, True)]
+        return [(chance, after, False) for chance, after in branches]
+
+    def _warrior_action(self, state: CombatState, choice: str):
+        matchup = self.matchup
+        if choice == "2":
+            if state.rage > 0:
+                return None
+            return [(1.0, state._replace(rage=RAGE_DURATION))]
+
+        if not matchup.has_weapon:
+            return None
+        attack = matchup.hero_attack * 2 if state.rage else matchup.hero_attack
+        return self._weapon_attack(state, attack)
+
+    def _archer_action(self, state: CombatState, choice: str):
+        matchup = self.matchup
+
+        if choice == "2":
+            return [(1.0, state._replace(aiming=True))]
+
+        if choice == "3":
+            return [(1.0, state._replace(ammo=matchup.max_ammo))]
+
+        if choice == "4":
+            if (
+                state.ammo < ULTIMATE_AMMO_COST
+                or state.hero_life <= ULTIMATE_LIFE_RECOIL
+            ):
+                return [(1.0, state)]
+            shot = state._replace(
+                ammo=state.ammo - ULTIMATE_AMMO_COST,
+                hero_life=state.hero_life - ULTIMATE_LIFE_RECOIL,
+            )
+            damage = int(matchup.hero_attack * 3.2)
+            return self._hit_monster(shot, damage, Element.NEUTRAL, False)
+
+        if not matchup.has_weapon:
+            return None
+        if state.ammo < matchup.ammo_required:
+            # `Archer.strike` drops the aim in its `finally` block.
+            return state._replace(aiming=False) if state.aiming else None
+
+        shot = state._replace(ammo=state.ammo - matchup.ammo_required, aiming=False)
+        if state.aiming:
+            attack = int(matchup.hero_attack + (matchup.hero_attack / 2.5))
+            return self._weapon_attack(shot, attack)
+
+        hit = _chance(matchup.hit_probability)
+        branches = [
+            (hit * chance, after)
+            for chance, after in self._weapon_attack(shot, matchup.hero_attack)
+        ]
+        if hit < 1.0:
+            branches.append((1 - hit, shot))
+        return [(chance, after) for chance, after in branches if chance > 0.0]
+
+    def _mage_action(self, state: CombatState, choice: str):
+        matchup = self.matchup
+
+        if choice == "4":
+            if state.cooldown > 0:
+                return None
+            mana = min(state.mana + matchup.max_mana // 2, matchup.max_mana)
+            return [(1.0, state._replace(mana=mana, cooldown=MEDITATE_COOLDOWN))]
+
+        if choice == "3":
+            if state.mana < ANCIENT_MAGIC_COST:
+                return None
+            cast = state._replace(mana=state.mana - ANCIENT_MAGIC_COST)
+            return self._hit_monster(
+                cast, matchup.hero_attack * 3, Element.NEUTRAL, False
+            )
+
+        if not matchup.has_weapon:
+            # Punch without a grimoire ("1"; "2" is not offered).
+            return self._hit_monster(state, 1, Element.NEUTRAL, False)
+
+        if choice == "2":
+            cost = 2 * matchup.mana_cost
+            if state.mana < cost:
+                return None
+            cast = state._replace(mana=state.mana - cost)
+            damage = int((matchup.weapon_damage + matchup.hero_attack) * 2.0)
+            return self._hit_monster(cast, damage, matchup.weapon_element, False)
+
+        if state.mana < matchup.mana_cost:
+            return None
+        cast = state._replace(mana=state.mana - matchup.mana_cost)
+        return self._weapon_attack(cast, matchup.hero_attack)
+
+    # MONSTER:
+
+    def _monster_status(self, state: CombatState) -> CombatState:
+        """`Battle._apply_status_effects` on the monster."""
+        if state.status == NEUTRAL_STATUS:
+            return state
+        if state.duration <= 0:
+            return state._replace(
+                status=NEUTRAL_STATUS, duration=0, status_applied=False
+            )
+
+        duration = state.duration - 1
+        attack = state.monster_attack
+        applied = state.status_applied
+        life = state.monster_life
+
+        if state.status == BURNED:
+            if not applied:
+                attack = max(0, attack - BURN_ATTACK_DECREASE)
+            if duration <= 0:
+                attack += BURN_ATTACK_DECREASE
+            applied = True
+        elif state.status == FROZEN:
+            applied = True
+        elif state.status == POISONED:
+            multiplier = self.matchup.monster_multiplier(Element.POISON)
+            life = max(0, life - int(POISON_DAMAGE * multiplier))
+
+        return state._replace(
+            duration=duration,
+            monster_attack=attack,
+            status_applied=applied,
+            monster_life=life,
+        )
+
+    def _monster_phase(self, state: CombatState) -> list[tuple[float, CombatState]]:
+        """Status tick, then `Monster.strike` against the hero's defense."""
+        state = self._monster_status(state)
+        if self.is_over(state) or state.status == STUNNED:
+            return [(1.0, state)]
+
+        matchup = self.matchup
+        raw = matchup.hero_multiplier()
+        raw *= state.monster_attack
+
+        if matchup.archetype == "warrior":
+            enraged = state.rage > 0
+            armor = 0 if enraged else matchup.armor
+            evade = 0.0 if enraged else _chance(matchup.shield)
+            damage = max(0, int(raw - armor))
+        elif matchup.archetype == "archer":
+            evade = 0.0 if state.aiming else _chance(matchup.dodge_chance)
+            damage = int(raw)
+        else:
+            evade = 0.0
+            damage = int(raw)
+
+        hit = state._replace(hero_life=max(0, state.hero_life - damage))
+        branches = [(1 - evade, hit), (evade, state)]
+        return [(chance, after) for chance, after in branches if chance > 0.0]
+
+
+def basic_policy(model: BattleModel, state: CombatState) -> str:
+    """`simulation.basic_policy` expressed on a CombatState."""
+    matchup = model.matchup
+
+    if matchup.archetype == "archer":
+        if matchup.has_weapon and state.ammo < matchup.ammo_required:
+            return "3"
+
+    elif matchup.archetype == "mage":
+        if state.mana < matchup.mana_cost and state.cooldown == 0:
+            return "4"
+
+    return "1"
+
+
+@dataclass(frozen=True)
+class BattleSolution:
+    """
+    Exact outcome of a matchup under a fixed policy.
+
+    Attributes:
+        win_probability (float): Probability that the hero wins.
+        loss_probability (float): Probability that the hero dies.
+        stalemate_probability (float): Probability that the fight never ends
+            (e.g. a Mage out of mana repeating a failing action).
+        mean_turns_to_kill (float): Expected counted turns of the won fights.
+        mean_remaining_hp (float): Expected hero life at the end of won fights.
+        states (int): Reachable non-terminal states.
+    """
+
+    win_probability: float
+    loss_probability: float
+    stalemate_probability: float
+    mean_turns_to_kill: float
+    mean_remaining_hp: float
+    states: int
+
+
+def _reachable(model: BattleModel, policy) -> dict:
+    """Maps every reachable non-terminal state to its transitions."""
+    graph = {}
+    stack = [model.initial_state]
+    while stack:
+        state = stack.pop()
+        if state in graph or model.is_over(state):
+            continue
+        graph[state] = model.transitions(state, policy(model, state))
+        stack.extend(t.state for t in graph[state] if t.state not in graph)
+    return graph
+
+
+def _components(graph: dict) -> list[list[CombatState]]:
+    """
+    Strongly connected components (iterative Tarjan). Components come out
+    in reverse topological order: successors before the states reaching them.
+    """
+    index: dict = {}
+    low: dict = {}
+    on_stack: set = set()
+    stack: list = []
+    components = []
+
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, 0)]
+        while work:
+            state, child = work.pop()
+            if child == 0:
+                index[state] = low[state] = len(index)
+                stack.append(state)
+                on_stack.add(state)
+
+            successors = graph[state]
+            while child < len(successors):
+                nxt = successors[child].state
+                child += 1
+                if nxt not in graph:
+                    continue
+                if nxt not in index:
+                    work.append((state, child))
+                    work.append((nxt, 0))
+                    break
+                if nxt in on_stack:
+                    low[state] = min(low[state], index[nxt])
+            else:
+                if low[state] == index[state]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == state:
+                            break
+                    components.append(component)
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[state])
+
+    return components
+
+
+def _solve_linear(
+    matrix: list[list[float]], rhs: list[list[float]]
+) -> list[list[float]]:
+    """Gaussian elimination with partial pivoting for several right-hand sides."""
+    size = len(matrix)
+    rows = [matrix[i][:] + rhs[i][:] for i in range(size)]
+
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda r: abs(rows[r][col]))
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        pivot_row = rows[col]
+        for r in range(size):
+            if r != col and rows[r][col] != 0.0:
+                factor = rows[r][col] / pivot_row[col]
+                row = rows[r]
+                for c in range(col, len(row)):
+                    row[c] -= factor * pivot_row[c]
+
+    return [[value / rows[i][i] for value in rows[i][size:]] for i in range(size)]
+
+
+def _terminal_values(state: CombatState) -> tuple[float, float, float]:
+    """(win, loss, hero life on win) of a terminal state."""
+    if state.monster_life == 0:
+        return 1.0, 0.0, float(state.hero_life)
+    return 0.0, 1.0, 0.0
+
+
+def solve(
+    model: BattleModel,
+    policy: Callable[[BattleModel, CombatState], str] = basic_policy,
+) -> BattleSolution:
+    """
+    Computes the exact outcome of `model` when the hero follows `policy`.
+
+    Each strongly connected component of the state graph is solved once,
+    after all the states it can reach: a component is a single state in
+    most cases and a small linear system when a cycle exists (reloading
+    after a dodged miss, repeated failed actions...).
+    """
+    graph = _reachable(model, policy)
+
+    # win, loss, E[hero life * win], E[counted turns * win]
+    values: dict[CombatState, tuple[float, float, float, float]] = {}
+
+    def value(state: CombatState):
+        if state in values:
+            return values[state]
+        win, loss, hp = _terminal_values(state)
+        return win, loss, hp, 0.0
+
+    for component in _components(graph):
+        members = set(component)
+
+        # States that can never leave the component never end the fight.
+        leaving = {
+            state
+            for state in component
+            if any(t.state not in members for t in graph[state])
+        }
+        escaping = set(leaving)
+        changed = True
+        while changed:
+            changed = False
+            for state in component:
+                if state not in escaping and any(
+                    t.state in escaping for t in graph[state]
+                ):
+                    escaping.add(state)
+                    changed = True
+
+        for state in component:
+            if state not in escaping:
+                values[state] = (0.0, 0.0, 0.0, 0.0)
+
+        solvable = [state for state in component if state in escaping]
+        if not solvable:
+            continue
+
+        positions = {state: i for i, state in enumerate(solvable)}
+        size = len(solvable)
+        matrix = [[0.0] * size for _ in range(size)]
+        rhs = [[0.0, 0.0, 0.0] for _ in range(size)]
+
+        for i, state in enumerate(solvable):
+            matrix[i][i] += 1.0
+            for probability, nxt, _ in graph[state]:
+                if nxt in positions:
+                    matrix[i][positions[nxt]] -= probability
+                else:
+                    win, loss, hp, _ = value(nxt)
+                    rhs[i][0] += probability * win
+                    rhs[i][1] += probability * loss
+                    rhs[i][2] += probability * hp
+
+        solved = _solve_linear(matrix, rhs)
+        for state, (win, loss, hp) in zip(solvable, solved):
+            values[state] = (win, loss, hp, 0.0)
+
+        # Turns need the win probability of every successor first.
+        turn_rhs = [[0.0] for _ in range(size)]
+        for i, state in enumerate(solvable):
+            for probability, nxt, counted in graph[state]:
+                win, _, _, turns = value(nxt)
+                if counted:
+                    turn_rhs[i][0] += probability * win
+                if nxt not in positions:
+                    turn_rhs[i][0] += probability * turns
+
+        turns_solved = _solve_linear(matrix, turn_rhs)
+        for state, (turns,) in zip(solvable, turns_solved):
+            win, loss, hp, _ = values[state]
+            values[state] = (win, loss, hp, turns)
+
+    win, loss, hp, turns = value(model.initial_state)
+    if model.is_over(model.initial_state):
+        turns = 0.0
+
+    return BattleSolution(
+        win_probability=win,
+        loss_probability=loss,
+        stalemate_probability=max(0.0, 1.0 - win - loss),
+        mean_turns_to_kill=turns / win if win else 0.0,
+        mean_remaining_hp=hp / win if win else 0.0,
+        states=len(graph),
+    )
+
+
+def solve_battle(
+    hero: Hero,
+    monster: Monster,
+    policy: Callable[[BattleModel, CombatState], str] = basic_policy,
+    environment: Element | None = None,
+) -> BattleSolution:
+    """Exact outcome of `Battle(hero, monster, environment)` played with `policy`."""
+    return solve(BattleModel.from_entities(hero, monster, environment), policy)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DungeonPy exact battle solver")
+    parser.add_argument("archetype", choices=VALID_ARCHETYPES)
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument(
+        "--element", choices=[e.value for e in Element], default="neutral"
+    )
+    parser.add_argument("--boss", action="store_true")
+    args = parser.parse_args()
+
+    spec = MonsterSpec(level=args.level, element=Element(args.element), boss=args.boss)
+    solution = solve_battle(create_simulation_hero(args.archetype), spec.create())
+
+    print(
+        f"vitórias: {solution.win_probability:.4%}  "
+        f"derrotas: {solution.loss_probability:.4%}  "
+        f"turnos p/ matar: {solution.mean_turns_to_kill:.2f}  "
+        f"HP restante: {solution.mean_remaining_hp:.1f}  "
+        f"({solution.states} estados)"
+    )
+
+
+if __name__ == "__main__":
+    main()
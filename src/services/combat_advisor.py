@@ -0,0 +1,303 @@
+"""
+Expectimax combat advisor.
+
+Searches the hero's actions over the transition model of
+`services.battle_solver`: max nodes are the action keys of `get_actions`,
+chance nodes are every roll of the turn (hit, status proc, dodge, block).
+Depth is increased one turn at a time (iterative deepening) until the time
+budget runs out; the result of the last complete depth is returned, so the
+answer always arrives within the budget plus one depth-1 search.
+
+Positions below the search horizon are scored by a damage race heuristic
+(turns the hero needs to kill vs turns the monster needs to kill the hero).
+Values are shared across depths and turns in a transposition table keyed
+on the hashed `CombatState`.
+
+Used as the hint shown by `CLI.get_combat_choice` and as a policy for
+automated playtests (`advisor_policy`, see `simulation.run_trial`).
+"""
+
+import time
+from dataclasses import dataclass, field
+
+from domain.consumable_item import ConsumableItem
+from domain.hero import Hero
+from domain.monster import Monster
+from services.battle import Battle
+from services.battle_solver import BattleModel, CombatState, Matchup
+
+DEFAULT_TIME_BUDGET = 0.05
+DEFAULT_MAX_DEPTH = 12
+PLAYTEST_DEPTH = 3
+TABLE_LIMIT = 200_000
+# Win probability a free consumable must add before it is suggested.
+CONSUMABLE_MARGIN = 0.05
+_CLOCK_INTERVAL = 32
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the time budget is spent."""
+
+
+@dataclass(frozen=True)
+class Advice:
+    """
+    Result of a search.
+
+    Attributes:
+        action (str): Recommended key of `hero.get_actions()`.
+        value (float): Estimated win probability when following the advice.
+        depth (int): Turns searched in the last complete iteration.
+        nodes (int): Positions evaluated by the whole search.
+        scores (dict): Estimated win probability of each action searched.
+        consumable (str | None): Consumable worth drinking before acting
+            (it does not spend the turn).
+    """
+
+    action: str
+    value: float
+    depth: int
+    nodes: int
+    scores: dict = field(default_factory=dict)
+    consumable: str | None = None
+
+
+class CombatAdvisor:
+    """
+    Expectimax searcher with a transposition table and a time budget.
+
+    Args:
+        time_budget (float | None): Seconds per `advise` call. None searches
+            exactly `max_depth` turns, which makes the advice reproducible.
+        max_depth (int): Deepest iteration tried.
+    """
+
+    def __init__(
+        self,
+        time_budget: float | None = DEFAULT_TIME_BUDGET,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+    ):
+        if max_depth <= 0:
+            raise ValueError("max_depth must be greater than 0")
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+
+        self._matchup: Matchup | None = None
+        self._model: BattleModel | None = None
+        # state -> (depth searched, value)
+        self._table: dict[CombatState, tuple[int, float]] = {}
+        # (state, action) -> transitions, reused by every iteration
+        self._moves: dict[tuple[CombatState, str], list] = {}
+        self._nodes = 0
+        self._deadline: float | None = None
+
+    # SEARCH:
+
+    def advise(self, model: BattleModel, state: CombatState) -> Advice:
+        """Best action for `state`, searched as deep as the budget allows."""
+        if model.is_over(state):
+            raise ValueError("The battle is already over")
+
+        self._use_model(model)
+        self._nodes = 0
+        self._deadline = None
+        start = time.perf_counter()
+
+        scores = self._root_scores(state, 1)
+        depth = 1
+
+        if self.time_budget is not None:
+            self._deadline = start + self.time_budget
+
+        while depth < self.max_depth:
+            try:
+                scores = self._root_scores(state, depth + 1)
+            except _SearchTimeout:
+                break
+            depth += 1
+
+        self._deadline = None
+        if not scores:
+            # Every action fails (e.g. no weapon): the first key is as good as any.
+            first = model.actions(state)[0]
+            return Advice(first, self._heuristic(state), depth, self._nodes)
+
+        action = max(scores, key=scores.get)
+        return Advice(action, scores[action], depth, self._nodes, scores)
+
+    def policy(self, model: BattleModel, state: CombatState) -> str:
+        """`battle_solver` policy: `solve(model, advisor.policy)` is exact."""
+        return self.advise(model, state).action
+
+    def _use_model(self, model: BattleModel) -> None:
+        # Stored values are only valid for the matchup that produced them.
+        if model.matchup != self._matchup or len(self._table) > TABLE_LIMIT:
+            self._matchup = model.matchup
+            self._table.clear()
+            self._moves.clear()
+        self._model = model
+        self._prepare_heuristic()
+
+    def _root_scores(self, state: CombatState, depth: int) -> dict[str, float]:
+        scores = {}
+        for action in self._model.actions(state):
+            value = self._action_value(state, action, depth)
+            if value is not None:
+                scores[action] = value
+        return scores
+
+    def _action_value(
+        self, state: CombatState, action: str, depth: int
+    ) -> float | None:
+        """Expected value of `action`; None if the action fails right away."""
+        key = (state, action)
+        transitions = self._moves.get(key)
+        if transitions is None:
+            transitions = self._model.transitions(state, action)
+            self._moves[key] = transitions
+        if not transitions[0].counted:
+            return None
+        return sum(t.probability * self._value(t.state, depth - 1) for t in transitions)
+
+    def _value(self, state: CombatState, depth: int) -> float:
+        if state.monster_life == 0:
+            return 1.0
+        if state.hero_life == 0:
+            return 0.0
+        if depth == 0:
+            return self._heuristic(state)
+
+        stored = self._table.get(state)
+        if stored is not None and stored[0] >= depth:
+            return stored[1]
+
+        self._nodes += 1
+        if (
+            self._deadline is not None
+            and self._nodes % _CLOCK_INTERVAL == 0
+            and time.perf_counter() > self._deadline
+        ):
+            raise _SearchTimeout
+
+        best = None
+        for action in self._model.actions(state):
+            value = self._action_value(state, action, depth)
+            if value is not None and (best is None or value > best):
+                best = value
+
+        if best is None:
+            best = self._heuristic(state)
+
+        self._table[state] = (depth, best)
+        return best
+
+    # HEURISTIC:
+
+    def _prepare_heuristic(self) -> None:
+        """Per-matchup constants of the damage race."""
+        matchup = self._model.matchup
+
+        if matchup.has_weapon:
+            hero_damage = (matchup.weapon_damage + matchup.hero_attack) * (
+                matchup.monster_multiplier(matchup.weapon_element)
+            )
+            if matchup.archetype == "archer":
+                hero_damage *= matchup.hit_probability / 100
+        else:
+            hero_damage = 1.0 if matchup.archetype == "mage" else 0.0
+
+        if matchup.archetype == "warrior":
+            evade = min(max(matchup.shield, 0), 100) / 100
+        elif matchup.archetype == "archer":
+            evade = min(max(matchup.dodge_chance, 0), 100) / 100
+        else:
+            evade = 0.0
+
+        self._hero_damage = hero_damage
+        self._evade = evade
+        self._strike_multiplier = matchup.hero_multiplier()
+
+    def _heuristic(self, state: CombatState) -> float:
+        """Share of the damage race won by the hero, in [0, 1]."""
+        monster_damage = self._strike_multiplier * state.monster_attack
+        if self._model.matchup.archetype == "warrior":
+            monster_damage = max(0.0, monster_damage - self._model.matchup.armor)
+        monster_damage *= 1 - self._evade
+
+        if self._hero_damage <= 0:
+            return 0.0
+        if monster_damage <= 0:
+            return 1.0
+
+        turns_to_kill = state.monster_life / self._hero_damage
+        turns_to_die = state.hero_life / monster_damage
+        return turns_to_die / (turns_to_kill + turns_to_die)
+
+    # ENTITIES:
+
+    def advise_battle(self, battle: Battle) -> Advice:
+        """
+        Advice for the current turn of a live Battle.
+
+        Also checks the hero's consumables: drinking one from the inventory
+        does not spend the turn, so it is suggested when it raises the
+        estimated win probability by at least CONSUMABLE_MARGIN.
+        """
+        hero = battle.hero
+        model = BattleModel.from_entities(hero, battle.monster)
+        state = model.initial_state
+        advice = self.advise(model, state)
+
+        best_item = None
+        best_advice = advice
+        for item in _useful_consumables(hero):
+            if item.recovery_type == "mana":
+                boosted = state._replace(
+                    mana=min(state.mana + item.recovered_value, hero.max_mana)
+                )
+            else:
+                boosted = state._replace(
+                    hero_life=min(state.hero_life + item.recovered_value, hero.max_life)
+                )
+            candidate = self.advise(model, boosted)
+            if candidate.value >= best_advice.value + CONSUMABLE_MARGIN:
+                best_item, best_advice = item, candidate
+
+        if best_item is None:
+            return advice
+
+        return Advice(
+            best_advice.action,
+            best_advice.value,
+            best_advice.depth,
+            advice.nodes + best_advice.nodes,
+            best_advice.scores,
+            best_item.name,
+        )
+
+
+def _useful_consumables(hero: Hero) -> list[ConsumableItem]:
+    """
+    One consumable per distinct effect the hero can benefit from, smallest
+    first: a bigger potion is only suggested when it is clearly better.
+    """
+    found = {}
+    for item in hero.inventory.items:
+        if not isinstance(item, ConsumableItem):
+            continue
+        if item.recovery_type == "mana" and not hasattr(hero, "current_mana"):
+            continue
+        found.setdefault((item.recovery_type, item.recovered_value), item)
+    return sorted(found.values(), key=lambda item: item.recovered_value)
+
+
+_playtest_advisor = CombatAdvisor(time_budget=None, max_depth=PLAYTEST_DEPTH)
+
+
+def advisor_policy(hero: Hero, monster: Monster) -> str:
+    """
+    Simulation policy (see `simulation.run_trial`) backed by a fixed-depth
+    advisor, so playtests stay reproducible on any machine.
+    """
+    model = BattleModel.from_entities(hero, monster)
+    return _playtest_advisor.advise(model, model.initial_state).action
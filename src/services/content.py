@@ -0,0 +1,313 @@
+"""
+Game content loaded from data packs instead of Python literals.
+
+The hero stats, monster names and art, items, drop tables, loot tables and
+starter packs live in the packs of `CONTENT_DIR` (`*.json` and `*.toml`,
+read in name order). Every pack holds sections, e.g.
+
+    {"monster_names": {"fire": ["Salamandra", "Lobo de Fogo"]},
+     "drop_tables": {"Salamandra": {"grimoire": [{"name": ...}]}}}
+
+and a section found in several packs is merged key by key, the later pack
+winning. `load_content` checks the packs once (every item is built, every
+loot table compiled) and pickles the compiled `Content` into `CACHE_DIR`
+under the hash of the packs: while they stay the same, later startups
+load the pickle and skip the parsing and the checks. The cache is only
+ever written by this module; when it cannot be written the packs are just
+compiled at every start. The element chart (`domain.element.ELEMENTS_PACK`)
+lives in the same directory but is read by `domain.element` itself.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import tomllib
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Mapping, Sequence
+
+from domain.element import ELEMENTS_PACK, Element
+from services.item_catalog import ITEM_TYPES, ItemCatalog
+from services.loot_table import compile_loot_tables
+
+CONTENT_DIR = Path(__file__).resolve().parent.parent / "content"
+CACHE_DIR = CONTENT_DIR / "__pycache__"
+
+# Part of the cache key: bump it whenever `Content` or its compilation changes.
+FORMAT_VERSION = 1
+
+SECTIONS = (
+    "heroes",
+    "monster_names",
+    "monster_arts",
+    "base_items",
+    "drop_tables",
+    "loot_tables",
+    "base_packs",
+)
+
+# Stats every hero archetype must define, besides its element.
+HERO_STATS = {
+    "warrior": ("max_life", "attack", "speed", "shield", "armor"),
+    "mage": ("max_life", "attack", "speed", "max_mana", "current_mana"),
+    "archer": ("max_life", "attack", "speed", "max_ammo", "current_ammo"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Content:
+    """
+    The compiled content of the packs. Shared: read it, do not modify it.
+
+    Attributes:
+        heroes (dict): Stats of each hero archetype, element included.
+        monster_names (dict): Monster names by `Element`.
+        monster_arts (dict): Art by monster name ("DEFAULT": the others).
+        base_items (dict): Item config of the potions and starter gear.
+        drop_tables (dict): Item config of the equipment of each monster.
+        loot_tables (dict): Loot table config (see `services.loot_table`).
+        base_packs (dict): Item ids of each starter pack.
+    """
+
+    heroes: dict[str, dict]
+    monster_names: dict[Element, list[str]]
+    monster_arts: dict[str, str]
+    base_items: dict[str, list[dict]]
+    drop_tables: dict[str, dict[str, list[dict]]]
+    loot_tables: dict[str, dict]
+    base_packs: dict[str, tuple[str, ...]]
+
+
+@lru_cache(maxsize=None)
+def content() -> Content:
+    """The content of the packs of `CONTENT_DIR`, loaded once per process."""
+    return load_content()
+
+
+def content_packs(directory: Path = CONTENT_DIR) -> list[Path]:
+    """The pack files of `directory`, in the order they are merged."""
+    return sorted(
+        path
+        for path in directory.iterdir()
+        if path.suffix in (".json", ".toml") and path.name != ELEMENTS_PACK.name
+    )
+
+
+def load_content(
+    paths: Sequence[Path] | None = None, cache_dir: Path | None = CACHE_DIR
+) -> Content:
+    """
+    The compiled content of the packs `paths` (default: `content_packs()`),
+    taken from `cache_dir` when these very packs were compiled before
+    (None: no cache). Raises ValueError for invalid packs.
+    """
+    if paths is None:
+        paths = content_packs()
+    sources = [(Path(path).name, Path(path).read_bytes()) for path in paths]
+
+    cache = None
+    if cache_dir is not None:
+        cache = Path(cache_dir) / f"content-{_content_hash(sources)[:32]}.pickle"
+        cached = _read_cache(cache)
+        if cached is not None:
+            return cached
+
+    compiled = compile_content([(name, _parse(name, data)) for name, data in sources])
+    if cache is not None:
+        _write_cache(cache, compiled)
+    return compiled
+
+
+def compile_content(packs: Sequence[tuple[str, Mapping]]) -> Content:
+    """
+    Merges and checks parsed `packs` ((file name, sections) pairs) and
+    compiles them. Raises ValueError, naming the problem, if they are invalid.
+    """
+    sections: dict[str, dict] = {section: {} for section in SECTIONS}
+    for name, pack in packs:
+        if not isinstance(pack, Mapping):
+            raise ValueError(f"Invalid content pack '{name}': not a table of sections")
+        for section, values in pack.items():
+            if section not in sections:
+                raise ValueError(
+                    f"Invalid content pack '{name}': unknown section '{section}'"
+                )
+            if not isinstance(values, Mapping):
+                raise ValueError(
+                    f"Invalid content pack '{name}': section '{section}' is not a table"
+                )
+            sections[section].update(values)
+
+    base_items, items = _items(sections["base_items"], "base_items")
+    drop_tables = {}
+    for monster, config in sections["drop_tables"].items():
+        drop_tables[monster], drops = _items(config, f"drop_tables.{monster}")
+        items += drops
+
+    try:
+        catalog = ItemCatalog(items)
+    except ValueError as error:
+        raise _invalid(str(error)) from None
+
+    loot_tables = sections["loot_tables"]
+    if "fixed_drops" not in loot_tables:
+        raise _invalid("loot table 'fixed_drops' is missing")
+    try:
+        compile_loot_tables(loot_tables, catalog)
+    except ValueError as error:
+        raise _invalid(str(error)) from None
+
+    return Content(
+        heroes=_heroes(sections["heroes"]),
+        monster_names=_monster_names(sections["monster_names"]),
+        monster_arts=_monster_arts(sections["monster_arts"]),
+        base_items=base_items,
+        drop_tables=drop_tables,
+        loot_tables=loot_tables,
+        base_packs=_base_packs(sections["base_packs"], catalog),
+    )
+
+
+def _invalid(message: str) -> ValueError:
+    return ValueError(f"Invalid content: {message}")
+
+
+def _element(value) -> Element:
+    try:
+        return Element(value)
+    except ValueError:
+        raise _invalid(f"unknown element '{value}'") from None
+
+
+def _heroes(config: Mapping) -> dict[str, dict]:
+    unknown = set(config) - set(HERO_STATS)
+    if unknown:
+        raise _invalid(f"unknown hero archetypes {sorted(unknown)}")
+
+    heroes = {}
+    for archetype, stats in HERO_STATS.items():
+        spec = config.get(archetype)
+        if not isinstance(spec, Mapping):
+            raise _invalid(f"no stats for the hero '{archetype}'")
+        missing = [stat for stat in (*stats, "element") if stat not in spec]
+        if missing:
+            raise _invalid(f"hero '{archetype}' without {', '.join(missing)}")
+        for stat in stats:
+            if type(spec[stat]) is not int or spec[stat] < 0:
+                raise _invalid(f"hero '{archetype}': {stat} must be an integer >= 0")
+        heroes[archetype] = {**spec, "element": _element(spec["element"])}
+    return heroes
+
+
+def _monster_names(config: Mapping) -> dict[Element, list[str]]:
+    names = {}
+    for key, values in config.items():
+        if (
+            not isinstance(values, list)
+            or not values
+            or not all(isinstance(name, str) and name.strip() for name in values)
+        ):
+            raise _invalid(f"the monster names of '{key}' must be a list of names")
+        names[_element(key)] = list(values)
+
+    missing = [element.value for element in Element if element not in names]
+    if missing:
+        raise _invalid(f"no monster names for {', '.join(missing)}")
+    return {element: names[element] for element in Element}
+
+
+def _monster_arts(config: Mapping) -> dict[str, str]:
+    if "DEFAULT" not in config:
+        raise _invalid("monster art 'DEFAULT' is missing")
+    for name, art in config.items():
+        if not isinstance(art, str):
+            raise _invalid(f"the art of '{name}' is not a string")
+    return dict(config)
+
+
+def _items(config: Mapping, where: str) -> tuple[dict[str, list[dict]], list]:
+    """
+    The item config with its elements as `Element`, and its (item class,
+    arguments) pairs for an `ItemCatalog`.
+    """
+    compiled: dict[str, list[dict]] = {}
+    items = []
+    for item_type, specs in config.items():
+        item_class = ITEM_TYPES.get(item_type)
+        if item_class is None:
+            raise _invalid(f"{where}: unknown item type '{item_type}'")
+        if not isinstance(specs, list) or not all(
+            isinstance(spec, Mapping) for spec in specs
+        ):
+            raise _invalid(f"{where}.{item_type} must be a list of items")
+
+        compiled[item_type] = []
+        for spec in specs:
+            spec = dict(spec)
+            if "element" in spec:
+                spec["element"] = _element(spec["element"])
+            try:
+                # Built in checked mode: this is where item fields are checked.
+                item_class(**spec)
+            except (TypeError, ValueError) as error:
+                raise _invalid(f"{where}.{item_type}: {error}") from None
+            items.append((item_class, spec))
+            compiled[item_type].append(spec)
+    return compiled, items
+
+
+def _base_packs(config: Mapping, catalog: ItemCatalog) -> dict[str, tuple[str, ...]]:
+    for pack, ids in config.items():
+        unknown = [catalog_id for catalog_id in ids if catalog_id not in catalog]
+        if unknown:
+            raise _invalid(f"base pack '{pack}' with unknown items {unknown}")
+    return {pack: tuple(ids) for pack, ids in config.items()}
+
+
+def _parse(name: str, data: bytes) -> Mapping:
+    try:
+        if name.endswith(".toml"):
+            return tomllib.loads(data.decode("utf-8"))
+        return json.loads(data)
+    except (UnicodeDecodeError, ValueError) as error:
+        raise ValueError(f"Invalid content pack '{name}': {error}") from None
+
+
+def _content_hash(sources: Sequence[tuple[str, bytes]]) -> str:
+    digest = hashlib.sha256(f"dungeonpy-content/{FORMAT_VERSION}".encode())
+    for name, data in sources:
+        digest.update(f"\0{name}\0{len(data)}\0".encode())
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _read_cache(cache: Path) -> Content | None:
+    try:
+        with open(cache, "rb") as file:
+            cached = pickle.load(file)
+    except Exception:
+        # Missing, truncated or outdated: the packs are compiled again.
+        return None
+    return cached if isinstance(cached, Content) else None
+
+
+def _write_cache(cache: Path, compiled: Content) -> None:
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=cache.parent, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump(compiled, file, protocol=pickle.HIGHEST_PROTOCOL)
+            # Atomic: another process never reads a half-written cache.
+            os.replace(temporary, cache)
+        finally:
+            if os.path.exists(temporary):
+                os.unlink(temporary)
+        for stale in cache.parent.glob("content-*.pickle"):
+            if stale != cache:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass  # e.g. a read-only install: compiled at every start instead
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from domain.hero import Hero
+from domain.room import RoomDelta
 
 
 @dataclass
@@ -14,25 +15,38 @@ class GameState:
 
     Attributes:
         hero (Hero): The player's hero instance (Warrior/Mage/Archer).
-        current_level (int): Current dungeon level (1 to MAX_LEVELS).
+        current_level (int): Current dungeon level (1 to MAX_LEVELS, or
+            any level in an endless run).
         save_date (str): ISO format timestamp of when the game was saved.
         game_version (str): Version string for save compatibility.
+        endless (bool): Endless run: no last level, never completed.
+        seed (int | None): Seed of the run; the rooms are generated from it
+            again on load (None: saves from before seeds were stored).
+        battles_fought (int): Battles of the run so far (each one has its
+            own random stream, derived from the seed and this count).
+        room_deltas (dict): `Room.delta` of every floor with changes, by
+            level: what is replayed on the regenerated rooms.
     """
 
     hero: Hero
     current_level: int
     save_date: str
     game_version: str = "0.1.0"
+    endless: bool = False
+    seed: int | None = None
+    battles_fought: int = 0
+    room_deltas: dict[int, RoomDelta] = field(default_factory=dict)
 
     MAX_LEVELS = 5
 
     @classmethod
-    def create_new_game(cls, hero: Hero) -> "GameState":
+    def create_new_game(cls, hero: Hero, endless: bool = False) -> "GameState":
         return cls(
             hero=hero,
             current_level=1,
             save_date=datetime.now().isoformat(),
             game_version="0.1.0",
+            endless=endless,
         )
 
     @classmethod
@@ -48,21 +62,53 @@ class GameState:
                 f"Nível deve ser um inteiro, recebido: {type(current_level)}"
             )
 
-        if current_level < 1 or current_level > cls.MAX_LEVELS + 1:
+        endless = data.get("endless", False)
+        if current_level < 1 or (not endless and current_level > cls.MAX_LEVELS + 1):
             raise ValueError(f"Save corrompido: nível {current_level} é inválido")
 
+        seed = data.get("seed")
+        battles_fought = data.get("battles_fought", 0)
+        if seed is not None and not isinstance(seed, int):
+            raise ValueError(f"Save corrompido: semente inválida - {seed!r}")
+        if not isinstance(battles_fought, int) or battles_fought < 0:
+            raise ValueError(
+                f"Save corrompido: contagem de batalhas inválida - {battles_fought!r}"
+            )
+
         return cls(
             hero=hero,
             current_level=current_level,
             save_date=save_date,
             game_version=data.get("game_version", "0.1.0"),
+            endless=endless,
+            seed=seed,
+            battles_fought=battles_fought,
+            room_deltas=cls._parse_room_deltas(data.get("rooms", {})),
         )
 
+    @staticmethod
+    def _parse_room_deltas(data: dict) -> dict[int, RoomDelta]:
+        """`{"3": [[0, 1], []]}` (as saved by `to_dict`) into room deltas."""
+        try:
+            return {
+                int(level): (tuple(map(int, defeated)), tuple(map(int, taken)))
+                for level, (defeated, taken) in data.items()
+            }
+        except (AttributeError, TypeError, ValueError) as e:
+            raise ValueError(f"Save corrompido: salas inválidas - {e}") from e
+
     def to_dict(self) -> dict:
         return {
             "current_level": self.current_level,
             "save_date": self.save_date,
             "game_version": self.game_version,
+            "endless": self.endless,
+            "seed": self.seed,
+            "battles_fought": self.battles_fought,
+            "rooms": {
+                str(level): [list(defeated), list(taken)]
+                for level, (defeated, taken) in self.room_deltas.items()
+            },
         }
 
     def unlock_next_level(self) -> None:
@@ -74,9 +120,16 @@ class GameState:
         self.save_date = datetime.now().isoformat()
 
     def is_game_completed(self) -> bool:
-        return self.current_level > self.MAX_LEVELS
+        return not self.endless and self.current_level > self.MAX_LEVELS
 
     def get_progress_info(self) -> dict:
+        if self.endless:
+            return {
+                "status": "em_progresso",
+                "progresso": f"Andar {self.current_level} (modo infinito)",
+                "porcentagem": None,
+            }
+
         if self.is_game_completed():
             return {
                 "status": "Completo",
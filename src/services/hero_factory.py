@@ -1,38 +1,15 @@
 from domain.archer import Archer
-from domain.element import Element
 from domain.hero import Hero
 from domain.inventory import Inventory
 from domain.mage import Mage
 from domain.warrior import Warrior
+from services.content import content
 
 
-# Balancing constants per archetype
-WARRIOR_STATS = {
-    "max_life": 150,
-    "attack": 30,
-    "speed": 10,
-    "shield": 15,
-    "armor": 2,
-    "element": Element.NEUTRAL,
-}
-
-MAGE_STATS = {
-    "max_life": 80,
-    "attack": 50,
-    "speed": 15,
-    "max_mana": 100,
-    "current_mana": 100,
-    "element": Element.NEUTRAL,
-}
-
-ARCHER_STATS = {
-    "max_life": 100,
-    "attack": 35,
-    "speed": 25,
-    "max_ammo": 15,
-    "current_ammo": 15,
-    "element": Element.NEUTRAL,
-}
+# Balancing constants per archetype (from `content/heroes.json`)
+WARRIOR_STATS = content().heroes["warrior"]
+MAGE_STATS = content().heroes["mage"]
+ARCHER_STATS = content().heroes["archer"]
 
 VALID_ARCHETYPES = ("warrior", "mage", "archer")
 
@@ -0,0 +1,110 @@
+"""
+Item ids and the catalog of immutable item definitions.
+
+Kept apart from `ItemsFactory` so that the content loader
+(`services.content`) can build and check the items of a pack without
+importing the factories that are configured from it.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping
+
+from domain.consumable_item import ConsumableItem
+from domain.grimoire import Grimoire
+from domain.item import Item
+from domain.ranged_weapon import RangedWeapon
+from domain.weapon import Weapon
+
+# Item class of each item type of a config ({"weapon": [{...}], ...}).
+ITEM_TYPES = {
+    "consumable": ConsumableItem,
+    "weapon": Weapon,
+    "ranged_weapon": RangedWeapon,
+    "grimoire": Grimoire,
+}
+
+
+def item_id(name: str) -> str:
+    """Catalog id of an item name: "Poção de Cura" -> "pocao_de_cura"."""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore")
+    return re.sub(r"[^a-z0-9]+", "_", ascii_name.decode().lower()).strip("_")
+
+
+@dataclass(frozen=True, slots=True)
+class ItemDefinition:
+    """
+    An immutable catalog entry: the checked constructor arguments of an item.
+
+    Every item handed out is a new object (`create`), so whatever happens to
+    one copy stays in that copy. The copies are spawned from a prototype
+    built once from `config`, which is never handed out itself.
+
+    Attributes:
+        catalog_id (str): Id of the item in its catalog.
+        kind (type[Item]): Class of the items it creates.
+        config (tuple): The (argument, value) pairs the items are built with.
+    """
+
+    catalog_id: str
+    kind: type[Item]
+    config: tuple[tuple[str, object], ...]
+    _prototype: Item = field(repr=False, compare=False)
+
+    def create(self) -> Item:
+        """A new item of this definition (see `Item.spawn`)."""
+        return self._prototype.spawn()
+
+
+class ItemCatalog:
+    """
+    Immutable item definitions, keyed by id.
+
+    Loot tables, starter packs and saves refer to items by id and share the
+    definitions; each drop is a new `Item` created from its definition, so
+    two drops of "Poção de Cura" never share state.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Iterable[tuple[type[Item], Mapping]] = ()):
+        self._items: dict[str, ItemDefinition] = {}
+        for kind, config in items:
+            self.add(kind, config)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, catalog_id: str) -> bool:
+        return catalog_id in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def add(self, kind: type[Item], config: Mapping) -> str:
+        """
+        Registers the item `kind(**config)` under the id of its name and
+        returns the id. The item is built once, here, so invalid configs
+        raise (TypeError or ValueError) when registered, not on a drop.
+        """
+        item = kind(**config)
+        catalog_id = item_id(item.name)
+        if catalog_id in self._items:
+            raise ValueError(f"Item id repetido no catálogo: {catalog_id}")
+
+        item.catalog_id = catalog_id
+        self._items[catalog_id] = ItemDefinition(
+            catalog_id, kind, tuple(dict(config).items()), item
+        )
+        return catalog_id
+
+    def get(self, catalog_id: str) -> ItemDefinition:
+        try:
+            return self._items[catalog_id]
+        except KeyError:
+            raise KeyError(f"Item desconhecido no catálogo: {catalog_id}") from None
+
+    def create(self, catalog_id: str) -> Item:
+        """A new item of the definition `catalog_id`."""
+        return self.get(catalog_id).create()
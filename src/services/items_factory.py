@@ -1,223 +1,80 @@
-from domain.consumable_item import ConsumableItem
-from domain.weapon import Weapon
-from domain.ranged_weapon import RangedWeapon
-from domain.grimoire import Grimoire
-from domain.element import Element
+from domain.fields import trusted
+from services.content import content
+from services.item_catalog import ITEM_TYPES, ItemCatalog, item_id
+from services.loot_table import LootTable, compile_loot_tables
 import random
 
 
 class ItemsFactory:
     """
     Responsible only for instantiating item objects.
-    """
-
-    ITEM_REGISTRY = {
-        "consumable": ConsumableItem,
-        "weapon": Weapon,
-        "ranged_weapon": RangedWeapon,
-        "grimoire": Grimoire,
-    }
-
-    # Fixes drops for more easy progression
-    @staticmethod
-    def _fixed_drops() -> list:
-        """Returns fresh ConsumableItem instances based on a drop chance."""
-        drops = []
 
-        if random.random() <= 0.70:
-            drops.append(
-                ConsumableItem(
-                    name="Poção de Cura",
-                    description="Recupera 40 de Vida.",
-                    weight=0.5,
-                    recovered_value=40,
-                )
-            )
+    The tables below come from the content packs (`services.content`).
+    The items of the built-in tables (`BASE_ITEMS` and `DROP_TABLES`) are
+    registered once, in the trusted mode of `domain.fields`, as immutable
+    definitions in `catalog()`; loot and starter packs hand out new items
+    created from them. Loot is rolled on the weighted `LOOT_TABLES`,
+    compiled once by `loot_tables()`.
+    `create_items_from_config` builds (and validates) new items from any
+    config it is given.
+    """
 
-        if random.random() <= 0.50:
-            drops.append(
-                ConsumableItem(
-                    name="Poção de Mana",
-                    description="Recupera 30 de Mana.",
-                    weight=0.5,
-                    recovered_value=30,
-                    recovery_type="mana",
-                )
-            )
+    ITEM_REGISTRY = ITEM_TYPES
+
+    # Items outside the drop tables: potions and starter gear.
+    BASE_ITEMS = content().base_items
+
+    # Loot tables by name (see `services.loot_table`). Every monster of
+    # `DROP_TABLES` also gets a table named after it: the fixed drops and
+    # then its equipment, guaranteed.
+    LOOT_TABLES = content().loot_tables
+
+    # Starter inventories, by item id.
+    BASE_PACKS = content().base_packs
+
+    _catalog: ItemCatalog | None = None
+    _loot_tables: dict[str, LootTable] | None = None
+
+    @classmethod
+    def catalog(cls) -> ItemCatalog:
+        """The definitions of `BASE_ITEMS` and `DROP_TABLES`, registered once."""
+        if cls._catalog is None:
+            catalog = ItemCatalog()
+            with trusted():
+                for config in [cls.BASE_ITEMS, *cls.DROP_TABLES.values()]:
+                    for item_type, item_configs in config.items():
+                        for item_config in item_configs:
+                            catalog.add(cls.ITEM_REGISTRY[item_type], item_config)
+
+            cls._catalog = catalog
+        return cls._catalog
+
+    @classmethod
+    def loot_tables(cls) -> dict[str, LootTable]:
+        """`LOOT_TABLES` and the monster tables, compiled once."""
+        if cls._loot_tables is None:
+            config = dict(cls.LOOT_TABLES)
+            for monster_name, drops in cls.DROP_TABLES.items():
+                equipment = [
+                    item_id(item["name"]) for items in drops.values() for item in items
+                ]
+                config[monster_name] = {
+                    "guaranteed": [{"table": "fixed_drops"}, *equipment]
+                }
+            cls._loot_tables = compile_loot_tables(config, cls.catalog())
+        return cls._loot_tables
 
-        return drops
+    @classmethod
+    def _fixed_drops(cls, rng=random) -> list:
+        """The potions that won their drop roll."""
+        return cls.loot_tables()["fixed_drops"].roll(rng)
 
-    # Table of drops the monster
-    # Table of drops the monster
-    DROP_TABLES = {
-        # Drop fire items
-        "Salamandra": {  # grimoire
-            "grimoire": [
-                {
-                    "name": "Grimório Flamejante",
-                    "element": Element.FIRE,
-                    "magic_power": 30,
-                    "mana_cost": 8,
-                    "description": "Páginas quentes ao toque. Capaz de incinerar inimigos.",
-                }
-            ]
-        },
-        "Cavaleiro de Fogo": {  # weapon (ANTES ERA Demônio Ígneo)
-            "weapon": [
-                {
-                    "name": "Espada Incandescente",
-                    "base_damage": 25,
-                    "description": "Forjada no núcleo de um vulcão. A lâmina nunca esfria.",
-                }
-            ]
-        },
-        "Lobo de Fogo": {  # ranged_weapon (ANTES ERA Espírito Vulcânico)
-            "ranged_weapon": [
-                {
-                    "name": "Arco Vulcânico",
-                    "base_damage": 24,
-                    "ammo_required": 1,
-                    "element": Element.FIRE,
-                    "description": "Dispara flechas extremamente quentes, cuidado com os dedos.",
-                }
-            ]
-        },
-        # Drop ice items
-        "Golem de Gelo": {  # weapon
-            "weapon": [
-                {
-                    "name": "Martelo Congelado",
-                    "base_damage": 25,
-                    "description": "Pesado e brutal. Com ele, com certeza algo vai sobrar",
-                }
-            ]
-        },
-        "Yeti": {  # ranged_weapon (ANTES ERA Lobo Glacial)
-            "ranged_weapon": [
-                {
-                    "name": "Arco Congelante",
-                    "base_damage": 22,
-                    "ammo_required": 1,
-                    "element": Element.ICE,
-                    "description": "A corda deste arco é feita de pura geada mágica.",
-                }
-            ]
-        },
-        "Espectro Congelado": {  # grimoire
-            "grimoire": [
-                {
-                    "name": "Grimório Glacial",
-                    "element": Element.ICE,
-                    "magic_power": 27,
-                    "mana_cost": 7,
-                    "description": "Lê-se 'Fica frio aí' em runas antigas na parte de trás. Fascinante.",
-                }
-            ]
-        },
-        # Drop lightning items
-        "Serpente Elétrica": {  # ranged_weapon
-            "ranged_weapon": [
-                {
-                    "name": "Arco Tempestuoso",
-                    "base_damage": 26,
-                    "ammo_required": 1,
-                    "element": Element.LIGHTNING,
-                    "description": "Veloz como um relâmpago, mortal como a tempestade.",
-                }
-            ]
-        },
-        "Raijin": {  # grimoire
-            "grimoire": [
-                {
-                    "name": "Códice do Trovão",
-                    "element": Element.LIGHTNING,
-                    "magic_power": 33,
-                    "mana_cost": 12,
-                    "description": "As runas deste livro estalam com pura eletricidade.",
-                }
-            ]
-        },
-        "Medusa Elétrica": {  # weapon (ANTES ERA Elemental de Raio)
-            "weapon": [
-                {
-                    "name": "Lâmina Trovejante",
-                    "base_damage": 28,
-                    "element": Element.LIGHTNING,
-                    "description": "Uma espada que emite o som de um trovão a cada golpe.",
-                }
-            ]
-        },
-        # Drop poison items
-        "Aranha Tóxica": {  # weapon
-            "weapon": [
-                {
-                    "name": "Adaga Envenenada",
-                    "base_damage": 16,
-                    "element": Element.POISON,
-                    "description": "A lâmina pinga um líquido verde e corrosivo.",
-                }
-            ]
-        },
-        "Hidra Venenosa": {  # grimoire
-            "grimoire": [
-                {
-                    "name": "Grimório Pestilento",
-                    "element": Element.POISON,
-                    "magic_power": 24,
-                    "mana_cost": 9,
-                    "description": "Cheira a morte e decadência. Suas magias adoecem o alvo.",
-                }
-            ]
-        },
-        "Sapo Venenoso": {  # ranged_weapon (ANTES ERA Slime Corrosivo)
-            "ranged_weapon": [
-                {
-                    "name": "Lançador Corrosivo",
-                    "base_damage": 18,
-                    "ammo_required": 1,
-                    "element": Element.POISON,
-                    "description": "Arco rudimentar banhado em ácido de Slime.",
-                }
-            ]
-        },
-        # Drop Neutral items
-        "Goblin": {  # weapon
-            "weapon": [
-                {
-                    "name": "Adaga Rústica",
-                    "base_damage": 12,
-                    "element": Element.NEUTRAL,
-                    "description": "Arma lascada e suja, mas perigosamente afiada.",
-                }
-            ]
-        },
-        "Orc": {  # grimoire
-            "grimoire": [
-                {
-                    "name": "Tomo Profano",
-                    "element": Element.NEUTRAL,
-                    "magic_power": 22,
-                    "mana_cost": 6,
-                    "description": "Escrito em sangue, canaliza magia bruta e sem refinamento.",
-                }
-            ]
-        },
-        "Bandido Sombrio": {  # ranged_weapon
-            "ranged_weapon": [
-                {
-                    "name": "Besta Sombria",
-                    "base_damage": 23,
-                    "ammo_required": 1,
-                    "element": Element.NEUTRAL,
-                    "description": "Uma besta pesada usada por assassinos nas sombras.",
-                }
-            ]
-        },
-    }
+    # Table of drops the monster (equipment config by monster name)
+    DROP_TABLES = content().drop_tables
 
     # Returns the full list: fixed drops (potions) + equipment drop.
-    @staticmethod
-    def get_loot_for_monster(monster_name: str) -> list:
+    @classmethod
+    def get_loot_for_monster(cls, monster_name: str, rng=random) -> list:
         """
         Returns the complete loot list for a defeated monster.
 
@@ -226,61 +83,34 @@ class ItemsFactory:
 
         Args:
             monster_name: The exact name stored in monster.name.
+            rng: Random source for the drop rolls (a `RandomStream` or the
+                `random` module).
 
         Returns:
-            List of instantiated Item objects ready to be added to inventory.
+            A new list of new items created from the catalog, ready to be
+            added to an inventory.
         """
-        loot = ItemsFactory._fixed_drops()
-
-        equipment_config = ItemsFactory.DROP_TABLES.get(monster_name, {})
-        if equipment_config:
-            loot += ItemsFactory.create_items_from_config(equipment_config)
+        tables = cls.loot_tables()
+        return tables.get(monster_name, tables["fixed_drops"]).roll(rng)
 
-        return loot
+    @classmethod
+    def get_loot_for_monsters(cls, monster_names: list[str], rng=random) -> list:
+        """
+        The loot lists of many monsters at once (e.g. a horde), one per
+        name and in order: the same rolls as `get_loot_for_monster` in a loop.
+        """
+        tables = cls.loot_tables()
+        fixed = tables["fixed_drops"]
+        return [tables.get(name, fixed).roll(rng) for name in monster_names]
 
     # Basic items for hero sobrevivation
-    @staticmethod
-    def get_base_packs() -> dict:
-        """Base items for starter inventory."""
+    @classmethod
+    def get_base_packs(cls) -> dict:
+        """Base items for starter inventory (new items from the catalog)."""
+        catalog = cls.catalog()
         return {
-            "base_pack_warrior": [
-                Weapon(name="Espada de Ferro", base_damage=10),
-                Weapon(name="Adaga de Treino", base_damage=5),
-                ConsumableItem(
-                    name="Poção Pequena",
-                    description="Recupera 20 de Vida",
-                    weight=0.5,
-                    recovered_value=20,
-                ),
-            ],
-            "base_pack_mage": [
-                Grimoire(
-                    name="Grimório Iniciante",
-                    element=Element.FIRE,
-                    magic_power=12,
-                    mana_cost=5,
-                ),
-                ConsumableItem(
-                    name="Poção de Mana",
-                    description="Recupera 30 de Mana",
-                    weight=0.5,
-                    recovered_value=30,
-                    recovery_type="mana",
-                ),
-            ],
-            "base_pack_archer": [
-                RangedWeapon(
-                    name="Arco de Madeira",
-                    base_damage=8,
-                    ammo_required=1,
-                ),
-                ConsumableItem(
-                    name="Poção Pequena",
-                    description="Recupera 20 de Vida",
-                    weight=0.5,
-                    recovered_value=20,
-                ),
-            ],
+            pack: [catalog.create(catalog_id) for catalog_id in ids]
+            for pack, ids in cls.BASE_PACKS.items()
         }
 
     @staticmethod
@@ -1,22 +1,309 @@
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Iterator
+
+from services.items_factory import ItemsFactory
 from services.monster_factory import MonsterFactory
 from infra.cli import Color
-from domain.room import Room
+from domain.rng import RandomStream
+from domain.room import Room, RoomDelta
 from domain.element import Element
 import random
 
 
+class FloorWindow:
+    """
+    The generated floors of a run, at most `capacity` of them at a time.
+
+    For endless runs: asking for a floor generates it (see
+    `LevelFactory.room_at`) and keeps it; once more than `capacity` floors
+    are kept, the least recently asked for is dropped. Only its `Room.delta`
+    is kept: a dropped floor asked for again is generated anew from the
+    seed and the delta is replayed on it, so defeated monsters and taken
+    items stay gone.
+
+    The deltas of every floor with changes are saved (`deltas`) and
+    replayed on the regenerated rooms after a load (`restore`).
+
+    Attributes:
+        seed (int): Seed of the run.
+        capacity (int): Floors kept at most.
+        floors (int | None): Last floor of the run (None: endless).
+    """
+
+    __slots__ = ("seed", "capacity", "floors", "_root", "_rooms", "_pending")
+
+    def __init__(self, seed: int, capacity: int = 8, floors: int | None = None):
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
+        if floors is not None and floors <= 0:
+            raise ValueError("floors must be greater than 0")
+
+        self.seed = seed
+        self.capacity = capacity
+        self.floors = floors
+        self._root = RandomStream(seed)
+        self._rooms: OrderedDict[int, Room] = OrderedDict()
+        # Deltas of the floors not kept: restored or dropped ones, replayed
+        # when the floor is generated again.
+        self._pending: dict[int, RoomDelta] = {}
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def __contains__(self, level: int) -> bool:
+        """Whether the floor of `level` is generated and kept right now."""
+        return level in self._rooms
+
+    def has_floor(self, level: int) -> bool:
+        """Whether the run has a floor of `level`."""
+        return level >= 1 and (self.floors is None or level <= self.floors)
+
+    def room(self, level: int) -> Room:
+        """The room of `level`: the kept one, or a newly generated one."""
+        rooms = self._rooms
+        room = rooms.get(level)
+        if room is not None:
+            rooms.move_to_end(level)
+            return room
+
+        return self.adopt(level, self.generate(level))
+
+    def generate(self, level: int) -> Room:
+        """
+        A new room of `level`, not kept (see `adopt`). It reads nothing the
+        window changes, so it can run on another thread.
+        """
+        if not self.has_floor(level):
+            raise ValueError(f"The run has no floor {level}")
+        return LevelFactory._seeded_room(self._root, level)
+
+    def adopt(self, level: int, room: Room) -> Room:
+        """
+        Keeps `room`, generated for `level` by `generate`, as that floor and
+        returns it; if the floor is kept already, the kept room wins.
+        """
+        rooms = self._rooms
+        kept = rooms.get(level)
+        if kept is not None:
+            rooms.move_to_end(level)
+            return kept
+
+        rooms[level] = room
+        delta = self._pending.pop(level, None)
+        if delta is not None:
+            room.apply_delta(*delta)
+        if len(rooms) > self.capacity:
+            self._drop(*rooms.popitem(last=False))
+        return room
+
+    def _drop(self, level: int, room: Room) -> None:
+        delta = room.delta()
+        if delta[0] or delta[1]:
+            self._pending[level] = delta
+
+    def deltas(self) -> dict[int, RoomDelta]:
+        """The delta of each floor with changes, kept or dropped, by level."""
+        deltas = dict(self._pending)
+        for level, room in self._rooms.items():
+            delta = room.delta()
+            if delta[0] or delta[1]:
+                deltas[level] = delta
+        return {level: deltas[level] for level in sorted(deltas)}
+
+    def restore(self, deltas: dict[int, RoomDelta]) -> None:
+        """Replays saved `deltas` on their floors when they are generated."""
+        for level in deltas:
+            if level in self._rooms:
+                self._rooms[level].apply_delta(*deltas[level])
+            else:
+                self._pending[level] = deltas[level]
+
+
+class RoomPrefetcher:
+    """
+    Generates the next floors of a `FloorWindow` on a worker thread.
+
+    While the player is choosing an action the process is idle: `prefetch`
+    starts generating the floors ahead (monsters, loot rolls, descriptions)
+    and `room` hands the finished room over when the hero gets there. A room
+    is only touched by the worker until its future is done and only by the
+    caller afterwards, so nothing in the domain needs a lock. The window is
+    only changed by the caller's thread.
+
+    Attributes:
+        window (FloorWindow): The floors of the run.
+        ahead (int): Floors generated in advance.
+    """
+
+    def __init__(
+        self, window: FloorWindow, ahead: int = 1, executor: Executor | None = None
+    ):
+        if ahead <= 0:
+            raise ValueError("ahead must be greater than 0")
+
+        self.window = window
+        self.ahead = ahead
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="room-prefetch"
+        )
+        self._futures: dict[int, Future] = {}
+        # Built here, once, so that no worker builds a second copy of them.
+        ItemsFactory.loot_tables()
+
+    def prefetch(self, level: int) -> None:
+        """Starts generating the `ahead` floors from `level` not kept yet."""
+        window = self.window
+        for upcoming in range(level, level + self.ahead):
+            if (
+                window.has_floor(upcoming)
+                and upcoming not in window
+                and upcoming not in self._futures
+            ):
+                self._futures[upcoming] = self._executor.submit(
+                    window.generate, upcoming
+                )
+
+    def room(self, level: int) -> Room:
+        """The room of `level`: prefetched (waiting for it if needed) or new."""
+        future = self._futures.pop(level, None)
+        if future is None or future.cancelled():
+            return self.window.room(level)
+        return self.window.adopt(level, future.result())
+
+    def close(self) -> None:
+        """Drops the pending floors and stops the worker thread."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
 class LevelFactory:
     """
     Factory responsible for creating balanced phases
     based on player progression.
+
+    A run is a seed: `dungeon` generates its rooms lazily, one when the hero
+    gets to it, and `room_at` rebuilds the room of any level from the seed
+    alone. Nothing of a level is built before it is reached. Endless runs
+    keep their recent floors in a `FloorWindow`.
+
+    Every `HORDE_EVERY`-th floor of a run is a horde room (see
+    `is_horde_floor`), fought all at once by the game.
     """
 
+    HORDE_BASE_SIZE = 6
+    HORDE_GROWTH = 2
+    HORDE_EVERY = 4
+
     @classmethod
-    def create_room(cls, level: int, environment: Element | None = None) -> object:
+    def create_room(
+        cls, level: int, environment: Element | None = None, rng=random
+    ) -> object:
         """
         Creates a room scaled according to the level.
+        `rng` drives every random choice (a `RandomStream` or the `random` module).
+        """
+
+        chosen_environment = cls._choose_environment(level, environment, rng)
+        description = cls._describe(chosen_environment)
+
+        monster_1 = MonsterFactory.create_monster(level, chosen_environment, rng)
+        monster_2 = MonsterFactory.create_boss(level, chosen_environment, rng)
+
+        return Room(
+            description=description,
+            environment=chosen_environment,
+            monsters=[monster_1, monster_2],
+            items=[],
+        )
+
+    @classmethod
+    def dungeon(
+        cls, seed: int, floors: int | None = None, start: int = 1
+    ) -> Iterator[Room]:
+        """
+        The rooms of the run `seed`, from level `start` on: each one is
+        generated when the iterator is advanced (endless with no `floors`).
+        Only the room handed out is kept, by the caller.
+        """
+        if start <= 0:
+            raise ValueError("Level must be greater than 0")
+
+        root = RandomStream(seed)
+        level = start
+        while floors is None or level <= floors:
+            yield cls._seeded_room(root, level)
+            level += 1
+
+    @classmethod
+    def room_at(cls, seed: int, level: int) -> Room:
+        """The room of `level` in the run `seed`, as `dungeon` generates it."""
+        return cls._seeded_room(RandomStream(seed), level)
+
+    @classmethod
+    def _seeded_room(cls, root: RandomStream, level: int) -> Room:
+        # Each level has its own child stream: a room depends on (seed, level)
+        # only, not on the rooms generated (or skipped) before it.
+        rng = root.spawn(("room", level))
+        if cls.is_horde_floor(level):
+            return cls.create_horde_room(
+                level, size=cls.floor_horde_size(level), rng=rng
+            )
+        return cls.create_room(level, rng=rng)
+
+    @classmethod
+    def is_horde_floor(cls, level: int) -> bool:
+        """Whether the floor of `level` of a run is a horde room."""
+        return level % cls.HORDE_EVERY == 0
+
+    @classmethod
+    def floor_horde_size(cls, level: int) -> int:
+        """
+        Size of the horde of a horde floor: `HORDE_BASE_SIZE` on the first
+        one, `HORDE_GROWTH` more on each of the next ones. Smaller than the
+        default of `create_horde_room`, since the hero fights it alone.
         """
+        return cls.HORDE_BASE_SIZE + (level // cls.HORDE_EVERY - 1) * cls.HORDE_GROWTH
 
+    @classmethod
+    def create_horde_room(
+        cls,
+        level: int,
+        size: int | None = None,
+        environment: Element | None = None,
+        rng=random,
+    ) -> Room:
+        """
+        Creates a room crowded with regular monsters of the level, to be
+        fought all at once (see `services.room_battle.RoomBattle`).
+        The wave grows with the level unless `size` is given.
+        """
+        if size is None:
+            size = cls.HORDE_BASE_SIZE + level * cls.HORDE_GROWTH
+        if size <= 0:
+            raise ValueError("Horde size must be greater than 0")
+
+        chosen_environment = cls._choose_environment(level, environment, rng)
+        description = (
+            cls._describe(chosen_environment)
+            + f" Uma HORDA de {size} inimigos bloqueia o caminho!"
+        )
+
+        monsters = MonsterFactory.create_monsters(level, size, chosen_environment, rng)
+
+        return Room(
+            description=description,
+            environment=chosen_environment,
+            monsters=monsters,
+            items=[],
+        )
+
+    @staticmethod
+    def _choose_environment(level: int, environment: Element | None, rng) -> Element:
         if not isinstance(environment, Element) and environment is not None:
             raise TypeError("Enviroment must be a Element object or passes like None")
 
@@ -38,8 +325,12 @@ class LevelFactory:
                 valid_elements = [
                     element for element in Element if element != Element.NEUTRAL
                 ]
-                chosen_environment = random.choice(valid_elements)
+                chosen_environment = rng.choice(valid_elements)
+
+        return chosen_environment
 
+    @staticmethod
+    def _describe(chosen_environment: Element) -> str:
         element_translation = {
             Element.FIRE: (f"{Color.ORANGE}FOGO{Color.RESET}"),
             Element.ICE: (f"{Color.CYAN}GELO{Color.RESET}"),
@@ -48,16 +339,6 @@ class LevelFactory:
         }
 
         if chosen_environment != Element.NEUTRAL:
-            description = f"Você entra em uma sala dominada pelo {element_translation[chosen_environment]}."
+            return f"Você entra em uma sala dominada pelo {element_translation[chosen_environment]}."
         else:
-            description = "Você entra em uma sala estranha... não parece ter influência elemental aqui."
-
-        monster_1 = MonsterFactory.create_monster(level, chosen_environment)
-        monster_2 = MonsterFactory.create_boss(level, chosen_environment)
-
-        return Room(
-            description=description,
-            environment=chosen_environment,
-            monsters=[monster_1, monster_2],
-            items=[],
-        )
+            return "Você entra em uma sala estranha... não parece ter influência elemental aqui."
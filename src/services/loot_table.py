@@ -0,0 +1,204 @@
+"""
+Weighted loot tables, compiled into Walker alias tables.
+
+A table drops its `guaranteed` entries every time and then rolls `rolls`
+times on its weighted `entries`. An entry is an item, another table (rolled
+in turn, so tables nest) or nothing. The weights of a table are compiled
+once into an `AliasTable`, so every roll costs one `random()` and two list
+lookups, however many entries the table has. Item entries are catalog
+definitions: every drop is a new item created from one.
+
+Tables are data (see `ItemsFactory.LOOT_TABLES`, from `content/items.json`):
+
+    {"fixed_drops": {"guaranteed": [{"table": "healing_potion"}]},
+     "healing_potion": {"entries": [{"item": "pocao_de_cura", "weight": 70},
+                                    {"weight": 30}]},
+     "gear": {"rolls": 2, "entries": [{"item": "adaga_rustica", "rarity": "common"},
+                                      {"table": "epic_gear", "rarity": "epic"}]}}
+
+An entry weighs `weight`, or the weight of its `rarity` tier in
+`RARITY_WEIGHTS`. A guaranteed entry is an item id or {"table": name}.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Mapping, Sequence
+
+if TYPE_CHECKING:
+    from services.item_catalog import ItemCatalog, ItemDefinition
+
+# Weight of an entry given by its rarity tier instead of a `weight`.
+RARITY_WEIGHTS = {"common": 60.0, "uncommon": 25.0, "rare": 12.0, "epic": 3.0}
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table: samples index `i` with probability
+    `weights[i] / sum(weights)` from a single uniform number.
+    """
+
+    __slots__ = ("size", "_probability", "_alias")
+
+    def __init__(self, weights: Sequence[float]):
+        size = len(weights)
+        if size == 0:
+            raise ValueError("An alias table needs at least one weight")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("Weights cannot be negative")
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError("The weights must add up to more than 0")
+
+        scaled = [weight * size / total for weight in weights]
+        probability = [1.0] * size
+        alias = list(range(size))
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+
+        while small and large:
+            low, high = small.pop(), large.pop()
+            probability[low] = scaled[low]
+            alias[low] = high
+            scaled[high] += scaled[low] - 1.0
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Whatever is left is 1 up to rounding errors: it keeps itself.
+
+        self.size = size
+        self._probability = probability
+        self._alias = alias
+
+    def sample(self, uniform: float) -> int:
+        """The index drawn by `uniform`, a number in [0, 1)."""
+        scaled = uniform * self.size
+        index = int(scaled)
+        if scaled - index < self._probability[index]:
+            return index
+        return self._alias[index]
+
+
+class LootTable:
+    """
+    A compiled loot table: `guaranteed` drops plus `rolls` weighted rolls.
+
+    Attributes:
+        guaranteed (tuple): Item definitions and tables dropped (rolled)
+            every time.
+        rolls (int): Rolls on the weighted entries.
+    """
+
+    __slots__ = ("guaranteed", "rolls", "_drops", "_alias")
+
+    def __init__(
+        self,
+        entries: Sequence[tuple[float, ItemDefinition | LootTable | None]] = (),
+        rolls: int = 1,
+        guaranteed: Sequence[ItemDefinition | LootTable] = (),
+    ):
+        if rolls < 0:
+            raise ValueError("rolls cannot be negative")
+
+        self.guaranteed = tuple(drop for drop in guaranteed if drop is not None)
+        self.rolls = rolls if entries else 0
+        self._drops = tuple(drop for _, drop in entries)
+        self._alias = AliasTable([weight for weight, _ in entries]) if entries else None
+
+    def roll(self, rng=random) -> list:
+        """The drops of one roll of the table (`rng`: a stream or `random`)."""
+        drops: list = []
+        self._roll_into(drops, rng.random)
+        return drops
+
+    def roll_many(self, count: int, rng=random) -> list[list]:
+        """The drops of `count` independent rolls, e.g. a defeated horde."""
+        uniform = rng.random
+        roll_into = self._roll_into
+        results = []
+        for _ in range(count):
+            drops: list = []
+            roll_into(drops, uniform)
+            results.append(drops)
+        return results
+
+    def _roll_into(self, drops: list, uniform) -> None:
+        for drop in self.guaranteed:
+            if type(drop) is LootTable:
+                drop._roll_into(drops, uniform)
+            else:
+                drops.append(drop.create())
+
+        if self.rolls:
+            sample = self._alias.sample
+            entries = self._drops
+            for _ in range(self.rolls):
+                drop = entries[sample(uniform())]
+                if drop is None:
+                    continue
+                if type(drop) is LootTable:
+                    drop._roll_into(drops, uniform)
+                else:
+                    drops.append(drop.create())
+
+
+def compile_loot_tables(
+    config: Mapping[str, Mapping], catalog: ItemCatalog
+) -> dict[str, LootTable]:
+    """
+    Compiles the tables of `config` (see the module docstring), resolving
+    item ids in `catalog` and nested tables by name. Raises ValueError for
+    unknown items, tables or rarities, bad weights and cyclic tables.
+    """
+    compiled: dict[str, LootTable] = {}
+    compiling: set[str] = set()
+
+    def table(name: str) -> LootTable:
+        if name in compiled:
+            return compiled[name]
+        if name not in config:
+            raise ValueError(f"Invalid loot table: unknown table '{name}'")
+        if name in compiling:
+            raise ValueError(f"Invalid loot table: '{name}' contains itself")
+
+        compiling.add(name)
+        spec = config[name]
+        try:
+            result = LootTable(
+                entries=[
+                    (weight(entry), drop(entry)) for entry in spec.get("entries", ())
+                ],
+                rolls=spec.get("rolls", 1),
+                guaranteed=[
+                    drop({"item": entry} if isinstance(entry, str) else entry)
+                    for entry in spec.get("guaranteed", ())
+                ],
+            )
+        except ValueError as error:
+            if str(error).startswith("Invalid loot table"):
+                raise
+            raise ValueError(f"Invalid loot table '{name}': {error}") from error
+        compiling.discard(name)
+
+        compiled[name] = result
+        return result
+
+    def drop(entry: Mapping) -> ItemDefinition | LootTable | None:
+        if "table" in entry:
+            return table(entry["table"])
+        if "item" in entry:
+            try:
+                return catalog.get(entry["item"])
+            except KeyError as error:
+                raise ValueError(error.args[0]) from None
+        return None
+
+    def weight(entry: Mapping) -> float:
+        if "weight" in entry:
+            return float(entry["weight"])
+        rarity = entry.get("rarity")
+        if rarity not in RARITY_WEIGHTS:
+            raise ValueError(f"entry without weight or known rarity: {dict(entry)}")
+        return RARITY_WEIGHTS[rarity]
+
+    for name in config:
+        table(name)
+    return compiled
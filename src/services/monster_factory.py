@@ -1,8 +1,114 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
 from services.arts import MONSTER_ARTS
+from services.content import content
 from services.items_factory import ItemsFactory
 import random
 from domain.monster import Monster
 from domain.element import Element
+from domain.fields import trusted
+
+# `rng.choice` needs a sequence; built once instead of on every spawn.
+_ELEMENTS = tuple(Element)
+
+
+class MonsterPool:
+    """
+    Defeated monsters kept to be respawned, per prototype.
+
+    In long sessions most monsters are fought once and dropped; with a pool
+    the GameManager hands them back (`MonsterFactory.recycle`) and the next
+    spawn of the same prototype reuses the object instead of allocating one.
+    A recycled monster must not be used anywhere else afterwards. Monsters
+    can be spawned on a worker thread (see `RoomPrefetcher`) while others
+    are released: the free lists are guarded by a lock.
+
+    Attributes:
+        max_per_prototype (int): Monsters kept per prototype; extra ones
+            are left to the garbage collector.
+        max_prototypes (int): Prototypes with monsters kept; the one
+            released to least recently is dropped first (in an endless run,
+            the levels left behind).
+    """
+
+    def __init__(self, max_per_prototype: int = 16, max_prototypes: int = 64):
+        if max_per_prototype <= 0:
+            raise ValueError("max_per_prototype must be greater than 0")
+        if max_prototypes <= 0:
+            raise ValueError("max_prototypes must be greater than 0")
+        self.max_per_prototype = max_per_prototype
+        self.max_prototypes = max_prototypes
+        self._free: OrderedDict[Monster, list[Monster]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(monsters) for monsters in self._free.values())
+
+    def acquire(self, prototype: Monster, loot: list | None = None) -> Monster:
+        """A monster of `prototype` at full life: a recycled one if any."""
+        with self._lock:
+            free = self._free.get(prototype)
+            recycled = free.pop() if free else None
+        return prototype.spawn(loot, recycled)
+
+    def release(self, monster: Monster) -> None:
+        """Keeps a defeated monster spawned from a prototype for reuse."""
+        if monster.is_it_alive():
+            raise ValueError("Only defeated monsters can be recycled")
+
+        prototype = monster.prototype
+        if prototype is None:
+            return
+
+        with self._lock:
+            free = self._free.get(prototype)
+            if free is None:
+                free = self._free[prototype] = []
+                if len(self._free) > self.max_prototypes:
+                    self._free.popitem(last=False)
+            else:
+                self._free.move_to_end(prototype)
+
+            if len(free) < self.max_per_prototype and monster not in free:
+                free.append(monster)
+
+
+@lru_cache(maxsize=1024)
+def _prototype(name: str, level: int, element: Element, boss: bool) -> Monster:
+    """
+    The immutable template of every monster of (name, level, element, boss):
+    stats, art and description computed once. It is never fought; spawns
+    copy it (see `Monster.spawn`).
+    """
+    if boss:
+        max_life = 120 + (level * 20)
+        attack = 20 + (level * 8)
+        speed = 10 + level
+        description = f"{name}, um chefe elemental extremamente poderoso."
+    else:
+        # Progressive scaling
+        max_life = 55 + (level * 10)
+        attack = 8 + (level * 5)
+        speed = 5 + level
+        description = (
+            f"{name} de nível {level}. "
+            f"Uma criatura imbuída com o poder de {element.name.lower()}."
+        )
+
+    art = MONSTER_ARTS.get(name, MONSTER_ARTS["DEFAULT"])
+
+    with trusted():
+        return Monster(
+            name=name,
+            max_life=max_life,
+            attack=attack,
+            speed=speed,
+            element=element,
+            description=description,
+            art=art,
+        )
 
 
 class MonsterFactory:
@@ -10,6 +116,11 @@ class MonsterFactory:
     Factory responsible for creating balanced monsters
     based on room level or player progression.
 
+    The stats, art and description of a (name, level, element, boss) are
+    computed once into a prototype monster (see `prototype`); every spawn
+    copies it and only gets its own combat state and loot. With a `pool`
+    set, defeated monsters handed to `recycle` are reused by later spawns.
+
     Integration with ItemsFactory:
         Every monster created here already carries its loot list populated
         via ItemsFactory.get_loot_for_monster(name). The GameManager only
@@ -17,81 +128,86 @@ class MonsterFactory:
         defeated — no extra factory call required at that point.
     """
 
-    BASE_NAMES = {
-        Element.FIRE: ["Salamandra", "Lobo de Fogo", "Cavaleiro de Fogo"],
-        Element.ICE: ["Golem de Gelo", "Yeti", "Espectro Congelado"],
-        Element.LIGHTNING: ["Serpente Elétrica", "Raijin", "Medusa Elétrica"],
-        Element.POISON: ["Aranha Tóxica", "Hidra Venenosa", "Sapo Venenoso"],
-        Element.NEUTRAL: ["Goblin", "Orc", "Bandido Sombrio"],
-    }
+    # Names of the monsters of each element (from `content/monsters.json`).
+    BASE_NAMES = content().monster_names
+
+    # Optional recycling of defeated monsters (None: always a new object).
+    pool: MonsterPool | None = None
 
     @classmethod
-    def create_monster(cls, level: int, element: Element | None = None) -> Monster:
+    def create_monster(
+        cls, level: int, element: Element | None = None, rng=random
+    ) -> Monster:
         """
         Creates a monster scaled according to the level.
         Loot is automatically populated via ItemsFactory.
+        `rng` drives every random choice (a `RandomStream` or the `random` module).
         """
         if level <= 0:
             raise ValueError("Level must be greater than 0")
 
-        element = element or random.choice(list(Element))
-        name = random.choice(cls.BASE_NAMES[element])
+        element = element or rng.choice(_ELEMENTS)
+        name = rng.choice(cls.BASE_NAMES[element])
 
-        # Progressive scaling
-        max_life = 55 + (level * 10)
-        attack = 8 + (level * 5)
-        speed = 5 + level
+        # call directly after victory
+        loot = ItemsFactory.get_loot_for_monster(name, rng)
 
-        art = MONSTER_ARTS.get(name, MONSTER_ARTS["DEFAULT"])
+        return cls._spawn(cls.prototype(name, level, element), loot)
 
-        description = (
-            f"{name} de nível {level}. "
-            f"Uma criatura imbuída com o poder de {element.name.lower()}."
-        )
+    @classmethod
+    def create_monsters(
+        cls, level: int, count: int, element: Element, rng=random
+    ) -> list[Monster]:
+        """
+        `count` regular monsters of `element` (e.g. a horde): their names
+        are drawn first and their loot is rolled in one bulk call.
+        """
+        if level <= 0:
+            raise ValueError("Level must be greater than 0")
 
-        # call directly after victory
-        loot = ItemsFactory.get_loot_for_monster(name)
+        names = [rng.choice(cls.BASE_NAMES[element]) for _ in range(count)]
+        loots = ItemsFactory.get_loot_for_monsters(names, rng)
 
-        return Monster(
-            name=name,
-            max_life=max_life,
-            attack=attack,
-            speed=speed,
-            element=element,
-            loot=loot,
-            description=description,
-            art=art,
-        )
+        return [
+            cls._spawn(cls.prototype(name, level, element), loot)
+            for name, loot in zip(names, loots)
+        ]
 
     @classmethod
-    def create_boss(cls, level: int, element: Element) -> Monster:
+    def create_boss(cls, level: int, element: Element, rng=random) -> Monster:
         """
         Creates a stronger monster for special rooms.
         Bosses drop the standard fixed items (potions) only,
         since their name won't match any DROP_TABLE entry.
         To give bosses unique drops, add their name to DROP_TABLES.
         """
-        name = random.choice(cls.BASE_NAMES[element])
+        name = rng.choice(cls.BASE_NAMES[element])
 
-        max_life = 120 + (level * 20)
-        attack = 20 + (level * 8)
-        speed = 10 + level
+        # Bosses always drop the fixed potions; unique gear can be added
+        # to DROP_TABLES using their generated name as key if needed.
+        loot = ItemsFactory.get_loot_for_monster(name, rng)
 
-        art = MONSTER_ARTS.get(name, MONSTER_ARTS["DEFAULT"])
+        return cls._spawn(cls.prototype(name, level, element, boss=True), loot)
 
-        description = f"{name}, um chefe elemental extremamente poderoso."
+    @staticmethod
+    def prototype(
+        name: str, level: int, element: Element, boss: bool = False
+    ) -> Monster:
+        """
+        The cached template of the monsters of (name, level, element, boss).
+        Read it, do not fight or modify it: spawn copies with `Monster.spawn`.
+        """
+        return _prototype(name, level, element, boss)
 
-        # Bosses always drop the fixed potions; unique gear can be added
-        # to DROP_TABLES using their generated name as key if needed.
-        loot = ItemsFactory.get_loot_for_monster(name)
+    @classmethod
+    def recycle(cls, monster: Monster) -> None:
+        """Hands a defeated monster back to the `pool`, if there is one."""
+        if cls.pool is not None:
+            cls.pool.release(monster)
 
-        return Monster(
-            name=name,
-            max_life=max_life,
-            attack=attack,
-            speed=speed,
-            element=element,
-            loot=loot,
-            description=description,
-            art=art,
-        )
+    @classmethod
+    def _spawn(cls, prototype: Monster, loot: list) -> Monster:
+        pool = cls.pool
+        if pool is None:
+            return prototype.spawn(loot)
+        return pool.acquire(prototype, loot)
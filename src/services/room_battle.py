@@ -0,0 +1,465 @@
+"""
+Room battles: a hero (or a party) against every monster of a `Room` at once.
+
+Combat is still played in rounds, each combatant acting once per round,
+fastest first (heroes win speed ties, then the order they joined the fight).
+Instead of sorting everybody at the start of each round, the order lives in
+an `InitiativeQueue`: a heap for the round being played and another for the
+next one. A combatant that acts is pushed into the next round with its
+current speed, so a `FrozenState` that slows it down (or wears off) is
+reflected in the following round at O(log n) per action, which keeps rooms
+with hundreds of monsters cheap.
+"""
+
+import heapq
+import itertools
+import random
+from typing import Iterable
+
+from domain.actions import ALL_ENEMIES, BoundAction
+from domain.element import Element
+from domain.entity import Entity
+from domain.hero import Hero
+from domain.monster import Monster
+from domain.rng import RandomStream
+from domain.room import Room
+from services.battle import Battle
+from services.battle_events import (
+    AbilityUsed,
+    ActionFailed,
+    ActionPrevented,
+    Defeated,
+    RenderedEvents,
+    render_events,
+)
+
+HERO_PRIORITY = 0
+MONSTER_PRIORITY = 1
+
+
+class InitiativeQueue:
+    """
+    Speed-ordered priority queue of the combatants of a round-based fight.
+
+    Entries are `[-speed, priority, order, entity]` lists. Changing the key
+    of a queued entity marks its entry as removed (entity set to None) and
+    pushes a fresh one; removed entries are dropped when they reach the top.
+    """
+
+    def __init__(self):
+        self.round = 1
+        self._current: list[list] = []
+        self._next: list[list] = []
+        # id(entity) -> (entry, heap holding it)
+        self._entries: dict[int, tuple[list, list]] = {}
+        self._priority: dict[int, tuple[int, int]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, entity: Entity) -> bool:
+        return id(entity) in self._entries
+
+    def add(self, entity: Entity, priority: int) -> None:
+        """Registers the entity and queues it in the round being played."""
+        self._priority[id(entity)] = (priority, next(self._counter))
+        self._push(entity, self._current)
+
+    def pop(self) -> Entity | None:
+        """
+        Next entity to act, opening a new round when the current one is over.
+        The entity leaves the queue until `push_next` (or `remove`).
+        """
+        while True:
+            while self._current:
+                entry = heapq.heappop(self._current)
+                entity = entry[-1]
+                if entity is not None:
+                    del self._entries[id(entity)]
+                    return entity
+
+            if not self._next:
+                return None
+            self._current, self._next = self._next, []
+            self.round += 1
+
+    def push_next(self, entity: Entity) -> None:
+        """Queues an entity that just acted for the next round."""
+        self._push(entity, self._next)
+
+    def reschedule(self, entity: Entity) -> None:
+        """Re-keys a queued entity whose speed changed; no-op otherwise."""
+        found = self._entries.get(id(entity))
+        if found is None or -found[0][0] == entity.speed:
+            return
+        entry, heap = found
+        entry[-1] = None
+        self._push(entity, heap)
+
+    def remove(self, entity: Entity) -> None:
+        """Takes the entity out of the fight (e.g. it died)."""
+        found = self._entries.pop(id(entity), None)
+        if found is not None:
+            found[0][-1] = None
+
+    def _push(self, entity: Entity, heap: list) -> None:
+        priority, order = self._priority[id(entity)]
+        entry = [-entity.speed, priority, order, entity]
+        self._entries[id(entity)] = (entry, heap)
+        heapq.heappush(heap, entry)
+
+    def snapshot(self) -> tuple:
+        """Live entries of both rounds (see `RoomBattle.snapshot`)."""
+        return (
+            self.round,
+            tuple(tuple(e) for e in self._current if e[-1] is not None),
+            tuple(tuple(e) for e in self._next if e[-1] is not None),
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        self.round, current, upcoming = snapshot
+        self._entries = {}
+        self._current = self._rebuild(current)
+        self._next = self._rebuild(upcoming)
+
+    def _rebuild(self, entries: tuple) -> list:
+        heap = [list(e) for e in entries]
+        heapq.heapify(heap)
+        for entry in heap:
+            self._entries[id(entry[-1])] = (entry, heap)
+        return heap
+
+
+class RoomBattle(Battle):
+    """
+    Orchestrates a fight between one or more heroes and many monsters.
+
+    Reuses the turn rules of `Battle` (status ticks, stun, hero actions and
+    monster strikes, typed events) and only replaces the scheduling: the
+    `InitiativeQueue` decides who acts next. Monsters act on their own and
+    strike a random living hero; when a hero's slot comes up the battle
+    stops and waits for `execute_turn(choice, target)`.
+
+    Besides `get_actions`, heroes may use their `get_area_actions`, which
+    hit every living monster in one batched pass (see `domain.area_damage`).
+    Given a `Room`, the fight uses the multipliers of its environment.
+
+    A failed hero action (no ammo, no mana...) does not spend the slot: the
+    same hero chooses again. `end_of_turn_routine` is called by the battle
+    itself, right before each hero's next slot, so callers must not call it.
+    """
+
+    def __init__(
+        self,
+        heroes: Hero | Iterable[Hero],
+        monsters: Room | Iterable[Monster],
+        headless: bool = False,
+        rng: RandomStream | None = None,
+        environment: Element | None = None,
+    ):
+        heroes = [heroes] if isinstance(heroes, Hero) else list(heroes)
+        if isinstance(monsters, Room):
+            if environment is None:
+                environment = monsters.environment
+            monsters = monsters.monsters
+        else:
+            monsters = list(monsters)
+        if not heroes:
+            raise ValueError("O combate precisa de pelo menos um herói.")
+        if not monsters:
+            raise ValueError("O combate precisa de pelo menos um monstro.")
+
+        # The setters validate each combatant; the last pair is left in place.
+        for hero in heroes:
+            self.hero = hero
+        for monster in monsters:
+            self.monster = monster
+
+        self.heroes = heroes
+        self.monsters = monsters
+        self.headless = headless
+        self.rng = rng
+        self._enter_environment(environment)
+        self._open_event_bus()
+        self._join(heroes + monsters)
+
+        self.turn_count = 0
+        self.is_combat_active = True
+        self.current_hero: Hero | None = None
+        self._living_heroes = list(heroes)
+        self._living_monsters = list(monsters)
+        # ids of heroes that still owe their end_of_turn_routine
+        self._acted: set[int] = set()
+
+        self._queue = InitiativeQueue()
+        for hero in heroes:
+            self._queue.add(hero, HERO_PRIORITY)
+        for monster in monsters:
+            self._queue.add(monster, MONSTER_PRIORITY)
+
+        # Monsters faster than every hero strike before the first choice;
+        # what they did is reported by the first execute_turn.
+        self._pending = self._new_turn_log()
+        self._advance(self._pending)
+        if not self.is_combat_active:
+            self.close()
+
+    @property
+    def round(self) -> int:
+        return self._queue.round
+
+    @property
+    def living_heroes(self) -> list[Hero]:
+        return self._living_heroes[:]
+
+    @property
+    def living_monsters(self) -> list[Monster]:
+        return self._living_monsters[:]
+
+    def get_available_actions(self) -> dict:
+        return self.hero.get_actions() | self.hero.get_area_actions()
+
+    def _is_combat_over(self) -> bool:
+        return not self._living_heroes or not self._living_monsters
+
+    def _new_turn_log(self) -> dict:
+        return {
+            "turn": self.turn_count + 1,
+            "round": self.round,
+            "events": [],
+            "status": {},
+            "combat_over": False,
+            "hero_used_consumable": False,
+            "special_state": None,
+            "actor": None,
+            "target": None,
+        }
+
+    def _defeat(self, entity: Entity, events: list) -> None:
+        entity.is_active = False
+        self._queue.remove(entity)
+        if isinstance(entity, Hero):
+            self._living_heroes.remove(entity)
+            self._acted.discard(id(entity))
+        else:
+            self._living_monsters.remove(entity)
+        events.append(Defeated(entity.name))
+
+        if self._is_combat_over():
+            self.is_combat_active = False
+
+    def _defeat_monsters(self, events: list) -> None:
+        """Removes every monster that fell to an area action at once."""
+        living = []
+        for monster in self._living_monsters:
+            if monster.is_it_alive():
+                living.append(monster)
+                continue
+            monster.is_active = False
+            self._queue.remove(monster)
+            events.append(Defeated(monster.name))
+        self._living_monsters = living
+
+        if self._is_combat_over():
+            self.is_combat_active = False
+
+    def _pick_hero(self) -> Hero:
+        if len(self._living_heroes) == 1:
+            return self._living_heroes[0]
+        rng = self.rng if self.rng is not None else random
+        return rng.choice(self._living_heroes)
+
+    def _advance(self, turn_log: dict) -> None:
+        """Plays slots until a hero has to choose or the fight is over."""
+        events = turn_log["events"]
+
+        while self.is_combat_active and self.current_hero is None:
+            entity = self._queue.pop()
+            is_hero = isinstance(entity, Hero)
+
+            if is_hero and id(entity) in self._acted:
+                self._acted.discard(id(entity))
+                entity.end_of_turn_routine()
+
+            self._apply_status_effects(entity)
+            turn_log["status"][entity.name] = entity.current_status.name
+
+            if not entity.is_it_alive():
+                self._defeat(entity, events)
+                continue
+
+            if not self._can_act(entity):
+                events.append(
+                    ActionPrevented(entity.name, entity.preventing_status().name)
+                )
+                if is_hero:
+                    self._acted.add(id(entity))
+                self._queue.push_next(entity)
+                continue
+
+            if is_hero:
+                self.current_hero = entity
+                return
+
+            target = self._pick_hero()
+            self.hero = target
+            self.monster = entity
+            self._execute_monster_action(turn_log)
+            self._queue.push_next(entity)
+
+            if not target.is_it_alive():
+                self._defeat(target, events)
+
+    def _execute_area_action(self, action: BoundAction, turn_log: dict) -> bool:
+        """
+        Runs an area action against every living monster.
+
+        Returns:
+            bool: True if the action consumed the hero's slot, False if it failed.
+        """
+        events = turn_log["events"]
+        hero = self.hero
+        targets = self._living_monsters[:]
+        life = sum(monster.current_life for monster in targets)
+        ammo = hero.current_ammo if self._hero_uses_ammo else 0
+        mana = hero.current_mana if self._hero_uses_mana else 0
+        self._published.clear()
+
+        try:
+            text = action.method(targets)
+        except ValueError as e:
+            events.append(ActionFailed(hero.name, str(e)))
+            turn_log["action_failed"] = True
+            return False
+
+        damage = life - sum(monster.current_life for monster in targets)
+        events.append(AbilityUsed(hero.name, text, damage))
+
+        if self._hero_uses_mana:
+            mana_event = self._mana_event(mana)
+            if mana_event is not None:
+                events.append(mana_event)
+        if self._hero_uses_ammo:
+            events.append(self._ammo_event(ammo))
+
+        self._defeat_monsters(events)
+        return True
+
+    def _resolve_target(self, target: Monster | int | None) -> Monster:
+        if target is None:
+            return self._living_monsters[0]
+        if isinstance(target, int):
+            if not 0 <= target < len(self._living_monsters):
+                raise ValueError(f"Alvo {target} é inválido.")
+            return self._living_monsters[target]
+        if target not in self._living_monsters:
+            raise ValueError(f"{target.name} não está mais no combate.")
+        return target
+
+    def execute_turn(
+        self, player_choice: str, target: Monster | int | None = None
+    ) -> dict:
+        """
+        Applies the choice of `current_hero` against `target` (a living
+        monster or its index in `living_monsters`; the first one by default)
+        and plays every slot up to the next hero's choice.
+        """
+        if not self.is_combat_active:
+            raise ValueError("O combate já terminou.")
+
+        hero = self.current_hero
+        action = hero.action_view().actions.get(player_choice)
+        area_action = (
+            action if action and action.spec.targeting == ALL_ENEMIES else None
+        )
+        monster = self._resolve_target(target)
+
+        turn_log = self._pending
+        turn_log["turn"] = self.turn_count + 1
+        turn_log["actor"] = hero.name
+        turn_log["target"] = None if area_action else monster.name
+        self._pending = self._new_turn_log()
+
+        self.hero = hero
+        self.monster = monster
+
+        if area_action is not None:
+            succeeded = self._execute_area_action(area_action, turn_log)
+        else:
+            succeeded = self._execute_hero_action(player_choice, turn_log)
+
+        if succeeded:
+            self.current_hero = None
+            self._acted.add(id(hero))
+            self._queue.push_next(hero)
+
+            # Area actions already removed the monsters they killed.
+            if area_action is None:
+                if monster.is_it_alive():
+                    self._queue.reschedule(monster)
+                else:
+                    self._defeat(monster, turn_log["events"])
+
+            self._advance(turn_log)
+
+        turn_log["combat_over"] = not self.is_combat_active
+        if self.headless:
+            turn_log["actions"] = RenderedEvents(turn_log["events"])
+        else:
+            turn_log["actions"] = render_events(turn_log["events"])
+
+        combat_result = self.get_combat_result()
+        self.turn_count += 1
+        if not self.is_combat_active:
+            self.close()
+
+        return {
+            "result": combat_result["result"],
+            "loot": combat_result["loot"],
+            "turn_log": turn_log,
+        }
+
+    def get_combat_result(self) -> dict:
+        if not self._living_monsters:
+            loot = []
+            for monster in self.monsters:
+                loot.extend(monster.get_loot())
+            return {"result": "victory", "loot": loot}
+        if not self._living_heroes:
+            return {"result": "defeat", "loot": []}
+        return {"result": "ongoing", "loot": []}
+
+    def snapshot(self) -> tuple:
+        """Every combatant, the initiative queue and whose choice is pending."""
+        return (
+            self.turn_count,
+            self.is_combat_active,
+            tuple(entity.snapshot() for entity in self.heroes + self.monsters),
+            self._queue.snapshot(),
+            self.current_hero,
+            tuple(self._living_heroes),
+            tuple(self._living_monsters),
+            frozenset(self._acted),
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        (
+            self.turn_count,
+            self.is_combat_active,
+            entities,
+            queue,
+            self.current_hero,
+            living_heroes,
+            living_monsters,
+            acted,
+        ) = snapshot
+        for entity, entity_snapshot in zip(self.heroes + self.monsters, entities):
+            entity.restore(entity_snapshot)
+        self._queue.restore(queue)
+        self._living_heroes = list(living_heroes)
+        self._living_monsters = list(living_monsters)
+        self._acted = set(acted)
+        self._pending = self._new_turn_log()
+        if not self._attached and self.is_combat_active:
+            self._attach()
@@ -0,0 +1,329 @@
+"""
+Monte Carlo battle simulator.
+
+Runs complete `Battle`s between a freshly created hero archetype and a
+factory-made monster, spread across a process pool. Workers only send back
+aggregated `SimulationStats` per chunk of trials, never the Battle objects.
+
+Trial `i` draws every random number from `RandomStream(seed).spawn(i)`, so a
+seeded simulation gives identical stats whatever the chunk size, number of
+workers or completion order.
+
+Usage (from `src/`):
+    python -m services.simulation warrior --level 3 --element fire --boss -n 10000
+"""
+
+import argparse
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+from domain.element import Element
+from domain.fields import trusted
+from domain.hero import Hero
+from domain.monster import Monster
+from domain.rng import RandomStream
+from domain.weapon import Weapon
+from services.battle import Battle
+from services.hero_factory import VALID_ARCHETYPES, HeroFactory
+from services.monster_factory import MonsterFactory
+
+DEFAULT_MAX_TURNS = 500
+DEFAULT_CHUNK_SIZE = 250
+
+
+@dataclass(frozen=True)
+class MonsterSpec:
+    """
+    Describes the monster faced in every trial.
+
+    Attributes:
+        level (int): Level passed to MonsterFactory.
+        element (Element | None): Monster element. None picks a random one per trial.
+        boss (bool): Uses `create_boss` instead of `create_monster`.
+    """
+
+    level: int
+    element: Element | None = None
+    boss: bool = False
+
+    def create(self, rng=random) -> Monster:
+        element = self.element or rng.choice(list(Element))
+        if self.boss:
+            return MonsterFactory.create_boss(self.level, element, rng)
+        return MonsterFactory.create_monster(self.level, element, rng)
+
+
+@dataclass
+class SimulationStats:
+    """
+    Aggregated outcome of a batch of trials. Chunks are merged with `merge`.
+
+    Attributes:
+        trials (int): Number of battles simulated.
+        wins (int): Battles won by the hero.
+        timeouts (int): Battles stopped after `max_turns` without a winner.
+        turns_to_kill_total (int): Sum of turns of the won battles.
+        remaining_hp_total (int): Sum of the hero's life left in the won battles.
+        turns_histogram (Counter): Turns taken -> number of won battles.
+    """
+
+    trials: int = 0
+    wins: int = 0
+    timeouts: int = 0
+    turns_to_kill_total: int = 0
+    remaining_hp_total: int = 0
+    turns_histogram: Counter = field(default_factory=Counter)
+
+    @property
+    def losses(self) -> int:
+        return self.trials - self.wins - self.timeouts
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.trials if self.trials else 0.0
+
+    @property
+    def mean_turns_to_kill(self) -> float:
+        return self.turns_to_kill_total / self.wins if self.wins else 0.0
+
+    @property
+    def mean_remaining_hp(self) -> float:
+        return self.remaining_hp_total / self.wins if self.wins else 0.0
+
+    def record(self, result: str, turns: int, hero_life: int) -> None:
+        self.trials += 1
+        if result == "victory":
+            self.wins += 1
+            self.turns_to_kill_total += turns
+            self.remaining_hp_total += hero_life
+            self.turns_histogram[turns] += 1
+        elif result == "ongoing":
+            self.timeouts += 1
+
+    def merge(self, other: "SimulationStats") -> None:
+        self.trials += other.trials
+        self.wins += other.wins
+        self.timeouts += other.timeouts
+        self.turns_to_kill_total += other.turns_to_kill_total
+        self.remaining_hp_total += other.remaining_hp_total
+        self.turns_histogram.update(other.turns_histogram)
+
+
+def basic_policy(hero: Hero, monster: Monster | None = None) -> str:
+    """
+    Default automated player: always attacks, reloading (Archer) or
+    meditating (Mage) when the equipped weapon can no longer be used.
+
+    Policies receive the hero and the monster it is fighting; this one only
+    looks at the hero.
+    """
+    weapon = hero.equipped_weapon
+
+    if hasattr(hero, "current_ammo"):
+        if weapon is not None and hero.current_ammo < weapon.ammo_required:
+            return "3"
+
+    elif hasattr(hero, "current_mana"):
+        mana_cost = getattr(weapon, "mana_cost", 0)
+        if hero.current_mana < mana_cost and hero.meditate_cooldown == 0:
+            return "4"
+
+    return "1"
+
+
+def create_simulation_hero(archetype: str, overrides: dict | None = None) -> Hero:
+    """
+    Creates a hero through HeroFactory and equips its starting weapon.
+
+    `overrides` replaces attributes after creation (e.g. {"attack": 40}) so
+    balance changes can be tried without editing the *_STATS tables.
+    """
+    hero = HeroFactory.create_hero(archetype, "Simulado")
+
+    for item in hero.inventory.items:
+        if isinstance(item, Weapon):
+            hero.equip_weapon(item)
+            break
+
+    for attribute, value in (overrides or {}).items():
+        setattr(hero, attribute, value)
+        if attribute == "max_life":
+            hero.current_life = value
+
+    return hero
+
+
+def run_trial(
+    hero: Hero,
+    monster: Monster,
+    policy: Callable[[Hero, Monster], str] = basic_policy,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    rng: RandomStream | None = None,
+    environment: Element | None = None,
+) -> tuple[str, int]:
+    """
+    Fights a battle to the end the same way GameManager does.
+    `rng` and the room `environment` are handed to the Battle; None keeps the
+    global `random` module and neutral multipliers.
+
+    Returns:
+        tuple[str, int]: ("victory" | "defeat" | "ongoing", turns played).
+        "ongoing" means the battle hit `max_turns`.
+    """
+    battle = Battle(hero, monster, headless=True, rng=rng, environment=environment)
+    turns = 0
+    result = "ongoing"
+
+    while battle.is_combat_active and battle.turn_count < max_turns:
+        turn_result = battle.execute_turn(policy(hero, monster))
+        result = turn_result["result"]
+
+        # Failed actions do not spend the turn (see GameManager.run_combat_loop).
+        if turn_result["turn_log"].get("action_failed"):
+            continue
+
+        turns += 1
+        hero.end_of_turn_routine()
+
+    return result, turns
+
+
+def _run_chunk(
+    archetype: str,
+    monster_spec: MonsterSpec,
+    trial_range: range,
+    seed: int,
+    policy: Callable[[Hero, Monster], str],
+    max_turns: int,
+    overrides: dict | None,
+) -> SimulationStats:
+    root = RandomStream(seed)
+
+    stats = SimulationStats()
+    for index in trial_range:
+        rng = root.spawn(index)
+        # The overrides come from the user: they are validated on the way in.
+        hero = create_simulation_hero(archetype, overrides)
+        with trusted():
+            monster = monster_spec.create(rng)
+            result, turns = run_trial(hero, monster, policy, max_turns, rng)
+        stats.record(result, turns, hero.current_life)
+    return stats
+
+
+def _chunk_ranges(trials: int, chunk_size: int) -> list[range]:
+    return [
+        range(start, min(start + chunk_size, trials))
+        for start in range(0, trials, chunk_size)
+    ]
+
+
+def simulate(
+    archetype: str,
+    monster_spec: MonsterSpec,
+    trials: int,
+    policy: Callable[[Hero, Monster], str] = basic_policy,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int | None = None,
+    overrides: dict | None = None,
+    seed: int | None = None,
+) -> Iterator[SimulationStats]:
+    """
+    Runs `trials` battles and yields the stats of each chunk as it finishes.
+
+    `policy` must be a module-level function so it can be sent to the
+    worker processes. `max_workers=1` runs everything in this process.
+    `seed` makes the merged result reproducible; None picks a fresh one.
+    """
+    if archetype not in VALID_ARCHETYPES:
+        raise ValueError(
+            f"Invalid archetype: '{archetype}'. "
+            f"Valid options: {', '.join(VALID_ARCHETYPES)}"
+        )
+    if trials <= 0:
+        raise ValueError("trials must be greater than 0")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+
+    chunks = _chunk_ranges(trials, chunk_size)
+    args = (archetype, monster_spec)
+    options = (RandomStream(seed).root_seed, policy, max_turns, overrides)
+
+    if max_workers == 1:
+        for trial_range in chunks:
+            yield _run_chunk(*args, trial_range, *options)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        futures = [
+            pool.submit(_run_chunk, *args, trial_range, *options)
+            for trial_range in chunks
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_simulation(
+    archetype: str, monster_spec: MonsterSpec, trials: int, **kwargs
+) -> SimulationStats:
+    """Runs `simulate` to the end and returns the merged SimulationStats."""
+    total = SimulationStats()
+    for chunk in simulate(archetype, monster_spec, trials, **kwargs):
+        total.merge(chunk)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DungeonPy Monte Carlo simulator")
+    parser.add_argument("archetype", choices=VALID_ARCHETYPES)
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--element", choices=[e.value for e in Element])
+    parser.add_argument("--boss", action="store_true")
+    parser.add_argument("-n", "--trials", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--policy", choices=["basic", "advisor"], default="basic")
+    args = parser.parse_args()
+
+    policy = basic_policy
+    if args.policy == "advisor":
+        # Imported here: the advisor builds on modules that import this one.
+        from services.combat_advisor import advisor_policy
+
+        policy = advisor_policy
+
+    spec = MonsterSpec(
+        level=args.level,
+        element=Element(args.element) if args.element else None,
+        boss=args.boss,
+    )
+
+    total = SimulationStats()
+    for chunk in simulate(
+        args.archetype,
+        spec,
+        args.trials,
+        policy=policy,
+        chunk_size=args.chunk_size,
+        max_workers=args.workers,
+        seed=args.seed,
+    ):
+        total.merge(chunk)
+        print(
+            f"[{total.trials:>7}/{args.trials}] "
+            f"vitórias: {total.win_rate:6.1%}  "
+            f"turnos p/ matar: {total.mean_turns_to_kill:5.1f}  "
+            f"HP restante: {total.mean_remaining_hp:6.1f}"
+        )
+
+    print(f"Derrotas: {total.losses}  Tempo esgotado: {total.timeouts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+import pytest
+
+from domain.element import ELEMENT_MATRIX, Element
+
+# Room modifiers for the tests of elemental rooms: the game ships none.
+ROOM_MODIFIERS = {
+    Element.FIRE: {Element.FIRE: 1.25, Element.ICE: 0.75},
+    Element.ICE: {Element.ICE: 1.25, Element.LIGHTNING: 0.75},
+    Element.LIGHTNING: {Element.LIGHTNING: 1.25, Element.POISON: 0.75},
+    Element.POISON: {Element.POISON: 1.25, Element.FIRE: 0.75},
+}
+
+
+@pytest.fixture
+def room_modifiers(monkeypatch):
+    """`ELEMENT_MATRIX` with `ROOM_MODIFIERS` for the duration of a test."""
+    monkeypatch.setattr(ELEMENT_MATRIX, "_modifiers", ROOM_MODIFIERS)
+    monkeypatch.setattr(ELEMENT_MATRIX, "_environments", {})
+    return ROOM_MODIFIERS
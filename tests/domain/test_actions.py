@@ -0,0 +1,144 @@
+import pytest
+
+from domain.actions import ALL_ENEMIES, ENEMY, SELF, ActionSpec, consumable_spec
+from domain.archer import Archer
+from domain.consumable_item import ConsumableItem
+from domain.element import Element
+from domain.grimoire import Grimoire
+from domain.mage import Mage
+from domain.warrior import Warrior
+
+
+@pytest.fixture
+def warrior():
+    return Warrior(name="Knight", max_life=100, current_life=100, attack=10, speed=5)
+
+
+@pytest.fixture
+def mage():
+    return Mage(
+        name="Gandalf",
+        max_life=100,
+        current_life=100,
+        max_mana=100,
+        current_mana=100,
+        attack=10,
+        speed=10,
+    )
+
+
+def _potion(name="Poção de Cura", recovery_type="life"):
+    return ConsumableItem(
+        name=name,
+        description="Teste",
+        weight=0.5,
+        recovered_value=20,
+        recovery_type=recovery_type,
+    )
+
+
+# SPECS:
+
+
+def test_archetypes_declare_unique_keys():
+    for cls in (Warrior, Archer, Mage):
+        keys = [spec.key for spec in cls.ACTIONS]
+        assert len(keys) == len(set(keys))
+
+
+def test_specs_name_existing_methods():
+    for cls in (Warrior, Archer, Mage):
+        for spec in cls.ACTIONS:
+            assert callable(getattr(cls, spec.method))
+
+
+def test_spec_costs_match_the_methods():
+    archer_specs = {spec.key: spec for spec in Archer.ACTIONS}
+    mage_specs = {spec.key: spec for spec in Mage.ACTIONS}
+
+    assert archer_specs["4"].cost == Archer.ULTIMATE_AMMO_COST
+    assert archer_specs["5"].targeting == ALL_ENEMIES
+    assert mage_specs["3"].resource == "mana"
+    assert mage_specs["3"].cost == Mage.ANCIENT_MAGIC_MANA_COST
+    assert mage_specs["4"].targeting == SELF
+
+
+def test_spec_describe_accepts_text_or_callable(warrior):
+    assert ActionSpec("1", "strike", "Atacar").describe(warrior) == "Atacar"
+    spec = ActionSpec("1", "strike", lambda hero: f"Atacar ({hero.name})")
+    assert spec.describe(warrior) == "Atacar (Knight)"
+
+
+def test_consumable_spec():
+    spec = consumable_spec(2, _potion(recovery_type="mana"))
+
+    assert spec.key == "p2"
+    assert spec.targeting == SELF
+    assert spec.resource == "mana"
+    assert spec.consumes_turn is True
+
+
+# VIEW CACHE:
+
+
+def test_view_is_reused_while_nothing_changes(warrior):
+    view = warrior.action_view()
+
+    assert warrior.action_view() is view
+    assert warrior.get_actions() is warrior.get_actions()
+
+
+def test_view_is_rebuilt_on_inventory_change(warrior):
+    view = warrior.action_view()
+    assert warrior.get_consumable_actions() == {}
+
+    potion = _potion()
+    warrior.inventory.add_item_to_inventory(potion)
+
+    assert warrior.action_view() is not view
+    assert warrior.get_consumable_actions()["p1"]["description"] == potion.name
+
+    warrior.inventory.remove_item_from_inventory(potion)
+    assert warrior.get_consumable_actions() == {}
+
+
+def test_view_is_rebuilt_on_equip(mage):
+    assert "2" not in mage.get_actions()
+
+    grimoire = Grimoire(
+        name="Necronomicon", element=Element.FIRE, magic_power=10, mana_cost=10
+    )
+    mage.inventory.add_item_to_inventory(grimoire)
+    mage.equip_weapon(grimoire)
+
+    actions = mage.get_actions()
+    assert actions["1"]["description"] == "Magia Básica (Necronomicon)"
+    assert actions["2"]["description"] == "Magia Aprimorada (Necronomicon)"
+
+
+def test_live_labels_are_refreshed(mage):
+    before = mage.get_actions()["3"]["description"]
+    mage.current_mana = 40
+
+    after = mage.get_actions()["3"]["description"]
+    assert before != after
+    assert after.endswith("[Mana Atual: 40/100]")
+
+
+def test_view_separates_targeting(warrior):
+    view = warrior.action_view()
+
+    assert set(view.menu) == {"1", "2"}
+    assert set(view.area_menu) == {"3"}
+    assert view.actions["1"].spec.targeting == ENEMY
+    assert view.actions["2"].spec.targeting == SELF
+
+
+def test_consumables_are_bound_to_their_item(warrior):
+    first, second = _potion("Poção A"), _potion("Poção B")
+    warrior.inventory.add_item_to_inventory(first)
+    warrior.inventory.add_item_to_inventory(second)
+
+    actions = warrior.action_view().actions
+    assert actions["p1"].item is first
+    assert actions["p2"].item is second
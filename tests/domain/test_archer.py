@@ -1,7 +1,7 @@
 import pytest
 from domain.element import Element
 from domain.ranged_weapon import RangedWeapon
-from unittest.mock import patch
+from unittest.mock import Mock
 from domain.weapon import Weapon
 from domain.archer import Archer
 from domain.monster import Monster
@@ -61,6 +61,33 @@ def test_ultimate():
     assert monstrin.current_life == 36
 
 
+def test_arrow_rain_hits_every_target():
+    jotinha = Archer(
+        name="Legolas",
+        max_life=200,
+        current_life=100,
+        attack=20,
+        speed=30,
+        max_ammo=10,
+        current_ammo=4,
+    )
+    jotinha.equip_weapon(RangedWeapon(name="Arco", base_damage=10, ammo_required=1))
+    monstros = [
+        Monster(name="Goblin", max_life=100, attack=5, speed=5, element=Element.NEUTRAL)
+        for _ in range(3)
+    ]
+
+    msg = jotinha.arrow_rain(monstros)
+
+    assert "3 inimigo(s)" in msg
+    assert jotinha.current_ammo == 1
+    assert [m.current_life for m in monstros] == [70, 70, 70]
+
+    with pytest.raises(ValueError):
+        jotinha.arrow_rain(monstros)
+    assert jotinha.get_area_actions()["5"]["method"] == jotinha.arrow_rain
+
+
 def test_reload():
     archer_generic = Archer(
         name="gavião_do_grau",
@@ -101,8 +128,8 @@ def test_aim_cancel_dodge():
         dodge=True,
     )
     archer_generic.aim()
-    with patch("domain.archer.random.randint", return_value=1000):
-        archer_generic.damage_received(10, Element.NEUTRAL)
+    archer_generic.rng = Mock(randint=Mock(return_value=1000))
+    archer_generic.damage_received(10, Element.NEUTRAL)
 
     assert archer_generic.current_life == 90
 
@@ -153,9 +180,8 @@ def test_attempted_dodge_success_in_damage_receive():
     archer_generic = Archer(
         name="gavião_do_grau", max_life=200, current_life=100, attack=20, speed=30
     )
-    with patch("domain.archer.random.randint", return_value=15):
-        #
-        archer_generic.damage_received(10, Element.NEUTRAL)
+    archer_generic.rng = Mock(randint=Mock(return_value=15))
+    archer_generic.damage_received(10, Element.NEUTRAL)
 
     assert archer_generic.current_life == 100
     assert archer_generic.dodge is False
@@ -166,8 +192,8 @@ def test_attempted_dodge_fail_in_damage_receive():
         name="gavião_do_grau", max_life=200, current_life=100, attack=20, speed=30
     )
 
-    with patch("domain.archer.random.randint", return_value=50):
-        archer_generic.damage_received(10, Element.NEUTRAL)
+    archer_generic.rng = Mock(randint=Mock(return_value=50))
+    archer_generic.damage_received(10, Element.NEUTRAL)
 
     assert archer_generic.current_life == 90
 
@@ -183,8 +209,8 @@ def test_attempted_dodge_with_aim():
     )
 
     arqueirin.aim()
-    with patch("domain.archer.random.randint", return_value=100):
-        arqueirin.damage_received(10, Element.NEUTRAL)
+    arqueirin.rng = Mock(randint=Mock(return_value=100))
+    arqueirin.damage_received(10, Element.NEUTRAL)
 
     assert arqueirin.is_aiming is True
     assert arqueirin.dodge is False
@@ -381,3 +407,23 @@ def test_archer_can_equip_ranged_weapon():
     archer.equip_weapon(bow)
 
     assert archer.equipped_weapon is bow
+
+
+def test_snapshot_restore_ammo_and_aim():
+    archer = Archer(
+        name="gavião_do_grau",
+        max_life=200,
+        current_life=100,
+        attack=20,
+        speed=30,
+        max_ammo=10,
+        current_ammo=4,
+    )
+    snapshot = archer.snapshot()
+
+    archer.aim()
+    archer.reload()
+    archer.restore(snapshot)
+
+    assert archer.current_ammo == 4
+    assert archer.is_aiming is False
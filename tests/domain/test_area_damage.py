@@ -0,0 +1,55 @@
+import pytest
+from domain.area_damage import apply_area_damage
+from domain.element import ELEMENT_MATRIX, Element
+from domain.monster import Monster
+from domain.warrior import Warrior
+
+
+def _monster(element=Element.NEUTRAL, life=100) -> Monster:
+    return Monster(name="Goblin", max_life=life, attack=5, speed=5, element=element)
+
+
+@pytest.mark.usefixtures("room_modifiers")
+def test_area_damage_uses_the_matrix_of_each_target():
+    plain, in_fire_room = _monster(Element.POISON), _monster(Element.POISON)
+    in_fire_room.element_matrix = ELEMENT_MATRIX.for_environment(Element.FIRE)
+
+    damages = apply_area_damage([plain, in_fire_room], 10, Element.FIRE)
+
+    assert damages == [20, 25]
+
+
+def test_area_damage_matches_damage_received():
+    elements = list(Element)
+    batched = [_monster(element) for element in elements]
+    one_by_one = [_monster(element) for element in elements]
+
+    damages = apply_area_damage(batched, 15, Element.ICE)
+    for monster in one_by_one:
+        monster.damage_received(15, Element.ICE)
+
+    assert [m.current_life for m in batched] == [m.current_life for m in one_by_one]
+    assert damages == [100 - m.current_life for m in batched]
+
+
+def test_area_damage_clamps_life_and_reports_life_lost():
+    weak = _monster(life=10)
+
+    assert apply_area_damage([weak], 50, Element.NEUTRAL) == [10]
+    assert weak.current_life == 0
+    assert not weak.is_it_alive()
+
+
+def test_entities_with_own_defense_use_damage_received():
+    warrior = Warrior(
+        name="Knight",
+        max_life=100,
+        current_life=100,
+        attack=10,
+        speed=10,
+        armor=5,
+        in_test=True,
+    )
+
+    assert apply_area_damage([warrior], 20, Element.NEUTRAL) == [15]
+    assert warrior.current_life == 85
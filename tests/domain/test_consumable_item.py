@@ -165,3 +165,18 @@ def test_use_normal_heal():
     pocao.use(guerreirozin)
 
     assert guerreirozin.current_life == 110
+
+
+def test_spawn_keeps_the_recovery():
+    pocao = ConsumableItem(
+        name="pocao", description="cura", weight=1, recovered_value=10
+    )
+
+    clone = pocao.spawn()
+
+    assert clone is not pocao
+    assert (clone.name, clone.recovered_value, clone.recovery_type) == (
+        pocao.name,
+        10,
+        pocao.recovery_type,
+    )
@@ -1,4 +1,12 @@
-from domain.element import Element
+import pytest
+
+from domain.element import (
+    ELEMENT_MATRIX,
+    ELEMENTS_PACK,
+    Element,
+    ElementMatrix,
+    element_chart,
+)
 
 
 def test_has_advantage_over_returns_true_when_there_is_advantage():
@@ -20,3 +28,100 @@ def test_multiplier_returns_05_when_there_is_disadvantage():
     ice_element = Element.ICE
 
     assert fire_element.multiplier(ice_element) == 0.5
+
+
+# MATRIX:
+
+
+def test_matrix_rows_are_indexed_by_element():
+    assert isinstance(ELEMENT_MATRIX.rows, tuple)
+    assert [element.index for element in Element] == list(range(len(Element)))
+    assert ELEMENT_MATRIX.rows[Element.ICE.index][Element.FIRE.index] == 2.0
+    assert ELEMENT_MATRIX.multiplier(Element.FIRE, Element.ICE) == 0.5
+    assert ELEMENT_MATRIX.multiplier(Element.NEUTRAL, Element.POISON) == 1.0
+
+
+def test_matrix_follows_the_advantage_chart():
+    advantages = {
+        Element(strike): Element(target)
+        for strike, target in element_chart()["advantages"].items()
+    }
+    for strike in Element:
+        for target in Element:
+            expected = 1.0
+            if advantages.get(strike) == target:
+                expected = 2.0
+            elif advantages.get(target) == strike:
+                expected = 0.5
+            assert strike.multiplier(target) == expected
+            assert strike.has_advantage_over(target) is (expected == 2.0)
+
+
+def test_rooms_ship_without_modifiers():
+    for environment in Element:
+        assert ELEMENT_MATRIX.for_environment(environment) is ELEMENT_MATRIX
+
+
+@pytest.mark.usefixtures("room_modifiers")
+def test_environment_modifies_strikes_by_element():
+    fire_room = ELEMENT_MATRIX.for_environment(Element.FIRE)
+
+    assert fire_room.multiplier(Element.FIRE, Element.POISON) == 2.5
+    assert fire_room.multiplier(Element.ICE, Element.FIRE) == 1.5
+    assert fire_room.multiplier(Element.NEUTRAL, Element.FIRE) == 1.0
+    assert ELEMENT_MATRIX.for_environment(Element.FIRE) is fire_room
+    assert ELEMENT_MATRIX.for_environment(Element.NEUTRAL) is ELEMENT_MATRIX
+    assert ELEMENT_MATRIX.for_environment(None) is ELEMENT_MATRIX
+
+
+def test_matrix_from_content_data():
+    config = {
+        "advantages": element_chart()["advantages"],
+        "environments": {"ice": {"ice": 1.5}},
+    }
+
+    matrix = ElementMatrix.from_config(config)
+
+    assert matrix.rows == ELEMENT_MATRIX.rows
+    assert matrix.for_environment(Element.ICE).multiplier(
+        Element.ICE, Element.FIRE
+    ) == pytest.approx(3.0)
+    assert ElementMatrix.from_config({}).rows == ((1.0,) * len(Element),) * len(Element)
+    with pytest.raises(ValueError, match="Invalid element table"):
+        ElementMatrix.from_config({"advantages": {"shadow": "fire"}})
+    with pytest.raises(ValueError):
+        ElementMatrix([[1.0]])
+
+
+@pytest.mark.usefixtures("room_modifiers")
+def test_matrix_as_numpy_array():
+    np = pytest.importorskip("numpy")
+
+    array = ELEMENT_MATRIX.as_array()
+    stacked = ELEMENT_MATRIX.environment_array()
+
+    assert array.tolist() == [list(row) for row in ELEMENT_MATRIX.rows]
+    assert not array.flags.writeable
+    assert stacked.shape == (len(Element),) * 3
+    assert np.array_equal(stacked[Element.NEUTRAL.index], array)
+    assert stacked[Element.FIRE.index, Element.FIRE.index, Element.POISON.index] == 2.5
+
+
+def test_element_chart_is_read_from_its_pack(tmp_path):
+    pack = tmp_path / ELEMENTS_PACK.name
+    pack.write_text('{"advantages": {"fire": "ice"}, "strong": 3.0}')
+
+    matrix = ElementMatrix.from_config(element_chart(pack))
+
+    assert matrix.multiplier(Element.FIRE, Element.ICE) == 3.0
+    assert matrix.multiplier(Element.ICE, Element.FIRE) == 0.5
+    assert matrix.multiplier(Element.POISON, Element.LIGHTNING) == 1.0
+
+
+def test_invalid_element_chart_is_rejected(tmp_path):
+    pack = tmp_path / ELEMENTS_PACK.name
+    pack.write_text('{"advantages": ')
+    with pytest.raises(ValueError):
+        element_chart(pack)
+    with pytest.raises(ValueError):
+        ElementMatrix.from_config({"advantages": ["fire"]})
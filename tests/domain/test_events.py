@@ -0,0 +1,200 @@
+from unittest.mock import patch
+
+import pytest
+
+from domain.archer import Archer
+from domain.element import Element
+from domain.events import (
+    AmmoChanged,
+    Blocked,
+    DamageApplied,
+    Dodged,
+    EventBus,
+    Healed,
+    ManaChanged,
+    StanceEntered,
+    StatusApplied,
+)
+from domain.mage import Mage
+from domain.monster import Monster
+from domain.state import BurnState
+from domain.warrior import Warrior
+
+
+def _monster(life=100):
+    return Monster(
+        name="Goblin", max_life=life, attack=10, speed=5, element=Element.NEUTRAL
+    )
+
+
+def _listen(entity, *event_types) -> list:
+    """Gives `entity` a bus and returns the list its events are recorded in."""
+    received = []
+    bus = EventBus()
+    for event_type in event_types:
+        bus.subscribe(event_type, received.append)
+    entity.event_bus = bus
+    return received
+
+
+# BUS:
+
+
+def test_publish_reaches_only_subscribed_type():
+    bus = EventBus()
+    damages, heals = [], []
+    bus.subscribe(DamageApplied, damages.append)
+    bus.subscribe(Healed, heals.append)
+    monster = _monster()
+
+    bus.publish(DamageApplied(monster, 5, Element.FIRE))
+
+    assert damages == [DamageApplied(monster, 5, Element.FIRE)]
+    assert heals == []
+
+
+def test_emit_builds_nothing_without_subscribers():
+    bus = EventBus()
+
+    with patch("domain.events.Dodged") as event_type:
+        bus.emit(event_type, object())
+
+    event_type.assert_not_called()
+
+
+def test_handlers_run_in_subscription_order():
+    bus = EventBus()
+    calls = []
+    bus.subscribe(Dodged, lambda event: calls.append("first"))
+    bus.subscribe(Dodged, lambda event: calls.append("second"))
+
+    bus.emit(Dodged, _monster())
+
+    assert calls == ["first", "second"]
+
+
+def test_unsubscribe():
+    bus = EventBus()
+    received = []
+    bus.subscribe(Dodged, received.append)
+    bus.unsubscribe(Dodged, received.append)
+
+    bus.emit(Dodged, _monster())
+
+    assert received == []
+    assert not bus.has_subscribers(Dodged)
+    with pytest.raises(ValueError):
+        bus.unsubscribe(Dodged, received.append)
+
+
+def test_handler_may_unsubscribe_while_dispatching():
+    bus = EventBus()
+    calls = []
+
+    def once(event):
+        calls.append("once")
+        bus.unsubscribe(Dodged, once)
+
+    bus.subscribe(Dodged, once)
+    bus.subscribe(Dodged, lambda event: calls.append("always"))
+
+    bus.emit(Dodged, _monster())
+    bus.emit(Dodged, _monster())
+
+    assert calls == ["once", "always", "always"]
+
+
+# PUBLISHERS:
+
+
+def test_entity_without_bus_publishes_nothing():
+    monster = _monster()
+
+    monster.damage_received(10, Element.NEUTRAL)
+
+    assert monster.event_bus is None
+    assert monster.current_life == 90
+
+
+def test_damage_applied_is_clamped_to_remaining_life():
+    monster = _monster(life=5)
+    received = _listen(monster, DamageApplied)
+
+    monster.damage_received(30, Element.FIRE)
+
+    assert received == [DamageApplied(monster, 5, Element.FIRE)]
+
+
+def test_healed_reports_life_actually_recovered():
+    monster = _monster()
+    monster.current_life = 95
+    received = _listen(monster, Healed)
+
+    monster.heal_life(20)
+
+    assert received == [Healed(monster, 5)]
+
+
+def test_status_applied():
+    monster = _monster()
+    received = _listen(monster, StatusApplied)
+    burn = BurnState(duration_turns=2, attack_decrease=5)
+
+    monster.add_status(burn)
+
+    assert received == [StatusApplied(monster, burn)]
+
+
+def test_warrior_block_and_rage():
+    warrior = Warrior(
+        name="Knight", max_life=100, current_life=100, attack=10, speed=5, in_test=True
+    )
+    received = _listen(warrior, Blocked, DamageApplied, StanceEntered)
+    warrior.defend = True
+
+    warrior.damage_received(50, Element.NEUTRAL)
+    warrior.to_rage()
+
+    assert received == [Blocked(warrior), StanceEntered(warrior, "enraged")]
+    assert warrior.current_life == 100
+
+
+def test_archer_dodge_aim_and_ammo():
+    archer = Archer(
+        name="Legolas",
+        max_life=100,
+        current_life=100,
+        attack=10,
+        speed=100,
+        current_ammo=2,
+    )
+    received = _listen(archer, Dodged, AmmoChanged, StanceEntered)
+
+    archer.damage_received(50, Element.NEUTRAL)
+    archer.reload()
+    archer.reload()  # already full: nothing changed
+    archer.aim()
+
+    assert received == [
+        Dodged(archer),
+        AmmoChanged(archer, 2, 10),
+        StanceEntered(archer, "aiming"),
+    ]
+
+
+def test_mage_mana_changes():
+    mage = Mage(
+        name="Merlin",
+        max_life=100,
+        current_life=100,
+        max_mana=100,
+        current_mana=100,
+        attack=10,
+        speed=5,
+    )
+    received = _listen(mage, ManaChanged)
+
+    mage.ancient_magic(_monster())
+    mage.current_mana = 50  # unchanged
+
+    assert received == [ManaChanged(mage, 100, 50)]
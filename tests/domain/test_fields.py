@@ -0,0 +1,134 @@
+import threading
+
+import pytest
+
+from domain.archer import Archer
+from domain.consumable_item import ConsumableItem
+from domain.element import Element
+from domain.events import AmmoChanged, EventBus
+from domain.fields import field, is_trusted, trusted
+from domain.monster import Monster
+from domain.weapon import Weapon
+
+
+def _monster(**overrides):
+    stats = dict(name="goblin", max_life=100, attack=10, speed=5)
+    stats.update(overrides)
+    return Monster(element=Element.NEUTRAL, **stats)
+
+
+def test_fields_are_plain_properties():
+    assert type(Monster.current_life) is property
+
+    monster = _monster()
+    monster.current_life = 40
+    assert monster._Entity__current_life == 40
+
+
+def test_field_accessors_read_and_write_the_storage_by_name():
+    getter, setter = Monster.current_life.fget, Monster.current_life.fset
+
+    assert "_Entity__current_life" in getter.__code__.co_names
+    assert "_Entity__current_life" in setter.__code__.co_names
+    assert "_Entity__max_life" in setter.__code__.co_names
+    assert getter.__code__.co_filename.endswith("fields.py")
+
+
+def test_field_clamps_between_minimum_and_maximum_of():
+    class Gauge:
+        level = field(
+            "_level", int, "level must be an int", minimum=0, maximum_of="cap"
+        )
+
+        def __init__(self):
+            self.cap = 10
+
+    gauge = Gauge()
+    gauge.level = 50
+    assert gauge.level == 10
+    gauge.level = -5
+    assert gauge.level == 0
+    with pytest.raises(TypeError, match="level must be an int"):
+        gauge.level = "3"
+
+
+def test_field_rejects_invalid_attribute_names():
+    with pytest.raises(ValueError):
+        field("x; import os", int, "")
+
+
+def test_validated_mode_is_the_default():
+    assert is_trusted() is False
+
+    with pytest.raises(TypeError):
+        _monster(max_life="100")
+    with pytest.raises(ValueError):
+        Weapon(name="Espada", base_damage=0)
+
+
+def test_trusted_mode_skips_checks():
+    with trusted():
+        weapon = Weapon(name="Espada", base_damage=0)
+        assert is_trusted() is True
+
+    assert weapon.base_damage == 0
+    assert is_trusted() is False
+
+
+def test_trusted_mode_still_normalizes():
+    with trusted():
+        monster = _monster(name="  orc  ")
+        monster.current_life = 500
+        monster.attack = -3
+        potion = ConsumableItem("poção", "Cura", 1, 20)
+
+    assert monster.name == "Orc"
+    assert monster.current_life == 100
+    assert monster.attack == 0
+    assert potion.weight == 1.0
+    assert isinstance(potion.weight, float)
+
+
+def test_trusted_mode_keeps_side_effects():
+    archer = Archer(name="Legolas", max_life=100, current_life=100, attack=10, speed=5)
+    received = []
+    archer.event_bus = EventBus()
+    archer.event_bus.subscribe(AmmoChanged, received.append)
+
+    with trusted():
+        archer.current_ammo = 4
+
+    assert received == [AmmoChanged(archer, 0, 4)]
+
+
+def test_trusted_blocks_nest_and_restore_on_error():
+    with pytest.raises(RuntimeError):
+        with trusted():
+            with trusted():
+                pass
+            assert is_trusted() is True
+            raise RuntimeError
+
+    assert is_trusted() is False
+
+
+def test_mode_is_per_thread():
+    seen = []
+
+    with trusted():
+        thread = threading.Thread(target=lambda: seen.append(is_trusted()))
+        thread.start()
+        thread.join()
+
+    assert seen == [False]
+
+
+def test_validation_messages_are_kept():
+    monster = _monster()
+
+    with pytest.raises(TypeError, match="Current life needs to be a whole number"):
+        monster.current_life = 1.5
+    with pytest.raises(ValueError, match="Name cannot be empty"):
+        monster.name = "   "
+    with pytest.raises(ValueError, match="recovery_type must be one of"):
+        ConsumableItem("Poção", "Cura", 1, 20, recovery_type=5)
@@ -41,6 +41,7 @@ def test_grimoire_attacks_structure():
     assert callable(attacks["1"]["method"])
     assert "MP: 10" in attacks["2"]["description"]
     assert callable(attacks["2"]["method"])
+    assert book.get_attacks() is attacks
 
 
 # VALIDATION TESTS:
@@ -183,3 +184,17 @@ def test_use_equip_on_non_mage_failure():
     message = book.use(warrior)
 
     assert "não entendeu nada" in message
+
+
+def test_spawn_keeps_the_cost_and_a_menu_of_its_own():
+    book = Grimoire("Book", Element.ICE, 10, 5)
+
+    clone = book.spawn()
+
+    assert clone is not book
+    assert clone.mana_cost == 5
+    assert (
+        clone.get_attacks()["2"]["description"]
+        == (book.get_attacks()["2"]["description"])
+    )
+    assert clone.get_attacks()["2"]["method"] == clone.heavy_attack
@@ -5,6 +5,7 @@ from domain.mage import Mage
 from domain.element import Element
 from domain.grimoire import Grimoire
 from domain.entity import Entity
+from domain.monster import Monster
 
 # FIXTURES & MOCKS:
 
@@ -86,6 +87,7 @@ def test_strike_with_grimoire_equipped(mage_default, mock_target):
     Using a Grimoire mock to isolate Mage tests.
     """
     mock_grimoire = MagicMock(spec=Grimoire)
+    mock_grimoire.allowed_class = ["Mage"]
     mage_default.equip_grimoire(mock_grimoire)
     mage_default.strike(mock_target)
 
@@ -127,6 +129,26 @@ def test_ancient_magic_insufficient_mana(mage_default, mock_target):
     mock_target.damage_received.assert_not_called()  # TARGET RECEIVES NO DAMAGE
 
 
+def test_arcane_storm(mage_default):
+    """Spends 40 Mana Points and deals (attack * 2) to every target."""
+
+    targets = [
+        Monster(name="Goblin", max_life=50, attack=5, speed=5, element=Element.NEUTRAL)
+        for _ in range(4)
+    ]
+
+    msg = mage_default.arcane_storm(targets)
+
+    assert "TEMPESTADE ARCANA" in msg
+    assert mage_default.current_mana == 60
+    assert all(t.current_life == 30 for t in targets)
+
+    mage_default.current_mana = 39
+    with pytest.raises(ValueError):
+        mage_default.arcane_storm(targets)
+    assert all(t.current_life == 30 for t in targets)
+
+
 # UPGRADE TESTS:
 
 
@@ -168,6 +190,7 @@ def test_get_actions_with_weapon(mage_default):
     # Using a named mock grimoire
     mock_grimoire = MagicMock(spec=Grimoire)
     mock_grimoire.name = "Tome Of Fire"
+    mock_grimoire.allowed_class = ["Mage"]
 
     # Equips the grimoire
     mage_default.inventory = MagicMock()
@@ -184,3 +207,14 @@ def test_get_actions_with_weapon(mage_default):
     assert "Magia Aprimorada (Tome Of Fire)" in actions["2"]["description"]
     assert "Magia Ancestral" in actions["3"]["description"]
     assert "Meditar" in actions["4"]["description"]
+
+
+def test_snapshot_restore_mana_and_cooldown(mage_default):
+    mage_default.current_mana = 10
+    snapshot = mage_default.snapshot()
+
+    mage_default.meditate()
+    mage_default.restore(snapshot)
+
+    assert mage_default.current_mana == 10
+    assert mage_default.meditate_cooldown == 0
@@ -0,0 +1,189 @@
+import pytest
+
+from domain.archer import Archer
+from domain.element import Element
+from domain.modifiers import Modifier, ModifierStack
+from domain.monster import Monster
+from domain.ranged_weapon import RangedWeapon
+from domain.state import NEUTRAL, BurnState, FrozenState
+from domain.warrior import Warrior
+
+
+def _monster(attack=10, speed=5):
+    return Monster(
+        name="goblin", max_life=100, attack=attack, speed=speed, element=Element.FIRE
+    )
+
+
+def _warrior():
+    return Warrior(
+        name="Knight",
+        max_life=100,
+        current_life=100,
+        attack=10,
+        speed=5,
+        shield=20,
+        armor=3,
+    )
+
+
+def test_stack_applies_modifiers_in_order():
+    stack = ModifierStack()
+    stack.push(Modifier("attack", "burn", add=-3))
+    stack.push(Modifier("attack", "rage", ratio=1.0))
+
+    assert stack.effective("attack", 10) == 14
+
+
+def test_stack_recomputes_only_when_dirty():
+    stack = ModifierStack([Modifier("attack", "rage", ratio=1.0)])
+
+    assert stack.effective("attack", 10) == 20
+    assert stack._cache["attack"] == (10, 20)
+
+    stack.push(Modifier("speed", "ice", add=-1))
+    assert "attack" in stack._cache
+
+    stack.remove("rage")
+    assert "attack" not in stack._cache
+    assert stack.effective("attack", 10) == 10
+
+
+def test_stack_follows_a_new_base():
+    stack = ModifierStack([Modifier("attack", "rage", ratio=1.0)])
+
+    assert stack.effective("attack", 10) == 20
+    assert stack.effective("attack", 12) == 24
+
+
+def test_effective_value_never_goes_below_zero():
+    stack = ModifierStack([Modifier("attack", "burn", add=-5)])
+
+    assert stack.effective("attack", 3) == 0
+
+
+def test_entity_without_modifiers_has_no_stack():
+    monster = _monster()
+
+    assert monster.modifiers == ()
+    assert monster._modifiers is None
+
+    monster.add_modifier(Modifier("attack", "rage", ratio=1.0))
+    monster.remove_modifiers("rage")
+
+    assert monster._modifiers is None
+
+
+def test_unknown_stat_is_rejected():
+    with pytest.raises(ValueError):
+        _monster().add_modifier(Modifier("shield", "rage", ratio=-1.0))
+
+
+def test_setting_a_stat_changes_the_base():
+    monster = _monster()
+    monster.add_modifier(Modifier("attack", "rage", ratio=1.0))
+
+    monster.attack = 12
+
+    assert monster.base_stat("attack") == 12
+    assert monster.attack == 24
+
+
+def test_burn_below_zero_does_not_corrupt_the_base():
+    monster = _monster(attack=3)
+    monster.add_status(BurnState(duration_turns=2, attack_decrease=5))
+
+    monster.tick_statuses()
+    assert monster.attack == 0
+
+    monster.tick_statuses()
+    assert monster.attack == 3
+    assert monster.modifiers == ()
+
+
+def test_clearing_a_status_removes_its_modifier():
+    monster = _monster()
+    monster.add_status(FrozenState(duration_turns=5, speed_decrease=2))
+    monster.tick_statuses()
+    assert monster.speed == 3
+
+    monster.current_status = NEUTRAL
+
+    assert monster.speed == 5
+    assert monster.modifiers == ()
+
+
+def test_replacing_a_status_removes_the_old_modifier():
+    monster = _monster()
+    monster.add_status(BurnState(duration_turns=5, attack_decrease=2))
+    monster.tick_statuses()
+
+    monster.add_status(BurnState(duration_turns=5, attack_decrease=4))
+    monster.tick_statuses()
+
+    assert monster.attack == 6
+
+
+def test_rage_and_burn_end_in_any_order():
+    warrior = _warrior()
+    burn = BurnState(duration_turns=5, attack_decrease=4)
+    warrior.add_status(burn)
+    warrior.tick_statuses()
+
+    warrior.to_rage()
+    assert (warrior.attack, warrior.shield, warrior.armor) == (12, 0, 0)
+
+    warrior.current_status = NEUTRAL
+    assert warrior.attack == 20
+
+    warrior.reset_rage()
+    assert (warrior.attack, warrior.shield, warrior.armor) == (10, 20, 3)
+
+
+def test_upgrade_during_rage_keeps_the_bonus_out_of_the_base():
+    warrior = _warrior()
+    warrior.to_rage()
+
+    warrior.upgrade(4)
+    warrior.reset_rage()
+
+    assert warrior.attack == 12
+    assert warrior.shield == 22
+    assert warrior.armor == 5
+
+
+def test_aim_is_removed_after_the_strike():
+    archer = Archer(
+        name="Legolas",
+        max_life=100,
+        current_life=100,
+        attack=10,
+        speed=5,
+        current_ammo=5,
+    )
+    archer.equip_weapon(RangedWeapon(name="Arco", base_damage=10, ammo_required=1))
+    target = Monster(
+        name="ogre", max_life=1000, attack=1, speed=1, element=Element.NEUTRAL
+    )
+
+    archer.aim()
+    archer.strike(target)
+
+    assert target.current_life == 1000 - (10 + 14)
+    assert archer.attack == 10
+    assert archer.modifiers == ()
+
+
+def test_snapshot_restores_the_modifiers():
+    warrior = _warrior()
+    snapshot = warrior.snapshot()
+
+    warrior.to_rage()
+    warrior.restore(snapshot)
+    assert (warrior.attack, warrior.shield) == (10, 20)
+
+    warrior.to_rage()
+    snapshot = warrior.snapshot()
+    warrior.reset_rage()
+    warrior.restore(snapshot)
+    assert (warrior.attack, warrior.shield) == (20, 0)
@@ -89,7 +89,7 @@ def test_attack_hits_based_on_probability():
 
     target = MagicMock()
 
-    with patch("domain.ranged_weapon.random.randint", return_value=35):
+    with patch("random.randint", return_value=35):
         weapon.attack(user, target)
 
     assert user.current_ammo == 8
@@ -106,7 +106,7 @@ def test_attack_misses_based_on_probability():
 
     target = MagicMock()
 
-    with patch("domain.ranged_weapon.random.randint", return_value=80):
+    with patch("random.randint", return_value=80):
         weapon.attack(user, target)
 
     assert user.current_ammo == 8
@@ -165,3 +165,16 @@ def test_ranged_weapon_has_allowed_class_archer():
     weapon = RangedWeapon(name="Arco", base_damage=10, ammo_required=1)
     assert hasattr(weapon, "allowed_class")
     assert weapon.allowed_class == ["Archer"]
+
+
+def test_spawn_keeps_ammo_and_hit_probability():
+    weapon = RangedWeapon("Bow", 15, ammo_required=2, hit_probability=85)
+
+    clone = weapon.spawn()
+
+    assert clone is not weapon
+    assert (clone.base_damage, clone.ammo_required, clone.hit_probability) == (
+        15,
+        2,
+        85,
+    )
@@ -0,0 +1,102 @@
+import pickle
+import random
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+from domain.rng import RandomStream, roll_d100
+
+
+def test_same_seed_gives_same_sequence():
+    first = RandomStream(42)
+    second = RandomStream(42)
+
+    assert [first.randint(1, 100) for _ in range(20)] == [
+        second.randint(1, 100) for _ in range(20)
+    ]
+
+
+def test_spawn_ignores_parent_state():
+    root = RandomStream(7)
+    child = root.spawn(3)
+    root.random()
+
+    assert root.spawn(3).random() == child.random()
+
+
+def test_spawned_streams_are_independent():
+    root = RandomStream(7)
+
+    assert root.spawn(0).random() != root.spawn(1).random()
+    assert root.spawn(("battle", 1)).root_seed != root.spawn(("room", 1)).root_seed
+
+
+def test_stream_survives_pickling():
+    stream = RandomStream(5)
+    stream.random()
+
+    copy = pickle.loads(pickle.dumps(stream))
+
+    assert copy.root_seed == 5
+    assert copy.random() == stream.random()
+
+
+def test_seed_must_be_integer():
+    with pytest.raises(TypeError):
+        RandomStream("abc")
+
+
+def test_d100_rolls_every_face_evenly():
+    stream = RandomStream(11)
+
+    counts = Counter(stream.d100() for _ in range(100_000))
+
+    assert set(counts) == set(range(1, 101))
+    assert max(counts.values()) < 1_150
+    assert min(counts.values()) > 850
+
+
+def test_tiny_blocks_still_roll():
+    stream = RandomStream(11, block_size=1)
+
+    rolls = [stream.d100() for _ in range(1_000)]
+
+    assert all(1 <= roll <= 100 for roll in rolls)
+
+
+def test_buffered_rolls_replay_with_the_seed():
+    def fight(stream):
+        return [
+            (stream.d100(), stream.random(), stream.randint(1, 6)) for _ in range(600)
+        ]
+
+    assert fight(RandomStream(3)) == fight(RandomStream(3))
+    assert fight(RandomStream(3)) != fight(RandomStream(4))
+
+
+def test_pickled_stream_keeps_pending_rolls():
+    stream = RandomStream(5)
+    stream.d100()
+
+    copy = pickle.loads(pickle.dumps(stream))
+
+    assert [copy.d100() for _ in range(300)] == [stream.d100() for _ in range(300)]
+
+
+def test_reseeding_drops_pending_rolls():
+    stream = RandomStream(5)
+    stream.d100()
+
+    stream.seed(5)
+
+    assert stream.d100() == RandomStream(5).d100()
+
+
+def test_roll_falls_back_to_the_random_module():
+    with patch("random.randint", return_value=42):
+        assert roll_d100(random) == 42
+
+
+def test_block_size_must_be_positive():
+    with pytest.raises(ValueError):
+        RandomStream(1, block_size=0)
@@ -174,3 +174,43 @@ def test_integration_hero_cannot_loot_heavy_items(hero, heavy_item):
     assert success is False
     assert len(hero.inventory.items) == 0
     assert len(room.items) == 0
+
+
+def test_room_delta_lists_defeated_monsters_and_taken_items(item):
+    monsters = [Monster(name, 50, 5, 5, Element.FIRE) for name in ("A", "B", "C")]
+    room = Room("Sala.", Element.FIRE, monsters=monsters, items=[item])
+    assert room.delta() == ((), ())
+
+    room.remove_defeated_monster()
+    room.remove_monster(monsters[2])
+    room.take_item(item.name)
+    room.add_monster(Monster("D", 50, 5, 5, Element.FIRE))
+
+    assert room.delta() == ((0, 2), (0,))
+
+
+def test_room_apply_delta_replays_the_changes(item, heavy_item):
+    monsters = [Monster(name, 50, 5, 5, Element.FIRE) for name in ("A", "B", "C")]
+    room = Room("Sala.", Element.FIRE, monsters=monsters, items=[item, heavy_item])
+
+    room.apply_delta((1,), (0,))
+    room.apply_delta((1,), ())
+
+    assert room.monsters == [monsters[0], monsters[2]]
+    assert room.items == [heavy_item]
+    assert room.delta() == ((1,), (0,))
+    with pytest.raises(ValueError):
+        room.apply_delta((3,), ())
+
+
+def test_room_delta_tells_apart_copies_of_the_same_catalog_item(item):
+    # Both potions are the very same object.
+    room = Room("Sala.", Element.FIRE, items=[item, item])
+
+    assert room.take_item(item.name) is item
+    assert room.delta() == ((), (0,))
+
+    rebuilt = Room("Sala.", Element.FIRE, items=[item, item])
+    rebuilt.apply_delta(*room.delta())
+    assert rebuilt.items == [item]
+    assert rebuilt.delta() == room.delta()
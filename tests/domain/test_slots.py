@@ -0,0 +1,89 @@
+import copy
+import pickle
+
+import pytest
+
+from domain.archer import Archer
+from domain.consumable_item import ConsumableItem
+from domain.element import Element
+from domain.grimoire import Grimoire
+from domain.inventory import Inventory
+from domain.mage import Mage
+from domain.monster import Monster
+from domain.ranged_weapon import RangedWeapon
+from domain.room import Room
+from domain.state import NEUTRAL, BurnState, FrozenState, PoisonedState, StunnedState
+from domain.status_effects import StatusEffects
+from domain.warrior import Warrior
+from domain.weapon import Weapon
+
+
+def _monster():
+    return Monster(
+        name="goblin", max_life=100, attack=10, speed=5, element=Element.FIRE
+    )
+
+
+def _domain_objects():
+    return [
+        _monster(),
+        Warrior(name="Knight", max_life=100, current_life=100, attack=10, speed=5),
+        Archer(name="Legolas", max_life=100, current_life=100, attack=10, speed=5),
+        Mage(
+            name="Merlin",
+            max_life=100,
+            current_life=100,
+            max_mana=100,
+            current_mana=100,
+            attack=10,
+            speed=5,
+        ),
+        Weapon(name="Espada", base_damage=10),
+        RangedWeapon(name="Arco", base_damage=10, ammo_required=1),
+        Grimoire(name="Tomo", element=Element.FIRE, magic_power=10, mana_cost=5),
+        ConsumableItem("Poção", "Cura", 1, 20),
+        Room("Uma sala úmida.", Element.NEUTRAL),
+        Inventory(),
+        StatusEffects(),
+        NEUTRAL,
+        PoisonedState(duration_turns=2, damage_per_turns=5),
+        BurnState(duration_turns=2, attack_decrease=5),
+        StunnedState(),
+        FrozenState(duration_turns=2, speed_decrease=5),
+    ]
+
+
+@pytest.mark.parametrize("obj", _domain_objects(), ids=lambda obj: type(obj).__name__)
+def test_domain_objects_have_no_instance_dict(obj):
+    assert not hasattr(obj, "__dict__")
+
+    with pytest.raises(AttributeError):
+        obj.not_an_attribute = 1
+
+
+def test_public_api_is_kept():
+    weapon = Weapon(name="Espada", base_damage=10)
+    warrior = Warrior(name="Knight", max_life=100, current_life=100, attack=10, speed=5)
+
+    assert weapon.allowed_class == ["Warrior"]
+    assert weapon.get_attacks()["1"]["method"] == weapon.attack
+    assert warrior.attributes_to_upgrade == ["shield", "armor"]
+    assert warrior.is_active is True
+    assert warrior.event_bus is None
+
+
+def test_slotted_entities_copy_and_pickle():
+    monster = _monster()
+    monster.damage_received(30, Element.NEUTRAL)
+    monster.add_status(BurnState(duration_turns=2, attack_decrease=5))
+
+    for clone in (copy.deepcopy(monster), pickle.loads(pickle.dumps(monster))):
+        assert clone.current_life == monster.current_life
+        assert clone.current_status.name == "Burned"
+        assert clone.name == "Goblin"
+
+
+def test_repeated_names_share_one_string():
+    first, second = _monster(), _monster()
+
+    assert first.name is second.name
@@ -6,6 +6,7 @@ from domain.state import (
     StunnedState,
 )
 from domain.element import Element
+from domain.modifiers import ModifierStack
 
 
 class FakeEntity:
@@ -14,13 +15,14 @@ class FakeEntity:
     def __init__(self):
         self._attack = 10
         self._speed = 10
+        self.modifiers = ModifierStack()
         self.current_status = None
         self.received_damage = []
 
     # Liberando o acesso total ao Ataque para o teste funcionar
     @property
     def attack(self):
-        return self._attack
+        return self.modifiers.effective("attack", self._attack)
 
     @attack.setter
     def attack(self, value):
@@ -29,12 +31,18 @@ class FakeEntity:
     # Liberando o acesso total à Velocidade para o teste funcionar
     @property
     def speed(self):
-        return self._speed
+        return self.modifiers.effective("speed", self._speed)
 
     @speed.setter
     def speed(self, value):
         self._speed = value
 
+    def add_modifier(self, modifier):
+        self.modifiers.push(modifier)
+
+    def remove_modifiers(self, source):
+        self.modifiers.remove(source)
+
     def damage_received(self, value, strike_element):
         self.received_damage.append((value, strike_element))
         pass
@@ -148,3 +156,15 @@ def test_stunned_state_reduces_duration():
     state.apply_effect(entity)
 
     assert state.duration_turns == 1
+
+
+def test_snapshot_restore_burn_state():
+    entity = FakeEntity()
+    burn = BurnState(duration_turns=2, attack_decrease=5)
+    snapshot = burn.snapshot()
+
+    burn.apply_effect(entity)
+    burn.restore(snapshot)
+
+    assert burn.duration_turns == 2
+    assert burn._applied is False
@@ -0,0 +1,126 @@
+from domain.element import Element
+from domain.monster import Monster
+from domain.state import (
+    NEUTRAL,
+    BurnState,
+    NeutralState,
+    PoisonedState,
+    StunnedState,
+)
+from domain.status_effects import StatusEffects, TimerWheel
+
+
+def _monster() -> Monster:
+    return Monster(
+        name="Goblin", max_life=100, attack=20, speed=5, element=Element.NEUTRAL
+    )
+
+
+def test_timer_wheel_pops_only_items_due_on_the_turn():
+    wheel = TimerWheel(slots=4)
+    wheel.schedule(2, "a")
+    wheel.schedule(6, "b")  # same bucket, one revolution later
+    wheel.schedule(3, "c")
+
+    assert wheel.pop_due(1) == []
+    assert wheel.pop_due(2) == ["a"]
+    assert wheel.pop_due(2) == []
+    assert wheel.pop_due(6) == ["b"]
+    assert wheel.pop_due(3) == ["c"]
+
+
+def test_neutral_state_is_a_shared_singleton():
+    assert NeutralState() is NeutralState() is NEUTRAL
+    assert _monster().current_status is NEUTRAL
+
+
+def test_entity_without_effects_keeps_no_manager():
+    monster = _monster()
+    monster.tick_statuses()
+
+    assert monster.statuses == ()
+    assert monster.preventing_status() is None
+
+
+def test_effects_stack_and_expire_independently():
+    monster = _monster()
+    monster.add_status(BurnState(duration_turns=1, attack_decrease=5))
+    monster.add_status(PoisonedState(duration_turns=2, damage_per_turns=5))
+
+    monster.tick_statuses()
+    assert monster.attack == 20  # burn applied and reverted on its last turn
+    assert monster.current_life == 95
+    assert monster.has_status("Burned")
+
+    monster.tick_statuses()
+    assert [s.name for s in monster.statuses] == ["Poison"]
+    assert monster.current_life == 90
+
+    monster.tick_statuses()
+    assert monster.statuses == ()
+    assert monster.current_status is NEUTRAL
+
+
+def test_stun_lasts_as_a_single_status_did():
+    monster = _monster()
+    monster.set_status(StunnedState(duration_turns=1))
+
+    monster.tick_statuses()
+    assert monster.preventing_status().name == "Stunned"
+
+    monster.tick_statuses()
+    assert monster.preventing_status() is None
+
+
+def test_same_effect_replaces_the_old_one():
+    monster = _monster()
+    first = PoisonedState(duration_turns=1, damage_per_turns=5)
+    second = PoisonedState(duration_turns=3, damage_per_turns=5)
+    monster.add_status(first)
+    monster.add_status(second)
+
+    for _ in range(3):
+        monster.tick_statuses()
+
+    assert monster.statuses == (second,)
+    assert monster.current_life == 85
+
+
+def test_extended_duration_is_rescheduled():
+    monster = _monster()
+    poison = PoisonedState(duration_turns=1, damage_per_turns=5)
+    monster.add_status(poison)
+
+    monster.tick_statuses()
+    poison.duration_turns = 1
+    monster.tick_statuses()
+    monster.tick_statuses()
+
+    assert monster.current_life == 90
+    assert monster.statuses == ()
+
+
+def test_set_status_replaces_every_effect():
+    monster = _monster()
+    monster.add_status(BurnState(duration_turns=2, attack_decrease=5))
+    monster.add_status(PoisonedState(duration_turns=2, damage_per_turns=5))
+
+    monster.set_status(None)
+
+    assert monster.statuses == ()
+
+
+def test_snapshot_restore_keeps_schedule():
+    effects = StatusEffects()
+    monster = _monster()
+    effects.add(PoisonedState(duration_turns=2, damage_per_turns=5))
+    snapshot = effects.snapshot()
+
+    effects.tick(monster)
+    effects.tick(monster)
+    effects.tick(monster)
+    assert effects.active == []
+
+    effects.restore(snapshot)
+    effects.tick(monster)
+    assert effects.active[0].duration_turns == 1
@@ -49,6 +49,33 @@ def test_strike() -> None:
     assert sample_monster.current_life == 74
 
 
+def test_whirlwind_hits_every_target() -> None:
+    sample_warrior: Warrior = Warrior(
+        name="Errant Knight",
+        max_life=200,
+        current_life=100,
+        attack=25,
+        speed=25,
+    )
+    monsters = [
+        Monster(name="Goblin", max_life=100, attack=5, speed=5, element=Element.POISON),
+        Monster(name="Yeti", max_life=100, attack=5, speed=5, element=Element.ICE),
+    ]
+
+    with pytest.raises(ValueError):
+        sample_warrior.whirlwind(monsters)
+
+    weapon = Weapon(name="Sword", base_damage=1, element=Element.FIRE)
+    sample_warrior.inventory.add_item_to_inventory(weapon)
+    sample_warrior.equip_weapon(weapon)
+
+    msg = sample_warrior.whirlwind(monsters)
+
+    # Fire is strong against Poison and weak against Ice.
+    assert [m.current_life for m in monsters] == [48, 87]
+    assert "65 de dano" in msg
+
+
 def test_heavy_strike() -> None:
     sample_warrior: Warrior = Warrior(
         name="Errant Knight",
@@ -355,3 +382,27 @@ def test_no_defend_applies_damage():
 
     assert sample_warrior.current_life < 100
     assert sample_warrior.defend is False
+
+
+def test_snapshot_restore_undoes_rage() -> None:
+    warrior = Warrior(
+        name="Errant Knight",
+        max_life=200,
+        current_life=100,
+        attack=20,
+        speed=25,
+        shield=30,
+        armor=5,
+    )
+    snapshot = warrior.snapshot()
+
+    warrior.to_rage()
+    warrior.current_life = 40
+    warrior.restore(snapshot)
+
+    assert warrior.in_rage is False
+    assert warrior.attack == 20
+    assert warrior.shield == 30
+    assert warrior.armor == 5
+    assert warrior.current_life == 100
+    warrior.to_rage()
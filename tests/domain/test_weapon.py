@@ -4,6 +4,7 @@ import pytest
 
 from domain.element import Element
 from domain.entity import Entity
+from domain.monster import Monster
 from domain.weapon import Weapon
 
 
@@ -110,6 +111,13 @@ def test_get_attacks_returns_expected_structure(mock_random):
     assert callable(attacks["2"]["method"])
 
 
+def test_get_attacks_is_built_once_per_weapon():
+    weapon = Weapon(name="Sword", base_damage=10)
+
+    assert weapon.get_attacks() is weapon.get_attacks()
+    assert weapon.get_attacks()["2"]["method"] == weapon.heavy_attack
+
+
 def test_heavy_attack_applies_double_damage():
     weapon = Weapon(name="Sword", base_damage=10, element=Element.ICE)
 
@@ -170,7 +178,7 @@ def test_apply_status_fails_when_rng_is_low(mock_random):
     weapon._apply_elemental_status(mock_target)
 
     # O alvo não deve receber nenhum status
-    mock_target.set_status.assert_not_called()
+    mock_target.add_status.assert_not_called()
 
 
 @patch("domain.weapon.random.random", return_value=0.30)
@@ -178,11 +186,11 @@ def test_apply_status_fire_applies_burn(mock_random):
     """Armas de Fogo devem aplicar BurnState quando o RNG favorece."""
     weapon = Weapon(name="Espada de Fogo", base_damage=10, element=Element.FIRE)
     mock_target = MagicMock(spec=Entity)
-    mock_target.current_status = None
+    mock_target.has_status.return_value = False
 
     weapon._apply_elemental_status(mock_target)
 
-    mock_target.set_status.assert_called_once()
+    mock_target.add_status.assert_called_once()
 
 
 @patch("domain.weapon.random.random", return_value=0.30)
@@ -190,11 +198,11 @@ def test_apply_status_ice_applies_frozen(mock_random):
     """Armas de Gelo devem aplicar FrozenState quando o RNG favorece."""
     weapon = Weapon(name="Espada de Gelo", base_damage=10, element=Element.ICE)
     mock_target = MagicMock(spec=Entity)
-    mock_target.current_status = None
+    mock_target.has_status.return_value = False
 
     weapon._apply_elemental_status(mock_target)
 
-    mock_target.set_status.assert_called_once()
+    mock_target.add_status.assert_called_once()
 
 
 @patch("domain.weapon.random.random", return_value=0.30)
@@ -202,11 +210,11 @@ def test_apply_status_poison_applies_poisoned(mock_random):
     """Armas de Veneno devem aplicar PoisonedState quando o RNG favorece."""
     weapon = Weapon(name="Adaga Tóxica", base_damage=10, element=Element.POISON)
     mock_target = MagicMock(spec=Entity)
-    mock_target.current_status = None
+    mock_target.has_status.return_value = False
 
     weapon._apply_elemental_status(mock_target)
 
-    mock_target.set_status.assert_called_once()
+    mock_target.add_status.assert_called_once()
 
 
 @patch("domain.weapon.random.random", return_value=0.30)
@@ -214,8 +222,44 @@ def test_apply_status_lightning_applies_stunned(mock_random):
     """Armas de Raio devem aplicar StunnedState quando o RNG favorece."""
     weapon = Weapon(name="Martelo do Trovão", base_damage=10, element=Element.LIGHTNING)
     mock_target = MagicMock(spec=Entity)
-    mock_target.current_status = None
+    mock_target.has_status.return_value = False
 
     weapon._apply_elemental_status(mock_target)
 
-    mock_target.set_status.assert_called_once()
+    mock_target.add_status.assert_called_once()
+
+
+@patch("domain.weapon.random.random", return_value=0.30)
+def test_apply_status_stacks_but_not_twice(mock_random):
+    """Um novo efeito se acumula com outro, mas nunca com um do mesmo tipo."""
+    fire = Weapon(name="Espada de Fogo", base_damage=10, element=Element.FIRE)
+    poison = Weapon(name="Adaga Tóxica", base_damage=10, element=Element.POISON)
+    target = Monster(
+        name="Goblin", max_life=100, attack=5, speed=5, element=Element.NEUTRAL
+    )
+
+    fire._apply_elemental_status(target)
+    burn = target.current_status
+    fire._apply_elemental_status(target)
+    poison._apply_elemental_status(target)
+
+    assert [s.name for s in target.statuses] == ["Burned", "Poison"]
+    assert target.statuses[0] is burn
+
+
+def test_spawn_returns_an_equal_but_separate_weapon():
+    weapon = Weapon(name="Sword", base_damage=10, element=Element.FIRE)
+    weapon.catalog_id = "sword"
+
+    clone = weapon.spawn()
+    clone.base_damage = 99
+
+    assert clone is not weapon
+    assert (clone.name, clone.element, clone.catalog_id) == (
+        "Sword",
+        Element.FIRE,
+        "sword",
+    )
+    assert weapon.base_damage == 10
+    assert clone.get_attacks()["1"]["method"] == clone.attack
+    assert clone.get_attacks() is not weapon.get_attacks()
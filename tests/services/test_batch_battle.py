@@ -0,0 +1,169 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from domain.archer import Archer  # noqa: E402
+from domain.element import Element  # noqa: E402
+from domain.monster import Monster  # noqa: E402
+from domain.ranged_weapon import RangedWeapon  # noqa: E402
+from domain.warrior import Warrior  # noqa: E402
+from domain.weapon import Weapon  # noqa: E402
+from services.batch_battle import (  # noqa: E402
+    DEFEAT,
+    POISONED,
+    TIMEOUT,
+    VICTORY,
+    BatchBattle,
+)
+from services.simulation import (  # noqa: E402
+    MonsterSpec,
+    SimulationStats,
+    create_simulation_hero,
+    run_trial,
+)
+
+
+def _warrior(element=Element.NEUTRAL, weapon=True) -> Warrior:
+    warrior = Warrior("Knight", 150, 150, 12, 10, shield=20, armor=3)
+    if weapon:
+        sword = Weapon("Sword", 8, element=element)
+        warrior.inventory.add_item_to_inventory(sword)
+        warrior.equip_weapon(sword)
+    return warrior
+
+
+def _archer(element=Element.NEUTRAL) -> Archer:
+    archer = Archer("Legolas", 110, 110, 14, 30, max_ammo=6, current_ammo=6)
+    bow = RangedWeapon("Bow", 9, 1, hit_probability=60, element=element)
+    archer.inventory.add_item_to_inventory(bow)
+    archer.equip_weapon(bow)
+    return archer
+
+
+def _monster(element=Element.LIGHTNING, speed=40, life=260, attack=24) -> Monster:
+    return Monster("Ogre", life, attack, speed, element)
+
+
+def _object_stats(make_hero, make_monster, trials: int) -> SimulationStats:
+    random.seed(7)
+    stats = SimulationStats()
+    for _ in range(trials):
+        hero = make_hero()
+        result, turns = run_trial(hero, make_monster())
+        stats.record(result, turns, hero.current_life)
+    return stats
+
+
+@pytest.mark.parametrize(
+    "make_hero, make_monster",
+    [
+        (lambda: _warrior(Element.LIGHTNING), lambda: _monster()),
+        (lambda: _archer(Element.POISON), lambda: _monster()),
+        (
+            lambda: create_simulation_hero("warrior"),
+            lambda: MonsterSpec(3, Element.FIRE, boss=True).create(),
+        ),
+    ],
+)
+def test_batch_reproduces_object_battle_statistics(make_hero, make_monster):
+    expected = _object_stats(make_hero, make_monster, 3000)
+
+    batch = BatchBattle.repeat(make_hero(), make_monster(), 50_000, seed=3)
+    stats = batch.run().to_stats()
+
+    assert stats.win_rate == pytest.approx(expected.win_rate, abs=0.04)
+    assert stats.mean_turns_to_kill == pytest.approx(
+        expected.mean_turns_to_kill, abs=0.5
+    )
+    assert stats.mean_remaining_hp == pytest.approx(expected.mean_remaining_hp, rel=0.1)
+
+
+def test_batch_is_reproducible_with_seed():
+    first = BatchBattle.repeat(_warrior(), _monster(), 500, seed=11).run()
+    second = BatchBattle.repeat(_warrior(), _monster(), 500, seed=11).run()
+
+    assert (first.outcome == second.outcome).all()
+    assert (first.turns == second.turns).all()
+
+
+def test_from_pairs_mixes_archetypes():
+    batch = BatchBattle.from_pairs(
+        [
+            (_warrior(), _monster(life=1)),
+            (_archer(), _monster(attack=999, speed=99)),
+        ],
+        seed=1,
+    )
+    batch.hit_probability[:] = 100
+    batch.dodge_chance[:] = 0
+
+    result = batch.run()
+
+    assert result.outcome.tolist() == [VICTORY, DEFEAT]
+
+
+def test_unarmed_warrior_times_out():
+    batch = BatchBattle.repeat(_warrior(weapon=False), _monster(attack=1), 10)
+    batch.max_turns = 20
+
+    result = batch.run()
+
+    assert (result.outcome == TIMEOUT).all()
+    assert (result.turns == 0).all()
+
+
+def test_poison_ticks_on_monster_turn():
+    batch = BatchBattle.repeat(_warrior(), _monster(element=Element.NEUTRAL), 1)
+    batch.status[:] = POISONED
+    batch.duration[:] = 2
+    life = batch.monster_life.copy()
+
+    batch._monster_phase(np.array([0]))
+
+    assert batch.monster_life[0] == life[0] - 5
+    assert batch.duration[0] == 1
+
+
+@pytest.mark.usefixtures("room_modifiers")
+def test_poison_ticks_with_room_modifier():
+    batch = BatchBattle.repeat(
+        _warrior(), _monster(element=Element.NEUTRAL), 1, environment=Element.POISON
+    )
+    batch.status[:] = POISONED
+    batch.duration[:] = 2
+    life = batch.monster_life.copy()
+
+    batch._monster_phase(np.array([0]))
+
+    assert batch.monster_life[0] == life[0] - int(5 * 1.25)
+
+
+@pytest.mark.usefixtures("room_modifiers")
+def test_batch_reproduces_object_battles_in_a_room():
+    room = Element.LIGHTNING
+    random.seed(7)
+    expected = SimulationStats()
+    for _ in range(3000):
+        hero = _warrior(Element.LIGHTNING)
+        result, turns = run_trial(hero, _monster(), environment=room)
+        expected.record(result, turns, hero.current_life)
+
+    stats = (
+        BatchBattle.repeat(
+            _warrior(Element.LIGHTNING), _monster(), 50_000, room, seed=3
+        )
+        .run()
+        .to_stats()
+    )
+
+    assert stats.win_rate == pytest.approx(expected.win_rate, abs=0.04)
+    assert stats.mean_turns_to_kill == pytest.approx(
+        expected.mean_turns_to_kill, abs=0.5
+    )
+
+
+def test_from_pairs_checks_environments():
+    with pytest.raises(ValueError):
+        BatchBattle.from_pairs([(_warrior(), _monster())], environments=[])
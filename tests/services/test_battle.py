@@ -8,14 +8,18 @@ Crie testes nesta ordem (mesma ordem das etapas):
 13. test_no_loot_on_defeat - Sem loot se herói perdeu?
 """
 
+import random
+
 import pytest
 from services.battle import Battle
+from services.battle_events import ActionPrevented, ConsumableUsed
 from domain.hero import Hero
 from domain.warrior import Warrior
 from domain.monster import Monster
-from domain.element import Element
-from domain.state import NeutralState, StunnedState
+from domain.element import ELEMENT_MATRIX, Element
+from domain.state import BurnState, NeutralState, StunnedState
 from domain.weapon import Weapon
+from domain.rng import RandomStream
 
 
 def _create_warrior_with_weapon(**kwargs) -> Warrior:
@@ -457,18 +461,15 @@ def test_consumable_use_sets_hero_used_consumable():
     monster = _make_monster(attack=5, speed=5, life=200)
     battle = Battle(hero, monster)
 
-    # Warrior.get_actions() does not expose inventory items — inject the potion
-    # directly into the action dict, exactly as game_manager does at runtime.
-    original_get_actions = hero.get_actions
-
-    def patched_get_actions():
-        actions = original_get_actions()
-        actions["p"] = {"description": potion.name, "method": potion.use}
-        return actions
+    assert "p1" in hero.get_consumable_actions()
+    result = battle.execute_turn(player_choice="p1")
 
-    hero.get_actions = patched_get_actions
-    result = battle.execute_turn(player_choice="p")
     assert result["turn_log"]["hero_used_consumable"] is True
+    used = [e for e in result["turn_log"]["events"] if isinstance(e, ConsumableUsed)]
+    assert used[0].amount == 20
+    assert monster.current_life == 200  # the potion does not heal the monster
+    assert not hero.inventory.has_item("Poção de Cura")
+    assert "p1" not in hero.get_consumable_actions()
 
 
 def test_mana_potion_blocked_for_warrior_in_battle():
@@ -490,19 +491,12 @@ def test_mana_potion_blocked_for_warrior_in_battle():
     monster = _make_monster(attack=999, speed=5, life=200)
     battle = Battle(hero, monster)
 
-    original_get_actions = hero.get_actions
-
-    def patched_get_actions():
-        actions = original_get_actions()
-        actions["m"] = {"description": mana_potion.name, "method": mana_potion.use}
-        return actions
-
-    hero.get_actions = patched_get_actions
     life_before = hero.current_life
-    result = battle.execute_turn(player_choice="m")
+    result = battle.execute_turn(player_choice="p1")
 
     assert result["turn_log"].get("action_failed") is True
     assert hero.current_life == life_before  # monster did not act
+    assert hero.inventory.has_item("Poção de Mana")
 
 
 def test_turn_log_actions_list_not_empty_after_attack():
@@ -559,3 +553,123 @@ def test_archer_aim_sets_special_state_in_log():
     result = battle.execute_turn(player_choice="2")  # aim
 
     assert result["turn_log"].get("special_state") == "aiming"
+
+
+def _seeded_battle_events(seed: int) -> list:
+    warrior = _create_warrior_with_weapon(
+        name="Knight", max_life=500, current_life=500, attack=10, speed=20, shield=50
+    )
+    monster = Monster(
+        name="Goblin", max_life=500, attack=15, speed=5, element=Element.NEUTRAL
+    )
+    battle = Battle(warrior, monster, headless=True, rng=RandomStream(seed))
+
+    events = []
+    for _ in range(15):
+        events += battle.execute_turn("1")["turn_log"]["events"]
+    return events
+
+
+def test_battle_with_same_stream_is_reproducible():
+    assert _seeded_battle_events(3) == _seeded_battle_events(3)
+    assert _seeded_battle_events(3) != _seeded_battle_events(4)
+
+
+def test_battle_snapshot_restore_rewinds_the_fight():
+    warrior = _create_warrior_with_weapon(
+        name="Knight", max_life=100, current_life=100, attack=10, speed=20
+    )
+    monster = Monster(
+        name="Goblin", max_life=100, attack=15, speed=5, element=Element.NEUTRAL
+    )
+    monster.set_status(StunnedState(duration_turns=1))
+    battle = Battle(warrior, monster, headless=True)
+    snapshot = battle.snapshot()
+
+    battle.execute_turn("2")
+    battle.execute_turn("1")
+    battle.restore(snapshot)
+
+    assert battle.turn_count == 0
+    assert warrior.in_rage is False
+    assert warrior.attack == 10
+    assert monster.current_life == 100
+    assert monster.current_status.name == "Stunned"
+    assert monster.current_status.duration_turns == 1
+
+
+def test_stacked_statuses_all_fire_in_a_turn():
+    warrior = _create_warrior_with_weapon(
+        name="Knight", max_life=100, current_life=100, attack=10, speed=20, in_test=True
+    )
+    monster = Monster(
+        name="Goblin", max_life=100, attack=15, speed=5, element=Element.NEUTRAL
+    )
+    monster.add_status(BurnState(duration_turns=2, attack_decrease=5))
+    monster.add_status(StunnedState(duration_turns=1))
+    battle = Battle(warrior, monster, headless=True)
+
+    log = battle.execute_turn("1")["turn_log"]
+
+    assert monster.attack == 10
+    assert warrior.current_life == 100
+    assert any(isinstance(e, ActionPrevented) for e in log["events"])
+
+    # The burn wears off at the start of the Goblin's second turn.
+    battle.execute_turn("1")
+    assert monster.attack == 15
+    assert warrior.current_life == 85
+
+
+@pytest.mark.usefixtures("room_modifiers")
+def test_battle_environment_applies_to_both_fighters():
+    warrior = _create_warrior_with_weapon(
+        name="Knight", max_life=100, current_life=100, attack=10, speed=5
+    )
+    monster = Monster(name="Imp", max_life=50, attack=8, speed=1, element=Element.ICE)
+
+    Battle(warrior, monster, environment=Element.ICE)
+    monster.strike(warrior)
+    assert warrior.element_matrix is monster.element_matrix
+    assert warrior.current_life == 100 - int(8 * 1.25)
+
+    # The next battle outside that room goes back to plain multipliers.
+    Battle(warrior, monster)
+    assert warrior.element_matrix is ELEMENT_MATRIX
+
+
+@pytest.mark.usefixtures("room_modifiers")
+def test_finished_battle_detaches_the_fighters():
+    warrior = _create_warrior_with_weapon(
+        name="Knight", max_life=100, current_life=50, attack=100, speed=20
+    )
+    monster = _make_monster(life=10)
+    battle = Battle(
+        warrior, monster, headless=True, rng=RandomStream(1), environment=Element.ICE
+    )
+
+    result = battle.execute_turn("1")
+    published = list(battle._published)
+    warrior.heal_life(10)
+
+    assert result["result"] == "victory"
+    for fighter in (warrior, monster):
+        assert fighter.event_bus is None
+        assert fighter.rng is random
+        assert fighter.element_matrix is ELEMENT_MATRIX
+    assert battle._published == published
+
+
+def test_rewinding_a_finished_battle_attaches_the_fighters_again():
+    warrior = _create_warrior_with_weapon(
+        name="Knight", max_life=100, current_life=100, attack=100, speed=20
+    )
+    monster = _make_monster(life=10)
+    battle = Battle(warrior, monster, headless=True, rng=RandomStream(1))
+    snapshot = battle.snapshot()
+
+    battle.execute_turn("1")
+    battle.restore(snapshot)
+
+    assert warrior.event_bus is battle.event_bus
+    assert monster.rng is battle.rng
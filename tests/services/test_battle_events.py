@@ -0,0 +1,181 @@
+from services.battle import Battle
+from services.battle_events import (
+    Blocked,
+    DamageDealt,
+    Defeated,
+    Dodged,
+    ResourceChanged,
+    StatusApplied,
+    render_event,
+    render_events,
+)
+from domain import events as domain_events
+from domain.archer import Archer
+from domain.element import Element
+from domain.monster import Monster
+from domain.ranged_weapon import RangedWeapon
+from domain.warrior import Warrior
+from domain.weapon import Weapon
+
+
+def _make_warrior(**kwargs) -> Warrior:
+    warrior = Warrior(
+        name="Knight", max_life=100, current_life=100, attack=10, speed=20, **kwargs
+    )
+    weapon = Weapon(name="Test Sword", base_damage=5)
+    warrior.inventory.add_item_to_inventory(weapon)
+    warrior.equip_weapon(weapon)
+    return warrior
+
+
+def _make_monster(attack=10, speed=5, life=100, element=Element.NEUTRAL):
+    return Monster(
+        name="Goblin",
+        max_life=life,
+        attack=attack,
+        speed=speed,
+        element=element,
+    )
+
+
+def test_headless_turn_records_events_without_text():
+    battle = Battle(_make_warrior(), _make_monster(), headless=True)
+
+    turn_log = battle.execute_turn("1")["turn_log"]
+
+    assert isinstance(turn_log["events"][0], DamageDealt)
+    assert turn_log["events"][0].damage == 15
+    assert turn_log["actions"]._lines is None
+
+
+def test_headless_turn_renders_the_text_when_it_is_read():
+    default = Battle(_make_warrior(), _make_monster())
+    headless = Battle(_make_warrior(), _make_monster(), headless=True)
+
+    default_log = default.execute_turn("1")["turn_log"]
+    headless_log = headless.execute_turn("1")["turn_log"]
+
+    assert headless_log["actions"] == default_log["actions"]
+    assert list(headless_log["actions"]) == default_log["actions"]
+    assert headless_log["actions"][0] == default_log["actions"][0]
+
+
+def test_rendering_headless_events_matches_default_mode():
+    default = Battle(_make_warrior(), _make_monster())
+    headless = Battle(_make_warrior(), _make_monster(), headless=True)
+
+    default_log = default.execute_turn("1")["turn_log"]
+    headless_log = headless.execute_turn("1")["turn_log"]
+
+    assert render_events(headless_log["events"]) == default_log["actions"]
+
+
+def test_monster_hit_event():
+    warrior = _make_warrior(in_test=True)
+    battle = Battle(warrior, _make_monster(speed=50), headless=True)
+
+    events = battle.execute_turn("1")["turn_log"]["events"]
+
+    assert events[0] == DamageDealt("Goblin", "Knight", 10, 1.0)
+
+
+def test_block_event_for_warrior():
+    warrior = _make_warrior(in_test=True)
+    warrior.defend = True
+    battle = Battle(warrior, _make_monster(speed=50), headless=True)
+
+    events = battle.execute_turn("1")["turn_log"]["events"]
+
+    assert events[0] == Blocked("Knight", "Goblin", 0)
+    assert warrior.defend is False
+
+
+def test_archer_reload_event():
+    archer = Archer(
+        name="Legolas",
+        max_life=100,
+        current_life=100,
+        attack=20,
+        speed=0,
+        max_ammo=10,
+        current_ammo=2,
+    )
+    bow = RangedWeapon(name="Arco", base_damage=10, ammo_required=1)
+    archer.inventory.add_item_to_inventory(bow)
+    archer.equip_weapon(bow)
+    battle = Battle(archer, _make_monster(speed=50), headless=True)
+
+    events = battle.execute_turn("3")["turn_log"]["events"]
+
+    assert ResourceChanged("Legolas", "ammo", 2, 10, 10) in events
+
+
+def test_render_damage_with_elemental_advantage():
+    line = render_event(DamageDealt("Knight", "Goblin", 30, 2.0, "Atacar"))
+
+    assert "15 de dano" in line
+    assert "Super Efetivo" in line
+
+
+def test_render_enraged_damage_shows_halved_base():
+    line = render_event(DamageDealt("Knight", "Goblin", 40, 1.0, "Atacar", False, True))
+
+    assert "com 20 de dano" in line
+    assert "Fúria" in line
+
+
+def test_render_status_and_dodge():
+    assert "QUEIMADURA" in render_event(StatusApplied("Goblin", "Burned"))
+    assert "esquivou" in render_event(Dodged("Legolas", "Goblin"))
+    assert "derrotado" in render_event(Defeated("Goblin"))
+
+
+def test_mana_snapshot_is_not_rendered():
+    assert render_events([ResourceChanged("Merlin", "mana", 100, 95, 100)]) == []
+
+
+def test_dodge_event_for_archer():
+    archer = Archer(
+        name="Legolas",
+        max_life=100,
+        current_life=100,
+        attack=20,
+        speed=100,
+        max_ammo=10,
+        current_ammo=10,
+    )
+    bow = RangedWeapon(name="Arco", base_damage=10, ammo_required=1)
+    archer.inventory.add_item_to_inventory(bow)
+    archer.equip_weapon(bow)
+    battle = Battle(archer, _make_monster(speed=200), headless=True)
+
+    events = battle.execute_turn("3")["turn_log"]["events"]
+
+    assert events[0] == Dodged("Legolas", "Goblin")
+
+
+def test_outside_subscribers_share_the_battle_bus():
+    warrior = _make_warrior(in_test=True)
+    monster = _make_monster()
+    battle = Battle(warrior, monster, headless=True)
+    damages = []
+    battle.event_bus.subscribe(domain_events.DamageApplied, damages.append)
+
+    battle.execute_turn("1")
+
+    assert [(event.target, event.amount) for event in damages] == [
+        (monster, 15),
+        (warrior, 10),
+    ]
+
+
+def test_plain_hits_publish_nothing_the_battle_listens_to():
+    warrior = _make_warrior(in_test=True)
+    monster = _make_monster()
+    battle = Battle(warrior, monster, headless=True)
+
+    events = battle.execute_turn("1")["turn_log"]["events"]
+
+    assert not battle.event_bus.has_subscribers(domain_events.DamageApplied)
+    assert [type(event) for event in events] == [DamageDealt, DamageDealt]
+    assert events[0].damage == 15 and events[1].damage == 10
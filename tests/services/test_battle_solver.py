@@ -0,0 +1,175 @@
+import pytest
+from domain.archer import Archer
+from domain.element import Element
+from domain.grimoire import Grimoire
+from domain.mage import Mage
+from domain.monster import Monster
+from domain.ranged_weapon import RangedWeapon
+from domain.state import BurnState, PoisonedState
+from services.battle_solver import (
+    BattleModel,
+    basic_policy,
+    solve,
+    solve_battle,
+)
+from domain.rng import RandomStream
+from services.simulation import (
+    MonsterSpec,
+    SimulationStats,
+    create_simulation_hero,
+    run_simulation,
+    run_trial,
+)
+
+
+def _archer(element=Element.NEUTRAL) -> Archer:
+    archer = Archer("Legolas", 110, 110, 14, 30, max_ammo=6, current_ammo=6)
+    bow = RangedWeapon("Bow", 9, 1, hit_probability=60, element=element)
+    archer.inventory.add_item_to_inventory(bow)
+    archer.equip_weapon(bow)
+    return archer
+
+
+def _mage(max_mana=20, mana_cost=8, speed=50) -> Mage:
+    mage = Mage("Merlin", 100, 100, max_mana, max_mana, 10, speed)
+    grimoire = Grimoire("Livro", Element.FIRE, magic_power=5, mana_cost=mana_cost)
+    mage.inventory.add_item_to_inventory(grimoire)
+    mage.equip_grimoire(grimoire)
+    return mage
+
+
+@pytest.mark.parametrize(
+    "archetype, spec",
+    [
+        ("warrior", MonsterSpec(3, Element.FIRE, boss=True)),
+        ("archer", MonsterSpec(3, Element.ICE, boss=True)),
+        ("archer", MonsterSpec(2, Element.LIGHTNING)),
+    ],
+)
+def test_solver_matches_monte_carlo(archetype, spec):
+    solution = solve_battle(create_simulation_hero(archetype), spec.create())
+
+    stats = run_simulation(archetype, spec, 3000, max_workers=1, seed=5)
+
+    assert stats.win_rate == pytest.approx(solution.win_probability, abs=0.035)
+    assert stats.mean_turns_to_kill == pytest.approx(
+        solution.mean_turns_to_kill, abs=0.3
+    )
+    assert stats.mean_remaining_hp == pytest.approx(solution.mean_remaining_hp, rel=0.1)
+
+
+@pytest.mark.usefixtures("room_modifiers")
+@pytest.mark.parametrize(
+    "archetype, spec, environment",
+    [
+        ("warrior", MonsterSpec(3, Element.FIRE, boss=True), Element.FIRE),
+        ("archer", MonsterSpec(3, Element.ICE, boss=True), Element.FIRE),
+    ],
+)
+def test_solver_matches_monte_carlo_in_elemental_room(archetype, spec, environment):
+    solution = solve_battle(
+        create_simulation_hero(archetype), spec.create(), environment=environment
+    )
+    neutral = solve_battle(create_simulation_hero(archetype), spec.create())
+
+    root = RandomStream(5)
+    stats = SimulationStats()
+    for index in range(3000):
+        rng = root.spawn(index)
+        hero = create_simulation_hero(archetype)
+        result, turns = run_trial(
+            hero, spec.create(rng), rng=rng, environment=environment
+        )
+        stats.record(result, turns, hero.current_life)
+
+    assert solution != neutral
+    assert stats.win_rate == pytest.approx(solution.win_probability, abs=0.035)
+    assert stats.mean_turns_to_kill == pytest.approx(
+        solution.mean_turns_to_kill, abs=0.3
+    )
+    assert stats.mean_remaining_hp == pytest.approx(solution.mean_remaining_hp, rel=0.1)
+
+
+def test_deterministic_fight_is_exact():
+    hero = create_simulation_hero("mage")
+    monster = MonsterSpec(3, Element.POISON).create()
+
+    solution = solve_battle(hero, monster)
+
+    assert solution.win_probability == 1.0
+    assert solution.mean_turns_to_kill == 1.0
+    assert solution.mean_remaining_hp == 80.0
+
+
+def test_transitions_are_distributions():
+    model = BattleModel.from_entities(
+        _archer(Element.POISON), Monster("Ogre", 200, 20, 10, Element.LIGHTNING)
+    )
+    seen = set()
+    frontier = [model.initial_state]
+
+    while frontier:
+        state = frontier.pop()
+        if state in seen or model.is_over(state):
+            continue
+        seen.add(state)
+        transitions = model.transitions(state, basic_policy(model, state))
+        assert sum(t.probability for t in transitions) == pytest.approx(1.0)
+        frontier.extend(t.state for t in transitions)
+
+    solution = solve(model)
+    total = (
+        solution.win_probability
+        + solution.loss_probability
+        + solution.stalemate_probability
+    )
+    assert total == pytest.approx(1.0)
+    assert solution.states == len(seen)
+
+
+def test_mage_without_mana_on_cooldown_never_finishes():
+    # Casts at 20 and 12 mana, meditates to 14, casts at 14: 6 mana with the
+    # cooldown still running, so every "1" fails and no turn ever passes.
+    mage = _mage()
+    monster = Monster("Rocha", 500, 0, 1, Element.NEUTRAL)
+
+    solution = solve_battle(mage, monster)
+
+    assert solution.stalemate_probability == pytest.approx(1.0)
+    assert solution.win_probability == 0.0
+
+
+def test_burn_state_is_read_from_monster():
+    monster = Monster("Ogre", 100, 20, 1, Element.NEUTRAL)
+    monster.set_status(BurnState(duration_turns=2, attack_decrease=5))
+
+    model = BattleModel.from_entities(_archer(), monster)
+
+    assert model.initial_state.status == "Burned"
+    assert model.initial_state.duration == 2
+
+
+def test_stacked_monster_statuses_are_rejected():
+    monster = Monster("Ogre", 100, 20, 1, Element.NEUTRAL)
+    monster.add_status(BurnState(duration_turns=2, attack_decrease=5))
+    monster.add_status(PoisonedState(duration_turns=2, damage_per_turns=5))
+
+    with pytest.raises(ValueError):
+        BattleModel.from_entities(_archer(), monster)
+
+
+def test_invalid_action_raises():
+    model = BattleModel.from_entities(
+        _archer(), Monster("Ogre", 100, 20, 1, Element.FIRE)
+    )
+
+    with pytest.raises(ValueError):
+        model.transitions(model.initial_state, "9")
+
+
+def test_hero_with_status_is_rejected():
+    archer = _archer()
+    archer.set_status(BurnState(duration_turns=2, attack_decrease=5))
+
+    with pytest.raises(ValueError):
+        solve_battle(archer, Monster("Ogre", 100, 20, 1, Element.FIRE))
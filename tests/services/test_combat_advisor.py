@@ -0,0 +1,102 @@
+import time
+
+import pytest
+from domain.consumable_item import ConsumableItem
+from domain.element import Element
+from domain.monster import Monster
+from services.battle import Battle
+from services.battle_solver import BattleModel, solve
+from services.combat_advisor import CombatAdvisor, advisor_policy
+from services.simulation import MonsterSpec, create_simulation_hero, run_trial
+
+
+def _model(archetype: str, monster: Monster) -> BattleModel:
+    return BattleModel.from_entities(create_simulation_hero(archetype), monster)
+
+
+def test_advice_is_an_available_action():
+    model = _model("archer", MonsterSpec(3, Element.FIRE, boss=True).create())
+
+    advice = CombatAdvisor().advise(model, model.initial_state)
+
+    assert advice.action in model.actions(model.initial_state)
+    assert advice.action in advice.scores
+    assert 0.0 <= advice.value <= 1.0
+    assert advice.depth >= 1
+
+
+def test_advice_respects_time_budget():
+    model = _model("archer", MonsterSpec(2, Element.LIGHTNING).create())
+    advisor = CombatAdvisor(time_budget=0.02, max_depth=50)
+
+    start = time.perf_counter()
+    advice = advisor.advise(model, model.initial_state)
+
+    assert time.perf_counter() - start < 0.2
+    assert advice.depth < 50
+
+
+def test_advisor_policy_beats_basic_policy():
+    model = _model("archer", MonsterSpec(3, Element.ICE, boss=True).create())
+    advisor = CombatAdvisor(time_budget=None, max_depth=2)
+
+    basic = solve(model)
+    advised = solve(model, advisor.policy)
+
+    assert advised.win_probability > basic.win_probability + 0.5
+
+
+def test_failing_actions_are_not_advised():
+    mage = create_simulation_hero("mage")
+    mage.current_mana = 0
+    model = BattleModel.from_entities(mage, MonsterSpec(1, Element.FIRE).create())
+
+    advice = CombatAdvisor(time_budget=None, max_depth=2).advise(
+        model, model.initial_state
+    )
+
+    assert list(advice.scores) == ["4"]
+    assert advice.action == "4"
+
+
+def test_advise_battle_suggests_free_potion_when_dying():
+    hero = create_simulation_hero("warrior")
+    hero.current_life = 10
+    hero.inventory.add_item_to_inventory(
+        ConsumableItem("Poção de Cura", "Recupera 40 de Vida.", 0.5, 40)
+    )
+    monster = Monster("Ogre", 60, 15, 1, Element.NEUTRAL)
+
+    advice = CombatAdvisor(time_budget=None, max_depth=3).advise_battle(
+        Battle(hero, monster)
+    )
+
+    assert advice.consumable is not None
+
+
+def test_advise_battle_keeps_potions_at_full_life():
+    hero = create_simulation_hero("warrior")
+    monster = Monster("Goblin", 30, 5, 1, Element.NEUTRAL)
+
+    advice = CombatAdvisor(time_budget=None, max_depth=3).advise_battle(
+        Battle(hero, monster)
+    )
+
+    assert advice.consumable is None
+
+
+def test_advisor_policy_runs_playtests():
+    hero = create_simulation_hero("mage")
+    monster = MonsterSpec(3, Element.FIRE, boss=True).create()
+
+    result, turns = run_trial(hero, monster, policy=advisor_policy)
+
+    assert result == "victory"
+    assert turns > 0
+
+
+def test_advise_finished_battle_raises():
+    model = _model("warrior", MonsterSpec(1, Element.FIRE).create())
+
+    with pytest.raises(ValueError):
+        CombatAdvisor().advise(model, model.initial_state._replace(monster_life=0))
@@ -0,0 +1,157 @@
+import json
+import shutil
+
+import pytest
+
+from domain.element import Element
+from services import content as content_module
+from services.content import (
+    CONTENT_DIR,
+    Content,
+    compile_content,
+    content,
+    content_packs,
+    load_content,
+)
+from services.items_factory import ItemsFactory
+from services.monster_factory import MonsterFactory
+
+
+@pytest.fixture
+def packs(tmp_path):
+    """A copy of the built-in packs, free to be edited."""
+    directory = tmp_path / "content"
+    shutil.copytree(CONTENT_DIR, directory, ignore=shutil.ignore_patterns("__*"))
+    return directory
+
+
+@pytest.fixture
+def compilations(monkeypatch):
+    calls = []
+    compile_packs = content_module.compile_content
+
+    def counting(packs):
+        calls.append(len(packs))
+        return compile_packs(packs)
+
+    monkeypatch.setattr(content_module, "compile_content", counting)
+    return calls
+
+
+def _sections(directory):
+    return [
+        (path.name, json.loads(path.read_text(encoding="utf-8")))
+        for path in content_packs(directory)
+        if path.suffix == ".json"
+    ]
+
+
+def test_built_in_content_configures_the_factories():
+    loaded = content()
+
+    assert MonsterFactory.BASE_NAMES is loaded.monster_names
+    assert ItemsFactory.DROP_TABLES is loaded.drop_tables
+    assert set(loaded.monster_names) == set(Element)
+    assert loaded.heroes["warrior"]["element"] is Element.NEUTRAL
+    assert loaded.drop_tables["Salamandra"]["grimoire"][0]["element"] is Element.FIRE
+    assert "DEFAULT" in loaded.monster_arts
+    assert loaded.base_packs["base_pack_mage"] == (
+        "grimorio_iniciante",
+        "pocao_de_mana",
+    )
+
+
+def test_toml_and_json_packs_are_both_read(packs):
+    names = [path.name for path in content_packs(packs)]
+
+    assert "arts.toml" in names and "items.json" in names
+    assert "elements.json" not in names
+    assert load_content(content_packs(packs), cache_dir=None) == content()
+
+
+def test_later_packs_override_earlier_ones(packs):
+    (packs / "zz_mod.json").write_text(
+        json.dumps({"monster_names": {"ice": ["Yeti", "Pinguim Imperador"]}}),
+        encoding="utf-8",
+    )
+
+    loaded = load_content(content_packs(packs), cache_dir=None)
+
+    assert loaded.monster_names[Element.ICE] == ["Yeti", "Pinguim Imperador"]
+    assert loaded.monster_names[Element.FIRE] == content().monster_names[Element.FIRE]
+
+
+def test_a_second_load_comes_from_the_cache(packs, tmp_path, compilations):
+    cache_dir = tmp_path / "cache"
+
+    first = load_content(content_packs(packs), cache_dir)
+    second = load_content(content_packs(packs), cache_dir)
+
+    assert compilations == [4]
+    assert second == first
+    assert len(list(cache_dir.glob("content-*.pickle"))) == 1
+
+
+def test_an_edited_pack_is_compiled_again(packs, tmp_path, compilations):
+    cache_dir = tmp_path / "cache"
+    load_content(content_packs(packs), cache_dir)
+    heroes = packs / "heroes.json"
+    data = json.loads(heroes.read_text(encoding="utf-8"))
+    data["heroes"]["mage"]["max_mana"] = 120
+    heroes.write_text(json.dumps(data), encoding="utf-8")
+
+    loaded = load_content(content_packs(packs), cache_dir)
+
+    assert compilations == [4, 4]
+    assert loaded.heroes["mage"]["max_mana"] == 120
+    assert len(list(cache_dir.glob("content-*.pickle"))) == 1
+
+
+def test_a_broken_cache_is_compiled_again(packs, tmp_path, compilations):
+    cache_dir = tmp_path / "cache"
+    load_content(content_packs(packs), cache_dir)
+    for cache in cache_dir.glob("content-*.pickle"):
+        cache.write_bytes(b"not a pickle")
+
+    loaded = load_content(content_packs(packs), cache_dir)
+
+    assert compilations == [4, 4]
+    assert isinstance(loaded, Content)
+
+
+@pytest.mark.parametrize(
+    "section, key, value",
+    [
+        ("monster_names", "ice", []),
+        ("monster_names", "plasma", ["Nuvem"]),
+        ("heroes", "mage", {"max_life": 80}),
+        ("heroes", "bard", {}),
+        ("drop_tables", "Yeti", {"shield": [{"name": "Escudo"}]}),
+        ("drop_tables", "Yeti", {"weapon": [{"name": "Clava", "base_damage": -3}]}),
+        (
+            "drop_tables",
+            "Orc",
+            {"weapon": [{"name": "Poção de Cura", "base_damage": 3}]},
+        ),
+        (
+            "loot_tables",
+            "mana_potion",
+            {"entries": [{"item": "pocao_de_lava", "weight": 1}]},
+        ),
+        ("base_packs", "base_pack_mage", ["cajado_lendario"]),
+        ("pets", "cat", {}),
+    ],
+)
+def test_invalid_packs_are_rejected(packs, section, key, value):
+    sections = _sections(packs)
+    sections.append(("zz_mod.json", {section: {key: value}}))
+
+    with pytest.raises(ValueError, match="Invalid content"):
+        compile_content(sections)
+
+
+def test_unreadable_packs_are_rejected(packs):
+    (packs / "zz_mod.json").write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Invalid content pack 'zz_mod.json'"):
+        load_content(content_packs(packs), cache_dir=None)
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from services.game_state import GameState
+from services.hero_factory import HeroFactory
+
+
+@pytest.fixture
+def hero():
+    return HeroFactory.create_hero("warrior", "Conan")
+
+
+def test_run_progress_survives_a_json_round_trip(hero):
+    state = GameState.create_new_game(hero, endless=True)
+    state.current_level = 42
+    state.seed = 2**63 + 5
+    state.battles_fought = 80
+    state.room_deltas = {41: ((0, 1), ()), 42: ((0,), (2,))}
+
+    loaded = GameState.from_dict(json.loads(json.dumps(state.to_dict())), hero)
+
+    assert loaded.current_level == 42
+    assert loaded.endless
+    assert loaded.seed == state.seed
+    assert loaded.battles_fought == 80
+    assert loaded.room_deltas == state.room_deltas
+
+
+def test_saves_without_a_seed_still_load(hero):
+    loaded = GameState.from_dict(
+        {"current_level": 3, "save_date": "2025-01-01T00:00:00"}, hero
+    )
+
+    assert loaded.seed is None
+    assert loaded.battles_fought == 0
+    assert loaded.room_deltas == {}
+
+
+def test_save_size_does_not_grow_with_depth(hero):
+    def size(level):
+        state = GameState.create_new_game(hero, endless=True)
+        state.current_level = level
+        state.seed = 123
+        state.room_deltas = {level: ((0, 1), ())}
+        return len(json.dumps(state.to_dict()))
+
+    assert size(10_000) - size(10) <= 6
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [
+        {"seed": "abc"},
+        {"battles_fought": -1},
+        {"rooms": {"x": [[0], []]}},
+        {"rooms": {"1": [[0]]}},
+        {"rooms": []},
+    ],
+)
+def test_corrupted_run_progress_is_rejected(hero, extra):
+    data = {"current_level": 1, "save_date": "2025-01-01T00:00:00", **extra}
+
+    with pytest.raises(ValueError, match="Save corrompido"):
+        GameState.from_dict(data, hero)
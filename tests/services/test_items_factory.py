@@ -1,11 +1,12 @@
 import pytest
 
-from services.items_factory import ItemsFactory
+from services.items_factory import ItemCatalog, ItemsFactory, item_id
 from domain.weapon import Weapon
 from domain.ranged_weapon import RangedWeapon
 from domain.grimoire import Grimoire
 from domain.consumable_item import ConsumableItem
 from domain.element import Element
+from domain.rng import RandomStream
 from unittest.mock import patch
 
 
@@ -24,6 +25,7 @@ def test_base_packs_return_new_instances():
 
     assert packs1["base_pack_warrior"][0] is not packs2["base_pack_warrior"][0]
     assert packs1["base_pack_mage"][0] is not packs2["base_pack_mage"][0]
+    assert packs1["base_pack_mage"][0].catalog_id == "grimorio_iniciante"
 
 
 def test_base_pack_contains_correct_types():
@@ -215,6 +217,11 @@ def test_get_loot_for_monster_returns_independent_lists(mock_random):
     assert loot_a is not loot_b
     # The fixed potion objects must not be the same instance.
     assert loot_a[0] is not loot_b[0]
+    assert [item.catalog_id for item in loot_a] == [
+        "pocao_de_cura",
+        "pocao_de_mana",
+        "tomo_profano",
+    ]
 
 
 @patch("services.items_factory.random.random", return_value=0.1)
@@ -308,3 +315,63 @@ def test_archer_base_pack_has_no_mana_potion():
         if isinstance(item, ConsumableItem) and item.recovery_type == "mana"
     ]
     assert len(mana_potions) == 0
+
+
+# =============================================================================
+# CATÁLOGO (definições compartilhadas)
+# =============================================================================
+
+
+def test_item_id_is_an_ascii_slug():
+    assert item_id("Poção de Cura") == "pocao_de_cura"
+    assert item_id("Códice Do Trovão") == "codice_do_trovao"
+
+
+def test_catalog_holds_every_table_item_once():
+    catalog = ItemsFactory.catalog()
+
+    assert ItemsFactory.catalog() is catalog
+    for config in [ItemsFactory.BASE_ITEMS, *ItemsFactory.DROP_TABLES.values()]:
+        for configs in config.values():
+            for item_config in configs:
+                item = catalog.create(item_id(item_config["name"]))
+                assert item.catalog_id == item_id(item_config["name"])
+
+
+def test_catalog_rejects_repeated_unknown_and_invalid_items():
+    catalog = ItemCatalog([(Weapon, {"name": "Espada", "base_damage": 10})])
+
+    with pytest.raises(ValueError):
+        catalog.add(Weapon, {"name": "espada", "base_damage": 12})
+    with pytest.raises(ValueError):
+        catalog.add(Weapon, {"name": "Machado", "base_damage": 0})
+    with pytest.raises(KeyError):
+        catalog.get("machado")
+
+
+def test_catalog_definitions_are_immutable():
+    definition = ItemsFactory.catalog().get("pocao_de_cura")
+
+    with pytest.raises(AttributeError):
+        definition.config = ()
+    with pytest.raises(AttributeError):
+        definition.catalog_id = "pocao_de_mana"
+
+
+def test_changing_a_drop_leaves_the_other_drops_alone():
+    catalog = ItemsFactory.catalog()
+    first = catalog.create("pocao_de_cura")
+    second = catalog.create("pocao_de_cura")
+
+    first.recovered_value = 999
+
+    assert second.recovered_value != 999
+    assert catalog.create("pocao_de_cura").recovered_value == second.recovered_value
+
+
+def test_loot_rolls_follow_the_stream():
+    first = ItemsFactory.get_loot_for_monster("Yeti", RandomStream(9))
+    second = ItemsFactory.get_loot_for_monster("Yeti", RandomStream(9))
+
+    assert [item.catalog_id for item in first] == [item.catalog_id for item in second]
+    assert first[-1].catalog_id == "arco_congelante"
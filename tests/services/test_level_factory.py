@@ -1,5 +1,9 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from services.level_factory import LevelFactory
+from domain.fields import is_trusted, trusted
+from services.level_factory import FloorWindow, LevelFactory, RoomPrefetcher
 from domain.element import Element
 from domain.room import Room
 
@@ -30,3 +34,253 @@ def test_no_arguments_for_enviroment():
     salinha = LevelFactory.create_room(level=1)
 
     assert isinstance(salinha.environment, Element)
+
+
+def test_horde_room_size_grows_with_level():
+    small = LevelFactory.create_horde_room(level=1, environment=Element.ICE)
+    large = LevelFactory.create_horde_room(level=5, environment=Element.ICE)
+
+    assert (
+        len(small.monsters) == LevelFactory.HORDE_BASE_SIZE + LevelFactory.HORDE_GROWTH
+    )
+    assert len(large.monsters) > len(small.monsters)
+    assert all(m.element == Element.ICE for m in large.monsters)
+
+
+def test_horde_room_custom_size():
+    horde = LevelFactory.create_horde_room(level=2, size=40)
+
+    assert len(horde.monsters) == 40
+    assert "HORDA de 40" in horde.description
+
+    with pytest.raises(ValueError):
+        LevelFactory.create_horde_room(level=2, size=0)
+
+
+def test_every_fourth_floor_of_a_run_is_a_horde():
+    rooms = list(LevelFactory.dungeon(seed=11, floors=8))
+
+    assert [LevelFactory.is_horde_floor(level) for level in (3, 4, 8)] == [
+        False,
+        True,
+        True,
+    ]
+    assert [len(room.monsters) for room in rooms] == [2, 2, 2, 6, 2, 2, 2, 8]
+    assert "HORDA de 6" in rooms[3].description
+
+
+def _layout(room):
+    return (
+        room.description,
+        room.environment,
+        [(m.name, m.max_life, [i.catalog_id for i in m.loot]) for m in room.monsters],
+    )
+
+
+def test_dungeon_rooms_depend_on_seed_and_level_only():
+    rooms = [_layout(room) for room in LevelFactory.dungeon(seed=11, floors=5)]
+
+    assert len(rooms) == 5
+    assert rooms == [_layout(LevelFactory.room_at(11, level)) for level in range(1, 6)]
+    assert rooms[2:] == [_layout(r) for r in LevelFactory.dungeon(11, 5, start=3)]
+    assert rooms != [_layout(room) for room in LevelFactory.dungeon(seed=12, floors=5)]
+
+
+def test_dungeon_builds_a_room_only_when_reached(monkeypatch):
+    built = []
+    create_room = LevelFactory.create_room
+    monkeypatch.setattr(
+        LevelFactory,
+        "create_room",
+        lambda level, **kwargs: built.append(level) or create_room(level, **kwargs),
+    )
+
+    dungeon = LevelFactory.dungeon(seed=3)
+    assert built == []
+
+    next(dungeon)
+    next(dungeon)
+    assert built == [1, 2]
+
+
+def test_endless_dungeon_keeps_going():
+    dungeon = LevelFactory.dungeon(seed=5)
+
+    rooms = [next(dungeon) for _ in range(8)]
+
+    assert rooms[-1].monsters[0].attack > rooms[0].monsters[0].attack
+
+
+def test_dungeon_level_validation():
+    with pytest.raises(ValueError):
+        next(LevelFactory.dungeon(seed=1, start=0))
+
+
+def test_floor_window_keeps_only_the_recent_floors():
+    window = FloorWindow(seed=4, capacity=3)
+
+    for level in range(1, 6):
+        window.room(level)
+    window.room(3)
+    window.room(6)
+
+    assert len(window) == 3
+    assert [level for level in range(1, 7) if level in window] == [3, 5, 6]
+
+
+def test_floor_window_hands_out_the_kept_room():
+    window = FloorWindow(seed=4)
+
+    room = window.room(2)
+    room.remove_defeated_monster()
+
+    assert window.room(2) is room
+
+
+def test_floor_window_regenerates_evicted_floors_from_the_seed():
+    window = FloorWindow(seed=9, capacity=2)
+
+    first = window.room(7)
+    window.room(8)
+    window.room(9)
+
+    assert 7 not in window
+    assert _layout(window.room(7)) == _layout(LevelFactory.room_at(9, 7))
+    assert window.room(7) is not first
+
+
+def test_floor_window_keeps_the_delta_of_evicted_floors():
+    window = FloorWindow(seed=9, capacity=2)
+
+    first = window.room(6)
+    first.remove_defeated_monster()
+    window.room(7)
+    window.room(8)
+
+    assert 6 not in window
+    assert window.deltas() == {6: ((0,), ())}
+
+    again = window.room(6)
+    assert again is not first
+    assert [m.name for m in again.monsters] == [
+        LevelFactory.room_at(9, 6).monsters[1].name
+    ]
+    assert window.deltas() == {6: ((0,), ())}
+
+
+def test_floor_window_stays_bounded_in_a_long_run():
+    window = FloorWindow(seed=1, capacity=4)
+
+    for level in range(1, 1001):
+        window.room(level)
+
+    assert len(window) == 4
+    # Floor 1000 is a horde; 999 still has a boss.
+    assert window.room(999).monsters[1].max_life == 120 + 999 * 20
+
+
+def test_floor_window_limits():
+    window = FloorWindow(seed=1, floors=5)
+
+    assert window.has_floor(5)
+    assert not window.has_floor(6)
+    with pytest.raises(ValueError):
+        window.room(6)
+    with pytest.raises(ValueError):
+        window.room(0)
+    with pytest.raises(ValueError):
+        FloorWindow(seed=1, capacity=0)
+
+
+def test_floor_window_restores_saved_deltas():
+    window = FloorWindow(seed=6)
+    window.room(1).remove_defeated_monster()
+    window.room(1).remove_defeated_monster()
+    window.room(2).remove_defeated_monster()
+    window.room(3)
+
+    deltas = window.deltas()
+    assert deltas == {1: ((0, 1), ()), 2: ((0,), ())}
+
+    loaded = FloorWindow(seed=6)
+    loaded.restore(deltas)
+    assert loaded.deltas() == deltas
+    assert loaded.room(1).monsters == []
+    assert [m.name for m in loaded.room(2).monsters] == [
+        m.name for m in window.room(2).monsters
+    ]
+    assert loaded.deltas() == deltas
+
+
+def test_floor_window_saves_the_deltas_of_every_floor():
+    window = FloorWindow(seed=6, capacity=3)
+    for level in range(1, 6):
+        window.room(level).remove_defeated_monster()
+
+    assert list(window.deltas()) == [1, 2, 3, 4, 5]
+
+    loaded = FloorWindow(seed=6, capacity=2)
+    loaded.restore(window.deltas())
+    assert loaded.deltas() == window.deltas()
+    assert len(loaded.room(1).monsters) == 1
+
+
+def test_prefetcher_generates_the_next_floors_on_a_worker(monkeypatch):
+    threads = {}
+    create_room = LevelFactory.create_room
+
+    def recording_create_room(level, **kwargs):
+        threads[level] = threading.current_thread().name
+        return create_room(level, **kwargs)
+
+    monkeypatch.setattr(LevelFactory, "create_room", recording_create_room)
+    window = FloorWindow(seed=21)
+    prefetcher = RoomPrefetcher(window, ahead=2)
+
+    prefetcher.prefetch(2)
+    second = prefetcher.room(2)
+    third = prefetcher.room(3)
+    prefetcher.close()
+
+    assert threads[2].startswith("room-prefetch")
+    assert threads[3].startswith("room-prefetch")
+    assert window.room(2) is second and window.room(3) is third
+    assert _layout(second) == _layout(LevelFactory.room_at(21, 2))
+
+
+def test_prefetcher_without_a_prefetch_generates_on_the_spot():
+    window = FloorWindow(seed=21)
+    prefetcher = RoomPrefetcher(window)
+    prefetcher.prefetch(3)
+    prefetcher.close()
+
+    assert _layout(prefetcher.room(3)) == _layout(LevelFactory.room_at(21, 3))
+    assert prefetcher.room(1) is window.room(1)
+
+
+def test_prefetched_rooms_get_their_restored_delta():
+    window = FloorWindow(seed=21)
+    window.restore({3: ((0,), ())})
+    prefetcher = RoomPrefetcher(window)
+
+    prefetcher.prefetch(3)
+    room = prefetcher.room(3)
+    prefetcher.close()
+
+    assert len(room.monsters) == 1
+    assert window.deltas() == {3: ((0,), ())}
+
+
+def test_prefetch_does_not_run_in_trusted_mode():
+    executor = ThreadPoolExecutor(max_workers=1)
+    prefetcher = RoomPrefetcher(FloorWindow(seed=21), executor=executor)
+
+    with trusted():
+        prefetcher.prefetch(2)
+        worker_trusted = executor.submit(is_trusted).result()
+    prefetcher.room(2)
+    prefetcher.close()
+    executor.shutdown()
+
+    assert not worker_trusted
+    assert not is_trusted()
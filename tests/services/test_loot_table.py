@@ -0,0 +1,147 @@
+from collections import Counter
+
+import pytest
+
+from domain.element import Element
+from domain.rng import RandomStream
+from domain.weapon import Weapon
+from services.items_factory import ItemCatalog, ItemsFactory
+from services.level_factory import LevelFactory
+from services.loot_table import (
+    RARITY_WEIGHTS,
+    AliasTable,
+    LootTable,
+    compile_loot_tables,
+)
+from services.monster_factory import MonsterFactory
+
+
+def _catalog():
+    return ItemCatalog(
+        [
+            (Weapon, {"name": "Espada", "base_damage": 10}),
+            (Weapon, {"name": "Machado", "base_damage": 12}),
+            (Weapon, {"name": "Lança", "base_damage": 14}),
+        ]
+    )
+
+
+def test_alias_table_follows_the_weights():
+    table = AliasTable([5, 3, 2])
+    rng = RandomStream(1)
+
+    counts = Counter(table.sample(rng.random()) for _ in range(100_000))
+
+    assert counts[0] == pytest.approx(50_000, rel=0.03)
+    assert counts[1] == pytest.approx(30_000, rel=0.03)
+    assert counts[2] == pytest.approx(20_000, rel=0.03)
+
+
+def test_alias_table_never_draws_a_zero_weight():
+    table = AliasTable([0, 1, 0])
+
+    assert {table.sample(u / 1000) for u in range(1000)} == {1}
+
+
+@pytest.mark.parametrize("weights", [[], [-1, 2], [0, 0]])
+def test_alias_table_rejects_bad_weights(weights):
+    with pytest.raises(ValueError):
+        AliasTable(weights)
+
+
+def test_guaranteed_drops_come_first_and_always():
+    catalog = _catalog()
+    table = LootTable(
+        entries=[(1, catalog.get("machado"))],
+        rolls=2,
+        guaranteed=[catalog.get("espada")],
+    )
+
+    assert [item.catalog_id for item in table.roll(RandomStream(3))] == [
+        "espada",
+        "machado",
+        "machado",
+    ]
+
+
+def test_compiled_tables_nest_and_can_drop_nothing():
+    tables = compile_loot_tables(
+        {
+            "boss": {"guaranteed": ["espada", {"table": "gear"}]},
+            "gear": {
+                "rolls": 3,
+                "entries": [
+                    {"table": "epic", "rarity": "epic"},
+                    {"rarity": "common"},
+                ],
+            },
+            "epic": {"entries": [{"item": "lanca", "weight": 1}]},
+        },
+        _catalog(),
+    )
+    rng = RandomStream(8)
+
+    drops = Counter(
+        item.catalog_id
+        for loot in tables["boss"].roll_many(10_000, rng)
+        for item in loot
+    )
+
+    assert drops["espada"] == 10_000
+    share = RARITY_WEIGHTS["epic"] / (RARITY_WEIGHTS["epic"] + RARITY_WEIGHTS["common"])
+    assert drops["lanca"] == pytest.approx(30_000 * share, rel=0.1)
+    assert tables["gear"] is tables["boss"].guaranteed[1]
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"a": {"guaranteed": ["arco"]}},
+        {"a": {"guaranteed": [{"table": "b"}]}},
+        {"a": {"guaranteed": [{"table": "a"}]}},
+        {"a": {"entries": [{"item": "espada", "rarity": "lendário"}]}},
+        {"a": {"entries": [{"item": "espada", "weight": -1}]}},
+    ],
+)
+def test_invalid_tables_are_rejected(config):
+    with pytest.raises(ValueError, match="Invalid loot table"):
+        compile_loot_tables(config, _catalog())
+
+
+def test_fixed_drops_keep_their_chances():
+    table = ItemsFactory.loot_tables()["fixed_drops"]
+
+    drops = Counter(
+        item.catalog_id
+        for loot in table.roll_many(20_000, RandomStream(4))
+        for item in loot
+    )
+
+    assert drops["pocao_de_cura"] == pytest.approx(14_000, rel=0.03)
+    assert drops["pocao_de_mana"] == pytest.approx(10_000, rel=0.03)
+
+
+def test_bulk_loot_matches_one_by_one_rolls():
+    names = ["Yeti", "Goblin", "Monstro Inexistente", "Yeti"]
+
+    bulk = ItemsFactory.get_loot_for_monsters(names, RandomStream(6))
+    rng = RandomStream(6)
+    single = [ItemsFactory.get_loot_for_monster(name, rng) for name in names]
+
+    assert [[item.catalog_id for item in loot] for loot in bulk] == [
+        [item.catalog_id for item in loot] for loot in single
+    ]
+
+
+def test_horde_monsters_carry_their_loot():
+    room = LevelFactory.create_horde_room(
+        2, environment=Element.ICE, rng=RandomStream(2)
+    )
+    tables = ItemsFactory.loot_tables()
+    equipment = {
+        name.title(): tables[name].guaranteed[-1]
+        for name in MonsterFactory.BASE_NAMES[Element.ICE]
+    }
+
+    for monster in room.monsters:
+        assert monster.loot[-1].catalog_id == equipment[monster.name].catalog_id
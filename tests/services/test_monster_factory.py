@@ -1,10 +1,12 @@
 import pytest
-from services.monster_factory import MonsterFactory
+from services.monster_factory import MonsterFactory, MonsterPool
 from domain.element import Element
 from domain.monster import Monster
 from domain.weapon import Weapon
 from domain.ranged_weapon import RangedWeapon
 from domain.grimoire import Grimoire
+from domain.rng import RandomStream
+from domain.state import BurnState
 from unittest.mock import patch
 
 
@@ -135,3 +137,130 @@ def test_all_elements_produce_monsters_with_loot():
         assert len(monster.loot) > 0, (
             f"Monstro do elemento {element.name} foi criado sem loot."
         )
+
+
+def test_create_monster_with_same_stream_is_reproducible():
+    first = MonsterFactory.create_monster(2, rng=RandomStream(11))
+    second = MonsterFactory.create_monster(2, rng=RandomStream(11))
+
+    assert first.name == second.name
+    assert [item.name for item in first.loot] == [item.name for item in second.loot]
+
+
+# =============================================================================
+# PROTÓTIPOS E POOL
+# =============================================================================
+
+
+@pytest.fixture
+def monster_pool():
+    pool = MonsterPool(max_per_prototype=2)
+    MonsterFactory.pool = pool
+    yield pool
+    MonsterFactory.pool = None
+
+
+def _defeat(monster):
+    monster.damage_received(monster.max_life * 10, Element.NEUTRAL)
+
+
+def test_prototype_is_built_once():
+    first = MonsterFactory.prototype("Yeti", 4, Element.ICE)
+
+    assert MonsterFactory.prototype("Yeti", 4, Element.ICE) is first
+    assert MonsterFactory.prototype("Yeti", 4, Element.ICE, boss=True) is not first
+
+
+def test_spawns_match_the_constructor():
+    monster = MonsterFactory.create_boss(3, Element.FIRE, rng=RandomStream(5))
+    name = RandomStream(5).choice(MonsterFactory.BASE_NAMES[Element.FIRE])
+    built = Monster(
+        name=name,
+        max_life=120 + 3 * 20,
+        attack=20 + 3 * 8,
+        speed=10 + 3,
+        element=Element.FIRE,
+        description=f"{name}, um chefe elemental extremamente poderoso.",
+    )
+
+    assert monster.snapshot() == built.snapshot()
+    assert monster.get_description() == built.get_description()
+    assert monster.art
+    assert monster.prototype is MonsterFactory.prototype(
+        name, 3, Element.FIRE, boss=True
+    )
+
+
+def test_spawns_do_not_share_combat_state():
+    first = MonsterFactory.create_monster(2, Element.POISON, rng=RandomStream(1))
+    second = MonsterFactory.create_monster(2, Element.POISON, rng=RandomStream(1))
+
+    first.damage_received(10, Element.NEUTRAL)
+    first.add_status(BurnState(duration_turns=2, attack_decrease=3))
+    first.tick_statuses()
+
+    assert second.current_life == second.max_life
+    assert second.attack == first.prototype.attack
+    assert not second.has_status("Burned")
+    assert first.prototype.current_life == first.prototype.max_life
+    assert first.loot is not second.loot
+
+
+def test_pool_respawns_defeated_monsters(monster_pool):
+    monster = MonsterFactory.create_monster(1, Element.ICE, rng=RandomStream(3))
+    monster.add_status(BurnState(duration_turns=2, attack_decrease=3))
+    monster.tick_statuses()
+    _defeat(monster)
+
+    MonsterFactory.recycle(monster)
+    again = MonsterFactory.create_monster(1, Element.ICE, rng=RandomStream(3))
+
+    assert again is monster
+    assert again.current_life == again.max_life
+    assert again.attack == again.prototype.attack
+    assert again.modifiers == ()
+    assert len(monster_pool) == 0
+
+
+def test_pool_keeps_only_defeated_spawned_monsters(monster_pool):
+    alive = MonsterFactory.create_monster(1, Element.ICE)
+    built = Monster(name="Orc", max_life=10, attack=1, speed=1, element=Element.FIRE)
+    _defeat(built)
+
+    with pytest.raises(ValueError):
+        MonsterFactory.recycle(alive)
+    MonsterFactory.recycle(built)
+
+    assert len(monster_pool) == 0
+
+
+def test_pool_is_bounded_per_prototype(monster_pool):
+    monsters = [
+        MonsterFactory.create_monster(1, Element.ICE, rng=RandomStream(3))
+        for _ in range(3)
+    ]
+    for monster in monsters:
+        _defeat(monster)
+        MonsterFactory.recycle(monster)
+    MonsterFactory.recycle(monsters[0])
+
+    assert len(monster_pool) == 2
+
+
+def test_pool_drops_the_prototypes_released_least_recently():
+    pool = MonsterPool(max_prototypes=2)
+    monsters = {
+        level: MonsterFactory.prototype("Yeti", level, Element.ICE).spawn()
+        for level in (1, 2, 3)
+    }
+    spare = MonsterFactory.prototype("Yeti", 1, Element.ICE).spawn()
+
+    for monster in [monsters[1], monsters[2], spare, monsters[3]]:
+        _defeat(monster)
+        pool.release(monster)
+
+    assert len(pool) == 3
+    assert pool.acquire(monsters[1].prototype) in (monsters[1], spare)
+    assert pool.acquire(monsters[2].prototype) is not monsters[2]
+    with pytest.raises(ValueError):
+        MonsterPool(max_prototypes=0)
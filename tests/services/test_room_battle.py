@@ -0,0 +1,267 @@
+import random
+
+import pytest
+
+from domain.element import Element
+from domain.monster import Monster
+from domain.rng import RandomStream
+from domain.room import Room
+from domain.state import FrozenState, StunnedState
+from domain.warrior import Warrior
+from domain.weapon import Weapon
+from services.battle_events import DamageDealt, Defeated
+from services.room_battle import InitiativeQueue, RoomBattle
+
+
+def _warrior(name="Knight", speed=10, attack=50, life=200) -> Warrior:
+    warrior = Warrior(
+        name=name,
+        max_life=life,
+        current_life=life,
+        attack=attack,
+        speed=speed,
+        in_test=True,
+    )
+    weapon = Weapon(name="Test Sword", base_damage=1)
+    warrior.inventory.add_item_to_inventory(weapon)
+    warrior.equip_weapon(weapon)
+    return warrior
+
+
+def _monster(name="Goblin", speed=5, life=40, attack=10, loot=None) -> Monster:
+    return Monster(
+        name=name,
+        max_life=life,
+        attack=attack,
+        speed=speed,
+        element=Element.NEUTRAL,
+        loot=loot,
+    )
+
+
+def test_queue_orders_by_speed_with_hero_priority_on_ties():
+    hero = _warrior(speed=10)
+    slow, fast, tied = _monster(speed=5), _monster(speed=30), _monster(speed=10)
+
+    queue = InitiativeQueue()
+    queue.add(slow, 1)
+    queue.add(fast, 1)
+    queue.add(tied, 1)
+    queue.add(hero, 0)
+
+    assert [queue.pop() for _ in range(4)] == [fast, hero, tied, slow]
+    assert queue.pop() is None
+
+
+def test_queue_uses_new_speed_in_the_next_round():
+    first, second = _monster(speed=20), _monster(speed=10)
+    queue = InitiativeQueue()
+    queue.add(first, 1)
+    queue.add(second, 1)
+
+    actor = queue.pop()
+    actor.speed = 1  # e.g. FrozenState applied at its slot
+    queue.push_next(actor)
+    queue.push_next(queue.pop())
+
+    assert queue.round == 1
+    assert queue.pop() is second
+    assert queue.round == 2
+    assert queue.pop() is first
+
+
+def test_queue_reschedule_and_remove():
+    a, b, c = _monster(speed=10), _monster(speed=20), _monster(speed=30)
+    queue = InitiativeQueue()
+    for monster in (a, b, c):
+        queue.add(monster, 1)
+
+    a.speed = 50
+    queue.reschedule(a)
+    queue.remove(c)
+
+    assert len(queue) == 2
+    assert c not in queue
+    assert [queue.pop(), queue.pop(), queue.pop()] == [a, b, None]
+
+
+def test_faster_monsters_strike_before_the_first_choice():
+    hero = _warrior(speed=10)
+    fast = _monster(name="Wolf", speed=20)
+    battle = RoomBattle(hero, [fast, _monster(speed=5)], headless=True)
+
+    assert battle.current_hero is hero
+    assert hero.current_life == 190
+
+    log = battle.execute_turn("1")["turn_log"]
+    assert isinstance(log["events"][0], DamageDealt)
+    assert log["events"][0].source == "Wolf"
+
+
+def test_hero_clears_the_room_and_collects_all_loot():
+    hero = _warrior(attack=50)
+    room = Room(
+        "Sala",
+        Element.NEUTRAL,
+        monsters=[
+            _monster(name="A", loot=["Osso"]),
+            _monster(name="B", loot=["Dente"]),
+            _monster(name="C"),
+        ],
+    )
+    battle = RoomBattle(hero, room, headless=True, rng=RandomStream(1))
+
+    results = [battle.execute_turn("1") for _ in range(3)]
+
+    assert [r["result"] for r in results] == ["ongoing", "ongoing", "victory"]
+    assert results[-1]["loot"] == ["Osso", "Dente"]
+    assert not battle.is_combat_active
+    assert hero.event_bus is None and hero.rng is random
+    assert all(monster.event_bus is None for monster in room.monsters)
+    assert [
+        e.actor for e in results[0]["turn_log"]["events"] if isinstance(e, Defeated)
+    ] == ["A"]
+    with pytest.raises(ValueError):
+        battle.execute_turn("1")
+
+
+def test_target_can_be_chosen_by_index_or_monster():
+    hero = _warrior(attack=50)
+    first, second, third = _monster(name="A"), _monster(name="B"), _monster(name="C")
+    battle = RoomBattle(hero, [first, second, third], headless=True)
+
+    battle.execute_turn("1", target=2)
+    assert not third.is_it_alive()
+    battle.execute_turn("1", target=second)
+    assert battle.living_monsters == [first]
+
+    with pytest.raises(ValueError):
+        battle.execute_turn("1", target=second)
+    with pytest.raises(ValueError):
+        battle.execute_turn("1", target=5)
+
+
+def test_every_monster_acts_once_per_round():
+    hero = _warrior(attack=1, life=1000)
+    monsters = [_monster(life=500, attack=10) for _ in range(5)]
+    battle = RoomBattle(hero, monsters, headless=True)
+
+    battle.execute_turn("1")
+    assert battle.round == 2
+    assert hero.current_life == 1000 - 5 * 10
+
+
+def test_failed_action_keeps_the_hero_slot():
+    hero = _warrior()
+    hero.unequip_weapon()
+    battle = RoomBattle(hero, [_monster(speed=5)], headless=True)
+
+    log = battle.execute_turn("1")["turn_log"]
+
+    assert log["action_failed"]
+    assert battle.current_hero is hero
+    assert hero.current_life == 200
+
+
+def test_defeat_when_every_hero_falls():
+    heroes = [_warrior(name="A", life=15), _warrior(name="B", life=15, speed=1)]
+    monsters = [_monster(speed=20, attack=20, life=500) for _ in range(2)]
+    battle = RoomBattle(heroes, monsters, headless=True, rng=RandomStream(3))
+
+    assert battle.get_combat_result()["result"] == "defeat"
+    assert battle.living_heroes == []
+    assert not battle.is_combat_active
+    assert all(entity.event_bus is None for entity in heroes + monsters)
+
+
+def test_stunned_monster_loses_its_action():
+    hero = _warrior(attack=1)
+    monster = _monster(life=500)
+    monster.set_status(StunnedState(1))
+    battle = RoomBattle(hero, [monster], headless=True)
+
+    battle.execute_turn("1")
+    assert hero.current_life == 200
+    battle.execute_turn("1")
+    assert hero.current_life == 190
+
+
+def test_frozen_monster_falls_behind_in_the_next_round():
+    hero = _warrior(speed=10, attack=1, life=1000)
+    frozen = _monster(name="Frozen", speed=20, life=500)
+    other = _monster(name="Other", speed=15, life=500)
+    frozen.set_status(FrozenState(3, 15))
+
+    battle = RoomBattle(hero, [frozen, other], headless=True)
+    log = battle.execute_turn("1")["turn_log"]
+
+    # Round 1 is played at the starting speeds; the freeze lands at Frozen's
+    # slot, so in round 2 it is Other (15) > Knight (10) > Frozen (5).
+    sources = [e.source for e in log["events"] if isinstance(e, DamageDealt)]
+    assert sources == ["Frozen", "Other", "Knight", "Other"]
+    assert battle.current_hero is hero
+
+
+def test_snapshot_restore_rewinds_the_room():
+    hero = _warrior(attack=30, life=500)
+    monsters = [_monster(life=60) for _ in range(3)]
+    battle = RoomBattle(hero, monsters, headless=True)
+
+    snapshot = battle.snapshot()
+    first = [battle.execute_turn("1")["result"] for _ in range(4)]
+    lives = [m.current_life for m in monsters] + [hero.current_life]
+
+    battle.restore(snapshot)
+    second = [battle.execute_turn("1")["result"] for _ in range(4)]
+
+    assert first == second
+    assert [m.current_life for m in monsters] + [hero.current_life] == lives
+
+
+def test_hundreds_of_monsters():
+    hero = _warrior(attack=100, life=10**6)
+    monsters = [_monster(speed=i % 40, life=50) for i in range(300)]
+    battle = RoomBattle(hero, monsters, headless=True, rng=RandomStream(7))
+
+    while battle.is_combat_active:
+        result = battle.execute_turn("1")
+
+    assert result["result"] == "victory"
+    assert battle.turn_count == 300
+
+
+def test_area_action_hits_the_whole_room():
+    hero = _warrior(attack=50)
+    monsters = [
+        _monster(name=f"G{i}", life=life) for i, life in enumerate((40, 50, 100, 100))
+    ]
+    battle = RoomBattle(hero, monsters, headless=True)
+
+    assert "3" in battle.get_available_actions()
+    log = battle.execute_turn("3")["turn_log"]
+
+    defeated = [e.actor for e in log["events"] if isinstance(e, Defeated)]
+    assert defeated == ["G0", "G1"]
+    assert log["target"] is None
+    assert battle.living_monsters == monsters[2:]
+    # The survivors strike back in the same round.
+    assert hero.current_life == 200 - 2 * 10
+
+    battle.execute_turn("3")
+    assert not battle.is_combat_active
+    assert battle.get_combat_result()["result"] == "victory"
+
+
+@pytest.mark.usefixtures("room_modifiers")
+def test_room_environment_sets_the_multipliers():
+    hero = _warrior()
+    goblin = Monster(
+        name="Goblin", max_life=40, attack=10, speed=5, element=Element.FIRE
+    )
+    room = Room("Uma sala em chamas.", Element.FIRE, monsters=[goblin])
+
+    battle = RoomBattle(hero, room, headless=True)
+
+    assert battle.environment is Element.FIRE
+    assert goblin.element_matrix is hero.element_matrix is battle.element_matrix
+    assert battle.element_matrix.multiplier(Element.FIRE, Element.NEUTRAL) == 1.25
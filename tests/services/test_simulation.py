@@ -0,0 +1,115 @@
+import pytest
+from domain.element import Element
+from services.simulation import (
+    MonsterSpec,
+    SimulationStats,
+    basic_policy,
+    create_simulation_hero,
+    run_simulation,
+    run_trial,
+    simulate,
+)
+
+
+def test_simulation_hero_has_weapon_equipped():
+    for archetype in ("warrior", "mage", "archer"):
+        hero = create_simulation_hero(archetype)
+
+        assert hero.equipped_weapon is not None
+
+
+def test_simulation_hero_overrides():
+    hero = create_simulation_hero("warrior", {"attack": 99, "max_life": 500})
+
+    assert hero.attack == 99
+    assert hero.max_life == 500
+    assert hero.current_life == 500
+
+
+def test_basic_policy_reloads_empty_archer():
+    archer = create_simulation_hero("archer")
+    archer.current_ammo = 0
+
+    assert basic_policy(archer) == "3"
+
+
+def test_basic_policy_meditates_without_mana():
+    mage = create_simulation_hero("mage")
+    mage.current_mana = 0
+
+    assert basic_policy(mage) == "4"
+
+
+def test_run_trial_finishes_battle():
+    hero = create_simulation_hero("warrior")
+    monster = MonsterSpec(level=1, element=Element.FIRE).create()
+
+    result, turns = run_trial(hero, monster)
+
+    assert result in ("victory", "defeat")
+    assert turns > 0
+
+
+def test_run_trial_stops_at_max_turns():
+    hero = create_simulation_hero("warrior", {"max_life": 10**6})
+    monster = MonsterSpec(level=1, element=Element.FIRE).create()
+    monster.max_life = 10**6
+    monster.current_life = 10**6
+
+    result, turns = run_trial(hero, monster, max_turns=5)
+
+    assert result == "ongoing"
+    assert turns == 5
+
+
+def test_stats_merge():
+    first = SimulationStats()
+    first.record("victory", 4, 30)
+    first.record("defeat", 7, 0)
+    second = SimulationStats()
+    second.record("victory", 6, 50)
+    second.record("ongoing", 500, 10)
+
+    first.merge(second)
+
+    assert first.trials == 4
+    assert first.wins == 2
+    assert first.losses == 1
+    assert first.timeouts == 1
+    assert first.win_rate == 0.5
+    assert first.mean_turns_to_kill == 5
+    assert first.mean_remaining_hp == 40
+    assert first.turns_histogram == {4: 1, 6: 1}
+
+
+def test_simulate_streams_chunks_in_process():
+    spec = MonsterSpec(level=1, element=Element.POISON)
+
+    chunks = list(simulate("archer", spec, 25, chunk_size=10, max_workers=1))
+
+    assert [chunk.trials for chunk in chunks] == [10, 10, 5]
+
+
+def test_run_simulation_with_process_pool():
+    spec = MonsterSpec(level=1, element=Element.NEUTRAL)
+
+    stats = run_simulation("warrior", spec, 40, chunk_size=10, max_workers=2)
+
+    assert stats.trials == 40
+    assert stats.wins + stats.losses + stats.timeouts == 40
+
+
+def test_simulate_rejects_unknown_archetype():
+    with pytest.raises(ValueError):
+        list(simulate("paladin", MonsterSpec(level=1), 10))
+
+
+def test_seeded_simulation_ignores_chunking_and_workers():
+    spec = MonsterSpec(level=2)
+
+    in_process = run_simulation(
+        "archer", spec, 60, chunk_size=60, max_workers=1, seed=9
+    )
+    pooled = run_simulation("archer", spec, 60, chunk_size=7, max_workers=3, seed=9)
+
+    assert in_process == pooled